@@ -14,197 +14,244 @@ user-facing should be imported to this file.
 # TODO: import examples once we settle on those
 # TODO: import this in all user-facing files
 
+import importlib
 
-###################
-# General Imports #
-###################
+# Every public name of the API maps to the module that defines it. The modules are only
+# imported the first time one of their names is accessed (PEP 562), so importing this file is
+# cheap and users only pay for the parts of Aviary that they actually use.
+_lazy_imports = [
+    ###################
+    # General Imports #
+    ###################
+    ('aviary.variable_info.variables', ['Aircraft', 'Mission', 'Dynamic', 'Settings']),
+    ('aviary.variable_info.options', ['get_option_defaults', 'is_option']),
+    ('aviary.utils.develop_metadata', ['add_meta_data', 'update_meta_data']),
+    ('aviary.variable_info.variable_meta_data', ['CoreMetaData']),
+    (
+        'aviary.variable_info.functions',
+        [
+            'add_aviary_input',
+            'add_aviary_output',
+            'get_units',
+            'override_aviary_vars',
+            'setup_model_options',
+            'setup_trajectory_params',
+        ],
+    ),
+    ('aviary.utils.merge_hierarchies', ['merge_hierarchies']),
+    ('aviary.utils.merge_variable_metadata', ['merge_meta_data']),
+    ('aviary.utils.named_values', ['NamedValues', 'get_keys', 'get_items', 'get_values']),
+    ('aviary.utils.aviary_values', ['AviaryValues']),
+    ('aviary.utils.csv_data_file', ['read_data_file', 'write_data_file']),
+    ('aviary.utils.data_interpolator_builder', ['build_data_interpolator']),
+    (
+        'aviary.variable_info.enums',
+        [
+            'AlphaModes',
+            'EquationsOfMotion',
+            'FlapType',
+            'GASPEngineType',
+            'LegacyCode',
+            'ProblemType',
+            'SpeedType',
+            'Verbosity',
+        ],
+    ),
+    ('aviary.models.missions.two_dof_default', [('phase_info', 'default_2DOF_phase_info')]),
+    (
+        'aviary.models.missions.height_energy_default',
+        [('phase_info', 'default_height_energy_phase_info')],
+    ),
+    ('aviary.interface.methods_for_level1', ['run_level_1', 'run_aviary']),
+    ('aviary.interface.methods_for_level2', ['AviaryProblem']),
+    ('aviary.interface.design_batch', ['evaluate_design_batch', 'run_premission_batch']),
+    ('aviary.utils.engine_deck_conversion', ['convert_engine_deck']),
+    ('aviary.utils.fortran_to_aviary', ['fortran_to_aviary']),
+    (
+        'aviary.utils.functions',
+        ['get_path', 'set_aviary_initial_values', 'set_aviary_input_defaults', 'top_dir'],
+    ),
+    ('aviary.utils.options', ['list_options']),
+    (
+        'aviary.constants',
+        [
+            'GRAV_ENGLISH_FLOPS',
+            'GRAV_ENGLISH_GASP',
+            'GRAV_ENGLISH_LBM',
+            'GRAV_METRIC_FLOPS',
+            'GRAV_METRIC_GASP',
+            'MU_LANDING',
+            'MU_TAKEOFF',
+            'PSLS_PSF',
+            'RADIUS_EARTH_METRIC',
+            'RHO_SEA_LEVEL_ENGLISH',
+            'RHO_SEA_LEVEL_METRIC',
+            'TSLS_DEGR',
+        ],
+    ),
+    (
+        'aviary.subsystems.test.subsystem_tester',
+        ['TestSubsystemBuilderBase', 'skipIfMissingDependencies'],
+    ),
+    ('aviary.subsystems.propulsion.utils', ['build_engine_deck']),
+    ###################
+    # Level 3 Imports #
+    ###################
+    # Miscellaneous
+    ('aviary.subsystems.premission', ['CorePreMission']),
+    ('aviary.subsystems.subsystem_builder_base', ['SubsystemBuilderBase']),
+    (
+        'aviary.utils.preprocessors',
+        ['preprocess_crewpayload', 'preprocess_options', 'preprocess_propulsion'],
+    ),
+    ('aviary.utils.process_input_decks', ['create_vehicle']),
+    ('aviary.utils.functions', ['create_opts2vals', 'add_opts2vals', 'Null']),
+    # ODEs
+    # TODO: check and see if this works with both sides, or just GASP
+    ('aviary.mission.base_ode', ['BaseODE']),
+    ('aviary.mission.flops_based.ode.energy_ODE', ['EnergyODE']),
+    (
+        'aviary.mission.flops_based.ode.landing_ode',
+        [('LandingODE', 'DetailedLandingODE'), ('FlareODE', 'DetailedFlareODE')],
+    ),
+    ('aviary.mission.flops_based.ode.takeoff_ode', [('TakeoffODE', 'DetailedTakeoffODE')]),
+    (
+        'aviary.mission.flops_based.phases.simplified_takeoff',
+        [('TakeoffGroup', 'HeightEnergySimplifiedTakeoff')],
+    ),
+    (
+        'aviary.mission.flops_based.phases.simplified_landing',
+        [('LandingGroup', 'HeightEnergySimplifiedLanding')],
+    ),
+    ('aviary.mission.gasp_based.ode.two_dof_ode', ['TwoDOFODE']),
+    ('aviary.mission.gasp_based.ode.accel_ode', [('AccelODE', 'TwoDOFAccelerationODE')]),
+    ('aviary.mission.gasp_based.ode.ascent_ode', [('AscentODE', 'TwoDOFAscentODE')]),
+    ('aviary.mission.gasp_based.ode.breguet_cruise_ode', ['BreguetCruiseODESolution']),
+    ('aviary.mission.gasp_based.ode.climb_ode', [('ClimbODE', 'TwoDOFClimbODE')]),
+    ('aviary.mission.gasp_based.ode.descent_ode', [('DescentODE', 'TwoDOFDescentODE')]),
+    ('aviary.mission.gasp_based.ode.flight_path_ode', [('FlightPathODE', 'TwoDOFFlightPathODE')]),
+    ('aviary.mission.gasp_based.ode.groundroll_ode', [('GroundrollODE', 'TwoDOFGroundrollODE')]),
+    ('aviary.mission.gasp_based.ode.rotation_ode', [('RotationODE', 'TwoDOFRotationODE')]),
+    ('aviary.mission.gasp_based.ode.landing_ode', [('LandingSegment', 'TwoDOFSimplifiedLanding')]),
+    ('aviary.mission.gasp_based.ode.taxi_ode', [('TaxiSegment', 'AnalyticTaxi')]),
+    # Phase builders
+    ('aviary.mission.phase_builder_base', ['PhaseBuilderBase']),
+    # note that this is only for simplified right now
+    (
+        'aviary.mission.flops_based.phases.energy_phase',
+        [('EnergyPhase', 'HeightEnergyPhaseBuilder')],
+    ),
+    (
+        'aviary.mission.flops_based.phases.build_landing',
+        [('Landing', 'HeightEnergyLandingPhaseBuilder')],
+    ),
+    # note that this is only for simplified right now
+    (
+        'aviary.mission.flops_based.phases.build_takeoff',
+        [('Takeoff', 'HeightEnergyTakeoffPhaseBuilder')],
+    ),
+    (
+        'aviary.mission.flops_based.phases.detailed_landing_phases',
+        [
+            ('LandingApproachToMicP3', 'DetailedLandingApproachToMicP3PhaseBuilder'),
+            ('LandingMicP3ToObstacle', 'DetailedLandingMicP3ToObstaclePhaseBuilder'),
+            ('LandingObstacleToFlare', 'DetailedLandingObstacleToFlarePhaseBuilder'),
+            ('LandingFlareToTouchdown', 'DetailedLandingFlareToTouchdownPhaseBuilder'),
+            ('LandingTouchdownToNoseDown', 'DetailedLandingTouchdownToNoseDownPhaseBuilder'),
+            ('LandingNoseDownToStop', 'DetailedLandingNoseDownToStopPhaseBuilder'),
+        ],
+    ),
+    (
+        'aviary.mission.flops_based.phases.detailed_takeoff_phases',
+        [
+            (
+                'TakeoffBrakeReleaseToDecisionSpeed',
+                'DetailedTakeoffBrakeReleaseToDecisionSpeedPhaseBuilder',
+            ),
+            ('TakeoffDecisionSpeedToRotate', 'DetailedTakeoffDecisionSpeedToRotatePhaseBuilder'),
+            (
+                'TakeoffDecisionSpeedBrakeDelay',
+                'DetailedTakeoffDecisionSpeedBrakeDelayPhaseBuilder',
+            ),
+            ('TakeoffRotateToLiftoff', 'DetailedTakeoffRotateToLiftoffPhaseBuilder'),
+            ('TakeoffLiftoffToObstacle', 'DetailedTakeoffLiftoffToObstaclePhaseBuilder'),
+            ('TakeoffObstacleToMicP2', 'DetailedTakeoffObstacleToMicP2PhaseBuilder'),
+            ('TakeoffMicP2ToEngineCutback', 'DetailedTakeoffMicP2ToEngineCutbackPhaseBuilder'),
+            ('TakeoffEngineCutback', 'DetailedTakeoffEngineCutbackPhaseBuilder'),
+            ('TakeoffEngineCutbackToMicP1', 'DetailedTakeoffEngineCutbackToMicP1PhaseBuilder'),
+            ('TakeoffMicP1ToClimb', 'DetailedTakeoffMicP1ToClimbPhaseBuilder'),
+            ('TakeoffBrakeToAbort', 'DetailedTakeoffBrakeToAbortPhaseBuilder'),
+        ],
+    ),
+    # Phase builders
+    ('aviary.mission.gasp_based.phases.accel_phase', [('AccelPhase', 'TwoDOFAccelerationPhase')]),
+    ('aviary.mission.gasp_based.phases.ascent_phase', [('AscentPhase', 'TwoDOFAscentPhase')]),
+    ('aviary.mission.gasp_based.phases.climb_phase', [('ClimbPhase', 'TwoDOFClimbPhase')]),
+    ('aviary.mission.gasp_based.phases.descent_phase', [('DescentPhase', 'TwoDOFDescentPhase')]),
+    (
+        'aviary.mission.gasp_based.phases.groundroll_phase',
+        [('GroundrollPhase', 'TwoDOFGroundrollPhase')],
+    ),
+    ('aviary.mission.gasp_based.phases.rotation_phase', [('RotationPhase', 'TwoDOFRotationPhase')]),
+    # Trajectory builders
+    (
+        'aviary.mission.flops_based.phases.detailed_landing_phases',
+        [('LandingTrajectory', 'DetailedLandingTrajectoryBuilder')],
+    ),
+    (
+        'aviary.mission.flops_based.phases.detailed_takeoff_phases',
+        [('TakeoffTrajectory', 'DetailedTakeoffTrajectoryBuilder')],
+    ),
+    ##############
+    # Subsystems #
+    ##############
+    # Aerodynamics
+    (
+        'aviary.subsystems.aerodynamics.aerodynamics_builder',
+        ['AerodynamicsBuilderBase', 'CoreAerodynamicsBuilder'],
+    ),
+    ('aviary.subsystems.aerodynamics.flops_based.tabular_aero_group', ['TabularAeroGroup']),
+    # Atmosphere
+    ('aviary.subsystems.atmosphere.atmosphere', ['Atmosphere']),
+    # Geometry
+    ('aviary.subsystems.geometry.geometry_builder', ['GeometryBuilderBase', 'CoreGeometryBuilder']),
+    # Mass
+    ('aviary.subsystems.mass.mass_builder', ['MassBuilderBase', 'CoreMassBuilder']),
+    # Propulsion
+    ('aviary.subsystems.propulsion.engine_deck', ['EngineDeck']),
+    ('aviary.subsystems.propulsion.engine_model', ['EngineModel']),
+    ('aviary.subsystems.propulsion.motor.motor_builder', ['MotorBuilder']),
+    (
+        'aviary.subsystems.propulsion.propulsion_builder',
+        ['PropulsionBuilderBase', 'CorePropulsionBuilder'],
+    ),
+    ('aviary.subsystems.propulsion.turboprop_model', ['TurbopropModel']),
+]
 
-from aviary.variable_info.variables import Aircraft, Mission, Dynamic, Settings
-from aviary.variable_info.options import get_option_defaults, is_option
-from aviary.utils.develop_metadata import add_meta_data, update_meta_data
-from aviary.variable_info.variable_meta_data import CoreMetaData
-from aviary.variable_info.functions import (
-    add_aviary_input,
-    add_aviary_output,
-    get_units,
-    override_aviary_vars,
-    setup_model_options,
-    setup_trajectory_params,
-)
-from aviary.utils.merge_hierarchies import merge_hierarchies
-from aviary.utils.merge_variable_metadata import merge_meta_data
-from aviary.utils.named_values import NamedValues, get_keys, get_items, get_values
-from aviary.utils.aviary_values import AviaryValues
-from aviary.utils.csv_data_file import read_data_file, write_data_file
-from aviary.utils.data_interpolator_builder import build_data_interpolator
-from aviary.variable_info.enums import (
-    AlphaModes,
-    EquationsOfMotion,
-    FlapType,
-    GASPEngineType,
-    LegacyCode,
-    ProblemType,
-    SpeedType,
-    Verbosity,
-)
-from aviary.models.missions.two_dof_default import phase_info as default_2DOF_phase_info
-from aviary.models.missions.height_energy_default import (
-    phase_info as default_height_energy_phase_info,
-)
-from aviary.interface.methods_for_level1 import run_level_1
-from aviary.interface.methods_for_level1 import run_aviary
-from aviary.interface.methods_for_level2 import AviaryProblem
-from aviary.utils.engine_deck_conversion import convert_engine_deck
-from aviary.utils.fortran_to_aviary import fortran_to_aviary
-from aviary.utils.functions import (
-    get_path,
-    set_aviary_initial_values,
-    set_aviary_input_defaults,
-    top_dir,
-)
-from aviary.utils.options import list_options
-from aviary.constants import (
-    GRAV_ENGLISH_FLOPS,
-    GRAV_ENGLISH_GASP,
-    GRAV_ENGLISH_LBM,
-    GRAV_METRIC_FLOPS,
-    GRAV_METRIC_GASP,
-    MU_LANDING,
-    MU_TAKEOFF,
-    PSLS_PSF,
-    RADIUS_EARTH_METRIC,
-    RHO_SEA_LEVEL_ENGLISH,
-    RHO_SEA_LEVEL_METRIC,
-    TSLS_DEGR,
-)
-from aviary.subsystems.test.subsystem_tester import (
-    TestSubsystemBuilderBase,
-    skipIfMissingDependencies,
-)
-from aviary.subsystems.propulsion.utils import build_engine_deck
+_api_names = {}
+for _module_name, _names in _lazy_imports:
+    for _name in _names:
+        _attr, _alias = _name if isinstance(_name, tuple) else (_name, _name)
+        _api_names[_alias] = (_module_name, _attr)
 
-###################
-# Level 3 Imports #
-###################
+__all__ = list(_api_names)
 
-# Miscellaneous
-from aviary.subsystems.premission import CorePreMission
-from aviary.subsystems.subsystem_builder_base import SubsystemBuilderBase
-from aviary.utils.preprocessors import (
-    preprocess_crewpayload,
-    preprocess_options,
-    preprocess_propulsion,
-)
-from aviary.utils.process_input_decks import create_vehicle
-from aviary.utils.functions import create_opts2vals, add_opts2vals, Null
 
-# ODEs
-# TODO: check and see if this works with both sides, or just GASP
-from aviary.mission.base_ode import BaseODE
-from aviary.mission.flops_based.ode.energy_ODE import EnergyODE
-from aviary.mission.flops_based.ode.landing_ode import LandingODE as DetailedLandingODE
-from aviary.mission.flops_based.ode.landing_ode import FlareODE as DetailedFlareODE
-from aviary.mission.flops_based.ode.takeoff_ode import TakeoffODE as DetailedTakeoffODE
-from aviary.mission.flops_based.phases.simplified_takeoff import (
-    TakeoffGroup as HeightEnergySimplifiedTakeoff,
-)
-from aviary.mission.flops_based.phases.simplified_landing import (
-    LandingGroup as HeightEnergySimplifiedLanding,
-)
-from aviary.mission.gasp_based.ode.two_dof_ode import TwoDOFODE
-from aviary.mission.gasp_based.ode.accel_ode import AccelODE as TwoDOFAccelerationODE
-from aviary.mission.gasp_based.ode.ascent_ode import AscentODE as TwoDOFAscentODE
-from aviary.mission.gasp_based.ode.breguet_cruise_ode import BreguetCruiseODESolution
-from aviary.mission.gasp_based.ode.climb_ode import ClimbODE as TwoDOFClimbODE
-from aviary.mission.gasp_based.ode.descent_ode import DescentODE as TwoDOFDescentODE
-from aviary.mission.gasp_based.ode.flight_path_ode import FlightPathODE as TwoDOFFlightPathODE
-from aviary.mission.gasp_based.ode.groundroll_ode import GroundrollODE as TwoDOFGroundrollODE
-from aviary.mission.gasp_based.ode.rotation_ode import RotationODE as TwoDOFRotationODE
-from aviary.mission.gasp_based.ode.landing_ode import LandingSegment as TwoDOFSimplifiedLanding
-from aviary.mission.gasp_based.ode.taxi_ode import TaxiSegment as AnalyticTaxi
+def __getattr__(name):
+    """Import the requested API name from its defining module on first access."""
+    try:
+        module_name, attr = _api_names[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
 
+    value = getattr(importlib.import_module(module_name), attr)
 
-# Phase builders
-from aviary.mission.phase_builder_base import PhaseBuilderBase
+    # cache the value so that this function is only called once per name
+    globals()[name] = value
 
-# note that this is only for simplified right now
-from aviary.mission.flops_based.phases.energy_phase import (
-    EnergyPhase as HeightEnergyPhaseBuilder,
-)
-from aviary.mission.flops_based.phases.build_landing import (
-    Landing as HeightEnergyLandingPhaseBuilder,
-)
+    return value
 
-# note that this is only for simplified right now
-from aviary.mission.flops_based.phases.build_takeoff import (
-    Takeoff as HeightEnergyTakeoffPhaseBuilder,
-)
-from aviary.mission.flops_based.phases.detailed_landing_phases import (
-    LandingApproachToMicP3 as DetailedLandingApproachToMicP3PhaseBuilder,
-    LandingMicP3ToObstacle as DetailedLandingMicP3ToObstaclePhaseBuilder,
-    LandingObstacleToFlare as DetailedLandingObstacleToFlarePhaseBuilder,
-    LandingFlareToTouchdown as DetailedLandingFlareToTouchdownPhaseBuilder,
-    LandingTouchdownToNoseDown as DetailedLandingTouchdownToNoseDownPhaseBuilder,
-    LandingNoseDownToStop as DetailedLandingNoseDownToStopPhaseBuilder,
-)
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import (
-    TakeoffBrakeReleaseToDecisionSpeed as DetailedTakeoffBrakeReleaseToDecisionSpeedPhaseBuilder,
-    TakeoffDecisionSpeedToRotate as DetailedTakeoffDecisionSpeedToRotatePhaseBuilder,
-    TakeoffDecisionSpeedBrakeDelay as DetailedTakeoffDecisionSpeedBrakeDelayPhaseBuilder,
-    TakeoffRotateToLiftoff as DetailedTakeoffRotateToLiftoffPhaseBuilder,
-    TakeoffLiftoffToObstacle as DetailedTakeoffLiftoffToObstaclePhaseBuilder,
-    TakeoffObstacleToMicP2 as DetailedTakeoffObstacleToMicP2PhaseBuilder,
-    TakeoffMicP2ToEngineCutback as DetailedTakeoffMicP2ToEngineCutbackPhaseBuilder,
-    TakeoffEngineCutback as DetailedTakeoffEngineCutbackPhaseBuilder,
-    TakeoffEngineCutbackToMicP1 as DetailedTakeoffEngineCutbackToMicP1PhaseBuilder,
-    TakeoffMicP1ToClimb as DetailedTakeoffMicP1ToClimbPhaseBuilder,
-    TakeoffBrakeToAbort as DetailedTakeoffBrakeToAbortPhaseBuilder,
-)
 
-# Phase builders
-from aviary.mission.gasp_based.phases.accel_phase import AccelPhase as TwoDOFAccelerationPhase
-from aviary.mission.gasp_based.phases.ascent_phase import AscentPhase as TwoDOFAscentPhase
-from aviary.mission.gasp_based.phases.climb_phase import ClimbPhase as TwoDOFClimbPhase
-from aviary.mission.gasp_based.phases.descent_phase import DescentPhase as TwoDOFDescentPhase
-from aviary.mission.gasp_based.phases.groundroll_phase import (
-    GroundrollPhase as TwoDOFGroundrollPhase,
-)
-from aviary.mission.gasp_based.phases.rotation_phase import RotationPhase as TwoDOFRotationPhase
-
-# Trajectory builders
-from aviary.mission.flops_based.phases.detailed_landing_phases import (
-    LandingTrajectory as DetailedLandingTrajectoryBuilder,
-)
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import (
-    TakeoffTrajectory as DetailedTakeoffTrajectoryBuilder,
-)
-
-##############
-# Subsystems #
-##############
-
-# Aerodynamics
-from aviary.subsystems.aerodynamics.aerodynamics_builder import (
-    AerodynamicsBuilderBase,
-    CoreAerodynamicsBuilder,
-)
-from aviary.subsystems.aerodynamics.flops_based.tabular_aero_group import TabularAeroGroup
-
-# Atmosphere
-from aviary.subsystems.atmosphere.atmosphere import Atmosphere
-
-# Geometry
-from aviary.subsystems.geometry.geometry_builder import GeometryBuilderBase, CoreGeometryBuilder
-
-# Mass
-from aviary.subsystems.mass.mass_builder import MassBuilderBase, CoreMassBuilder
-
-# Propulsion
-from aviary.subsystems.propulsion.engine_deck import EngineDeck
-from aviary.subsystems.propulsion.engine_model import EngineModel
-from aviary.subsystems.propulsion.motor.motor_builder import MotorBuilder
-from aviary.subsystems.propulsion.propulsion_builder import (
-    PropulsionBuilderBase,
-    CorePropulsionBuilder,
-)
-from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
+def __dir__():
+    """List the API names alongside the attributes that have already been loaded."""
+    return sorted(set(globals()) | set(__all__))
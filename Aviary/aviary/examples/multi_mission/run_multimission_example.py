@@ -5,9 +5,12 @@ Multi Mission Optimization Example using Aviary.
 In this example, a monolithic optimization is created by instantiating two aviary groups
 using using multiple add_aviary_group() calls. Once those groups are setup and all of their
 phases are linked together, we then promote GROSS_MASS, RANGE, and wing SWEEP from each of
-those sub-groups (prob.model.mission1 and prob.model.mission2) up to prob.model so
-the optimizer can control them both with a single value. The fuel_burn results from each
-of the mission1 and mission2 are summed and weighted to create the objective function.
+those sub-groups (prob.model.missions.mission1 and prob.model.missions.mission2) up to
+prob.model so the optimizer can control them both with a single value. The fuel_burn results
+from each of the mission1 and mission2 are summed and weighted to create the objective function.
+
+The missions are in a ParallelGroup, so when this example is run under MPI with one processor
+per mission (mpirun -n 2 python run_multimission_example.py), they run at the same time.
 """
 
 import copy as copy
@@ -168,5 +171,5 @@ if __name__ == '__main__':
     # Aircraft.Design.EMPTY_MASS is the final dry mass summation from pre-mission.
     # You can use the following OpenMDAO commends below to list out and compare
     # the each individual mass from every subsystem on the aircraft
-    # prob.model.mission1.list_vars(val=True, units=True, print_arrays=False)
-    # prob.model.mission2.list_vars(val=True, units=True, print_arrays=False)
+    # prob.model.missions.mission1.list_vars(val=True, units=True, print_arrays=False)
+    # prob.model.missions.mission2.list_vars(val=True, units=True, print_arrays=False)
@@ -1,7 +1,5 @@
 """Define meta data associated with variables in the disciplinary data hierarchy."""
 
-from copy import deepcopy
-
 import numpy as np
 
 import aviary.api as av
@@ -17,7 +15,7 @@ from aviary.examples.variables_extension import Aircraft, Mission
 # Sub categories such as AntiIcing and Wing are in 'Big' font
 # ---------------------------
 
-ExtendedMetaData = deepcopy(av.CoreMetaData)
+ExtendedMetaData = av.CoreMetaData.copy()
 
 
 # ================================================================================================================================================================
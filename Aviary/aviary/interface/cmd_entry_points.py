@@ -1,18 +1,9 @@
 import argparse
+import importlib
 import os
 import sys
 
-from aviary.interface.download_models import _exec_hangar, _setup_hangar_parser
-from aviary.interface.graphical_input import _exec_flight_profile, _setup_flight_profile_parser
-from aviary.interface.methods_for_level1 import _exec_level1, _setup_level1_parser
-from aviary.interface.plot_drag_polar import _exec_plot_drag_polar, _setup_plot_drag_polar_parser
-from aviary.interface.test_installation import _exec_installation_test, _setup_installation_test
-from aviary.utils.aero_table_conversion import _exec_ATC, _setup_ATC_parser
-from aviary.utils.engine_deck_conversion import _exec_EDC, _setup_EDC_parser
-from aviary.utils.fortran_to_aviary import _exec_F2A, _setup_F2A_parser
-from aviary.utils.propeller_map_conversion import _exec_PMC, _setup_PMC_parser
-from aviary.visualization.dashboard import _dashboard_cmd, _dashboard_setup_parser
-from aviary.visualization.realtime_plot import _rtplot_cmd, _rtplot_setup_parser
+import aviary
 
 
 def _load_and_exec(script_name, user_args):
@@ -43,62 +34,102 @@ def _load_and_exec(script_name, user_args):
     exec(code, globals_dict)  # nosec: private, internal use only
 
 
+# Each command maps to the module that implements it, the names of its parser setup and
+# executor functions in that module, and its help string. Only the module of the command being
+# run is imported, so a command does not pay the import cost of all the others.
 _command_map = {
     'check': (
-        _setup_installation_test,
-        _exec_installation_test,
+        'aviary.interface.test_installation',
+        '_setup_installation_test',
+        '_exec_installation_test',
         'Verify Aviary installation',
     ),
     'fortran_to_aviary': (
-        _setup_F2A_parser,
-        _exec_F2A,
+        'aviary.utils.fortran_to_aviary',
+        '_setup_F2A_parser',
+        '_exec_F2A',
         'Convert legacy Fortran (FLOPS OR GASP) input file to Aviary input file.',
     ),
-    'run_mission': (_setup_level1_parser, _exec_level1, 'Run Aviary using a provided input deck.'),
+    'run_mission': (
+        'aviary.interface.methods_for_level1',
+        '_setup_level1_parser',
+        '_exec_level1',
+        'Run Aviary using a provided input deck.',
+    ),
     'draw_mission': (
-        _setup_flight_profile_parser,
-        _exec_flight_profile,
+        'aviary.interface.graphical_input',
+        '_setup_flight_profile_parser',
+        '_exec_flight_profile',
         'Open the mission profile drawing GUI.',
     ),
     'dashboard': (
-        _dashboard_setup_parser,
-        _dashboard_cmd,
+        'aviary.visualization.dashboard',
+        '_dashboard_setup_parser',
+        '_dashboard_cmd',
         'Open the results dashboard for a provided Aviary run.',
     ),
     'hangar': (
-        _setup_hangar_parser,
-        _exec_hangar,
-        'Copy aircraft and engine models included with Aviary to specified folder. Allows users'
-        'who did not install Aviary locally to still access model files.',
+        'aviary.interface.download_models',
+        '_setup_hangar_parser',
+        '_exec_hangar',
+        (
+            'Copy aircraft and engine models included with Aviary to specified folder. Allows '
+            'users who did not install Aviary locally to still access model files.'
+        ),
     ),
     'convert_engine': (
-        _setup_EDC_parser,
-        _exec_EDC,
+        'aviary.utils.engine_deck_conversion',
+        '_setup_EDC_parser',
+        '_exec_EDC',
         'Convert FLOPS- or GASP-formatted engine decks into Aviary csv format.',
     ),
     'convert_aero_table': (
-        _setup_ATC_parser,
-        _exec_ATC,
+        'aviary.utils.aero_table_conversion',
+        '_setup_ATC_parser',
+        '_exec_ATC',
         'Convert FLOPS- or GASP-formatted aero data files into Aviary csv format.',
     ),
     'convert_prop_table': (
-        _setup_PMC_parser,
-        _exec_PMC,
+        'aviary.utils.propeller_map_conversion',
+        '_setup_PMC_parser',
+        '_exec_PMC',
         'Convert GASP-formatted propeller map file into Aviary csv format.',
     ),
     'plot_drag_polar': (
-        _setup_plot_drag_polar_parser,
-        _exec_plot_drag_polar,
+        'aviary.interface.plot_drag_polar',
+        '_setup_plot_drag_polar_parser',
+        '_exec_plot_drag_polar',
         'Plot a Drag Polar Graph using a provided polar data csv input.',
     ),
     'rtplot': (
-        _rtplot_setup_parser,
-        _rtplot_cmd,
+        'aviary.visualization.realtime_plot',
+        '_rtplot_setup_parser',
+        '_rtplot_cmd',
         'Run a script and show a real-time plot of the optimization progress.',
     ),
 }
 
 
+def _load_command(name):
+    """
+    Import the module implementing a command.
+
+    Parameters
+    ----------
+    name : str
+        The name of the command.
+
+    Returns
+    -------
+    tuple of (callable, callable)
+        The parser setup function and the executor function of the command.
+    """
+    module_name, setup_func_name, executor_name, _ = _command_map[name]
+    module = importlib.import_module(module_name)
+
+    return getattr(module, setup_func_name), getattr(module, executor_name)
+
+
 def aviary_cmd():
     """Run an 'aviary' sub-command or list help info for 'aviary' command or sub-commands."""
     # pre-parse sys.argv to split between before and after '--'
@@ -123,13 +154,17 @@ def aviary_cmd():
     # Adding the --version argument
     parser.add_argument('--version', action='store_true', help='show version and exit')
 
+    args = [a for a in sys.argv[1:] if not a.startswith('-')]
+
     subs = parser.add_subparsers(title='Tools', metavar='', dest='subparser_name')
-    for p, (parser_setup_func, executor, help_str) in sorted(_command_map.items()):
+    for p, (_, _, _, help_str) in sorted(_command_map.items()):
         subp = subs.add_parser(p, help=help_str)
-        parser_setup_func(subp)
-        subp.set_defaults(executor=executor)
 
-    args = [a for a in sys.argv[1:] if not a.startswith('-')]
+        # only the requested command needs its arguments, so only its module is imported
+        if args and args[0] == p:
+            parser_setup_func, executor = _load_command(p)
+            parser_setup_func(subp)
+            subp.set_defaults(executor=executor)
     # '--version', '--dependency_versions')]
     cmdargs = [a for a in sys.argv[1:] if a not in ('-h',)]
 
@@ -0,0 +1,385 @@
+"""
+Evaluation of a batch of candidate aircraft designs in a single pass through a model.
+
+Every value carries a trailing design axis, so a variable of shape (n,) is stored as an
+array of shape (n, num_designs). Components listed in _VECTORIZED_COMPONENTS compute all
+designs at once with their own compute method, because their equations are elementwise.
+Every other component, for example one that branches on input values, is evaluated one
+design at a time.
+
+Only models made of explicit components without iterative nonlinear solvers can be
+evaluated. Options are shared by all designs, so only continuous inputs can vary.
+"""
+
+from copy import deepcopy
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.units import unit_conversion
+
+from aviary.subsystems.premission import CorePreMission
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.named_values import NamedValues, get_items
+from aviary.utils.preprocessors import preprocess_options
+from aviary.utils.test_utils.default_subsystems import get_default_premission_subsystems
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.variables import Aircraft, Mission, Settings
+
+# Components whose compute method is elementwise in a trailing design axis, so that all
+# designs of a batch can be computed at once. test_design_batch.py checks every design of each
+# listed component against its evaluation one design at a time.
+_VECTORIZED_COMPONENTS = frozenset(
+    (
+        'aviary.subsystems.geometry.flops_based.characteristic_lengths.WingCharacteristicLength',
+        'aviary.subsystems.geometry.flops_based.prep_geom._Tail',
+        'aviary.subsystems.geometry.flops_based.prep_geom._Wing',
+        'aviary.subsystems.geometry.flops_based.wetted_area_total.TotalWettedArea',
+        'aviary.subsystems.geometry.flops_based.wing.WingPrelim',
+        'aviary.subsystems.mass.flops_based.air_conditioning.TransportAirCondMass',
+        'aviary.subsystems.mass.flops_based.anti_icing.AntiIcingMass',
+        'aviary.subsystems.mass.flops_based.apu.TransportAPUMass',
+        'aviary.subsystems.mass.flops_based.avionics.TransportAvionicsMass',
+        'aviary.subsystems.mass.flops_based.canard.CanardMass',
+        'aviary.subsystems.mass.flops_based.cargo.CargoMass',
+        'aviary.subsystems.mass.flops_based.cargo_containers.TransportCargoContainersMass',
+        'aviary.subsystems.mass.flops_based.crew.FlightCrewMass',
+        'aviary.subsystems.mass.flops_based.crew.NonFlightCrewMass',
+        'aviary.subsystems.mass.flops_based.electrical.ElectricalMass',
+        'aviary.subsystems.mass.flops_based.empty_margin.EmptyMassMargin',
+        'aviary.subsystems.mass.flops_based.engine_controls.TransportEngineCtrlsMass',
+        'aviary.subsystems.mass.flops_based.engine_oil.TransportEngineOilMass',
+        'aviary.subsystems.mass.flops_based.engine_pod.EnginePodMass',
+        'aviary.subsystems.mass.flops_based.fin.FinMass',
+        'aviary.subsystems.mass.flops_based.fuel_capacity.AuxFuelCapacity',
+        'aviary.subsystems.mass.flops_based.fuel_capacity.FuselageFuelCapacity',
+        'aviary.subsystems.mass.flops_based.fuel_capacity.TotalFuelCapacity',
+        'aviary.subsystems.mass.flops_based.fuel_system.TransportFuelSystemMass',
+        'aviary.subsystems.mass.flops_based.furnishings.TransportFurnishingsGroupMass',
+        'aviary.subsystems.mass.flops_based.fuselage.TransportFuselageMass',
+        'aviary.subsystems.mass.flops_based.horizontal_tail.HorizontalTailMass',
+        'aviary.subsystems.mass.flops_based.hydraulics.TransportHydraulicsGroupMass',
+        'aviary.subsystems.mass.flops_based.instruments.TransportInstrumentMass',
+        'aviary.subsystems.mass.flops_based.landing_gear.LandingGearMass',
+        'aviary.subsystems.mass.flops_based.landing_gear.NoseGearLength',
+        'aviary.subsystems.mass.flops_based.landing_mass.LandingMass',
+        'aviary.subsystems.mass.flops_based.landing_mass.LandingTakeoffMassRatio',
+        'aviary.subsystems.mass.flops_based.mass_summation.EmptyMass',
+        'aviary.subsystems.mass.flops_based.mass_summation.FuelMass',
+        'aviary.subsystems.mass.flops_based.mass_summation.OperatingMass',
+        'aviary.subsystems.mass.flops_based.mass_summation.PropulsionMass',
+        'aviary.subsystems.mass.flops_based.mass_summation.StructureMass',
+        'aviary.subsystems.mass.flops_based.mass_summation.SystemsEquipMass',
+        'aviary.subsystems.mass.flops_based.mass_summation.ZeroFuelMass',
+        'aviary.subsystems.mass.flops_based.misc_engine.EngineMiscMass',
+        'aviary.subsystems.mass.flops_based.nacelle.NacelleMass',
+        'aviary.subsystems.mass.flops_based.paint.PaintMass',
+        'aviary.subsystems.mass.flops_based.passenger_service.PassengerServiceMass',
+        'aviary.subsystems.mass.flops_based.starter.TransportStarterMass',
+        'aviary.subsystems.mass.flops_based.surface_controls.SurfaceControlMass',
+        'aviary.subsystems.mass.flops_based.thrust_reverser.ThrustReverserMass',
+        'aviary.subsystems.mass.flops_based.unusable_fuel.TransportUnusableFuelMass',
+        'aviary.subsystems.mass.flops_based.vertical_tail.VerticalTailMass',
+        'aviary.subsystems.mass.flops_based.wing_common.WingBendingMass',
+        'aviary.subsystems.mass.flops_based.wing_common.WingMiscMass',
+        'aviary.subsystems.mass.flops_based.wing_common.WingShearControlMass',
+        'aviary.subsystems.mass.flops_based.wing_common.WingTotalMass',
+        'aviary.subsystems.propulsion.engine_sizing.SizeEngine',
+    )
+)
+
+
+def _get_source(model, name):
+    """Return the absolute name of the output connected to a variable."""
+    # OpenMDAO does not have a public lookup of the source of a variable
+    return model._resolver.source(name)
+
+
+def _check_model(model):
+    """Raise an error if the model cannot be evaluated as a design batch."""
+    for group in model.system_iter(include_self=True, recurse=True, typ=om.Group):
+        solver = group.nonlinear_solver
+        if solver is not None and not isinstance(solver, om.NonlinearRunOnce):
+            raise ValueError(
+                f'{group.msginfo}: Design batches can only be evaluated for models '
+                f'without iterative nonlinear solvers, but this group uses a '
+                f'{type(solver).__name__}.'
+            )
+
+    for comp in model.system_iter(recurse=True):
+        if isinstance(comp, om.Group):
+            continue
+
+        if not isinstance(comp, om.ExplicitComponent):
+            raise ValueError(
+                f'{comp.msginfo}: Design batches can only be evaluated for models made of '
+                'explicit components.'
+            )
+
+        if any(meta['discrete'] for meta in comp.get_io_metadata(metadata_keys=[]).values()):
+            raise ValueError(
+                f'{comp.msginfo}: Design batches cannot be evaluated for components with '
+                'discrete variables.'
+            )
+
+
+def _is_vectorized(comp):
+    """Return True if the component can compute all designs of a batch at once."""
+    return f'{type(comp).__module__}.{type(comp).__qualname__}' in _VECTORIZED_COMPONENTS
+
+
+def _compute_design(comp, inputs, shapes, index):
+    """Compute a single design of a batch for a component."""
+    outputs = {name: np.zeros(shape) for name, shape in shapes.items()}
+
+    comp.compute({name: val[..., index] for name, val in inputs.items()}, outputs)
+
+    return {name: np.broadcast_to(outputs[name], shape) for name, shape in shapes.items()}
+
+
+def _compute_batch(comp, inputs, shapes, num_designs):
+    """
+    Compute all designs of a batch for a component.
+
+    Parameters
+    ----------
+    comp : ExplicitComponent
+        The component to evaluate.
+    inputs : dict
+        Mapping of the relative name of each input to its values for all designs.
+    shapes : dict
+        Mapping of the relative name of each output to its shape.
+    num_designs : int
+        Number of designs in the batch.
+
+    Returns
+    -------
+    dict
+        Mapping of the relative name of each output to its values for all designs.
+    """
+    if _is_vectorized(comp):
+        outputs = {name: np.zeros(shape + (num_designs,)) for name, shape in shapes.items()}
+
+        try:
+            with np.errstate(all='ignore'):
+                comp.compute(inputs, outputs)
+        except (ValueError, IndexError):
+            # Options that were not checked can lead to code that does not support the
+            # design axis, which numpy rejects when shapes do not match.
+            pass
+        else:
+            return {
+                name: np.broadcast_to(outputs[name], shape + (num_designs,))
+                for name, shape in shapes.items()
+            }
+
+    batch = {name: np.empty(shape + (num_designs,)) for name, shape in shapes.items()}
+
+    for index in range(num_designs):
+        for name, val in _compute_design(comp, inputs, shapes, index).items():
+            batch[name][..., index] = val
+
+    return batch
+
+
+def evaluate_design_batch(prob, design_inputs, outputs):
+    """
+    Evaluate a model for a batch of designs with one pass through its components.
+
+    The problem must be set up, and holds the values of all inputs that are not varied.
+
+    Parameters
+    ----------
+    prob : Problem
+        The problem containing the model to evaluate.
+    design_inputs : NamedValues
+        Values of the inputs that vary between designs, each with the number of designs as
+        its first dimension.
+    outputs : list of str
+        Promoted names of the variables to return.
+
+    Returns
+    -------
+    NamedValues
+        Values of the requested variables, with the number of designs as their first
+        dimension. Variables with a single value per design are returned as 1D arrays.
+    """
+    model = prob.model
+
+    prob.final_setup()
+
+    _check_model(model)
+
+    meta = model.get_io_metadata(
+        iotypes='output', metadata_keys=['units', 'shape'], return_rel_names=False
+    )
+    num_designs = None
+
+    # Values of every variable for all designs, keyed by absolute output name.
+    values = {}
+
+    for abs_name in model.get_io_metadata(
+        iotypes='output', metadata_keys=[], is_indep_var=True, return_rel_names=False
+    ):
+        values[abs_name] = prob.get_val(abs_name)
+
+    for name, (val, units) in get_items(design_inputs):
+        source = _get_source(model, name)
+
+        if source not in values:
+            raise ValueError(
+                f'{model.msginfo}: Design input "{name}" is computed by the model and '
+                'cannot be varied between designs.'
+            )
+
+        val = np.asarray(val, dtype=float)
+
+        if num_designs is None:
+            num_designs = val.shape[0]
+        elif val.shape[0] != num_designs:
+            raise ValueError(
+                f'{model.msginfo}: Design input "{name}" has {val.shape[0]} values, but '
+                f'{num_designs} designs were given for other inputs.'
+            )
+
+        src_units = meta[source]['units']
+        if units is not None and src_units is not None and units != src_units:
+            scale, offset = unit_conversion(units, src_units)
+            val = (val + offset) * scale
+
+        shape = meta[source]['shape']
+        values[source] = np.moveaxis(val.reshape((num_designs,) + shape), 0, -1)
+
+    if num_designs is None:
+        raise ValueError(f'{model.msginfo}: No design inputs were given.')
+
+    for source, val in values.items():
+        if val.shape == meta[source]['shape']:
+            values[source] = np.repeat(val[..., np.newaxis], num_designs, axis=-1)
+
+    for comp in model.system_iter(recurse=True, typ=om.ExplicitComponent):
+        if isinstance(comp, om.IndepVarComp):
+            continue
+
+        inputs = {}
+
+        for name, in_meta in comp.get_io_metadata(
+            iotypes='input', metadata_keys=['units', 'shape']
+        ).items():
+            source = _get_source(model, f'{comp.pathname}.{name}')
+
+            if source not in values:
+                # Feedback connection in a group without an iterative solver. As in
+                # run_model, the current value of the output is used.
+                val = prob.get_val(source)
+                values[source] = np.repeat(val[..., np.newaxis], num_designs, axis=-1)
+
+            val = values[source]
+            src_units = meta[source]['units']
+            units = in_meta['units']
+
+            if units is not None and src_units is not None and units != src_units:
+                scale, offset = unit_conversion(src_units, units)
+                val = (val + offset) * scale
+
+            inputs[name] = val.reshape(in_meta['shape'] + (num_designs,))
+
+        shapes = {
+            name: out_meta['shape']
+            for name, out_meta in comp.get_io_metadata(
+                iotypes='output', metadata_keys=['shape']
+            ).items()
+        }
+
+        batch = _compute_batch(comp, inputs, shapes, num_designs)
+
+        for name, val in batch.items():
+            values[f'{comp.pathname}.{name}'] = val
+
+    results = NamedValues()
+
+    for name in outputs:
+        source = _get_source(model, name)
+        val = np.moveaxis(values[source], -1, 0)
+
+        if val.shape[1:] == (1,):
+            val = val[:, 0]
+
+        results.set_val(name, val.copy(), meta[source]['units'])
+
+    return results
+
+
+def run_premission_batch(aviary_inputs, design_inputs, outputs=None, engine_models=None):
+    """
+    Evaluate the core pre-mission analysis of a batch of aircraft designs.
+
+    A single pre-mission model is built for the aircraft described by aviary_inputs, then
+    all designs are evaluated in one pass through it, without building a problem for each
+    design.
+
+    Parameters
+    ----------
+    aviary_inputs : AviaryValues
+        Options and input values shared by all designs. The pre-mission analysis is built
+        for the mass method given by Settings.MASS_METHOD.
+    design_inputs : NamedValues
+        Values of the inputs that vary between designs, each with the number of designs as
+        its first dimension.
+    outputs : list of str, optional
+        Promoted names of the variables to return. Defaults to the design gross mass and
+        every mass computed by the pre-mission analysis, which includes the operating empty
+        mass.
+    engine_models : list of EngineModel, optional
+        Engine models of the aircraft. Defaults to an engine deck built from
+        aviary_inputs.
+
+    Returns
+    -------
+    NamedValues
+        Values of the requested variables, with the number of designs as their first
+        dimension.
+    """
+    aviary_inputs = deepcopy(aviary_inputs)
+    aviary_inputs.set_val(Settings.VERBOSITY, 0)
+
+    if engine_models is None:
+        engine_models = [build_engine_deck(aviary_inputs)]
+
+    preprocess_options(aviary_inputs, engine_models=engine_models)
+
+    subsystems = get_default_premission_subsystems(
+        aviary_inputs.get_val(Settings.MASS_METHOD), engine_models
+    )
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem(
+        'pre_mission',
+        CorePreMission(aviary_options=aviary_inputs, subsystems=subsystems),
+        promotes_inputs=['*'],
+        promotes_outputs=['*'],
+    )
+
+    setup_model_options(prob, aviary_inputs, engine_models=engine_models)
+
+    prob.setup(check=False)
+
+    prom_names = {
+        meta['prom_name'] for meta in prob.model.get_io_metadata(metadata_keys=[]).values()
+    }
+
+    # only set the values of variables in the model, unknown names are slow to reject
+    for key, (val, units) in get_items(aviary_inputs):
+        if key in prom_names:
+            prob.set_val(key, val, units)
+
+    if outputs is None:
+        outputs = [Mission.Design.GROSS_MASS]
+        for meta in prob.model.get_io_metadata(iotypes='output', metadata_keys=[]).values():
+            prom_name = meta['prom_name']
+            if prom_name.endswith('mass') and prom_name not in outputs:
+                outputs.append(prom_name)
+
+        if Aircraft.Design.OPERATING_MASS not in outputs:
+            outputs.append(Aircraft.Design.OPERATING_MASS)
+
+    return evaluate_design_batch(prob, design_inputs, outputs)
@@ -5,6 +5,7 @@ from pathlib import Path
 import sys
 
 from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.interface.reports import enable_profiling, profile_report
 from aviary.utils.functions import get_path
 from aviary.variable_info.enums import Verbosity
 
@@ -20,6 +21,9 @@ def run_aviary(
     make_plots=True,
     phase_info_parameterization=None,
     verbosity=None,
+    profile=False,
+    reports=True,
+    solution_cache=None,
 ):
     """
     Run the Aviary optimization problem for a specified aircraft configuration and mission.
@@ -54,6 +58,17 @@ def run_aviary(
     verbosity : Verbosity or int, optional
         Sets level of information outputted to the terminal during model execution.
         If provided, overrides verbosity specified in aircraft_data.
+    profile : bool, optional
+        If True, time every component in the model and write a summary of where time was
+        spent to "profile.md" in the reports folder, defaults to False.
+    reports : bool, str, or list of str, optional
+        Reports to generate, passed on to AviaryProblem. 'minimal' only generates the Aviary
+        reports that write small text files, which is meant for batch runs. Defaults to True,
+        which generates the default reports.
+    solution_cache : str or Path, optional
+        Directory of a store of solved problems, used to warm-start the optimization from a
+        stored solution of the same problem and to store the new one. See
+        AviaryProblem.run_aviary_problem.
 
     Returns
     -------
@@ -73,7 +88,7 @@ def run_aviary(
         name = None
 
     # Build problem
-    prob = AviaryProblem(name=name, verbosity=verbosity)
+    prob = AviaryProblem(name=name, verbosity=verbosity, reports=reports)
 
     # Load aircraft and options data from user
     # Allow for user overrides here
@@ -101,24 +116,45 @@ def run_aviary(
 
     prob.setup(verbosity=verbosity)
 
+    if profile:
+        enable_profiling(prob)
+
     prob.run_aviary_problem(
         restart_filename=restart_filename,
         run_driver=run_driver,
         make_plots=make_plots,
         verbosity=verbosity,
+        solution_cache=solution_cache,
     )
 
+    if profile:
+        profile_report(prob)
+
     return prob
 
 
 def run_level_1(
-    input_deck, optimizer='IPOPT', phase_info=None, max_iter=50, verbosity=Verbosity.BRIEF
+    input_deck,
+    optimizer='IPOPT',
+    phase_info=None,
+    max_iter=50,
+    verbosity=Verbosity.BRIEF,
+    profile=False,
+    reports=True,
+    solution_cache=None,
 ):
     """
     This file enables running aviary from the command line with a user specified input deck.
     usage: aviary run_mission [input_deck] [opt_args].
     """
-    kwargs = {'max_iter': max_iter, 'optimizer': optimizer, 'verbosity': Verbosity(verbosity)}
+    kwargs = {
+        'max_iter': max_iter,
+        'optimizer': optimizer,
+        'verbosity': Verbosity(verbosity),
+        'profile': profile,
+        'reports': reports,
+        'solution_cache': solution_cache,
+    }
 
     if isinstance(phase_info, str):
         phase_info_path = get_path(phase_info)
@@ -161,6 +197,25 @@ def _setup_level1_parser(parser):
         help='verbosity settings: 0=quiet, 1=brief, 2=verbose, 3=debug',
         choices=(0, 1, 2, 3),
     )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='time every component and write a per-subsystem summary to reports/profile.md',
+    )
+    parser.add_argument(
+        '--reports',
+        type=str,
+        default=None,
+        help="reports to generate: 'minimal' for only the Aviary text reports (meant for batch "
+        "runs), 'none', or a comma-separated list of report names. Default is all default reports",
+    )
+    parser.add_argument(
+        '--solution_cache',
+        type=str,
+        default=None,
+        help='directory of stored solutions used to warm-start the optimization; the new '
+        'solution is added to it',
+    )
 
 
 def _exec_level1(args, user_args):
@@ -177,4 +232,7 @@ def _exec_level1(args, user_args):
         phase_info=args.phase_info,
         max_iter=args.max_iter,
         verbosity=args.verbosity,
+        profile=args.profile,
+        reports=True if args.reports is None else args.reports,
+        solution_cache=args.solution_cache,
     )
@@ -1,33 +1,30 @@
 import csv
 import json
 import os
+import subprocess
+import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from packaging import version
 
 import dymos as dm
 import numpy as np
 import openmdao
 import openmdao.api as om
-from openmdao.utils.om_warnings import warn_deprecation
 from openmdao.utils.reports_system import _default_reports
 from openmdao.utils.units import convert_units
+from packaging import version
 
 from aviary.core.aviary_group import AviaryGroup
-
+from aviary.interface.reports import minimal_reports
+from aviary.interface.solution_cache import find_cached_solution, store_solution, warm_start
+from aviary.interface.utils import set_warning_format
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import convert_strings_to_data
-from aviary.interface.utils import set_warning_format
 from aviary.utils.merge_variable_metadata import merge_meta_data
-
-from aviary.variable_info.enums import (
-    EquationsOfMotion,
-    LegacyCode,
-    ProblemType,
-    Verbosity,
-)
+from aviary.variable_info.enums import EquationsOfMotion, LegacyCode, ProblemType, Verbosity
 from aviary.variable_info.functions import setup_model_options
 from aviary.variable_info.variable_meta_data import _MetaData as BaseMetaData
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission, Settings
@@ -71,6 +68,12 @@ class AviaryProblem(om.Problem):
             if report not in _default_reports:
                 _default_reports.append(report)
 
+        # reports='minimal' only activates the Aviary reports that write small text files, and
+        # leaves the N2 diagram of the results to the dashboard. This is meant for batch runs.
+        self._minimal_reports = kwargs.get('reports') == 'minimal'
+        if self._minimal_reports:
+            kwargs['reports'] = minimal_reports
+
         super().__init__(**kwargs)
 
         self.timestamp = datetime.now()
@@ -84,6 +87,12 @@ class AviaryProblem(om.Problem):
         self.problem_type = problem_type
         if problem_type == ProblemType.MULTI_MISSION:
             self.model = om.Group()
+            # Each AviaryGroup goes in this ParallelGroup, so that under MPI the missions are
+            # split between the processors and run at the same time. Everything is promoted, so
+            # the missions keep their names in the model (e.g. 'mission1.aircraft:wing:area').
+            self._missions_group = self.model.add_subsystem(
+                'missions', om.ParallelGroup(), promotes=['*']
+            )
         else:
             self.model = AviaryGroup()
             self.aviary_inputs = None
@@ -92,6 +101,8 @@ class AviaryProblem(om.Problem):
 
         self.meta_data = meta_data
 
+        self._report_processes = []
+
     def load_inputs(
         self,
         aircraft_data,
@@ -166,7 +177,6 @@ class AviaryProblem(om.Problem):
 
     def _update_metadata_from_subsystems(self, group):
         """Merge metadata from user-defined subsystems into problem metadata."""
-
         # loop through phase_info and external subsystems
         for phase_name in group.phase_info:
             external_subsystems = group.get_all_subsystems(
@@ -174,8 +184,7 @@ class AviaryProblem(om.Problem):
             )
 
             for subsystem in external_subsystems:
-                meta_data = subsystem.meta_data.copy()
-                self.meta_data = merge_meta_data([self.meta_data, meta_data])
+                self.meta_data = merge_meta_data([self.meta_data, subsystem.meta_data])
 
         # Update the reference to the newly merged meta_data.
         group.meta_data = self.meta_data
@@ -216,11 +225,11 @@ class AviaryProblem(om.Problem):
 
         """
         if self.problem_type is not ProblemType.MULTI_MISSION:
-            ValueError(
+            raise ValueError(
                 'add_aviary_group() should only be called when ProblemType is MULTI_MISSION.'
             )
 
-        sub = self.model.add_subsystem(name, AviaryGroup())
+        sub = self._missions_group.add_subsystem(name, AviaryGroup())
         sub.meta_data = self.meta_data
         sub.load_inputs(
             aircraft_data=aircraft,
@@ -693,8 +702,10 @@ class AviaryProblem(om.Problem):
         ref: float = None,
     ):
         """
-        Add a design variable to the problem as well as initialized a default value for that design variable.
-        The default value can be over-written after setup with prob.set_val()
+        Add a design variable to the problem and initialize its default value.
+
+        The default value can be over-written after setup with prob.set_val().
+
         Parameters
         ----------
         name : string
@@ -781,7 +792,6 @@ class AviaryProblem(om.Problem):
         - Computes a weighted sum: each output is weighted by both the total weights
         - Adds the result as the final objective named `'composite_objective'`, accessible at the top level model.
         """
-
         # There are LOTS of different ways for the users to input str, 2-tuple, or 3-tuple into *args
         # Correct combinations are (output), (output, weight), (model, output), or (model, output, weight).
         # We have to catch every case and advise the user on how to corect their errors and add defaults as needed.
@@ -864,16 +874,16 @@ class AviaryProblem(om.Problem):
             if output == 'fuel_burned':
                 output = Mission.Summary.FUEL_BURNED
                 # default scaling is valid only if this is the only argument and the ref has not yet been set
-                if len(args) == 1 and ref == None:
+                if len(args) == 1 and ref is None:
                     # set a default ref
                     ref = default_ref_values['fuel_burned']
             elif output == 'fuel':
                 output = Mission.Objectives.FUEL
-                if len(args) == 1 and ref == None:
+                if len(args) == 1 and ref is None:
                     ref = default_ref_values['fuel']
             elif output == 'mass':
                 output = Mission.Summary.FINAL_MASS
-                if len(args) == 1 and ref == None:
+                if len(args) == 1 and ref is None:
                     ref = default_ref_values['mass']
             elif output == 'time':
                 output = Mission.Summary.FINAL_TIME
@@ -961,7 +971,6 @@ class AviaryProblem(om.Problem):
         and the weight of the mission it came from.
         - Adds the result as the final objective named `'composite_objective'`, accessible at the top level model.
         """
-
         # Setup mission and output lengths if they are not already given
         if mission_weights is None:
             mission_weights = np.ones(len(missions))
@@ -1051,7 +1060,6 @@ class AviaryProblem(om.Problem):
         var_pairs : list of (str, str)
             Each pair is (input_name_in_group, top_level_name_to_use)
         """
-
         #
         for name, group in self.aviary_groups_dict.items():
             for mission_name in mission_names:
@@ -1059,7 +1067,9 @@ class AviaryProblem(om.Problem):
                     # the group name matches the mission name,
                     # group.promotes(var_pairs)
                     # print("var_pairs",var_pairs)
-                    self.model.promotes(mission_name, inputs=var_pairs)
+                    # the inputs are promoted out of the ParallelGroup of the missions too, so
+                    # the driver sees one variable that is passed to every mission
+                    self._missions_group.promotes(mission_name, inputs=var_pairs)
 
     def setup(self, **kwargs):
         """
@@ -1081,7 +1091,11 @@ class AviaryProblem(om.Problem):
         if self.problem_type == ProblemType.MULTI_MISSION:
             for name, group in self.aviary_groups_dict.items():
                 setup_model_options(
-                    self, group.aviary_inputs, group.meta_data, prefix=name, group=group
+                    self,
+                    group.aviary_inputs,
+                    group.meta_data,
+                    prefix=f'{self._missions_group.name}.{name}',
+                    group=group,
                 )
                 with warnings.catch_warnings():
                     # group.aviary_inputs is already set
@@ -1128,10 +1142,15 @@ class AviaryProblem(om.Problem):
             verbosity = self.verbosity  # defaults to BRIEF
 
         if self.problem_type == ProblemType.MULTI_MISSION:
+            # The guesses are set through the problem rather than the groups, because under MPI
+            # a group only exists on the processors that run it.
+            if parent_prob is None:
+                parent_prob = self
+
             for name, group in self.aviary_groups_dict.items():
                 group.set_initial_guesses(
                     parent_prob=parent_prob,
-                    parent_prefix=parent_prefix,
+                    parent_prefix=f'{parent_prefix}{name}.',
                     verbosity=verbosity,
                 )
 
@@ -1150,6 +1169,8 @@ class AviaryProblem(om.Problem):
         simulate=False,
         make_plots=True,
         verbosity=None,
+        n2=None,
+        solution_cache=None,
     ):
         """
         This function actually runs the Aviary problem, which could be a simulation,
@@ -1176,6 +1197,22 @@ class AviaryProblem(om.Problem):
             If True (default), Dymos html plots will be generated as part of the output.
         verbosity : Verbosity or int, optional
             Controls the level of printouts for this method.
+        n2 : str, optional
+            How the N2 diagram is updated with the results after the run. 'inline' writes it
+            before returning. 'background' writes it from the solution record file in a
+            separate process, so this method returns without waiting for it (see
+            `wait_for_reports`). 'deferred' leaves it to the dashboard, which writes it from the
+            solution record file when opened if it is missing or older than that file. The
+            default is 'deferred' when the problem was created with reports='minimal', and
+            'inline' otherwise. Without a solution record file, which is only written when the
+            driver is run, the N2 diagram is always written inline.
+        solution_cache : str or Path, optional
+            Directory of a store of solved problems. When given, the driver is warm-started
+            from the stored solution of a problem with the same structure (phases, grids,
+            design variables and aircraft options) and the same aircraft inputs, unless a
+            restart_filename is given. Problems with different aircraft inputs start cold. A
+            successful run adds its solution to the store. Not supported for multi-mission
+            problems.
         """
         # `self.verbosity` is "true" verbosity for entire run. `verbosity` is verbosity
         # override for just this method
@@ -1185,6 +1222,16 @@ class AviaryProblem(om.Problem):
         else:
             verbosity = self.verbosity  # defaults to BRIEF
 
+        if n2 is None:
+            n2 = 'deferred' if self._minimal_reports else 'inline'
+        elif n2 not in ('inline', 'background', 'deferred'):
+            raise ValueError(
+                f"n2 must be 'inline', 'background', or 'deferred', but '{n2}' was given."
+            )
+
+        if solution_cache is not None and self.problem_type == ProblemType.MULTI_MISSION:
+            raise ValueError('solution_cache is not supported for multi-mission problems.')
+
         if verbosity >= Verbosity.VERBOSE:  # VERBOSE, DEBUG
             self.final_setup()
             with open(self.get_reports_dir() / 'input_list.txt', 'w') as outfile:
@@ -1202,8 +1249,19 @@ class AviaryProblem(om.Problem):
         if suppress_solver_print:
             self.set_solver_print(level=0)
 
+        record_file = Path(self.get_outputs_dir()) / 'problem_history.db'
+
         # and run mission, and dynamics
         if run_driver:
+            if solution_cache is not None and restart_filename is None:
+                cached_file = find_cached_solution(solution_cache, self)
+
+                if cached_file is not None:
+                    if verbosity >= Verbosity.BRIEF:
+                        print(f'Warm-starting from the stored solution {cached_file}')
+
+                    warm_start(self, cached_file)
+
             self.result = dm.run_problem(
                 self,
                 run_driver=run_driver,
@@ -1220,6 +1278,9 @@ class AviaryProblem(om.Problem):
                 not self.result.success and verbosity <= Verbosity.BRIEF  # QUIET, BRIEF
             ):
                 warnings.warn('\nAviary run failed. See the dashboard for more details.\n')
+
+            if solution_cache is not None and self.result.success:
+                store_solution(solution_cache, self, record_file)
         else:
             self.run_model()
             self.result = self.driver.result
@@ -1227,11 +1288,25 @@ class AviaryProblem(om.Problem):
         # update n2 diagram after run.
         outdir = Path(self.get_reports_dir(force=True))
         outfile = os.path.join(outdir, 'n2.html')
-        om.n2(
-            self,
-            outfile=outfile,
-            show_browser=False,
-        )
+
+        if n2 == 'inline' or not run_driver or not record_file.exists():
+            om.n2(
+                self,
+                outfile=outfile,
+                show_browser=False,
+            )
+        elif n2 == 'background':
+            self._report_processes.append(
+                subprocess.Popen(
+                    [
+                        sys.executable,
+                        '-c',
+                        'from aviary.interface.reports import write_n2_from_record_file; '
+                        f'write_n2_from_record_file({str(record_file)!r}, {outfile!r})',
+                    ],
+                    stdout=subprocess.DEVNULL,
+                )
+            )
 
         if verbosity >= Verbosity.VERBOSE:  # VERBOSE, DEBUG
             with open(Path(self.get_reports_dir()) / 'output_list.txt', 'w') as outfile:
@@ -1242,13 +1317,49 @@ class AviaryProblem(om.Problem):
         if payload_range_bool:
             self.run_payload_range()
 
-    def run_payload_range(self, verbosity=None):
+    def wait_for_reports(self, timeout=None):
+        """
+        Wait for the reports that run_aviary_problem writes in background processes.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait for each background process. The default is to
+            wait until they finish.
+        """
+        while self._report_processes:
+            self._report_processes[0].wait(timeout=timeout)
+            self._report_processes.pop(0)
+
+    def run_payload_range(self, verbosity=None, num_intermediate_points=0, max_workers=1):
         """
         This function runs Payload/Range analysis for the aircraft model.
 
         Assuming that the aircraft model has been sized and the mission has been run and has successfully converged,
         This function will adjust the given phase information by assumming firstly that there is a phase named 'cruise'
         and elongates the duration bounds to allow the optimizer to arrive at a local maximum for the max_fuel_plus_payload and ferry ranges.
+
+        Parameters
+        ----------
+        verbosity : Verbosity or int, optional
+            Controls the level of printouts for this method. If None, uses the value of
+            Settings.VERBOSITY in provided aircraft data.
+        num_intermediate_points : int, optional
+            Number of additional fallout missions to run along each edge of the
+            payload/range envelope that is bounded by fallout missions: between the sizing
+            and max fuel plus payload points (maximum gross mass), and between the max fuel
+            plus payload and ferry points (maximum fuel). Defaults to 0.
+        max_workers : int or None, optional
+            Maximum number of worker processes used to run the fallout missions. If 1
+            (default), or if there is only one fallout mission, all missions are run one
+            after another in this process. If None, the number of processors on the
+            machine is used.
+
+        Returns
+        -------
+        tuple of AviaryProblem or None
+            The max fuel plus payload and ferry fallout problems, if all fallout missions
+            were successful.
         """
         # `self.verbosity` is "true" verbosity for entire run. `verbosity` is verbosity
         # override for just this method
@@ -1306,6 +1417,39 @@ class AviaryProblem(om.Problem):
                 fuel_capacity = float(self.get_val(Aircraft.Fuel.TOTAL_CAPACITY)[0])
                 max_payload = float(self.get_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS)[0])
 
+                design_num_pax = {
+                    'num_first': self.aviary_inputs.get_val(
+                        Aircraft.CrewPayload.Design.NUM_FIRST_CLASS
+                    ),
+                    'num_business': self.aviary_inputs.get_val(
+                        Aircraft.CrewPayload.Design.NUM_BUSINESS_CLASS
+                    ),
+                    'num_tourist': self.aviary_inputs.get_val(
+                        Aircraft.CrewPayload.Design.NUM_TOURIST_CLASS
+                    ),
+                }
+                design_cargo = {
+                    'wing_cargo': int(
+                        self.aviary_inputs.get_val(Aircraft.CrewPayload.WING_CARGO, 'lbm')
+                    ),
+                    'misc_cargo': int(
+                        self.aviary_inputs.get_val(Aircraft.CrewPayload.MISC_CARGO, 'lbm')
+                    ),
+                }
+
+                def _scaled_payload(payload_frac):
+                    """Fallout mission payload, scaled from the design payload."""
+                    payload = {key: int(num * payload_frac) for key, num in design_num_pax.items()}
+                    # Aviary does not currently allow for off-design missions of 0 passengers
+                    if sum(payload.values()) == 0:
+                        payload['num_tourist'] = 1
+                    payload.update({key: mass * payload_frac for key, mass in design_cargo.items()})
+                    return payload
+
+                # fallout missions that define the payload/range envelope, in order of
+                # increasing range, as (point name, fallout_mission arguments)
+                fallout_points = []
+
                 # When a mission is run with a target range significantly shorter than the aircraft's design range,
                 # the "design" mission may not accurately represent the aircraft's sizing requirements. In this scenario,
                 # the aircraft would be sized based on gross mass and operating mass values where adding the full fuel
@@ -1324,89 +1468,131 @@ class AviaryProblem(om.Problem):
 
                     payload_frac = max_fuel_plus_payload_total_payload / max_payload
 
-                    # Calculates Different payload quantities
-                    max_fuel_plus_payload_wing_cargo = (
-                        int(self.aviary_inputs.get_val(Aircraft.CrewPayload.WING_CARGO, 'lbm'))
-                        * payload_frac
-                    )
-                    max_fuel_plus_payload_misc_cargo = (
-                        int(self.aviary_inputs.get_val(Aircraft.CrewPayload.MISC_CARGO, 'lbm'))
-                        * payload_frac
-                    )
-                    max_fuel_plus_payload_num_first = int(
-                        (self.aviary_inputs.get_val(Aircraft.CrewPayload.Design.NUM_FIRST_CLASS))
-                        * payload_frac
-                    )
-                    max_fuel_plus_payload_num_bus = int(
-                        (self.aviary_inputs.get_val(Aircraft.CrewPayload.Design.NUM_BUSINESS_CLASS))
-                        * payload_frac
-                    )
-                    max_fuel_plus_payload_num_tourist = int(
-                        (self.aviary_inputs.get_val(Aircraft.CrewPayload.Design.NUM_TOURIST_CLASS))
-                        * payload_frac
-                    )
-
-                    prob_fallout_max_fuel_plus_payload = self.fallout_mission(
-                        json_filename='payload_range_sizing.json',
-                        num_first=max_fuel_plus_payload_num_first,
-                        num_business=max_fuel_plus_payload_num_bus,
-                        num_tourist=max_fuel_plus_payload_num_tourist,
-                        wing_cargo=max_fuel_plus_payload_wing_cargo,
-                        misc_cargo=max_fuel_plus_payload_misc_cargo,
-                        phase_info=phase_info,
-                    )
-
-                    # Pull the payload and range values from the fallout mission
-                    payload_3 = float(
-                        prob_fallout_max_fuel_plus_payload.get_val(
-                            Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS
-                        )
-                    )
-
-                    range_3 = float(
-                        prob_fallout_max_fuel_plus_payload.get_val(Mission.Summary.RANGE)
-                    )
-
                     prob_3_skip = False
                 else:
                     # If the fuel capacity from the aviary_inputs csv file plus the sized operating mass exceeds the gross mass
                     # the fuel_capacity will be adjusted to equal the difference between the gross mass and the operating mass
                     prob_3_skip = True
                     fuel_capacity = gross_mass - operating_mass
+                    payload_frac = 0.0
+
+                # intermediate points at design gross mass, trading payload for fuel
+                for frac in np.linspace(1.0, payload_frac, num_intermediate_points + 2)[1:-1]:
+                    fallout_points.append(('Intermediate Point', _scaled_payload(frac)))
+
+                if not prob_3_skip:
+                    fallout_points.append(('Max Fuel Plus Payload', _scaled_payload(payload_frac)))
+
+                    # intermediate points at maximum fuel, trading payload for range
+                    for frac in np.linspace(payload_frac, 0.0, num_intermediate_points + 2)[1:-1]:
+                        fallout_points.append(
+                            (
+                                'Intermediate Point',
+                                {
+                                    **_scaled_payload(frac),
+                                    'mission_mass': operating_mass
+                                    + fuel_capacity
+                                    + frac * max_payload,
+                                },
+                            )
+                        )
 
                 # Point 4, ferry mission with maximum fuel and 0 payload
                 max_fuel_zero_payload_payload = operating_mass + fuel_capacity
                 # Aviary does not currently allow for off-design missions of 0 passengers, therefore 1 will be used
-                prob_fallout_ferry = self.fallout_mission(
-                    json_filename='payload_range_sizing.json',
-                    num_first=0,
-                    num_business=0,
-                    num_tourist=1,
-                    num_pax=1,
-                    wing_cargo=0,
-                    misc_cargo=0,
-                    cargo_mass=0,
-                    mission_mass=max_fuel_zero_payload_payload,
-                    phase_info=phase_info,
+                fallout_points.append(
+                    (
+                        'Ferry Mission',
+                        {
+                            'num_first': 0,
+                            'num_business': 0,
+                            'num_tourist': 1,
+                            'num_pax': 1,
+                            'wing_cargo': 0,
+                            'misc_cargo': 0,
+                            'cargo_mass': 0,
+                            'mission_mass': max_fuel_zero_payload_payload,
+                        },
+                    )
                 )
 
-                payload_4 = float(
-                    prob_fallout_ferry.get_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS)
-                )
-                range_4 = float(prob_fallout_ferry.get_val(Mission.Summary.RANGE))
+                ferry_idx = len(fallout_points) - 1
+                max_fuel_plus_payload_idx = ferry_idx if prob_3_skip else num_intermediate_points
+                returned_idxs = (max_fuel_plus_payload_idx, ferry_idx)
 
-                # if problem 3 was skipped, prob_falloout_fuel_plus_payload is redefined so it still exists despite being the same as prob_fallout_ferry
-                if prob_3_skip:
-                    prob_fallout_max_fuel_plus_payload = prob_fallout_ferry
-                    payload_3 = payload_4
-                    range_3 = range_4
+                fallout_results = [None] * len(fallout_points)
+                fallout_probs = {}
+
+                if max_workers == 1 or len(fallout_points) == 1:
+                    for idx, (_, kwargs) in enumerate(fallout_points):
+                        prob_fallout = self.fallout_mission(
+                            json_filename='payload_range_sizing.json',
+                            phase_info=phase_info,
+                            verbosity=verbosity,
+                            **kwargs,
+                        )
+                        fallout_results[idx] = _fallout_result(prob_fallout)
+                        if idx in returned_idxs:
+                            fallout_probs[idx] = prob_fallout
+                else:
+                    # Every fallout mission runs in a worker process. The returned problems
+                    # cannot be sent between processes, so they are set up again here and
+                    # the solutions found by the workers are loaded into them.
+                    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                        futures = {
+                            executor.submit(
+                                _run_fallout_mission,
+                                self._fallout_mission_args(
+                                    json_filename='payload_range_sizing.json',
+                                    phase_info=phase_info,
+                                    verbosity=verbosity,
+                                    **kwargs,
+                                ),
+                                self.driver.options['optimizer'],
+                                self.options,
+                                self.driver.options,
+                                self.driver.opt_settings,
+                                f'{self._name}_payload_range_{idx}',
+                                verbosity,
+                                return_solution=idx in returned_idxs,
+                            ): idx
+                            for idx, (_, kwargs) in enumerate(fallout_points)
+                        }
+
+                        for future in as_completed(futures):
+                            idx = futures[future]
+                            if idx not in returned_idxs:
+                                fallout_results[idx] = future.result()
+                                continue
+
+                            fallout_results[idx], solution, result = future.result()
+                            fallout_probs[idx] = self.fallout_mission(
+                                run_mission=False,
+                                json_filename='payload_range_sizing.json',
+                                phase_info=phase_info,
+                                verbosity=verbosity,
+                                **fallout_points[idx][1],
+                            )
+                            _load_fallout_solution(fallout_probs[idx], solution, result)
 
                 # Check if fallout missions ran successfully before writing to csv file
-                # If both missions ran successfully, writes the payload/range data to a csv file
-                if (
-                    prob_fallout_ferry.result.success
-                    and prob_fallout_max_fuel_plus_payload.result.success
-                ):
+                # If all missions ran successfully, writes the payload/range data to a csv file
+                if all(success for _, _, success in fallout_results):
+                    self.payload_range_data = [
+                        ('Max Payload Zero Fuel', payload_1, range_1),
+                        ('Max Payload Plus Fuel', payload_2, range_2),
+                    ]
+                    for (point_name, _), (payload, mission_range, _) in zip(
+                        fallout_points, fallout_results
+                    ):
+                        self.payload_range_data.append((point_name, payload, mission_range))
+
+                    # if problem 3 was skipped, the ferry mission is also the max fuel plus payload point
+                    if prob_3_skip:
+                        self.payload_range_data.insert(
+                            -1, ('Max Fuel Plus Payload', *self.payload_range_data[-1][1:])
+                        )
+
                     # TODO Temporary csv writing for payload/range data, should be replaced with a more robust solution
                     csv_filepath = Path(self.get_reports_dir()) / 'payload_range_data.csv'
                     with open(csv_filepath, 'w', newline='') as csvfile:
@@ -1415,30 +1601,25 @@ class AviaryProblem(om.Problem):
                         # Write header row
                         writer.writerow(['Point', 'Payload (lbs)', 'Range (NM)'])
 
-                        # Write the four points directly
-                        writer.writerow(['Max Payload Zero Fuel', payload_1, range_1])
-                        writer.writerow(['Max Payload Plus Fuel', payload_2, range_2])
-                        writer.writerow(['Max Fuel Plus Payload', payload_3, range_3])
-                        writer.writerow(['Ferry Mission', payload_4, range_4])
+                        # Write the points in order of increasing range
+                        writer.writerows(self.payload_range_data)
 
                     # Prints the payload/range data to the console if verbosity is set to VERBOSE or DEBUG
                     if verbosity >= Verbosity.VERBOSE:
-                        payload_points = [
-                            'Payload (lbs)',
-                            payload_1,
-                            payload_2,
-                            payload_3,
-                            payload_4,
+                        payload_points = ['Payload (lbs)'] + [
+                            payload for _, payload, _ in self.payload_range_data
+                        ]
+                        range_points = ['Range (NM)'] + [
+                            mission_range for _, _, mission_range in self.payload_range_data
                         ]
-                        range_points = ['Range (NM)', range_1, range_2, range_3, range_4]
 
                         print(range_points)
                         print(payload_points)
 
-                    return (prob_fallout_max_fuel_plus_payload, prob_fallout_ferry)
+                    return (fallout_probs[max_fuel_plus_payload_idx], fallout_probs[ferry_idx])
                 else:
                     warnings.warn(
-                        'One or both of the fallout missions did not run successfully; payload/range diagram was not generated.'
+                        'One or more of the fallout missions did not run successfully; payload/range diagram was not generated.'
                     )
             else:
                 warnings.warn(
@@ -1498,37 +1679,24 @@ class AviaryProblem(om.Problem):
         # TODO: these self.aviary_inputs methods will need to be updated
         mass_method = self.aviary_inputs.get_val(Settings.MASS_METHOD)
         equations_of_motion = self.aviary_inputs.get_val(Settings.EQUATIONS_OF_MOTION)
-        if mass_method == LegacyCode.FLOPS:
-            if num_first is None or num_business is None or num_tourist is None:
-                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                    warnings.warn(
-                        'Incomplete PAX numbers for FLOPS fallout - assume same as design'
-                    )
-                num_first = self.aviary_inputs.get_val(Aircraft.CrewPayload.Design.NUM_FIRST_CLASS)
-                num_business = self.aviary_inputs.get_val(
-                    Aircraft.CrewPayload.Design.NUM_BUSINESS_CLASS
-                )
-                num_tourist = self.aviary_inputs.get_val(
-                    Aircraft.CrewPayload.Design.NUM_TOURIST_CLASS
-                )
-            if wing_cargo is None or misc_cargo is None:
-                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                    warnings.warn(
-                        'Incomplete Cargo masses for FLOPS fallout - assume same as design'
-                    )
-                wing_cargo = self.aviary_inputs.get_val(Aircraft.CrewPayload.WING_CARGO, 'lbm')
-                misc_cargo = self.aviary_inputs.get_val(Aircraft.CrewPayload.MISC_CARGO, 'lbm')
-            num_pax = cargo_mass = 0
-        elif mass_method == LegacyCode.GASP:
-            if num_pax is None:
-                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                    warnings.warn('Unspecified PAX number for GASP fallout - assume same as design')
-                num_pax = self.aviary_inputs.get_val(Aircraft.CrewPayload.Design.NUM_PASSENGERS)
-            if cargo_mass is None:
-                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                    warnings.warn('Unspecified Cargo mass for GASP fallout - assume same as design')
-                cargo_mass = self.get_val(Aircraft.CrewPayload.CARGO_MASS, 'lbm')
-            num_first = num_business = num_tourist = wing_cargo = misc_cargo = 0
+        (
+            num_first,
+            num_business,
+            num_tourist,
+            num_pax,
+            wing_cargo,
+            misc_cargo,
+            cargo_mass,
+        ) = self._get_off_design_payload(
+            num_first,
+            num_business,
+            num_tourist,
+            num_pax,
+            wing_cargo,
+            misc_cargo,
+            cargo_mass,
+            verbosity,
+        )
 
         if phase_info is None:
             # model.phase_info only contains mission information
@@ -1545,7 +1713,7 @@ class AviaryProblem(om.Problem):
             elif mass_method == LegacyCode.FLOPS:
                 try:
                     mission_range = self.model.post_mission_info['target_range'][0]
-                except:
+                except Exception:
                     mission_range = self.get_val(Mission.Design.RANGE)[0]
 
         # gross mass is sliced from a column vector numpy array, i.e. it is a len 1 numpy
@@ -1571,15 +1739,14 @@ class AviaryProblem(om.Problem):
         )
 
         # TODO: All these methods will need to be updated
-        prob_alternate.check_and_preprocess_inputs()
-        prob_alternate.build_model()
-        prob_alternate.add_driver(optimizer, verbosity=verbosity)
-        prob_alternate.options = self.options
-        prob_alternate.driver.options = self.driver.options
-        prob_alternate.driver.opt_settings = self.driver.opt_settings
-        prob_alternate.add_design_variables()
-        prob_alternate.add_objective()
-        prob_alternate.setup()
+        _setup_off_design(
+            prob_alternate,
+            optimizer,
+            self.options,
+            self.driver.options,
+            self.driver.opt_settings,
+            verbosity,
+        )
         if run_mission:
             prob_alternate.run_aviary_problem()
         return prob_alternate
@@ -1627,8 +1794,282 @@ class AviaryProblem(om.Problem):
         else:
             verbosity = self.verbosity  # defaults to BRIEF
 
+        prob_fallout = _load_off_design(
+            *self._fallout_mission_args(
+                json_filename,
+                num_first,
+                num_business,
+                num_tourist,
+                num_pax,
+                wing_cargo,
+                misc_cargo,
+                cargo_mass,
+                mission_mass,
+                phase_info,
+                verbosity,
+            ),
+            verbosity=verbosity,
+        )
+
+        _setup_off_design(
+            prob_fallout,
+            self.driver.options['optimizer'],
+            self.options,
+            self.driver.options,
+            self.driver.opt_settings,
+            verbosity,
+        )
+        if run_mission:
+            prob_fallout.run_aviary_problem()
+        return prob_fallout
+
+    def _fallout_mission_args(
+        self,
+        json_filename='sizing_problem.json',
+        num_first=None,
+        num_business=None,
+        num_tourist=None,
+        num_pax=None,
+        wing_cargo=None,
+        misc_cargo=None,
+        cargo_mass=None,
+        mission_mass=None,
+        phase_info=None,
+        verbosity=Verbosity.BRIEF,
+    ):
+        """
+        Fill in the defaults of a fallout mission from the sizing problem.
+
+        Returns
+        -------
+        tuple
+            Positional arguments of _load_off_design() for the fallout mission.
+        """
         mass_method = self.aviary_inputs.get_val(Settings.MASS_METHOD)
         equations_of_motion = self.aviary_inputs.get_val(Settings.EQUATIONS_OF_MOTION)
+        payload = self._get_off_design_payload(
+            num_first,
+            num_business,
+            num_tourist,
+            num_pax,
+            wing_cargo,
+            misc_cargo,
+            cargo_mass,
+            verbosity,
+        )
+
+        if phase_info is None:
+            # Somewhere between the sizing and off-design self.pre_mission_info gets deleted
+            phase_info = self.model.phase_info
+            phase_info['pre_mission'] = self.model.pre_mission_info
+            phase_info['post_mission'] = self.model.post_mission_info
+        if mission_mass is None:
+            # mission mass is sliced from a column vector numpy array, i.e. it is a len 1
+            # numpy array
+            mission_mass = self.get_val(Mission.Design.GROSS_MASS)[0]
+        elif mission_mass > self.get_val(Mission.Design.GROSS_MASS)[0]:
+            raise ValueError(
+                f'Fallout Mission aircraft gross mass {mission_mass} lbm cannot be greater than Mission.Design.GROSS_MASS {self.get_val(Mission.Design.GROSS_MASS)[0]}'
+            )
+
+        return (
+            json_filename,
+            ProblemType.FALLOUT,
+            equations_of_motion,
+            mass_method,
+            phase_info,
+            *payload,
+            None,
+            mission_mass,
+        )
+
+    def run_off_design_sweep(
+        self,
+        points,
+        workers=1,
+        json_filename='sizing_problem.json',
+        output_file='off_design_sweep.csv',
+        phase_info=None,
+        verbosity=None,
+    ):
+        """
+        Run a batch of off-design missions of the sized aircraft.
+
+        Each point is a dict of arguments to alternate_mission() (if it contains
+        'mission_range') or fallout_mission() (if it contains 'mission_mass'). Points
+        that share a problem type and payload are sorted by range or takeoff mass and
+        split into contiguous chunks, one per worker. Each chunk sets up a single
+        off-design problem that is re-run for every point in the chunk, starting from
+        the solution of the previous (nearest) point.
+
+        Parameters
+        ----------
+        points : list of dict
+            Off-design missions to run. Each dict contains either 'mission_range' (NM)
+            or 'mission_mass' (lbm), and optionally any of the payload arguments of
+            alternate_mission() and fallout_mission(). Payload quantities that are not
+            given are the same as the design.
+        workers : int or None, optional
+            Maximum number of processes used to run the missions. If 1 (default), all
+            missions are run in this process. If None, the number of processors on the
+            machine is used.
+        json_filename : str, optional
+            Name of the file that the sizing mission is saved to before running the
+            sweep.
+        output_file : str or Path, optional
+            CSV file that results are written to, relative to the reports directory of
+            this problem. Results are written as each chunk finishes. If None, no file is
+            written.
+        phase_info : dict, optional
+            Dictionary containing the phases and their required parameters.
+        verbosity : Verbosity or int, optional
+            Controls the level of printouts for this method. If None, uses the value of
+            Settings.VERBOSITY in provided aircraft data.
+
+        Returns
+        -------
+        list of dict
+            Results of each point, in the order the points were given.
+        """
+        # `self.verbosity` is "true" verbosity for entire run. `verbosity` is verbosity
+        # override for just this method
+        if verbosity is not None:
+            # compatibility with being passed int for verbosity
+            verbosity = Verbosity(verbosity)
+        else:
+            verbosity = self.verbosity  # defaults to BRIEF
+
+        if phase_info is None:
+            phase_info = self.model.phase_info
+            phase_info['pre_mission'] = self.model.pre_mission_info
+            phase_info['post_mission'] = self.model.post_mission_info
+
+        if output_file is not None and Path(output_file).suffix != '.csv':
+            raise ValueError(
+                f'Off-design sweep results can only be written to a .csv file, not "{output_file}"'
+            )
+
+        design_gross_mass = self.get_val(Mission.Design.GROSS_MASS, 'lbm')[0]
+
+        # group points that can share an off-design model, by problem type and payload
+        groups = {}
+        for idx, point in enumerate(points):
+            point = point.copy()
+            mission_range = point.pop('mission_range', None)
+            mission_mass = point.pop('mission_mass', None)
+
+            if (mission_range is None) == (mission_mass is None):
+                raise ValueError(
+                    f'Off-design point {idx} must specify exactly one of "mission_range" '
+                    'or "mission_mass"'
+                )
+
+            if mission_range is not None:
+                problem_type = ProblemType.ALTERNATE
+                value = mission_range
+            else:
+                problem_type = ProblemType.FALLOUT
+                value = mission_mass
+                if mission_mass > design_gross_mass:
+                    raise ValueError(
+                        f'Fallout Mission aircraft gross mass {mission_mass} lbm cannot be '
+                        f'greater than Mission.Design.GROSS_MASS {design_gross_mass}'
+                    )
+
+            payload = tuple(
+                float(np.squeeze(quantity))
+                for quantity in self._get_off_design_payload(**point, verbosity=verbosity)
+            )
+            groups.setdefault((problem_type, payload), []).append((value, idx))
+
+        self.save_sizing_to_json(json_filename)
+
+        if workers is None:
+            workers = os.cpu_count()
+
+        chunks = []
+        for (problem_type, payload), group_points in groups.items():
+            group_points.sort()
+            num_chunks = min(workers, len(group_points))
+            for chunk in np.array_split(np.arange(len(group_points)), num_chunks):
+                chunks.append((problem_type, payload, [group_points[i] for i in chunk]))
+
+        args = (
+            json_filename,
+            self.aviary_inputs.get_val(Settings.EQUATIONS_OF_MOTION),
+            self.aviary_inputs.get_val(Settings.MASS_METHOD),
+            phase_info,
+            design_gross_mass,
+            self.driver.options['optimizer'],
+            self.options,
+            self.driver.options,
+            self.driver.opt_settings,
+        )
+
+        if output_file is not None:
+            output_file = Path(self.get_reports_dir(force=True)) / output_file
+            if output_file.exists():
+                output_file.unlink()
+
+        results = []
+
+        def _collect(rows):
+            if output_file is not None:
+                with open(output_file, 'a', newline='') as csvfile:
+                    writer = csv.DictWriter(csvfile, fieldnames=rows[0].keys())
+                    if csvfile.tell() == 0:
+                        writer.writeheader()
+                    writer.writerows(rows)
+            results.extend(rows)
+
+        if workers == 1:
+            for chunk_idx, chunk in enumerate(chunks):
+                _collect(
+                    _run_off_design_points(
+                        *chunk, *args, f'{self._name}_off_design_{chunk_idx}', verbosity
+                    )
+                )
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _run_off_design_points,
+                        *chunk,
+                        *args,
+                        f'{self._name}_off_design_{chunk_idx}',
+                        verbosity,
+                    )
+                    for chunk_idx, chunk in enumerate(chunks)
+                ]
+                for future in as_completed(futures):
+                    _collect(future.result())
+
+        results.sort(key=lambda row: row['Point'])
+
+        return results
+
+    def _get_off_design_payload(
+        self,
+        num_first=None,
+        num_business=None,
+        num_tourist=None,
+        num_pax=None,
+        wing_cargo=None,
+        misc_cargo=None,
+        cargo_mass=None,
+        verbosity=Verbosity.BRIEF,
+    ):
+        """
+        Fill in the payload of an off-design mission, using the design payload for any
+        quantities that are not given. Quantities not used by the mass method are zeroed.
+
+        Returns
+        -------
+        tuple
+            num_first, num_business, num_tourist, num_pax, wing_cargo, misc_cargo, and
+            cargo_mass of the off-design mission.
+        """
+        mass_method = self.aviary_inputs.get_val(Settings.MASS_METHOD)
         if mass_method == LegacyCode.FLOPS:
             if num_first is None or num_business is None or num_tourist is None:
                 if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
@@ -1661,28 +2102,7 @@ class AviaryProblem(om.Problem):
                 cargo_mass = self.get_val(Aircraft.CrewPayload.CARGO_MASS, 'lbm')
             num_first = num_business = num_tourist = wing_cargo = misc_cargo = 0
 
-        if phase_info is None:
-            # Somewhere between the sizing and off-design self.pre_mission_info gets deleted
-            phase_info = self.model.phase_info
-            phase_info['pre_mission'] = self.model.pre_mission_info
-            phase_info['post_mission'] = self.model.post_mission_info
-        if mission_mass is None:
-            # mission mass is sliced from a column vector numpy array, i.e. it is a len 1
-            # numpy array
-            mission_mass = self.get_val(Mission.Design.GROSS_MASS)[0]
-        elif mission_mass > self.get_val(Mission.Design.GROSS_MASS)[0]:
-            raise ValueError(
-                f'Fallout Mission aircraft gross mass {mission_mass} lbm cannot be greater than Mission.Design.GROSS_MASS {self.get_val(Mission.Design.GROSS_MASS)[0]}'
-            )
-
-        optimizer = self.driver.options['optimizer']
-
-        prob_fallout = _load_off_design(
-            json_filename,
-            ProblemType.FALLOUT,
-            equations_of_motion,
-            mass_method,
-            phase_info,
+        return (
             num_first,
             num_business,
             num_tourist,
@@ -1690,24 +2110,8 @@ class AviaryProblem(om.Problem):
             wing_cargo,
             misc_cargo,
             cargo_mass,
-            None,
-            mission_mass,
-            verbosity=verbosity,
         )
 
-        prob_fallout.check_and_preprocess_inputs()
-        prob_fallout.build_model()
-        prob_fallout.add_driver(optimizer, verbosity=verbosity)
-        prob_fallout.options = self.options
-        prob_fallout.driver.options = self.driver.options
-        prob_fallout.driver.opt_settings = self.driver.opt_settings
-        prob_fallout.add_design_variables()
-        prob_fallout.add_objective()
-        prob_fallout.setup()
-        if run_mission:
-            prob_fallout.run_aviary_problem()
-        return prob_fallout
-
     def save_sizing_to_json(self, json_filename='sizing_problem.json'):
         """
         This function saves an aviary problem object into a json file.
@@ -1747,7 +2151,7 @@ class AviaryProblem(om.Problem):
                         type_value = list
 
                     # Lists are fine except if they contain enums or Paths
-                    if type_value == list:
+                    if type_value is list:
                         if isinstance(value[0], Enum):
                             for i in range(len(value)):
                                 value[i] = value[i].name
@@ -1913,6 +2317,7 @@ def _load_off_design(
     mission_range=None,
     mission_gross_mass=None,
     verbosity=Verbosity.BRIEF,
+    name=None,
 ):
     """
     This function loads a sized aircraft, and sets up an aviary problem
@@ -1951,13 +2356,15 @@ def _load_off_design(
         Aircraft takeoff gross mass for off-design mission, in lbm
     verbosity : Verbosity or list, optional
         Controls the level of printouts for this method.
+    name : str, optional
+        Name of the new problem. If None, OpenMDAO generates a name.
 
     Returns
     -------
     Aviary Problem object with completed load_inputs() for specified off design mission
     """
     # Initialize a new aviary problem and aviary_input data structure
-    prob = AviaryProblem()
+    prob = AviaryProblem(name=name)
     prob.aviary_inputs = AviaryValues()
 
     prob = _read_sizing_json(prob, json_filename)
@@ -2019,3 +2426,253 @@ def _load_off_design(
     # Load inputs
     prob.load_inputs(prob.aviary_inputs, phase_info)
     return prob
+
+
+def _setup_off_design(
+    prob, optimizer, problem_options, driver_options, opt_settings, verbosity=Verbosity.BRIEF
+):
+    """
+    Build and set up an off-design problem returned by _load_off_design(), using the
+    driver settings of the sizing problem.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Off-design problem with loaded inputs.
+    optimizer : str
+        Name of the optimizer used by the sizing problem.
+    problem_options : OptionsDictionary
+        Options of the sizing problem.
+    driver_options : OptionsDictionary
+        Driver options of the sizing problem.
+    opt_settings : dict
+        Optimizer settings of the sizing problem.
+    verbosity : Verbosity or int, optional
+        Controls the level of printouts for this function.
+    """
+    prob.check_and_preprocess_inputs()
+    prob.build_model()
+    prob.add_driver(optimizer, verbosity=verbosity)
+    prob.options = problem_options
+    prob.driver.options = driver_options
+    prob.driver.opt_settings = opt_settings
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+
+
+def _fallout_result(prob):
+    """Return the payload mass (lbm), range (NM), and success of a fallout problem."""
+    return (
+        float(prob.get_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 'lbm')[0]),
+        float(prob.get_val(Mission.Summary.RANGE, 'NM')[0]),
+        prob.result.success,
+    )
+
+
+def _fallout_solution(prob):
+    """
+    Solved variable values and driver result of a fallout problem that has been run, in a
+    form that can be sent between processes and loaded with _load_fallout_solution().
+    """
+    solution = {
+        'inputs': prob.model.list_inputs(
+            out_stream=None, units=True, prom_name=True, return_format='dict'
+        ),
+        'outputs': prob.model.list_outputs(
+            out_stream=None, units=True, prom_name=True, return_format='dict'
+        ),
+    }
+    result = {key: val for key, val in vars(prob.result).items() if not key.startswith('_')}
+
+    return solution, result
+
+
+def _load_fallout_solution(prob, solution, result):
+    """
+    Load the solution of a fallout mission returned by _fallout_solution() into a set up
+    fallout problem that has not been run.
+    """
+    prob.final_setup()
+    prob.load_case(solution)
+
+    for key, val in result.items():
+        setattr(prob.driver.result, key, val)
+    prob.result = prob.driver.result
+
+
+def _run_fallout_mission(
+    off_design_args,
+    optimizer,
+    problem_options,
+    driver_options,
+    opt_settings,
+    name,
+    verbosity=Verbosity.BRIEF,
+    return_solution=False,
+):
+    """
+    Build and run a fallout mission from a saved sizing problem. Used to run
+    payload/range missions in separate processes.
+
+    Parameters
+    ----------
+    off_design_args : tuple
+        Positional arguments of _load_off_design(), as returned by
+        AviaryProblem._fallout_mission_args().
+    optimizer : str
+        Name of the optimizer used by the sizing problem.
+    problem_options : OptionsDictionary
+        Options of the sizing problem.
+    driver_options : OptionsDictionary
+        Driver options of the sizing problem.
+    opt_settings : dict
+        Optimizer settings of the sizing problem.
+    name : str
+        Name of the fallout problem, which must be unique between processes.
+    verbosity : Verbosity or int, optional
+        Controls the level of printouts for this function.
+    return_solution : bool, optional
+        If True, also return the solution of the mission, as returned by
+        _fallout_solution().
+
+    Returns
+    -------
+    tuple of (float, float, bool)
+        Payload mass (lbm), range (NM), and whether the mission ran successfully.
+    dict
+        Solved inputs and outputs of the model. Only returned if return_solution is True.
+    dict
+        Attributes of the driver result. Only returned if return_solution is True.
+    """
+    verbosity = Verbosity(verbosity)
+
+    prob_fallout = _load_off_design(*off_design_args, verbosity=verbosity, name=name)
+    _setup_off_design(
+        prob_fallout, optimizer, problem_options, driver_options, opt_settings, verbosity
+    )
+    prob_fallout.run_aviary_problem()
+
+    if return_solution:
+        return (_fallout_result(prob_fallout), *_fallout_solution(prob_fallout))
+
+    return _fallout_result(prob_fallout)
+
+
+def _run_off_design_points(
+    problem_type,
+    payload,
+    points,
+    json_filename,
+    equations_of_motion,
+    mass_method,
+    phase_info,
+    design_gross_mass,
+    optimizer,
+    problem_options,
+    driver_options,
+    opt_settings,
+    name,
+    verbosity=Verbosity.BRIEF,
+):
+    """
+    Run a series of off-design missions of the same problem type and payload, reusing
+    one off-design problem. Each mission starts from the solution of the previous one.
+    Used by AviaryProblem.run_off_design_sweep(), possibly in a separate process.
+
+    Parameters
+    ----------
+    problem_type : ProblemType
+        ALTERNATE, where points are ranges in NM, or FALLOUT, where points are takeoff
+        masses in lbm.
+    payload : tuple
+        num_first, num_business, num_tourist, num_pax, wing_cargo, misc_cargo, and
+        cargo_mass of the missions.
+    points : list of (float, int)
+        Range or takeoff mass of each mission, and the index of the point in the sweep.
+    json_filename : str
+        Name of the file that the sizing mission has been saved to.
+    equations_of_motion : EquationsOfMotion
+        Which equations of motion will be used for the off-design missions.
+    mass_method : LegacyCode
+        Which legacy code mass method will be used (GASP or FLOPS).
+    phase_info : dict
+        Dictionary containing the phases and their required parameters.
+    design_gross_mass : float
+        Design gross mass of the sized aircraft, in lbm.
+    optimizer : str
+        Name of the optimizer used by the sizing problem.
+    problem_options : OptionsDictionary
+        Options of the sizing problem.
+    driver_options : OptionsDictionary
+        Driver options of the sizing problem.
+    opt_settings : dict
+        Optimizer settings of the sizing problem.
+    name : str
+        Name of the off-design problem, which must be unique between processes.
+    verbosity : Verbosity or int, optional
+        Controls the level of printouts for this function.
+
+    Returns
+    -------
+    list of dict
+        Results of each mission.
+    """
+    verbosity = Verbosity(verbosity)
+    num_first, num_business, num_tourist, num_pax, wing_cargo, misc_cargo, cargo_mass = payload
+
+    value, _ = points[0]
+    if problem_type == ProblemType.ALTERNATE:
+        # gross mass is only used as the initial guess of the design variable
+        mission_range = value
+        mission_gross_mass = design_gross_mass
+    else:
+        mission_range = None
+        mission_gross_mass = value
+
+    prob = _load_off_design(
+        json_filename,
+        problem_type,
+        equations_of_motion,
+        mass_method,
+        phase_info,
+        int(num_first),
+        int(num_business),
+        int(num_tourist),
+        int(num_pax),
+        wing_cargo,
+        misc_cargo,
+        cargo_mass,
+        mission_range,
+        mission_gross_mass,
+        verbosity=verbosity,
+        name=name,
+    )
+
+    _setup_off_design(prob, optimizer, problem_options, driver_options, opt_settings, verbosity)
+
+    rows = []
+    for value, idx in points:
+        if problem_type == ProblemType.ALTERNATE:
+            prob.set_val('target_range', value, units='NM')
+        else:
+            prob.set_val(Mission.Summary.GROSS_MASS, value, units='lbm')
+
+        # the N2 of the off-design problem does not change between points
+        prob.run_aviary_problem(make_plots=False, verbosity=verbosity, n2='deferred')
+
+        rows.append(
+            {
+                'Point': idx,
+                'Problem Type': problem_type.value,
+                'Payload (lbm)': float(
+                    prob.get_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 'lbm')[0]
+                ),
+                'Range (NM)': float(prob.get_val(Mission.Summary.RANGE, 'NM')[0]),
+                'Gross Mass (lbm)': float(prob.get_val(Mission.Summary.GROSS_MASS, 'lbm')[0]),
+                'Fuel Burned (lbm)': float(prob.get_val(Mission.Summary.FUEL_BURNED, 'lbm')[0]),
+                'Success': prob.result.success,
+            }
+        )
+
+    return rows
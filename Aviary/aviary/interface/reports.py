@@ -1,10 +1,12 @@
 import datetime
+import functools
 import json
 import sys
 import time
 from pathlib import Path
 
 import numpy as np
+import openmdao.api as om
 import pandas as pd
 from openmdao.utils.mpi import MPI
 from openmdao.utils.reports_system import register_report
@@ -14,6 +16,11 @@ from aviary.utils.named_values import NamedValues
 from aviary.utils.utils import wrapped_convert_units
 from aviary.variable_info.enums import ProblemType
 
+# Aviary reports that only write small text files. These make up the 'minimal' reports
+# profile of AviaryProblem, meant for batch runs where report generation should not add to the
+# run time.
+minimal_reports = ['run_status', 'mission', 'timeseries_csv', 'input_checks']
+
 
 def register_custom_reports():
     """
@@ -135,6 +142,10 @@ def subsystem_report(prob, **kwargs):
     else:
         model = prob.model
 
+    if MPI and not model._is_local:
+        # under MPI, only the processors that run the mission have its values
+        return
+
     # TODO external subsystems??
     core_subsystems = model.core_subsystems  # TODO: redo for multimissions
 
@@ -152,15 +163,24 @@ def mission_report(prob, **kwargs):
         The AviaryProblem used to generate this report
     """
 
-    def _get_phase_value(model, traj, phase, var_name, units, indices=None):
+    def _has_var(model, name):
+        # Check for the variable up front, because a failed get_val searches the whole model
+        # for close matches to put in the error message, which is very slow for large models.
+        # a change in OpenMDAO 3.38.1-dev adds a resolver in place of the prom2abs attributes
         try:
+            return model._resolver.is_prom(name)
+        except AttributeError:
+            return any(name in prom2abs for prom2abs in model._var_allprocs_prom2abs_list.values())
+
+    def _get_phase_value(model, traj, phase, var_name, units, indices=None):
+        if _has_var(model, f'{traj}.{phase}.timeseries.{var_name}'):
             vals = model.get_val(
                 f'{traj}.{phase}.timeseries.{var_name}',
                 units=units,
                 indices=indices,
                 get_remote=True,
             )
-        except KeyError:
+        elif _has_var(model, f'{traj}.{phase}.{var_name}'):
             try:
                 vals = model.get_val(
                     f'{traj}.{phase}.{var_name}',
@@ -176,8 +196,8 @@ def mission_report(prob, **kwargs):
                     indices=indices,
                     get_remote=True,
                 )
-            except KeyError:
-                vals = None
+        else:
+            vals = None
 
         return vals
 
@@ -204,20 +224,27 @@ def mission_report(prob, **kwargs):
     all_data = {}
     all_totals = {}
     for name, model in models.items():
+        # Values are read through the whole model, because under MPI each mission group only
+        # exists on the processors that run it.
+        if multi_mission:
+            traj = f'{name}.traj'
+        else:
+            traj = 'traj'
+
         # read per-phase data from trajectory
         data = {}
         for idx, phase in enumerate(model.phase_info):  # TODO: redo for multimissions
             # TODO for traj in trajectories, currently assuming single one named "traj"
             # TODO delta mass and fuel consumption need to be tracked separately
-            fuel_burn = _get_phase_diff(model, 'traj', phase, 'mass', 'lbm', [-1, 0])
-            time = _get_phase_diff(model, 'traj', phase, 't', 'min')
-            range = _get_phase_diff(model, 'traj', phase, 'distance', 'nmi')
+            fuel_burn = _get_phase_diff(prob.model, traj, phase, 'mass', 'lbm', [-1, 0])
+            time = _get_phase_diff(prob.model, traj, phase, 't', 'min')
+            range = _get_phase_diff(prob.model, traj, phase, 'distance', 'nmi')
 
             # get initial values, first in traj
             if idx == 0:
-                initial_mass = _get_phase_value(model, 'traj', phase, 'mass', 'lbm', 0)[0]
-                initial_time = _get_phase_value(model, 'traj', phase, 't', 'min', 0)
-                initial_range = _get_phase_value(model, 'traj', phase, 'distance', 'nmi', 0)[0]
+                initial_mass = _get_phase_value(prob.model, traj, phase, 'mass', 'lbm', 0)[0]
+                initial_time = _get_phase_value(prob.model, traj, phase, 't', 'min', 0)
+                initial_range = _get_phase_value(prob.model, traj, phase, 'distance', 'nmi', 0)[0]
 
             outputs = NamedValues()
             # Fuel burn is negative of delta mass
@@ -227,9 +254,9 @@ def mission_report(prob, **kwargs):
             data[phase] = outputs
 
             # get final values, last in traj
-            final_mass = _get_phase_value(model, 'traj', phase, 'mass', 'lbm', -1)[0]
-            final_time = _get_phase_value(model, 'traj', phase, 't', 'min', -1)
-            final_range = _get_phase_value(model, 'traj', phase, 'distance', 'nmi', -1)[0]
+            final_mass = _get_phase_value(prob.model, traj, phase, 'mass', 'lbm', -1)[0]
+            final_time = _get_phase_value(prob.model, traj, phase, 't', 'min', -1)
+            final_range = _get_phase_value(prob.model, traj, phase, 'distance', 'nmi', -1)[0]
 
             totals = NamedValues()
             totals.set_val('Total Fuel Burn', initial_mass - final_mass, 'lbm')
@@ -241,12 +268,18 @@ def mission_report(prob, **kwargs):
 
             totals.set_val(
                 'Total Fuel Capacity',
-                prob.get_val(f'{var_name}aircraft:fuel:total_capacity', units='lbm')[0],
+                prob.get_val(
+                    f'{var_name}aircraft:fuel:total_capacity', units='lbm', get_remote=True
+                )[0],
                 units='lbm',
             )
             totals.set_val(
                 'Excess Fuel Capacity',
-                prob.get_val(f'{var_name}mission:constraints:excess_fuel_capacity', units='lbm')[0],
+                prob.get_val(
+                    f'{var_name}mission:constraints:excess_fuel_capacity',
+                    units='lbm',
+                    get_remote=True,
+                )[0],
                 units='lbm',
             )
             totals.set_val('Total Time', final_time - initial_time, 'min')
@@ -340,8 +373,9 @@ def input_check_report(prob, **kwargs):
         def abs2prom(abs_name):
             return prob.model._var_allprocs_abs2prom['input'][abs_name]
 
-    # Find all unconnected inputs.
-    all_ivc_abs = [k for k, v in prob.model._conn_abs_in2out.items() if 'ivc' in v]
+    # Find all unconnected inputs. The global connections are used so that every processor
+    # finds the same inputs under MPI.
+    all_ivc_abs = [k for k, v in prob.model._conn_global_abs_in2out.items() if 'ivc' in v]
     all_ivc_prom = [abs2prom(v) for v in all_ivc_abs]
     aviary_metadata = prob.meta_data
 
@@ -366,6 +400,36 @@ def input_check_report(prob, **kwargs):
     }
     bare_local_inputs = bare_inputs - bare_hierarchy_inputs
 
+    # Get all values up front, because get_val of a variable that may be on another processor
+    # is a collective call under MPI.
+    hierarchy_rows = []
+    for var in sorted(bare_hierarchy_inputs):
+        metadata = aviary_metadata.get(var)
+        try:
+            units = metadata['units']
+        except:
+            metadata = aviary_metadata.get(var.split('.')[-1])
+            units = metadata['units']
+
+        val = prob.model.get_val(var, units=units, get_remote=True)
+        desc = metadata['desc']
+        abs_paths = prom2abs(var)
+
+        hierarchy_rows.append((var, val, units, desc, abs_paths))
+
+    local_rows = []
+    for var in sorted(bare_local_inputs):
+        # Filter out dymos internals.
+        if var.startswith('traj') and '.rhs_all.' not in var:
+            continue
+
+        abs_paths = prom2abs(var)
+        val = prob.model.get_val(var, get_remote=True)
+        meta = prob.model._var_allprocs_abs2meta['input'][abs_paths[0]]
+        units = meta['units']
+
+        local_rows.append((var, val, units, abs_paths))
+
     # There are no more collective calls, so we can exit.
     if MPI and prob.comm.rank != 0:
         return
@@ -381,18 +445,7 @@ def input_check_report(prob, **kwargs):
             f.write('| Name | Value | Units | Description | Absolute Paths\n')
             f.write('| :- |  :- |  :- | :- | :- |\n')
 
-            for var in sorted(bare_hierarchy_inputs):
-                metadata = aviary_metadata.get(var)
-                try:
-                    units = metadata['units']
-                except:
-                    metadata = aviary_metadata.get(var.split('.')[-1])
-                    units = metadata['units']
-
-                val = prob.model.get_val(var, units=units)
-                desc = metadata['desc']
-                abs_paths = prom2abs(var)
-
+            for var, val, units, desc, abs_paths in hierarchy_rows:
                 f.write(f'| **{var}** | {val} | {units} | {desc} | {abs_paths}|\n')
 
             f.write('\n')
@@ -410,16 +463,7 @@ def input_check_report(prob, **kwargs):
             f.write('| Name | Value | Units | Absolute Paths\n')
             f.write('| :- |  :- |  :- | :- |\n')
 
-            for var in sorted(bare_local_inputs):
-                # Filter out dymos internals.
-                if var.startswith('traj') and '.rhs_all.' not in var:
-                    continue
-
-                abs_paths = prom2abs(var)
-                val = prob.model.get_val(var)
-                meta = prob.model._var_allprocs_abs2meta['input'][abs_paths[0]]
-                units = meta['units']
-
+            for var, val, units, abs_paths in local_rows:
                 f.write(f'| **{var}** | {val} | {units} | {abs_paths}|\n')
 
             f.write('\n\n')
@@ -457,13 +501,17 @@ def timeseries_csv(prob, **kwargs):
     else:
         model = prob.model
 
+    if MPI and not model._is_local:
+        # under MPI, only the processors that run the mission have its values
+        return
+
     timeseries_outputs = model.list_outputs(
         includes='*timeseries*', out_stream=None, return_format='dict', units=True
     )
     phase_names = model.traj._phases.keys()
 
     # There are no more collective calls, so we can exit.
-    if MPI and prob.comm.rank != 0:
+    if MPI and model.comm.rank != 0:
         return
 
     timeseries_outputs = {value['prom_name']: value for key, value in timeseries_outputs.items()}
@@ -549,3 +597,244 @@ def timeseries_csv(prob, **kwargs):
 
     # Write the DataFrame to a CSV file
     df.to_csv(report_file, index=False)
+
+
+# component methods timed by enable_profiling, keyed by component type
+_PROFILED_METHODS = {
+    om.ExplicitComponent: ('compute', 'compute_partials'),
+    om.ImplicitComponent: ('apply_nonlinear', 'solve_nonlinear', 'linearize'),
+}
+
+
+def write_n2_from_record_file(record_file, outfile):
+    """
+    Write the N2 diagram of a recorded problem, using the values of its last problem case.
+
+    This lets the N2 diagram be written after a run without the problem itself, either by a
+    background process or when the dashboard is opened. Only variables that were recorded have
+    values in the diagram; the solution record file of run_aviary_problem records the outputs.
+
+    Parameters
+    ----------
+    record_file : str or Path
+        Name of the problem case recorder file, such as problem_history.db.
+    outfile : str or Path
+        Name of the html file the N2 diagram is written to.
+    """
+    cr = om.CaseReader(record_file, pre_load=False)
+    problem_cases = cr.list_cases('problem', out_stream=None)
+    case_id = problem_cases[-1] if problem_cases else None
+
+    om.n2(
+        str(record_file),
+        outfile=str(outfile),
+        case_id=case_id,
+        show_browser=False,
+        display_in_notebook=False,
+    )
+
+
+def enable_profiling(prob):
+    """
+    Instrument every component in the model to record wall time and call counts.
+
+    Each component's compute, compute_partials, apply_nonlinear, solve_nonlinear, and
+    linearize methods (whichever apply to its type) are wrapped on the instance, so the
+    component classes themselves are left untouched. Timings are accumulated in
+    `prob.component_profile` and written out by `profile_report`. Must be called after
+    `prob.setup()`.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The AviaryProblem to instrument
+    """
+    profile = prob.component_profile = {}
+
+    for comp_type, method_names in _PROFILED_METHODS.items():
+        for comp in prob.model.system_iter(recurse=True, typ=comp_type):
+            stats = profile[comp.pathname] = {
+                'class_name': type(comp).__name__,
+                'methods': {},
+            }
+            for method_name in method_names:
+                method_stats = stats['methods'][method_name] = [0, 0.0]
+                method = getattr(comp, method_name)
+                setattr(comp, method_name, _timed(method, method_stats))
+
+
+def _timed(method, method_stats):
+    """Wrap a bound method so each call adds to [num_calls, total_time] in method_stats."""
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            method_stats[0] += 1
+            method_stats[1] += time.perf_counter() - start
+
+    return wrapper
+
+
+def _get_profile_subsystem_names(prob):
+    """
+    Map the names of all subsystem builders in the problem to the subsystem they belong to.
+    Core builders map to their generic category (aerodynamics, propulsion, etc.) and
+    external builders map to their own name.
+    """
+    if prob.problem_type == ProblemType.MULTI_MISSION:
+        groups = prob.aviary_groups_dict.values()
+    else:
+        groups = [prob.model]
+
+    names = {}
+    for group in groups:
+        for subsystem in group.get_all_subsystems():
+            names[subsystem.name] = subsystem.name
+        for category, subsystem in group.core_subsystems.items():
+            names[subsystem.name] = category
+        for phase_name in group.phase_info:
+            for subsystem in group.phase_info[phase_name].get('external_subsystems', []):
+                names[subsystem.name] = subsystem.name
+
+    return names
+
+
+def _classify_component(pathname, subsystem_names):
+    """
+    Return the subsystem a component belongs to, based on the innermost subsystem
+    builder found in its pathname. Components in a trajectory that do not belong to any
+    builder are considered part of the mission equations of motion.
+    """
+    parts = pathname.split('.')
+    for part in reversed(parts):
+        if part in subsystem_names:
+            return subsystem_names[part]
+
+    if 'traj' in parts:
+        return 'mission EOM'
+
+    return 'other'
+
+
+def profile_report(prob, num_components=25, **kwargs):
+    """
+    Creates a markdown report of the component timings gathered by `enable_profiling`.
+    The report contains a summary rolled up by subsystem followed by the most expensive
+    individual components. It is placed in the "reports" folder as "profile.md".
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The AviaryProblem used to generate this report
+    num_components : int, optional
+        Number of components listed in the table of most expensive components.
+    """
+    profile = getattr(prob, 'component_profile', None)
+    if profile is None:
+        return
+
+    if MPI and prob.comm.rank != 0:
+        return
+
+    subsystem_names = _get_profile_subsystem_names(prob)
+
+    rows = []
+    for pathname, stats in profile.items():
+        methods = stats['methods']
+        rows.append(
+            {
+                'pathname': pathname,
+                'class_name': stats['class_name'],
+                'subsystem': _classify_component(pathname, subsystem_names),
+                # compute or apply_nonlinear + solve_nonlinear
+                'evals': sum(
+                    methods[name][0]
+                    for name in ('compute', 'apply_nonlinear', 'solve_nonlinear')
+                    if name in methods
+                ),
+                'eval_time': sum(
+                    methods[name][1]
+                    for name in ('compute', 'apply_nonlinear', 'solve_nonlinear')
+                    if name in methods
+                ),
+                'derivs': sum(
+                    methods[name][0]
+                    for name in ('compute_partials', 'linearize')
+                    if name in methods
+                ),
+                'deriv_time': sum(
+                    methods[name][1]
+                    for name in ('compute_partials', 'linearize')
+                    if name in methods
+                ),
+            }
+        )
+
+    df = pd.DataFrame(
+        rows,
+        columns=[
+            'pathname',
+            'class_name',
+            'subsystem',
+            'evals',
+            'eval_time',
+            'derivs',
+            'deriv_time',
+        ],
+    )
+    df['total_time'] = df['eval_time'] + df['deriv_time']
+    total_time = df['total_time'].sum()
+
+    summary = (
+        df.groupby('subsystem')
+        .agg(
+            components=('pathname', 'count'),
+            evals=('evals', 'sum'),
+            eval_time=('eval_time', 'sum'),
+            derivs=('derivs', 'sum'),
+            deriv_time=('deriv_time', 'sum'),
+            total_time=('total_time', 'sum'),
+        )
+        .sort_values('total_time', ascending=False)
+    )
+
+    reports_folder = Path(prob.get_reports_dir(force=True))
+    reports_folder.mkdir(parents=True, exist_ok=True)
+    report_file = reports_folder / 'profile.md'
+
+    def _percent(time):
+        return 100.0 * time / total_time if total_time > 0.0 else 0.0
+
+    with open(report_file, mode='w') as f:
+        f.write('# Component Profile\n\n')
+        f.write(f'Total time spent in components: {total_time:.4f} s\n\n')
+
+        f.write('## Time by Subsystem\n')
+        f.write(
+            '| Subsystem | Components | Evaluations | Evaluation Time (s) | Derivative Calls | '
+            'Derivative Time (s) | Total Time (s) | Percent of Total |\n'
+        )
+        f.write('| :- | -: | -: | -: | -: | -: | -: | -: |\n')
+        for row in summary.itertuples():
+            f.write(
+                f'| {row.Index} | {row.components} | {row.evals} | {row.eval_time:.4f} | '
+                f'{row.derivs} | {row.deriv_time:.4f} | {row.total_time:.4f} | '
+                f'{_percent(row.total_time):.1f} |\n'
+            )
+
+        f.write(f'\n## Most Expensive Components (top {num_components})\n')
+        f.write(
+            '| Component | Class | Subsystem | Evaluations | Evaluation Time (s) | '
+            'Derivative Calls | Derivative Time (s) | Total Time (s) | Percent of Total |\n'
+        )
+        f.write('| :- | :- | :- | -: | -: | -: | -: | -: | -: |\n')
+        top = df.sort_values('total_time', ascending=False).head(num_components)
+        for row in top.itertuples():
+            f.write(
+                f'| {row.pathname} | {row.class_name} | {row.subsystem} | {row.evals} | '
+                f'{row.eval_time:.4f} | {row.derivs} | {row.deriv_time:.4f} | '
+                f'{row.total_time:.4f} | {_percent(row.total_time):.1f} |\n'
+            )
@@ -0,0 +1,200 @@
+"""
+Store of solved Aviary problems, used to warm-start new runs of similar problems.
+
+Solutions are grouped by a hash of the model structure, which covers the phases, their
+transcription grids and the aircraft options, so only solutions on the same grid are ever
+reused. Within a group, each solution is stored under a hash of the continuous aircraft
+inputs it was solved for, and a new run only starts from a solution of the same inputs.
+Solutions of nearby inputs are not reused: starting from them often takes the optimizer more
+iterations than a cold start (for example, 15 against 11 after a 2% change of wing area).
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+
+from aviary.utils.named_values import get_items
+from aviary.variable_info.variables import Settings
+
+_HASH_LENGTH = 16
+
+
+def _hash(data):
+    """Return a short hash of json serializable data."""
+    text = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode()).hexdigest()[:_HASH_LENGTH]
+
+
+def _split_inputs(prob):
+    """
+    Split the aircraft inputs of a problem into options and continuous values.
+
+    Returns
+    -------
+    dict
+        Mapping of option name to its value and units, as strings.
+    dict
+        Mapping of input name to a list of its values, and its units.
+    """
+    options = {}
+    values = {}
+
+    for key, (val, units) in get_items(prob.aviary_inputs):
+        if key == Settings.VERBOSITY:
+            continue
+
+        is_option = key in prob.meta_data and prob.meta_data[key]['option']
+
+        try:
+            array = np.asarray(val, dtype=float)
+        except (TypeError, ValueError):
+            array = None
+
+        if is_option or array is None or np.iscomplexobj(val):
+            options[key] = [str(val), str(units)]
+        else:
+            values[key] = [np.ravel(array).tolist(), str(units)]
+
+    return options, values
+
+
+def get_structure_hash(prob):
+    """
+    Return a hash of the structure of a problem that has been set up.
+
+    Two problems with the same hash have the same variables with the same shapes (and so the
+    same phases and transcription grids), the same design variables, and the same aircraft
+    options.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Problem after setup.
+
+    Returns
+    -------
+    str
+        Hash of the problem structure.
+    """
+    # design variables are only resolved in final setup
+    prob.final_setup()
+
+    outputs = prob.model.get_io_metadata(
+        iotypes='output', metadata_keys=['shape'], get_remote=True, return_rel_names=False
+    )
+    options, _ = _split_inputs(prob)
+
+    return _hash(
+        {
+            'outputs': sorted((name, meta['shape']) for name, meta in outputs.items()),
+            'design_vars': sorted(prob.model.get_design_vars(get_sizes=False)),
+            'options': options,
+        }
+    )
+
+
+def find_cached_solution(cache_dir, prob):
+    """
+    Find the stored solution of a problem.
+
+    Parameters
+    ----------
+    cache_dir : str or Path
+        Directory of the solution store.
+    prob : AviaryProblem
+        Problem after setup.
+
+    Returns
+    -------
+    Path or None
+        Case recorder file of the solution with the same structure and the same aircraft
+        inputs as the problem, or None if there is no such solution.
+    """
+    _, values = _split_inputs(prob)
+
+    name = _hash(values)
+    structure_dir = Path(cache_dir) / get_structure_hash(prob)
+    record_file = structure_dir / f'{name}.db'
+
+    # the inputs are written last, so a solution without them may be incomplete
+    if not (structure_dir / f'{name}.json').exists() or not record_file.exists():
+        return None
+
+    return record_file
+
+
+def store_solution(cache_dir, prob, record_file):
+    """
+    Add the solution of a problem to the solution store.
+
+    Parameters
+    ----------
+    cache_dir : str or Path
+        Directory of the solution store. It is created if needed.
+    prob : AviaryProblem
+        Problem that has been run.
+    record_file : str or Path
+        Case recorder file that contains the solution in a problem case named 'final'.
+
+    Returns
+    -------
+    Path
+        Stored copy of the case recorder file.
+    """
+    _, values = _split_inputs(prob)
+
+    structure_dir = Path(cache_dir) / get_structure_hash(prob)
+    structure_dir.mkdir(parents=True, exist_ok=True)
+
+    name = _hash(values)
+    stored_file = structure_dir / f'{name}.db'
+
+    # write the inputs last, so an entry is never listed before its solution is complete
+    shutil.copyfile(record_file, stored_file)
+    with open(structure_dir / f'{name}.json', 'w') as f:
+        json.dump({'inputs': values}, f, indent=1)
+
+    return stored_file
+
+
+def warm_start(prob, record_file):
+    """
+    Load a stored solution into a problem as the starting point of a run.
+
+    Trajectory values are interpolated onto the grid of the problem and the design variables
+    take their solved values, but the aircraft inputs of the problem are kept.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Problem after setup.
+    record_file : str or Path
+        Case recorder file that contains the solution in a problem case named 'final'.
+    """
+    prob.final_setup()
+
+    model_vars = {
+        meta['prom_name']
+        for meta in prob.model.list_vars(
+            val=False, all_procs=True, out_stream=None, return_format='dict'
+        ).values()
+    }
+    design_vars = prob.model.get_design_vars(get_sizes=False)
+    inputs = {}
+
+    for key, (val, units) in get_items(prob.aviary_inputs):
+        # options and design variables are skipped. get_val can return a view of the values in
+        # the model, which load_case would overwrite
+        if key in model_vars and key not in design_vars:
+            inputs[key] = (np.copy(prob.get_val(key, units=units)), units)
+
+    case = om.CaseReader(record_file, pre_load=False).get_case('final')
+    prob.load_case(case)
+
+    # the case holds the values of every input, so put back the aircraft inputs of this problem
+    for key, (val, units) in inputs.items():
+        prob.set_val(key, val, units=units)
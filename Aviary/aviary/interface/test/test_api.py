@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import unittest
+
+import aviary.api as av
+
+
+class APITest(unittest.TestCase):
+    def test_lazy_import(self):
+        # importing the api should not import the modules behind it
+        code = 'import sys, aviary.api; assert "openmdao" not in sys.modules'
+        try:
+            subprocess.check_output([sys.executable, '-c', code])
+        except subprocess.CalledProcessError as err:
+            self.fail(f'Importing aviary.api imported its contents. Return code: {err.returncode}')
+
+    def test_names(self):
+        for name in av.__all__:
+            with self.subTest(name=name):
+                self.assertIs(getattr(av, name), av.__dict__[name])
+
+        self.assertIn('AviaryProblem', dir(av))
+        # renamed imports resolve to the original objects
+        from aviary.mission.gasp_based.ode.climb_ode import ClimbODE
+
+        self.assertIs(av.TwoDOFClimbODE, ClimbODE)
+
+        self.assertFalse(hasattr(av, 'NotAnAviaryName'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import subprocess
+import sys
 import unittest
 from pathlib import Path
 
@@ -31,6 +32,26 @@ class InstallationTest(CommandEntryPointsTestCases):
         self.run_and_test_cmd(cmd)
 
 
+class versionTestCases(CommandEntryPointsTestCases):
+    def test_version(self):
+        cmd = 'aviary --version'
+        self.run_and_test_cmd(cmd)
+
+    def test_lazy_import(self):
+        # commands only import their own module, so trivial commands stay cheap
+        code = (
+            'import sys; sys.argv = ["aviary", "--version"]; '
+            'from aviary.interface.cmd_entry_points import aviary_cmd; aviary_cmd(); '
+            'assert "openmdao" not in sys.modules'
+        )
+        try:
+            subprocess.check_output([sys.executable, '-c', code])
+        except subprocess.CalledProcessError as err:
+            self.fail(
+                f'aviary --version imported more than it needs. Return code: {err.returncode}'
+            )
+
+
 class run_missionTestCases(CommandEntryPointsTestCases):
     @require_pyoptsparse(optimizer='SNOPT')
     def bench_test_SNOPT_cmd(self):
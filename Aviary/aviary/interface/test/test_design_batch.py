@@ -0,0 +1,154 @@
+import unittest
+from copy import deepcopy
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.interface import design_batch
+from aviary.interface.design_batch import evaluate_design_batch, run_premission_batch
+from aviary.models.aircraft.advanced_single_aisle.advanced_single_aisle_data import inputs
+from aviary.subsystems.premission import CorePreMission
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.functions import set_aviary_initial_values
+from aviary.utils.named_values import NamedValues, get_items
+from aviary.utils.preprocessors import preprocess_options
+from aviary.utils.test_utils.default_subsystems import get_default_premission_subsystems
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.variables import Aircraft, Mission, Settings
+
+
+def build_premission():
+    options = deepcopy(inputs)
+    options.set_val(Settings.VERBOSITY, 0)
+
+    engine_models = [build_engine_deck(options)]
+    preprocess_options(options, engine_models=engine_models)
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem(
+        'pre_mission',
+        CorePreMission(
+            aviary_options=options,
+            subsystems=get_default_premission_subsystems('FLOPS', engine_models),
+        ),
+        promotes_inputs=['*'],
+        promotes_outputs=['*'],
+    )
+
+    setup_model_options(prob, options, engine_models=engine_models)
+
+    prob.setup(check=False)
+
+    set_aviary_initial_values(prob, options)
+
+    prob.final_setup()
+
+    return prob
+
+
+class DesignBatchTest(unittest.TestCase):
+    def setUp(self):
+        num_designs = 5
+
+        self.design_inputs = NamedValues()
+        self.design_inputs.set_val(
+            Aircraft.Wing.AREA, np.linspace(1200.0, 1500.0, num_designs), 'ft**2'
+        )
+        self.design_inputs.set_val(Aircraft.Wing.ASPECT_RATIO, np.linspace(12.0, 9.0, num_designs))
+        self.design_inputs.set_val(
+            Mission.Design.GROSS_MASS, np.linspace(72.0, 86.0, num_designs), 'Mg'
+        )
+        self.design_inputs.set_val(
+            Aircraft.Fuselage.LENGTH, np.linspace(120.0, 140.0, num_designs), 'ft'
+        )
+
+    def test_matches_individual_designs(self):
+        results = run_premission_batch(inputs, self.design_inputs)
+
+        names = [name for name, _ in get_items(results)]
+        self.assertIn(Aircraft.Design.OPERATING_MASS, names)
+        self.assertIn(Aircraft.Wing.MASS, names)
+        assert_near_equal(
+            results.get_val(Mission.Design.GROSS_MASS, 'Mg'),
+            self.design_inputs.get_val(Mission.Design.GROSS_MASS, 'Mg'),
+        )
+
+        prob = build_premission()
+        initial_outputs = prob.model._outputs.asarray().copy()
+
+        for index in range(5):
+            # every design starts from the same state, as it does in the batch
+            prob.model._outputs.set_val(initial_outputs)
+
+            for name, (val, units) in get_items(self.design_inputs):
+                prob.set_val(name, val[index], units)
+
+            prob.run_model()
+
+            for name, (val, units) in get_items(results):
+                with self.subTest(design=index, name=name):
+                    assert_near_equal(val[index], prob.get_val(name, units), tolerance=1e-12)
+
+    def test_vectorized_components(self):
+        # every listed component must compute each design of a batch as it would on its own
+        prob = build_premission()
+        prob.run_model()
+
+        num_designs = 5
+        rng = np.random.default_rng(0)
+        checked = set()
+
+        for comp in prob.model.system_iter(recurse=True, typ=om.ExplicitComponent):
+            if not design_batch._is_vectorized(comp):
+                continue
+
+            checked.add(f'{type(comp).__module__}.{type(comp).__qualname__}')
+
+            inputs = {}
+            for name in comp.get_io_metadata(iotypes='input', metadata_keys=[]):
+                val = prob.get_val(f'{comp.pathname}.{name}')
+                inputs[name] = val[..., np.newaxis] * rng.uniform(
+                    0.9, 1.1, val.shape + (num_designs,)
+                )
+
+            shapes = {
+                name: meta['shape']
+                for name, meta in comp.get_io_metadata(
+                    iotypes='output', metadata_keys=['shape']
+                ).items()
+            }
+
+            outputs = {name: np.zeros(shape + (num_designs,)) for name, shape in shapes.items()}
+            comp.compute(inputs, outputs)
+
+            for index in range(num_designs):
+                design = design_batch._compute_design(comp, inputs, shapes, index)
+
+                for name, val in design.items():
+                    with self.subTest(comp=comp.pathname, design=index, name=name):
+                        batch = np.broadcast_to(outputs[name], shapes[name] + (num_designs,))
+                        assert_near_equal(batch[..., index], val, tolerance=1e-12)
+
+        self.assertEqual(checked, design_batch._VECTORIZED_COMPONENTS)
+
+    def test_invalid_design_inputs(self):
+        prob = build_premission()
+
+        computed = NamedValues()
+        computed.set_val(Aircraft.Wing.MASS, np.ones(5), 'lbm')
+
+        with self.assertRaises(ValueError) as cm:
+            evaluate_design_batch(prob, computed, [Aircraft.Wing.MASS])
+        self.assertIn('is computed by the model', str(cm.exception))
+
+        mismatched = deepcopy(self.design_inputs)
+        mismatched.set_val(Aircraft.Wing.SWEEP, np.ones(3), 'deg')
+
+        with self.assertRaises(ValueError) as cm:
+            evaluate_design_batch(prob, mismatched, [Aircraft.Wing.MASS])
+        self.assertIn('has 3 values, but 5 designs', str(cm.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
+import csv
 import unittest
 from copy import deepcopy
 from pathlib import Path
 
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
 import aviary.api as av
@@ -71,6 +73,130 @@ class TestJson(unittest.TestCase):
         )
 
 
+@use_tempdirs
+class TestOffDesignSweep(unittest.TestCase):
+    def test_off_design_sweep(self):
+        prob = av.run_aviary(
+            'models/aircraft/test_aircraft/aircraft_for_bench_FwFm.csv',
+            deepcopy(phase_info),
+            optimizer='SLSQP',
+            max_iter=50,
+            make_plots=False,
+            verbosity=0,
+        )
+        self.assertTrue(prob.result.success)
+
+        # invalid points and output files are rejected before any mission is run
+        with self.assertRaises(ValueError):
+            prob.run_off_design_sweep([{'mission_range': 1500.0, 'mission_mass': 1.0e5}])
+        with self.assertRaises(ValueError):
+            prob.run_off_design_sweep(
+                [{'mission_range': 1500.0}], output_file='off_design_sweep.parquet'
+            )
+
+        ranges = [1500.0, 1000.0]
+        points = [{'mission_range': mission_range} for mission_range in ranges]
+        results = prob.run_off_design_sweep(points, verbosity=0)
+
+        self.assertEqual([row['Point'] for row in results], [0, 1])
+        self.assertEqual([row['Problem Type'] for row in results], ['alternate'] * 2)
+        self.assertTrue(all(row['Success'] for row in results))
+        assert_near_equal([row['Range (NM)'] for row in results], ranges, 1e-6)
+        # shorter missions need less fuel
+        self.assertLess(results[1]['Fuel Burned (lbm)'], results[0]['Fuel Burned (lbm)'])
+
+        with open(prob.get_reports_dir() / 'off_design_sweep.csv', newline='') as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        self.assertEqual(sorted(int(row['Point']) for row in rows), [0, 1])
+
+        # each mission runs in a separate process
+        parallel_results = prob.run_off_design_sweep(points, workers=2, verbosity=0)
+
+        self.assertTrue(all(row['Success'] for row in parallel_results))
+        for row, parallel_row in zip(results, parallel_results):
+            self.assertEqual(parallel_row['Point'], row['Point'])
+            for key in ('Range (NM)', 'Gross Mass (lbm)', 'Fuel Burned (lbm)'):
+                assert_near_equal(parallel_row[key], row[key], 1e-4)
+
+        # fallout missions fly as far as the given takeoff mass allows
+        design_gross_mass = prob.get_val(av.Mission.Design.GROSS_MASS, 'lbm')[0]
+        masses = [design_gross_mass - 10000.0, design_gross_mass - 5000.0]
+        points = [{'mission_mass': mission_mass} for mission_mass in masses]
+        fallout_results = prob.run_off_design_sweep(points, output_file=None, verbosity=0)
+
+        self.assertEqual([row['Problem Type'] for row in fallout_results], ['fallout'] * 2)
+        self.assertTrue(all(row['Success'] for row in fallout_results))
+        assert_near_equal([row['Gross Mass (lbm)'] for row in fallout_results], masses, 1e-6)
+        # a lighter takeoff mass carries less fuel
+        self.assertLess(fallout_results[0]['Range (NM)'], fallout_results[1]['Range (NM)'])
+        self.assertLess(
+            fallout_results[0]['Fuel Burned (lbm)'], fallout_results[1]['Fuel Burned (lbm)']
+        )
+
+
+@use_tempdirs
+class TestPayloadRange(unittest.TestCase):
+    def test_payload_range_workers(self):
+        # With fuel capacity to spare at the design gross mass, no fallout mission starts with
+        # full tanks. SLSQP does not reliably converge missions limited by fuel capacity.
+        aviary_inputs, _ = av.create_vehicle(
+            'models/aircraft/test_aircraft/aircraft_for_bench_FwFm.csv'
+        )
+        aviary_inputs.set_val(av.Aircraft.Fuel.TOTAL_CAPACITY, 80000.0, 'lbm')
+
+        # leave room for the long cruise of the ferry mission
+        payload_range_phase_info = deepcopy(phase_info)
+        payload_range_phase_info['cruise']['user_options']['time_duration_bounds'] = (
+            (56.5, 500.0),
+            'min',
+        )
+
+        prob = av.run_aviary(
+            aviary_inputs,
+            payload_range_phase_info,
+            optimizer='SLSQP',
+            max_iter=50,
+            make_plots=False,
+            verbosity=0,
+        )
+        self.assertTrue(prob.result.success)
+
+        serial_probs = prob.run_payload_range(verbosity=0, num_intermediate_points=1)
+        serial_data = prob.payload_range_data
+
+        # every fallout mission is run in a worker process
+        parallel_probs = prob.run_payload_range(
+            verbosity=0, num_intermediate_points=1, max_workers=2
+        )
+        parallel_data = prob.payload_range_data
+
+        for probs in (serial_probs, parallel_probs):
+            self.assertEqual(len(probs), 2)
+            for fallout_prob in probs:
+                self.assertTrue(fallout_prob.result.success)
+
+        # the returned problems hold the solutions found by the workers
+        for serial_prob, parallel_prob in zip(serial_probs, parallel_probs):
+            for name, units in (
+                (av.Mission.Summary.RANGE, 'NM'),
+                (av.Mission.Summary.FUEL_BURNED, 'lbm'),
+                (av.Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 'lbm'),
+            ):
+                assert_near_equal(
+                    parallel_prob.get_val(name, units), serial_prob.get_val(name, units), 1e-4
+                )
+
+        self.assertEqual(
+            [name for name, _, _ in parallel_data], [name for name, _, _ in serial_data]
+        )
+        self.assertIn('Intermediate Point', [name for name, _, _ in serial_data])
+        for (_, payload, mission_range), (_, parallel_payload, parallel_range) in zip(
+            serial_data, parallel_data
+        ):
+            assert_near_equal(parallel_payload, payload, 1e-6)
+            assert_near_equal(parallel_range, mission_range, 1e-4)
+
+
 if __name__ == '__main__':
     unittest.main()
     # test = TestJson()
@@ -0,0 +1,149 @@
+import unittest
+from copy import deepcopy
+
+import openmdao.api as om
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.models.missions.height_energy_default import phase_info
+from aviary.validation_cases.validation_tests import get_flops_inputs
+from aviary.variable_info.enums import ProblemType
+from aviary.variable_info.variables import Aircraft, Mission
+
+try:
+    from openmdao.vectors.petsc_vector import PETScVector
+except ImportError:
+    PETScVector = None
+
+
+def build_multi_mission_problem(comm=None):
+    """Set up a problem with two missions that share their gross mass and wing sweep."""
+    aircraft1 = get_flops_inputs('LargeSingleAisle2FLOPS')
+    aircraft2 = deepcopy(aircraft1)
+    aircraft2.set_val(Aircraft.CrewPayload.NUM_PASSENGERS, 1, 'unitless')
+    aircraft2.set_val(Aircraft.CrewPayload.NUM_TOURIST_CLASS, 1, 'unitless')
+    aircraft2.set_val(Aircraft.CrewPayload.NUM_BUSINESS_CLASS, 0, 'unitless')
+    aircraft2.set_val(Aircraft.CrewPayload.NUM_FIRST_CLASS, 0, 'unitless')
+
+    prob = AviaryProblem(
+        problem_type=ProblemType.MULTI_MISSION, verbosity=0, reports=False, comm=comm
+    )
+    prob.add_aviary_group('mission1', aircraft=aircraft1, mission=deepcopy(phase_info))
+    prob.add_aviary_group('mission2', aircraft=aircraft2, mission=deepcopy(phase_info))
+    prob.build_model()
+
+    prob.promote_inputs(
+        ['mission1', 'mission2'],
+        [
+            (Mission.Design.GROSS_MASS, 'Aircraft1:GROSS_MASS'),
+            (Aircraft.Wing.SWEEP, 'Aircraft1:SWEEP'),
+        ],
+    )
+    prob.add_design_var_default(
+        'Aircraft1:SWEEP', lower=23.0, upper=27.0, units='deg', default_val=25
+    )
+    prob.add_composite_objective(
+        ('mission1', Mission.Summary.FUEL_BURNED, 2),
+        ('mission2', Mission.Summary.FUEL_BURNED, 1),
+    )
+    prob.add_driver('SLSQP', max_iter=0)
+    prob.add_design_variables()
+    prob.setup()
+
+    prob.set_val('Aircraft1:GROSS_MASS', 150000.0, units='lbm')
+    prob.set_val('Aircraft1:SWEEP', 24.0, units='deg')
+
+    return prob
+
+
+@use_tempdirs
+class MultiMissionTest(unittest.TestCase):
+    def setUp(self):
+        om.clear_reports()
+        _clear_problem_names()
+
+    def test_parallel_missions(self):
+        aircraft1 = get_flops_inputs('LargeSingleAisle2FLOPS')
+        prob = build_multi_mission_problem()
+
+        self.assertIsInstance(prob.model.missions, om.ParallelGroup)
+        self.assertEqual(
+            [group.name for group in prob.model.missions._subsystems_myproc],
+            ['mission1', 'mission2'],
+        )
+
+        prob.run_model()
+
+        # the shared inputs reach both missions
+        for group in prob.model.missions._subsystems_myproc:
+            assert_near_equal(group.get_val(Aircraft.Wing.SWEEP, units='deg'), 24.0)
+            assert_near_equal(group.get_val(Mission.Design.GROSS_MASS, units='lbm'), 150000.0)
+
+        # the missions keep their names in the model, and have different payloads
+        self.assertGreater(
+            prob.get_val(f'mission1.{Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS}')[0],
+            prob.get_val(f'mission2.{Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS}')[0],
+        )
+
+        with self.assertRaises(ValueError):
+            AviaryProblem(verbosity=0).add_aviary_group(
+                'mission3', aircraft=aircraft1, mission=deepcopy(phase_info)
+            )
+
+
+@unittest.skipUnless(MPI and PETScVector, 'MPI and PETSc are required.')
+@use_tempdirs
+class MultiMissionParallelTest(unittest.TestCase):
+    """Run the missions of the multi-mission problem on separate processors."""
+
+    N_PROCS = 2
+
+    def setUp(self):
+        om.clear_reports()
+        _clear_problem_names()
+
+    def test_parallel_missions_MPI(self):
+        prob = build_multi_mission_problem()
+        prob.run_model()
+
+        # each processor runs one of the missions
+        self.assertEqual(len(prob.model.missions._subsystems_myproc), 1)
+
+        # every processor builds and runs both missions on its own for reference
+        serial = build_multi_mission_problem(comm=MPI.COMM_SELF)
+        serial.run_model()
+
+        names = (
+            Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS,
+            Aircraft.Design.OPERATING_MASS,
+            Mission.Summary.GROSS_MASS,
+            Mission.Summary.FUEL_BURNED,
+        )
+
+        # the mission on this processor, through its path in the ParallelGroup
+        for group in prob.model.missions._subsystems_myproc:
+            serial_group = getattr(serial.model.missions, group.name)
+            for name in names:
+                with self.subTest(mission=group.name, name=name):
+                    assert_near_equal(
+                        group.get_val(name, units='lbm'),
+                        serial_group.get_val(name, units='lbm'),
+                        1e-10,
+                    )
+
+        # both missions, including the one on the other processor
+        for mission in ('mission1', 'mission2'):
+            for name in names:
+                with self.subTest(mission=mission, name=name):
+                    assert_near_equal(
+                        prob.get_val(f'{mission}.{name}', units='lbm', get_remote=True),
+                        serial.get_val(f'{mission}.{name}', units='lbm'),
+                        1e-10,
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -130,6 +130,58 @@ class TestReports(unittest.TestCase):
         # no need to run this model, just generate the report.
         prob.final_setup()
 
+    @set_env_vars(TESTFLO_RUNNING='0', OPENMDAO_REPORTS='0')
+    def test_profile_report(self):
+        local_phase_info = deepcopy(phase_info)
+        prob = run_aviary(
+            'models/aircraft/test_aircraft/aircraft_for_bench_FwFm.csv',
+            local_phase_info,
+            optimizer='SLSQP',
+            max_iter=0,
+            make_plots=False,
+            profile=True,
+        )
+
+        profile = prob.component_profile
+        aero_comps = [path for path in profile if '.core_aerodynamics.' in path]
+        self.assertTrue(len(aero_comps) > 0)
+        for path in aero_comps:
+            if 'compute' in profile[path]['methods']:
+                self.assertTrue(profile[path]['methods']['compute'][0] > 0)
+
+        with open(Path(prob.get_reports_dir()) / 'profile.md') as f:
+            report = f.read()
+
+        for subsystem in ('aerodynamics', 'propulsion', 'mass', 'geometry', 'mission EOM'):
+            self.assertIn(f'| {subsystem} |', report)
+
+    @set_env_vars(TESTFLO_RUNNING='0')
+    def test_minimal_reports(self):
+        local_phase_info = deepcopy(phase_info)
+        prob = run_aviary(
+            'models/aircraft/test_aircraft/aircraft_for_bench_FwFm.csv',
+            local_phase_info,
+            optimizer='SLSQP',
+            max_iter=0,
+            make_plots=False,
+            reports='minimal',
+        )
+
+        reports_dir = Path(prob.get_reports_dir())
+        self.assertEqual(
+            sorted(path.name for path in reports_dir.iterdir()),
+            ['input_checks.md', 'mission_summary.md', 'mission_timeseries_data.csv', 'status.json'],
+        )
+
+        # the n2 diagram is written from the solution record file in a separate process
+        prob.run_aviary_problem(run_driver=True, make_plots=False, n2='background')
+        prob.wait_for_reports()
+
+        self.assertTrue((reports_dir / 'n2.html').exists())
+
+        with self.assertRaises(ValueError):
+            prob.run_aviary_problem(n2='later')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from copy import deepcopy
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.methods_for_level1 import run_aviary
+from aviary.interface.solution_cache import find_cached_solution
+from aviary.models.missions.height_energy_default import phase_info
+from aviary.utils.process_input_decks import create_vehicle
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+@use_tempdirs
+class SolutionCacheTest(unittest.TestCase):
+    def run_bench(self, area_scale, solution_cache='solutions'):
+        aircraft, _ = create_vehicle('models/aircraft/test_aircraft/aircraft_for_bench_FwFm.csv')
+        area, units = aircraft.get_item(Aircraft.Wing.AREA)
+        aircraft.set_val(Aircraft.Wing.AREA, area * area_scale, units)
+
+        return run_aviary(
+            aircraft,
+            deepcopy(phase_info),
+            optimizer='SLSQP',
+            max_iter=50,
+            make_plots=False,
+            reports=False,
+            verbosity=0,
+            solution_cache=solution_cache,
+        )
+
+    def test_warm_start(self):
+        cold = self.run_bench(1.0)
+        self.assertTrue(cold.result.success)
+        self.assertIsNotNone(find_cached_solution('solutions', cold))
+
+        # the same inputs start at the stored solution
+        warm = self.run_bench(1.0)
+        self.assertTrue(warm.result.success)
+        self.assertLess(warm.driver.result.iter_count, cold.driver.result.iter_count)
+        assert_near_equal(
+            warm.get_val(Mission.Summary.FUEL_BURNED),
+            cold.get_val(Mission.Summary.FUEL_BURNED),
+            tolerance=1e-6,
+        )
+
+        # different inputs are not started from the stored solution, which would often take more
+        # iterations than a cold start
+        resized_cold = self.run_bench(1.02, solution_cache=None)
+        self.assertTrue(resized_cold.result.success)
+        self.assertIsNone(find_cached_solution('solutions', resized_cold))
+
+        resized = self.run_bench(1.02)
+        self.assertTrue(resized.result.success)
+        self.assertLessEqual(
+            resized.driver.result.iter_count, resized_cold.driver.result.iter_count
+        )
+        assert_near_equal(
+            resized.get_val(Mission.Summary.FUEL_BURNED),
+            resized_cold.get_val(Mission.Summary.FUEL_BURNED),
+            tolerance=1e-6,
+        )
+        self.assertIsNotNone(find_cached_solution('solutions', resized))
+
+
+if __name__ == '__main__':
+    unittest.main()
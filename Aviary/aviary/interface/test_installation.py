@@ -73,6 +73,10 @@ def _exec_installation_test(args, user_args):
     print('Importing Aviary api')
     try:
         import aviary.api as av
+
+        # the api is loaded lazily, so resolve every name to actually import the files
+        for name in av.__all__:
+            getattr(av, name)
     except Exception as import_error:
         print(f'An error occurred while importing Aviary API: {import_error}\n')
         return False
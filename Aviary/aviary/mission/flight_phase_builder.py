@@ -77,6 +77,16 @@ class FlightPhaseOptions(AviaryOptionsDictionary):
             'control, which allows you to assign a value or let the optimizer choose it.',
         )
 
+        self.declare(
+            name='inverse_throttle',
+            types=bool,
+            default=False,
+            desc='If True, compute throttle explicitly from the required thrust using an '
+            'inverse lookup of the engine deck, instead of converging a thrust balance with '
+            'a Newton solver. Only supported for a single engine deck without hybrid throttle, '
+            'and not with "control" or "bounded" throttle enforcement.',
+        )
+
         # Throttle is a solver variable, unless you set throttle_enforcement to control.
         defaults = {
             'throttle_bounds': (0.0, 1.0),
@@ -430,6 +440,7 @@ class FlightPhaseBase(PhaseBuilderBase):
             'subsystem_options': self.subsystem_options,
             'throttle_enforcement': self.user_options['throttle_enforcement'],
             'throttle_allocation': self.user_options['throttle_allocation'],
+            'inverse_throttle': self.user_options['inverse_throttle'],
         }
 
 
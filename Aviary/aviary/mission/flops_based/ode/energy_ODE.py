@@ -3,6 +3,8 @@ import openmdao.api as om
 
 from aviary.mission.base_ode import BaseODE as _BaseODE
 from aviary.mission.flops_based.ode.mission_EOM import MissionEOM
+from aviary.mission.flops_based.ode.required_thrust import RequiredThrust
+from aviary.subsystems.propulsion.propulsion_builder import CorePropulsionBuilder
 
 from aviary.subsystems.propulsion.throttle_allocation import ThrottleAllocator
 from aviary.variable_info.enums import SpeedType, ThrottleAllocation
@@ -36,6 +38,15 @@ class EnergyODE(_BaseODE):
             types=ThrottleAllocation,
             desc='Flag that determines how to handle throttles for multiple engines.',
         )
+        self.options.declare(
+            'inverse_throttle',
+            types=bool,
+            default=False,
+            desc='If True, compute throttle explicitly from the required thrust using an '
+            'inverse lookup of the engine deck, instead of converging a thrust balance with '
+            'a Newton solver. Only supported for a single engine type, and not with '
+            '"control" or "bounded" throttle enforcement.',
+        )
 
     def setup(self):
         options = self.options
@@ -63,10 +74,19 @@ class EnergyODE(_BaseODE):
         )
 
         throttle_enforcement = options['throttle_enforcement']
+        inverse_throttle = options['inverse_throttle']
+
+        if inverse_throttle and (
+            num_engine_type > 1 or throttle_enforcement in ('control', 'bounded')
+        ):
+            raise UserWarning(
+                'Inverse throttle lookup is only supported for a single engine type, and '
+                f'cannot be used with throttle_enforcement="{throttle_enforcement}".'
+            )
 
         sub1 = self.add_subsystem('solver_sub', om.Group(), promotes=['*'])
 
-        if throttle_enforcement == 'control':
+        if throttle_enforcement == 'control' or inverse_throttle:
             solver_group = None
             core_needs_solver = False
         else:
@@ -77,9 +97,53 @@ class EnergyODE(_BaseODE):
 
         ext_needs_solver = self.add_external_subsystems(solver_group=sub1)
 
-        sub1.add_subsystem(
+        if inverse_throttle:
+            # Required thrust does not depend on throttle, so throttle can be computed
+            # explicitly ahead of propulsion without a solver.
+            self.add_subsystem(
+                name='required_thrust',
+                subsys=RequiredThrust(num_nodes=nn),
+                promotes_inputs=[
+                    Dynamic.Vehicle.DRAG,
+                    Dynamic.Mission.ALTITUDE_RATE,
+                    Dynamic.Mission.VELOCITY,
+                    Dynamic.Mission.VELOCITY_RATE,
+                    Dynamic.Vehicle.MASS,
+                ],
+                promotes_outputs=['thrust_required'],
+            )
+
+            propulsion = [
+                subsystem
+                for subsystem in options['core_subsystems']
+                if isinstance(subsystem, CorePropulsionBuilder)
+            ]
+            if not propulsion:
+                raise UserWarning('Inverse throttle lookup requires core propulsion.')
+            propulsion = propulsion[0]
+
+            self.add_subsystem(
+                'inverse_throttle',
+                propulsion.build_inverse_throttle(nn, aviary_options),
+                promotes_inputs=['*'],
+                promotes_outputs=['*'],
+            )
+
+            eom_group = self
+        else:
+            eom_group = sub1
+
+        eom_outputs = [
+            Dynamic.Mission.SPECIFIC_ENERGY_RATE_EXCESS,
+            Dynamic.Mission.ALTITUDE_RATE_MAX,
+            Dynamic.Mission.DISTANCE_RATE,
+        ]
+        if not inverse_throttle:
+            eom_outputs.append('thrust_required')
+
+        eom_group.add_subsystem(
             name='mission_EOM',
-            subsys=MissionEOM(num_nodes=nn),
+            subsys=MissionEOM(num_nodes=nn, required_thrust=not inverse_throttle),
             promotes_inputs=[
                 Dynamic.Mission.VELOCITY,
                 Dynamic.Vehicle.MASS,
@@ -88,12 +152,7 @@ class EnergyODE(_BaseODE):
                 Dynamic.Mission.ALTITUDE_RATE,
                 Dynamic.Mission.VELOCITY_RATE,
             ],
-            promotes_outputs=[
-                Dynamic.Mission.SPECIFIC_ENERGY_RATE_EXCESS,
-                Dynamic.Mission.ALTITUDE_RATE_MAX,
-                Dynamic.Mission.DISTANCE_RATE,
-                'thrust_required',
-            ],
+            promotes_outputs=eom_outputs,
         )
 
         # THROTTLE Section
@@ -148,7 +207,7 @@ class EnergyODE(_BaseODE):
                     promotes_outputs=['*'],
                 )
                 self.add_constraint('thrust_residual', ref=thrust_res_ref, equals=0.0)
-            else:
+            elif not inverse_throttle:
                 # Add a balance comp to compute throttle based on the required thrust.
                 sub1.add_subsystem(
                     name='throttle_balance',
@@ -168,7 +227,10 @@ class EnergyODE(_BaseODE):
                     promotes_outputs=['*'],
                 )
 
-            self.set_input_defaults(Dynamic.Vehicle.Propulsion.THROTTLE, val=1.0, units='unitless')
+            if not inverse_throttle:
+                self.set_input_defaults(
+                    Dynamic.Vehicle.Propulsion.THROTTLE, val=1.0, units='unitless'
+                )
 
         self.set_input_defaults(Dynamic.Atmosphere.MACH, val=np.ones(nn), units='unitless')
         self.set_input_defaults(Dynamic.Vehicle.MASS, val=np.ones(nn), units='kg')
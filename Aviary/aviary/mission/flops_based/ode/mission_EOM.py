@@ -14,22 +14,30 @@ class MissionEOM(om.Group):
         self.options.declare(
             'num_nodes', types=int, desc='Number of nodes to be evaluated in the RHS'
         )
+        self.options.declare(
+            'required_thrust',
+            types=bool,
+            default=True,
+            desc='If True, compute thrust_required in this group. Set to False when it is '
+            'computed upstream of propulsion (e.g. for an explicit throttle calculation).',
+        )
 
     def setup(self):
         nn = self.options['num_nodes']
 
-        self.add_subsystem(
-            name='required_thrust',
-            subsys=RequiredThrust(num_nodes=nn),
-            promotes_inputs=[
-                Dynamic.Vehicle.DRAG,
-                Dynamic.Mission.ALTITUDE_RATE,
-                Dynamic.Mission.VELOCITY,
-                Dynamic.Mission.VELOCITY_RATE,
-                Dynamic.Vehicle.MASS,
-            ],
-            promotes_outputs=['thrust_required'],
-        )
+        if self.options['required_thrust']:
+            self.add_subsystem(
+                name='required_thrust',
+                subsys=RequiredThrust(num_nodes=nn),
+                promotes_inputs=[
+                    Dynamic.Vehicle.DRAG,
+                    Dynamic.Mission.ALTITUDE_RATE,
+                    Dynamic.Mission.VELOCITY,
+                    Dynamic.Mission.VELOCITY_RATE,
+                    Dynamic.Vehicle.MASS,
+                ],
+                promotes_outputs=['thrust_required'],
+            )
 
         self.add_subsystem(
             name='groundspeed',
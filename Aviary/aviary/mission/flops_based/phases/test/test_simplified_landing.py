@@ -114,9 +114,7 @@ class LandingGroupTest(unittest.TestCase):
         # not actual value
         assert_near_equal(self.prob[Mission.Landing.INITIAL_VELOCITY], 136.22914933, tol)
 
-        partial_data = self.prob.check_partials(
-            out_stream=None, excludes=['*.standard_atmosphere'], method='cs'
-        )
+        partial_data = self.prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
 
 
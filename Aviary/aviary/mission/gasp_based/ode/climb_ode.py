@@ -85,13 +85,7 @@ class ClimbODE(TwoDOFODE):
             'mach_balance_group', subsys=om.Group(), promotes=['*']
         )
 
-        mach_balance_group.nonlinear_solver = om.NewtonSolver()
-        mach_balance_group.nonlinear_solver.options['solve_subsystems'] = True
-        mach_balance_group.nonlinear_solver.options['iprint'] = 0
-        mach_balance_group.nonlinear_solver.options['atol'] = 1e-7
-        mach_balance_group.nonlinear_solver.options['rtol'] = 1e-7
-        mach_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        mach_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+        self.add_balance_solver(mach_balance_group)
         mach_balance_group.add_subsystem(
             'speeds',
             SpeedConstraints(num_nodes=nn, EAS_target=EAS_target, mach_cruise=mach_cruise),
@@ -162,14 +156,7 @@ class ClimbODE(TwoDOFODE):
 
         self.add_external_subsystems()
 
-        # maybe replace this with the solver in add_alpha_control?
-        lift_balance_group.nonlinear_solver = om.NewtonSolver()
-        lift_balance_group.nonlinear_solver.options['solve_subsystems'] = True
-        lift_balance_group.nonlinear_solver.options['iprint'] = 0
-        lift_balance_group.nonlinear_solver.options['atol'] = 1e-7
-        lift_balance_group.nonlinear_solver.options['rtol'] = 1e-7
-        lift_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        lift_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+        self.add_balance_solver(lift_balance_group)
 
         lift_balance_group.add_subsystem(
             'climb_eom',
@@ -78,13 +78,7 @@ class DescentODE(TwoDOFODE):
             )
 
             mach_balance_group.options['auto_order'] = True
-            mach_balance_group.nonlinear_solver = om.NewtonSolver()
-            mach_balance_group.nonlinear_solver.options['solve_subsystems'] = True
-            mach_balance_group.nonlinear_solver.options['iprint'] = 0
-            mach_balance_group.nonlinear_solver.options['atol'] = 1e-7
-            mach_balance_group.nonlinear_solver.options['rtol'] = 1e-7
-            mach_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-            mach_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+            self.add_balance_solver(mach_balance_group)
 
             speed_bal = om.BalanceComp(
                 name=Dynamic.Atmosphere.MACH,
@@ -134,14 +128,7 @@ class DescentODE(TwoDOFODE):
             promotes_outputs=['*'],  # [Dynamic.Atmosphere.DYNAMIC_PRESSURE] + speed_outputs,
         )
 
-        # maybe replace this with the solver in add_alpha_control?
-        lift_balance_group.nonlinear_solver = om.NewtonSolver()
-        lift_balance_group.nonlinear_solver.options['solve_subsystems'] = True
-        lift_balance_group.nonlinear_solver.options['iprint'] = 0
-        lift_balance_group.nonlinear_solver.options['atol'] = 1e-7
-        lift_balance_group.nonlinear_solver.options['rtol'] = 1e-7
-        lift_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        lift_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+        self.add_balance_solver(lift_balance_group)
 
         lift_balance_group.add_subsystem(
             'descent_eom',
@@ -6,6 +6,7 @@ from openmdao.utils.assert_utils import assert_check_partials
 
 from aviary.mission.gasp_based.ode.climb_ode import ClimbODE
 from aviary.mission.gasp_based.ode.params import set_params_for_unit_tests
+from aviary.mission.ode.nodewise_newton import is_openmdao_supported
 from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.utils.test_utils.default_subsystems import get_default_mission_subsystems
 from aviary.utils.test_utils.IO_test_util import check_prob_outputs
@@ -127,6 +128,15 @@ class ClimbODETestCase(unittest.TestCase):
         }
         check_prob_outputs(self.prob, testvals, 1e-6)
 
+    @unittest.skipIf(
+        not is_openmdao_supported(),
+        'Skipping due to OpenMDAO version not supported by NodewiseNewtonSolver',
+    )
+    def test_end_of_climb_nodewise(self):
+        # Same conditions as above, converging the balances node by node.
+        self.sys.options['balance_solver'] = 'nodewise'
+        self.test_end_of_climb()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,7 @@ from packaging import version
 
 from aviary.mission.gasp_based.ode.descent_ode import DescentODE
 from aviary.mission.gasp_based.ode.params import set_params_for_unit_tests
+from aviary.mission.ode.nodewise_newton import is_openmdao_supported
 from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.utils.test_utils.default_subsystems import get_default_mission_subsystems
 from aviary.utils.test_utils.IO_test_util import check_prob_outputs
@@ -86,6 +87,15 @@ class DescentODETestCase(unittest.TestCase):
         )
         assert_check_partials(partial_data, atol=1e-8, rtol=1e-8)
 
+    @unittest.skipIf(
+        not is_openmdao_supported(),
+        'Skipping due to OpenMDAO version not supported by NodewiseNewtonSolver',
+    )
+    def test_high_alt_nodewise(self):
+        # Same conditions as above, converging the balances node by node.
+        self.sys.options['balance_solver'] = 'nodewise'
+        self.test_high_alt()
+
     def test_low_alt(self):
         # Test descent below 10k ft
         self.sys.options['input_speed_type'] = SpeedType.EAS
@@ -3,6 +3,7 @@ import openmdao.api as om
 
 from aviary.mission.base_ode import BaseODE as _BaseODE
 from aviary.mission.ode.altitude_rate import AltitudeRate
+from aviary.mission.ode.nodewise_newton import NodewiseNewtonSolver
 from aviary.mission.ode.specific_energy_rate import SpecificEnergyRate
 from aviary.variable_info.enums import AlphaModes
 from aviary.variable_info.variables import Aircraft, Dynamic
@@ -13,6 +14,29 @@ class TwoDOFODE(_BaseODE):
 
     def initialize(self):
         super().initialize()
+        self.options.declare(
+            'balance_solver',
+            default='newton',
+            values=['newton', 'nodewise'],
+            desc='Nonlinear solver used on the balance groups of this ODE. "newton" solves '
+            'all nodes together with a NewtonSolver, "nodewise" uses the batched '
+            'NodewiseNewtonSolver, which treats every node as an independent problem.',
+        )
+
+    def add_balance_solver(self, group, atol=1e-7, rtol=1e-7, print_level=0, bounds_enforce=True):
+        """Add the nonlinear and linear solvers selected by "balance_solver" to a balance group."""
+        if self.options['balance_solver'] == 'nodewise':
+            group.nonlinear_solver = NodewiseNewtonSolver(atol=atol, rtol=rtol, iprint=print_level)
+        else:
+            group.nonlinear_solver = om.NewtonSolver()
+            group.nonlinear_solver.options['solve_subsystems'] = True
+            group.nonlinear_solver.options['iprint'] = print_level
+            group.nonlinear_solver.options['atol'] = atol
+            group.nonlinear_solver.options['rtol'] = rtol
+            if bounds_enforce:
+                group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
+
+        group.linear_solver = om.DirectSolver(assemble_jac=True)
 
     def add_alpha_control(
         self,
@@ -158,13 +182,7 @@ class TwoDOFODE(_BaseODE):
             )
 
             if add_default_solver and alpha_mode not in (AlphaModes.ROTATION,):
-                alpha_group.nonlinear_solver = om.NewtonSolver()
-                alpha_group.nonlinear_solver.options['solve_subsystems'] = True
-                alpha_group.nonlinear_solver.options['iprint'] = print_level
-                alpha_group.nonlinear_solver.options['atol'] = atol
-                alpha_group.nonlinear_solver.options['rtol'] = rtol
-                alpha_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-                alpha_group.linear_solver = om.DirectSolver(assemble_jac=True)
+                self.add_balance_solver(alpha_group, atol=atol, rtol=rtol, print_level=print_level)
 
     def add_throttle_control(
         self,
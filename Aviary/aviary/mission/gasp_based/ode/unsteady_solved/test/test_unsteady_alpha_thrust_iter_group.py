@@ -12,6 +12,7 @@ from aviary.mission.gasp_based.ode.unsteady_solved.unsteady_control_iter_group i
 from aviary.mission.gasp_based.ode.unsteady_solved.unsteady_solved_flight_conditions import (
     UnsteadySolvedFlightConditions,
 )
+from aviary.mission.ode.nodewise_newton import is_openmdao_supported
 from aviary.subsystems.aerodynamics.aerodynamics_builder import CoreAerodynamicsBuilder
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.enums import LegacyCode, SpeedType
@@ -22,7 +23,7 @@ from aviary.variable_info.variables import Aircraft, Dynamic
 class TestUnsteadyAlphaThrustIterGroup(unittest.TestCase):
     """Test the UnsteadyControlIterGroup."""
 
-    def _test_unsteady_alpha_thrust_iter_group(self, ground_roll=False):
+    def _test_unsteady_alpha_thrust_iter_group(self, ground_roll=False, balance_solver='newton'):
         nn = 5
 
         # just need aero subsystem
@@ -37,7 +38,11 @@ class TestUnsteadyAlphaThrustIterGroup(unittest.TestCase):
         p.model.add_subsystem('fc', subsys=fc, promotes_inputs=['*'], promotes_outputs=['*'])
 
         g = UnsteadyControlIterGroup(
-            num_nodes=nn, ground_roll=ground_roll, clean=True, core_subsystems=[aero]
+            num_nodes=nn,
+            ground_roll=ground_roll,
+            clean=True,
+            core_subsystems=[aero],
+            balance_solver=balance_solver,
         )
 
         ig = p.model.add_subsystem(
@@ -106,6 +111,13 @@ class TestUnsteadyAlphaThrustIterGroup(unittest.TestCase):
             with self.subTest(msg=f'ground_roll={ground_roll}'):
                 self._test_unsteady_alpha_thrust_iter_group(ground_roll=ground_roll)
 
+    @unittest.skipIf(
+        not is_openmdao_supported(),
+        'Skipping due to OpenMDAO version not supported by NodewiseNewtonSolver',
+    )
+    def test_iter_group_nodewise(self):
+        self._test_unsteady_alpha_thrust_iter_group(balance_solver='nodewise')
+
 
 if __name__ == '__main__':
     unittest.main()
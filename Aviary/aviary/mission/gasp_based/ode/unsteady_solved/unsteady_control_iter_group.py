@@ -3,6 +3,7 @@ import openmdao.api as om
 
 from aviary.constants import RHO_SEA_LEVEL_ENGLISH
 from aviary.mission.gasp_based.ode.unsteady_solved.unsteady_solved_eom import UnsteadySolvedEOM
+from aviary.mission.ode.nodewise_newton import NodewiseNewtonSolver
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Dynamic
 
@@ -43,6 +44,15 @@ class UnsteadyControlIterGroup(om.Group):
             desc='dictionary of parameters to be passed to the subsystem builders',
         )
 
+        self.options.declare(
+            'balance_solver',
+            default='newton',
+            values=['newton', 'nodewise'],
+            desc='Nonlinear solver used to converge alpha and thrust. "newton" solves all '
+            'nodes together with a NewtonSolver, "nodewise" uses the batched '
+            'NodewiseNewtonSolver, which treats every node as an independent problem.',
+        )
+
     def setup(self):
         nn = self.options['num_nodes']
         ground_roll = self.options['ground_roll']
@@ -108,8 +118,13 @@ class UnsteadyControlIterGroup(om.Group):
             promotes_outputs=['*'],
         )
 
-        self.nonlinear_solver = om.NewtonSolver(solve_subsystems=True, atol=1.0e-10, rtol=1.0e-10)
-        # self.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
+        if self.options['balance_solver'] == 'nodewise':
+            self.nonlinear_solver = NodewiseNewtonSolver(atol=1.0e-10, rtol=1.0e-10)
+        else:
+            self.nonlinear_solver = om.NewtonSolver(
+                solve_subsystems=True, atol=1.0e-10, rtol=1.0e-10
+            )
+            # self.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
         self.linear_solver = om.DirectSolver(assemble_jac=True)
 
         # Set common default values for promoted inputs
@@ -157,13 +157,7 @@ class UnsteadySolvedODE(TwoDOFODE):
             promotes_outputs=['*'],
         )
 
-        throttle_balance_group.nonlinear_solver = om.NewtonSolver(
-            solve_subsystems=True,
-            atol=1.0e-10,
-            rtol=1.0e-10,
-        )
-        throttle_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        throttle_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+        self.add_balance_solver(throttle_balance_group, atol=1.0e-10, rtol=1.0e-10)
         throttle_balance_group.nonlinear_solver.options['err_on_non_converge'] = True
 
         kwargs = {
@@ -252,11 +246,9 @@ class UnsteadySolvedODE(TwoDOFODE):
             promotes_outputs=['*'],
         )
 
-        control_iter_group.nonlinear_solver = om.NewtonSolver(
-            solve_subsystems=True, atol=1.0e-10, rtol=1.0e-10
+        self.add_balance_solver(
+            control_iter_group, atol=1.0e-10, rtol=1.0e-10, bounds_enforce=False
         )
-        # control_iter_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        control_iter_group.linear_solver = om.DirectSolver(assemble_jac=True)
 
         self.add_subsystem(
             'mass_rate',
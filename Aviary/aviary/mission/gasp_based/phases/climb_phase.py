@@ -103,6 +103,14 @@ class ClimbPhaseOptions(AviaryOptionsDictionary):
             'The mach value is set in "mach_cruise".',
         )
 
+        self.declare(
+            name='balance_solver',
+            default='newton',
+            values=['newton', 'nodewise'],
+            desc='Nonlinear solver used on the speed and lift balances of the ODE. "nodewise" '
+            'converges every node independently with the batched NodewiseNewtonSolver.',
+        )
+
 
 class ClimbPhase(PhaseBuilderBase):
     """
@@ -224,6 +232,7 @@ class ClimbPhase(PhaseBuilderBase):
         return {
             'EAS_target': self.user_options.get_val('EAS_target', units='kn'),
             'mach_cruise': self.user_options.get_val('mach_cruise'),
+            'balance_solver': self.user_options.get_val('balance_solver'),
         }
 
 
@@ -92,6 +92,14 @@ class DescentPhaseOptions(AviaryOptionsDictionary):
             'computed from it.',
         )
 
+        self.declare(
+            name='balance_solver',
+            default='newton',
+            values=['newton', 'nodewise'],
+            desc='Nonlinear solver used on the speed and lift balances of the ODE. "nodewise" '
+            'converges every node independently with the batched NodewiseNewtonSolver.',
+        )
+
 
 class DescentPhase(PhaseBuilderBase):
     """
@@ -178,6 +186,7 @@ class DescentPhase(PhaseBuilderBase):
             'input_speed_type': self.user_options.get_val('input_speed_type'),
             'mach_cruise': self.user_options.get_val('mach_cruise'),
             'EAS_limit': self.user_options.get_val('EAS_limit', 'kn'),
+            'balance_solver': self.user_options.get_val('balance_solver'),
         }
 
 
@@ -18,6 +18,8 @@ class PolynomialFit(om.ImplicitComponent):
         Compute the outputs, given the inputs using the numpy fitting function.
     apply_nonlinear(self, inputs, outputs, residuals):
         Compute the residuals
+    linearize(self, inputs, outputs, J):
+        Compute the partials of the residuals
     """
 
     def initialize(self):
@@ -39,9 +41,11 @@ class PolynomialFit(om.ImplicitComponent):
         # these are the coefficients of the polynomial function you are fitting
         self.add_output('A', np.zeros(4))  # assuming a 5th order polynomial
 
-        # using CS here will give accurate partials, but will miss the sparsity pattern
-        # issue #497
-        self.declare_partials('*', '*', method='cs')
+        self.declare_partials('A', ['A', 'h_cp', 'time_cp'])
+        self.declare_partials('h_init_gear', ['A', 't_init_gear'])
+        self.declare_partials('h_init_gear', 'h_init_gear', val=-1.0)
+        self.declare_partials('h_init_flaps', ['A', 't_init_flaps'])
+        self.declare_partials('h_init_flaps', 'h_init_flaps', val=-1.0)
 
         self.linear_solver = om.DirectSolver()
 
@@ -109,3 +113,31 @@ class PolynomialFit(om.ImplicitComponent):
         x_flaps = inputs['t_init_flaps']
         h_flaps = a0 + a1 * x_flaps + a2 * x_flaps**2 + a3 * x_flaps**3
         residuals['h_init_flaps'] = h_flaps - outputs['h_init_flaps']
+
+    def linearize(self, inputs, outputs, J):
+        a0, a1, a2, a3 = outputs['A']
+
+        X_cp = inputs['time_cp']
+        Y_cp = inputs['h_cp']
+
+        # powers of the control point times, X_cp**k for k = 0..3
+        powers = X_cp ** np.arange(4)[:, np.newaxis]
+
+        Y_computed = a0 + a1 * X_cp + a2 * X_cp**2 + a3 * X_cp**3
+        dY_computed__dX_cp = a1 + 2 * a2 * X_cp + 3 * a3 * X_cp**2
+        error = Y_computed - Y_cp
+
+        # residuals['A'][k] = sum(2 * error * X_cp**k)
+        J['A', 'A'] = 2 * powers @ powers.T
+        J['A', 'h_cp'] = -2 * powers
+        d_powers__dX_cp = np.zeros_like(powers)
+        d_powers__dX_cp[1:] = np.arange(1, 4)[:, np.newaxis] * powers[:-1]
+        J['A', 'time_cp'] = 2 * (dY_computed__dX_cp * powers + error * d_powers__dX_cp)
+
+        x_gear = inputs['t_init_gear']
+        J['h_init_gear', 'A'] = x_gear ** np.arange(4)
+        J['h_init_gear', 't_init_gear'] = a1 + 2 * a2 * x_gear + 3 * a3 * x_gear**2
+
+        x_flaps = inputs['t_init_flaps']
+        J['h_init_flaps', 'A'] = x_flaps ** np.arange(4)
+        J['h_init_flaps', 't_init_flaps'] = a1 + 2 * a2 * x_flaps + 3 * a3 * x_flaps**2
@@ -1,7 +1,7 @@
 import unittest
 
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
 from aviary.mission.gasp_based.polynomial_fit import PolynomialFit
 
@@ -74,15 +74,15 @@ class PolynomialFitTest(unittest.TestCase):
         self.prob.setup(check=False, force_alloc_complex=True)
 
     def test_case1(self):
-        # Checks output values only. It will not check partials
-        # because cs is used to compute partials already.
-
         self.prob.run_model()
 
         tol = 5e-4
         assert_near_equal(self.prob['h_init_gear'], -600, tol)
         assert_near_equal(self.prob['h_init_flaps'], -250, tol)
 
+        partial_data = self.prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-8, rtol=1e-8)
+
 
 if __name__ == '__main__':
     unittest.main()
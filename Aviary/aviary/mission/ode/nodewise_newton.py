@@ -0,0 +1,329 @@
+import numpy as np
+import openmdao
+import openmdao.api as om
+from openmdao.solvers.solver import NonlinearSolver
+from packaging.specifiers import SpecifierSet
+
+# Besides the solver hooks of NonlinearSolver, the solver reads and writes the vectors of the
+# owning group and runs its transfers directly, which OpenMDAO has no public API for. It is
+# only used with the versions of OpenMDAO it has been tested with.
+SUPPORTED_OPENMDAO_VERSIONS = SpecifierSet('>=3.37,<3.40')
+
+
+def is_openmdao_supported():
+    """Return True if the installed OpenMDAO is one NodewiseNewtonSolver supports."""
+    return openmdao.__version__ in SUPPORTED_OPENMDAO_VERSIONS
+
+
+class NodewiseNewtonSolver(NonlinearSolver):
+    """
+    Batched Newton solver for groups whose balances are independent at every node.
+
+    The outputs of the implicit components that are direct children of the owning group
+    (typically BalanceComps) are treated as the unknowns. They must all have the same size,
+    one value per node, so that each node is a small k x k problem where k is the number of
+    balanced variables. Every other subsystem must be feed-forward once those outputs are
+    fixed, and any subgroup must converge itself with its own solver.
+
+    Each iteration computes the per-node Jacobian with one finite difference evaluation of
+    the group per balanced variable (all nodes are perturbed at once) and takes a batched
+    Newton step. Converged nodes are frozen, steps are clipped to the output bounds, and for
+    scalar balances the step falls back to bisection whenever it leaves the bracket formed
+    by previously evaluated points.
+
+    Derivatives are unaffected: the linear solver of the owning group (usually
+    DirectSolver) is still used for linear solves.
+
+    The solver relies on internals of OpenMDAO, so setup fails unless the installed version
+    is in SUPPORTED_OPENMDAO_VERSIONS.
+    """
+
+    SOLVER = 'NL: NodewiseNewton'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._balance_outputs = []
+        self._eval_order = []
+        self._balance_systems = []
+        self._lower = None
+        self._upper = None
+        self._res0 = None
+        self._active = None
+        self._bracket = None
+
+    def _declare_options(self):
+        """Declare options before kwargs are processed in the init method."""
+        super()._declare_options()
+
+        self.options.declare(
+            'fd_step',
+            default=1e-6,
+            lower=0.0,
+            desc='Relative step used to compute the per-node Jacobian by finite difference.',
+        )
+
+    def _setup_solvers(self, system, depth):
+        """
+        Find the balanced outputs and a feed-forward execution order for the other subsystems.
+
+        Parameters
+        ----------
+        system : Group
+            Pointer to the owning system.
+        depth : int
+            Depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+
+        if not is_openmdao_supported():
+            raise RuntimeError(
+                f'{self.msginfo}: {self.SOLVER} supports OpenMDAO {SUPPORTED_OPENMDAO_VERSIONS}, '
+                f'but version {openmdao.__version__} is installed. Use NewtonSolver instead.'
+            )
+
+        subsystems = {subsys.name: subsys for subsys in system.system_iter(recurse=False)}
+        balance_names = [
+            name for name, subsys in subsystems.items() if isinstance(subsys, om.ImplicitComponent)
+        ]
+
+        if not balance_names:
+            raise RuntimeError(
+                f'{self.msginfo}: {self.SOLVER} requires at least one implicit component as a '
+                'direct child of the group.'
+            )
+
+        prefix = system.pathname + '.' if system.pathname else ''
+        abs2meta_out = system.get_io_metadata(
+            iotypes='output',
+            metadata_keys=['size', 'lower', 'upper', 'ref', 'ref0'],
+            return_rel_names=False,
+        )
+
+        self._balance_systems = [subsystems[name] for name in balance_names]
+        self._balance_outputs = [
+            abs_name
+            for abs_name in abs2meta_out
+            if abs_name[len(prefix) :].split('.', 1)[0] in balance_names
+        ]
+
+        sizes = {abs2meta_out[abs_name]['size'] for abs_name in self._balance_outputs}
+        if len(sizes) != 1:
+            raise RuntimeError(
+                f'{self.msginfo}: {self.SOLVER} requires all balanced outputs to have the same '
+                f'size (one value per node), but found sizes {sorted(sizes)}.'
+            )
+
+        num_nodes = sizes.pop()
+        lower = np.full((num_nodes, len(self._balance_outputs)), -np.inf)
+        upper = np.full((num_nodes, len(self._balance_outputs)), np.inf)
+
+        for i, abs_name in enumerate(self._balance_outputs):
+            meta = abs2meta_out[abs_name]
+            ref = meta['ref']
+            ref0 = meta['ref0']
+
+            if meta['lower'] is not None:
+                lower[:, i] = (np.ravel(meta['lower']) - ref0) / (ref - ref0)
+
+            if meta['upper'] is not None:
+                upper[:, i] = (np.ravel(meta['upper']) - ref0) / (ref - ref0)
+
+        self._lower = lower
+        self._upper = upper
+
+        # order the remaining subsystems so that one pass makes them consistent with the
+        # balanced outputs
+        depends_on = {name: set() for name in subsystems if name not in balance_names}
+
+        for abs_in, abs_out in system._conn_abs_in2out.items():
+            target = abs_in[len(prefix) :].split('.', 1)[0]
+            source = abs_out[len(prefix) :].split('.', 1)[0]
+
+            if target in depends_on and source in depends_on and source != target:
+                depends_on[target].add(source)
+
+        order = []
+        while depends_on:
+            ready = [name for name in subsystems if not depends_on.get(name, True)]
+
+            if not ready:
+                raise RuntimeError(
+                    f'{self.msginfo}: {self.SOLVER} requires the subsystems of the group to be '
+                    'feed-forward once the balanced outputs are fixed, but found a cycle '
+                    f'between {sorted(depends_on)}.'
+                )
+
+            name = ready[0]
+            order.append(subsystems[name])
+            depends_on.pop(name)
+
+            for sources in depends_on.values():
+                sources.discard(name)
+
+        self._eval_order = order
+
+    def _get_balance(self, vec):
+        """Return the balanced values of the given vector as an array of shape (nn, k)."""
+        return np.stack([vec._abs_get_val(abs_name) for abs_name in self._balance_outputs], axis=1)
+
+    def _set_balance(self, vals):
+        """Set the balanced outputs from an array of shape (nn, k)."""
+        outputs = self._system()._outputs
+
+        for i, abs_name in enumerate(self._balance_outputs):
+            outputs._abs_set_val(abs_name, vals[:, i])
+
+    def _evaluate(self):
+        """Run the feed-forward subsystems and return the balance residuals."""
+        system = self._system()
+
+        for subsys in self._eval_order:
+            system._transfer('nonlinear', 'fwd', subsys.name)
+
+            if subsys._is_local:
+                subsys._solve_nonlinear()
+
+        for subsys in self._balance_systems:
+            system._transfer('nonlinear', 'fwd', subsys.name)
+
+            if subsys._is_local:
+                subsys._apply_nonlinear()
+
+        return self._get_balance(system._residuals)
+
+    def _run_apply(self):
+        """Evaluate the group at the current balanced outputs."""
+        self._recording_iter.push(('_run_apply', 0))
+        try:
+            residuals = self._evaluate()
+        finally:
+            self._recording_iter.pop()
+
+        self._update_active(residuals)
+
+    def _update_active(self, residuals):
+        """Flag the nodes that have not met the tolerances yet."""
+        abs_res = np.abs(residuals)
+
+        if self._res0 is None:
+            res0 = abs_res.real.copy()
+            res0[res0 == 0.0] = 1.0
+            self._res0 = res0
+
+        unconverged = (abs_res > self.options['atol']) & (
+            abs_res > self.options['rtol'] * self._res0
+        )
+        self._active = np.any(unconverged | np.isnan(abs_res), axis=1)
+
+        if self._system().under_complex_step:
+            # the perturbation is far below the tolerances, so every node needs the update
+            self._active[:] = True
+
+        self._balance_residuals = residuals
+
+    def _iter_initialize(self):
+        """
+        Perform any necessary pre-processing operations.
+
+        Returns
+        -------
+        float
+            Initial error.
+        float
+            Error at the first iteration.
+        """
+        self._res0 = None
+        self._bracket = None
+
+        return super()._iter_initialize()
+
+    def _iter_get_norm(self):
+        """
+        Return the norm of the residuals at the nodes that have not converged.
+
+        Returns
+        -------
+        float
+            Norm.
+        """
+        if self._active is None:
+            return self._system()._residuals.get_norm()
+
+        return np.linalg.norm(self._balance_residuals[self._active])
+
+    def _single_iteration(self):
+        """Perform a batched Newton iteration on the unconverged nodes."""
+        active = self._active
+        x = self._get_balance(self._system()._outputs).copy()
+        residuals = self._balance_residuals
+        num_nodes, k = x.shape
+
+        # per-node jacobian; the perturbation is taken away from the nearest bound
+        steps = self.options['fd_step'] * (1.0 + np.abs(x.real))
+        steps[x.real + steps > self._upper] *= -1.0
+
+        jac = np.zeros((num_nodes, k, k), dtype=residuals.dtype)
+        for j in range(k):
+            x_perturbed = x.copy()
+            x_perturbed[active, j] += steps[active, j]
+            self._set_balance(x_perturbed)
+            residuals_perturbed = self._evaluate()
+
+            jac[:, :, j] = (residuals_perturbed - residuals) / steps[:, j, np.newaxis]
+
+            if k == 1:
+                self._update_bracket(x_perturbed, residuals_perturbed)
+
+        if k == 1:
+            self._update_bracket(x, residuals)
+
+        x_new = x + self._newton_step(jac, residuals)
+
+        if k == 1:
+            # bisect wherever the newton step is not usable or leaves the known bracket
+            lo, hi = self._bracket
+            bracketed = np.isfinite(lo) & np.isfinite(hi)
+            left = np.minimum(lo, hi)
+            right = np.maximum(lo, hi)
+            outside = ~np.isfinite(x_new.real) | (
+                bracketed & ((x_new.real <= left) | (x_new.real >= right))
+            )
+            bisect = outside & bracketed
+            x_new[bisect] = 0.5 * (lo[bisect] + hi[bisect])
+            x_new[outside & ~bracketed] = x[outside & ~bracketed]
+
+        x_new = np.where(np.isfinite(x_new), x_new, x)
+        x_new.real = np.clip(x_new.real, self._lower, self._upper)
+        x_new[~active] = x[~active]
+
+        self._set_balance(x_new)
+
+        if self._system().under_complex_step:
+            # with a finite difference jacobian the imaginary part only converges linearly, so
+            # take a couple of chord steps to resolve it to complex step accuracy
+            for _ in range(2):
+                x_new = x_new + self._newton_step(jac, self._evaluate())
+                self._set_balance(x_new)
+
+    def _newton_step(self, jac, residuals):
+        """Solve the per-node linear systems for the newton step."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if jac.shape[1] == 1:
+                return -residuals / jac[:, :, 0]
+
+            try:
+                return np.linalg.solve(jac, -residuals[..., np.newaxis])[..., 0]
+            except np.linalg.LinAlgError:
+                return (np.linalg.pinv(jac) @ -residuals[..., np.newaxis])[..., 0]
+
+    def _update_bracket(self, x, residuals):
+        """Track the latest points with negative and positive residuals for scalar balances."""
+        if self._bracket is None:
+            self._bracket = (np.full(x.shape, np.nan), np.full(x.shape, np.nan))
+
+        lo, hi = self._bracket
+        negative = residuals.real < 0.0
+        positive = residuals.real > 0.0
+        lo[negative] = x.real[negative]
+        hi[positive] = x.real[positive]
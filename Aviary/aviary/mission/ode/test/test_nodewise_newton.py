@@ -0,0 +1,137 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_totals, assert_near_equal
+from packaging.specifiers import SpecifierSet
+
+from aviary.mission.ode import nodewise_newton
+from aviary.mission.ode.nodewise_newton import NodewiseNewtonSolver, is_openmdao_supported
+
+
+@unittest.skipIf(
+    not is_openmdao_supported(),
+    'Skipping due to OpenMDAO version not supported by NodewiseNewtonSolver',
+)
+class NodewiseNewtonSolverTest(unittest.TestCase):
+    def test_scalar_balance(self):
+        nn = 6
+        target = np.linspace(-1.4, 1.4, nn)
+
+        prob = om.Problem()
+        group = prob.model.add_subsystem('group', om.Group(), promotes=['*'])
+
+        # the balance comes first so that the solver has to order the rest of the group
+        group.add_subsystem(
+            'balance',
+            om.BalanceComp(
+                'x', val=20.0 * np.ones(nn), lhs_name='f', rhs_name='c', lower=-50.0, upper=50.0
+            ),
+            promotes=['*'],
+        )
+        group.add_subsystem(
+            'atan', om.ExecComp('f = arctan(y)', f=np.ones(nn), y=np.ones(nn)), promotes=['*']
+        )
+        group.add_subsystem(
+            'scale', om.ExecComp('y = 2.0 * x', y=np.ones(nn), x=np.ones(nn)), promotes=['*']
+        )
+
+        # plain newton diverges for arctan from this far out, so this needs the bisection
+        group.nonlinear_solver = NodewiseNewtonSolver(
+            atol=1e-12, rtol=1e-12, maxiter=100, err_on_non_converge=True
+        )
+        group.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        prob.set_val('c', target)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('x'), 0.5 * np.tan(target), tolerance=1e-10)
+
+    def test_coupled_balances(self):
+        nn = 4
+        a = np.array([1.0, 2.0, 3.0, 4.0])
+
+        prob = om.Problem()
+        group = prob.model.add_subsystem('group', om.Group(), promotes=['*'])
+
+        group.add_subsystem(
+            'eqs',
+            om.ExecComp(
+                ['f1 = x**2 + y**2', 'f2 = x - y'],
+                f1=np.ones(nn),
+                f2=np.ones(nn),
+                x=np.ones(nn),
+                y=np.ones(nn),
+                has_diag_partials=True,
+            ),
+            promotes=['*'],
+        )
+
+        balance = om.BalanceComp()
+        balance.add_balance('x', val=np.ones(nn), lhs_name='f1', rhs_name='r1')
+        balance.add_balance('y', val=0.5 * np.ones(nn), lhs_name='f2', rhs_val=0.0)
+        group.add_subsystem('balance', balance, promotes=['*'])
+
+        group.nonlinear_solver = NodewiseNewtonSolver(atol=1e-12, rtol=1e-12, maxiter=30)
+        group.linear_solver = om.DirectSolver(assemble_jac=True)
+
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('r1', a)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('x'), np.sqrt(a / 2.0), tolerance=1e-10)
+        assert_near_equal(prob.get_val('y'), np.sqrt(a / 2.0), tolerance=1e-10)
+
+        # derivatives still come from the linear solver of the group
+        totals = prob.check_totals(of=['x'], wrt=['r1'], method='cs', out_stream=None)
+        assert_check_totals(totals, atol=1e-10, rtol=1e-10)
+
+    def test_cycle_error(self):
+        nn = 2
+
+        prob = om.Problem()
+        group = prob.model.add_subsystem('group', om.Group(), promotes=['*'])
+
+        group.add_subsystem(
+            'balance', om.BalanceComp('x', val=np.ones(nn), lhs_name='b'), promotes=['*']
+        )
+        group.add_subsystem(
+            'c1',
+            om.ExecComp('a = x + b', a=np.ones(nn), x=np.ones(nn), b=np.ones(nn)),
+            promotes=['*'],
+        )
+        group.add_subsystem(
+            'c2', om.ExecComp('b = 0.5 * a', b=np.ones(nn), a=np.ones(nn)), promotes=['*']
+        )
+
+        group.nonlinear_solver = NodewiseNewtonSolver()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertIn('feed-forward', str(cm.exception))
+
+
+class NodewiseNewtonVersionTest(unittest.TestCase):
+    def test_unsupported_version(self):
+        prob = om.Problem()
+        group = prob.model.add_subsystem('group', om.Group(), promotes=['*'])
+        group.add_subsystem('balance', om.BalanceComp('x', lhs_name='f'), promotes=['*'])
+        group.add_subsystem('f', om.ExecComp('f = 2.0 * x'), promotes=['*'])
+        group.nonlinear_solver = NodewiseNewtonSolver()
+
+        with patch.object(nodewise_newton, 'SUPPORTED_OPENMDAO_VERSIONS', SpecifierSet('<1.0')):
+            self.assertFalse(is_openmdao_supported())
+
+            with self.assertRaises(RuntimeError) as cm:
+                prob.setup()
+                prob.final_setup()
+
+        self.assertIn('NewtonSolver instead', str(cm.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Test the inverse engine deck throttle lookup in the height-energy ODE."""
+
+import unittest
+from copy import deepcopy
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.models.missions.height_energy_default import phase_info
+from aviary.variable_info.variables import Dynamic
+
+phase_info = deepcopy(phase_info)
+
+phase_info['pre_mission']['include_takeoff'] = False
+phase_info['post_mission']['include_landing'] = False
+phase_info.pop('climb')
+phase_info.pop('descent')
+
+
+@use_tempdirs
+class TestInverseThrottle(unittest.TestCase):
+    def _run_cruise(self, inverse_throttle):
+        local_phase_info = deepcopy(phase_info)
+        local_phase_info['cruise']['user_options']['inverse_throttle'] = inverse_throttle
+
+        prob = AviaryProblem(reports=False)
+
+        prob.load_inputs(
+            'models/aircraft/test_aircraft/aircraft_for_bench_FwFm.csv', local_phase_info
+        )
+
+        prob.check_and_preprocess_inputs()
+
+        prob.build_model()
+
+        prob.setup()
+
+        prob.run_model()
+
+        return prob
+
+    def test_inverse_throttle_energy(self):
+        prob = self._run_cruise(inverse_throttle=False)
+        inverse_prob = self._run_cruise(inverse_throttle=True)
+
+        # throttle is computed explicitly, so the thrust balance solver is not needed
+        solver_sub = inverse_prob.model.traj.phases.cruise.rhs_all.solver_sub
+        self.assertIsInstance(solver_sub.nonlinear_solver, om.NonlinearRunOnce)
+
+        throttle = prob.get_val('traj.cruise.timeseries.' + Dynamic.Vehicle.Propulsion.THROTTLE)
+        inverse_throttle = inverse_prob.get_val(
+            'traj.cruise.timeseries.' + Dynamic.Vehicle.Propulsion.THROTTLE
+        )
+        assert_near_equal(inverse_throttle, throttle, tolerance=1e-5)
+
+        thrust = inverse_prob.get_val(
+            'traj.cruise.rhs_all.' + Dynamic.Vehicle.Propulsion.THRUST_TOTAL, units='lbf'
+        )
+        thrust_required = inverse_prob.get_val('traj.cruise.rhs_all.thrust_required', units='lbf')
+        assert_near_equal(thrust, thrust_required, tolerance=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()
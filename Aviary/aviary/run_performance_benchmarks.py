@@ -0,0 +1,8 @@
+import sys
+
+from aviary.validation_cases.performance_benchmarks import main
+
+# Measure setup, final_setup, run_model and compute_totals times and peak memory of the
+# standard models, append them to a json history, and compare them against a baseline.
+# Run with --help for the options.
+sys.exit(main())
@@ -1,5 +1,6 @@
 import numpy as np
 import openmdao.api as om
+from openmdao.utils.om_warnings import SolverWarning, issue_warning
 
 from aviary.variable_info.functions import add_aviary_input, add_aviary_option
 from aviary.variable_info.variables import Aircraft, Dynamic
@@ -13,6 +14,13 @@ class SkinFriction(om.ImplicitComponent):
     The fixed-point iteration scheme has been replaced with Newton's method, which can
     converge the equations for multiple Mach numbers and characteristic lengths
     simultaneously.
+
+    Each node and component pair is an independent system in Re, wall_temp, cf_iter, and
+    skin_friction_coeff. By default ("block" solve mode), all pairs are converged at once
+    with vectorized Newton updates, and linear solves use the factored 4x4 diagonal blocks
+    of the Jacobian, so the cost grows linearly with the number of nodes. The "newton" solve
+    mode instead uses an OpenMDAO NewtonSolver with a DirectSolver over the whole
+    component.
     """
 
     def __init__(self, **kwargs):
@@ -22,11 +30,6 @@ class SkinFriction(om.ImplicitComponent):
         self.TAW = 1.0
         self.sea_level_pressure = 14.6959 * 144  # psi -> psf
 
-        self.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, atol=1e-12, rtol=1e-12)
-        self.linear_solver = om.DirectSolver()
-        self.nonlinear_solver.options['iprint'] = -1
-        self.linear_solver.options['iprint'] = -1
-
     def initialize(self):
         """Declare options."""
         self.options.declare(
@@ -35,6 +38,29 @@ class SkinFriction(om.ImplicitComponent):
             default=1,
             desc='The number of points at which the cross product is computed.',
         )
+        self.options.declare(
+            'solve_mode',
+            default='block',
+            values=('block', 'newton'),
+            desc='Use vectorized Newton with block-diagonal linear solves ("block"), or an '
+            'OpenMDAO NewtonSolver and DirectSolver ("newton").',
+        )
+        self.options.declare(
+            'tol',
+            types=float,
+            default=1e-12,
+            desc='Relative convergence tolerance for the "block" solve mode.',
+        )
+        self.options.declare(
+            'maxiter', types=int, default=30, desc='Maximum Newton iterations for "block" mode.'
+        )
+        self.options.declare(
+            'err_on_non_converge',
+            types=bool,
+            default=False,
+            desc='When True, raise an AnalysisError if the "block" solve mode does not '
+            'converge. Otherwise a warning is issued.',
+        )
 
         add_aviary_option(self, Aircraft.Engine.NUM_ENGINES)
         add_aviary_option(self, Aircraft.Fuselage.NUM_FUSELAGES)
@@ -48,6 +74,12 @@ class SkinFriction(om.ImplicitComponent):
 
         self.nc = nc = 2 + num_tails + num_fuselages + int(sum(num_engines))
 
+        if self.options['solve_mode'] == 'newton':
+            self.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, atol=1e-12, rtol=1e-12)
+            self.linear_solver = om.DirectSolver()
+            self.nonlinear_solver.options['iprint'] = -1
+            self.linear_solver.options['iprint'] = -1
+
         # Simulation inputs
         add_aviary_input(self, Dynamic.Atmosphere.TEMPERATURE, shape=nn, units='degR')
         add_aviary_input(self, Dynamic.Atmosphere.STATIC_PRESSURE, shape=nn, units='lbf/ft**2')
@@ -193,6 +225,77 @@ class SkinFriction(om.ImplicitComponent):
             outputs['skin_friction_coeff'] - outputs['cf_iter'] / wall_temp_ratio
         )
 
+    def solve_nonlinear(self, inputs, outputs):
+        """Converge all node and component pairs at once with vectorized Newton updates."""
+        tol = self.options['tol']
+        residuals = {}
+        partials = {}
+
+        self.guess_nonlinear(inputs, outputs, None)
+        self.apply_nonlinear(inputs, outputs, residuals)
+
+        maxiter = self.options['maxiter']
+
+        for _ in range(maxiter):
+            # Re and skin_friction_coeff follow explicitly from the (wall_temp, cf_iter)
+            # pair, so Newton only iterates on the 2x2 system in each cell.
+            self.linearize(inputs, outputs, partials)
+            a, b, c, d = self._blocks[:4]
+            r_wt = residuals['wall_temp']
+            r_cf = residuals['cf_iter']
+            det = a * d - b * c
+            delta_wt = (d * r_wt - b * r_cf) / det
+            delta_cf = (a * r_cf - c * r_wt) / det
+
+            outputs['wall_temp'] -= delta_wt
+            outputs['cf_iter'] -= delta_cf
+            self.apply_nonlinear(inputs, outputs, residuals)
+
+            if np.all(np.abs(delta_wt.real) <= tol * np.abs(outputs['wall_temp'].real)) and (
+                np.all(np.abs(delta_cf.real) <= tol * np.abs(outputs['cf_iter'].real))
+            ):
+                break
+        else:
+            msg = (
+                f"{self.msginfo}: Newton iteration of the 'block' solve mode failed to converge "
+                f'in {maxiter} iterations.'
+            )
+            if self.options['err_on_non_converge']:
+                raise om.AnalysisError(msg)
+
+            issue_warning(msg, category=SolverWarning)
+
+        outputs['Re'] -= residuals['Re']
+        outputs['skin_friction_coeff'] -= residuals['skin_friction_coeff']
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        """Solve the block-diagonal linear system one 4x4 block per node and component."""
+        a, b, c, d, e, f = self._blocks
+        det = a * d - b * c
+
+        if mode == 'fwd':
+            r_wt = d_residuals['wall_temp']
+            r_cf = d_residuals['cf_iter']
+            x_wt = (d * r_wt - b * r_cf) / det
+            x_cf = (a * r_cf - c * r_wt) / det
+
+            d_outputs['Re'] = d_residuals['Re']
+            d_outputs['wall_temp'] = x_wt
+            d_outputs['cf_iter'] = x_cf
+            d_outputs['skin_friction_coeff'] = d_residuals['skin_friction_coeff'] - (
+                e * x_wt + f * x_cf
+            )
+
+        else:
+            y_skf = d_outputs['skin_friction_coeff']
+            r_wt = d_outputs['wall_temp'] - e * y_skf
+            r_cf = d_outputs['cf_iter'] - f * y_skf
+
+            d_residuals['Re'] = d_outputs['Re']
+            d_residuals['wall_temp'] = (d * r_wt - c * r_cf) / det
+            d_residuals['cf_iter'] = (a * r_cf - b * r_wt) / det
+            d_residuals['skin_friction_coeff'] = y_skf
+
     def linearize(self, inputs, outputs, partials):
         nn = self.options['num_nodes']
         nc = self.nc
@@ -304,3 +407,14 @@ class SkinFriction(om.ImplicitComponent):
             'ij,i->ij', dskf_dwtr, dwtr_dwt
         ).ravel()
         partials['skin_friction_coeff', 'cf_iter'] = (-1.0 / wall_temp_ratio).ravel()
+
+        # Diagonal blocks of d(residuals)/d(outputs) that couple outputs within a cell, used
+        # by solve_nonlinear and solve_linear.
+        self._blocks = (
+            dreswt_dCFL * dCFL_dwt + dreswt_dwt,
+            dreswt_dCFL * dCFL_dcf,
+            drescf_dRP * dRP_dwt,
+            drescf_dcf,
+            np.einsum('ij,i->ij', dskf_dwtr, dwtr_dwt),
+            -1.0 / wall_temp_ratio,
+        )
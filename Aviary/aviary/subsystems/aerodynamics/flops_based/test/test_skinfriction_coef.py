@@ -2,7 +2,12 @@ import unittest
 
 import numpy as np
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from openmdao.utils.assert_utils import (
+    assert_check_partials,
+    assert_check_totals,
+    assert_near_equal,
+)
+from openmdao.utils.om_warnings import SolverWarning
 
 from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFriction
 from aviary.variable_info.variables import Aircraft
@@ -439,6 +444,81 @@ class SkinFrictionCoeffTest(unittest.TestCase):
         assert_near_equal(np.max(cf_diff), 0.0, 1e-4)
         assert_near_equal(np.max(Re_diff), 0.0, 1e-4)
 
+    def test_block_solve_mode(self):
+        # The block-diagonal solve must match the NewtonSolver/DirectSolver solution and
+        # give correct total derivatives in both modes.
+        n = 8
+        machs = np.linspace(0.2, 0.85, n)
+        temp = np.linspace(390.0, 518.0, n)
+        pres = np.linspace(2116.0, 400.0, n)
+        lens = np.array([8.0, 2.0, 12.0, 100.0, 10.0])
+
+        options = {}
+        options[Aircraft.VerticalTail.NUM_TAILS] = 1
+        options[Aircraft.Fuselage.NUM_FUSELAGES] = 1
+        options[Aircraft.Engine.NUM_ENGINES] = [1]
+
+        results = {}
+        for solve_mode in ('newton', 'block'):
+            for mode in ('fwd', 'rev'):
+                prob = om.Problem()
+                model = prob.model
+                model.add_subsystem(
+                    'cf', SkinFriction(num_nodes=n, solve_mode=solve_mode, **options)
+                )
+                model.add_design_var('cf.mach')
+                model.add_design_var('cf.characteristic_lengths')
+                model.add_constraint('cf.skin_friction_coeff')
+                model.add_constraint('cf.Re', ref=1e6)
+
+                prob.setup(mode=mode, force_alloc_complex=True)
+
+                prob.set_val('cf.temperature', temp)
+                prob.set_val('cf.static_pressure', pres)
+                prob.set_val('cf.mach', machs)
+                prob.set_val('cf.characteristic_lengths', lens)
+
+                prob.run_model()
+
+                results[solve_mode, mode] = prob.get_val('cf.skin_friction_coeff')
+
+                if solve_mode == 'block':
+                    data = prob.check_totals(method='cs', out_stream=None)
+                    assert_check_totals(data, atol=1e-8, rtol=1e-8)
+
+        for cf in results.values():
+            assert_near_equal(cf, results['newton', 'fwd'], 1e-12)
+
+    def test_block_solve_non_converge(self):
+        n = 4
+        options = {}
+        options[Aircraft.VerticalTail.NUM_TAILS] = 0
+        options[Aircraft.Fuselage.NUM_FUSELAGES] = 1
+        options[Aircraft.Engine.NUM_ENGINES] = [0]
+
+        for err_on_non_converge in (False, True):
+            prob = om.Problem()
+            prob.model.add_subsystem(
+                'cf',
+                SkinFriction(
+                    num_nodes=n, maxiter=1, err_on_non_converge=err_on_non_converge, **options
+                ),
+            )
+            prob.setup()
+
+            prob.set_val('cf.temperature', np.ones(n) * 389.97)
+            prob.set_val('cf.static_pressure', np.ones(n) * 374.74437747)
+            prob.set_val('cf.mach', np.linspace(0.2, 0.8, n))
+            prob.set_val('cf.characteristic_lengths', np.linspace(1, 2, 3))
+
+            # one Newton iteration is not enough to converge
+            if err_on_non_converge:
+                with self.assertRaises(om.AnalysisError):
+                    prob.run_model()
+            else:
+                with self.assertWarns(SolverWarning):
+                    prob.run_model()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,7 +7,7 @@ from aviary.subsystems.aerodynamics.gasp_based.flaps_model.Cl_max import CLmaxCa
 from aviary.subsystems.aerodynamics.gasp_based.flaps_model.L_and_D_increments import (
     LiftAndDragIncrements,
 )
-from aviary.subsystems.aerodynamics.gasp_based.flaps_model.meta_model import MetaModelGroup
+from aviary.subsystems.aerodynamics.gasp_based.flaps_model.meta_model import FlapTablesComp
 from aviary.variable_info.enums import FlapType
 from aviary.variable_info.functions import add_aviary_option
 from aviary.variable_info.variables import Aircraft, Dynamic
@@ -16,7 +16,7 @@ from aviary.variable_info.variables import Aircraft, Dynamic
 class FlapsGroup(om.Group):
     """
     Group connecting four components of the flaps model. They are: BasicFlapsCalculations,
-    CLmaxCalculation, MetaModelGroup, and LiftAndDragIncrements. Then, a non-linear solver
+    CLmaxCalculation, FlapTablesComp, and LiftAndDragIncrements. Then, a non-linear solver
     is provided.
     """
 
@@ -76,7 +76,7 @@ class FlapsGroup(om.Group):
 
         self.add_subsystem(
             'LookupTables',
-            MetaModelGroup(),
+            FlapTablesComp(),
             promotes_inputs=[
                 'flap_defl_ratio',
                 'flap_defl',
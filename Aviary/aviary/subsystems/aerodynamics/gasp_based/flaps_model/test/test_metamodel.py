@@ -3,7 +3,10 @@ import unittest
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
-from aviary.subsystems.aerodynamics.gasp_based.flaps_model.meta_model import MetaModelGroup
+from aviary.subsystems.aerodynamics.gasp_based.flaps_model.meta_model import (
+    FlapTablesComp,
+    MetaModelGroup,
+)
 from aviary.variable_info.enums import FlapType
 from aviary.variable_info.variables import Aircraft, Dynamic
 
@@ -169,5 +172,33 @@ class MetaModelTestCaseFowler(unittest.TestCase):
         assert_check_partials(data, atol=1e-4, rtol=1e-4)
 
 
+class FlapTablesCompTestCase(unittest.TestCase):
+    def test_partials(self):
+        for flap_type in FlapType:
+            with self.subTest(flap_type=flap_type):
+                prob = om.Problem()
+                prob.model.add_subsystem(
+                    'tables', FlapTablesComp(**{Aircraft.Wing.FLAP_TYPE: flap_type}), promotes=['*']
+                )
+                prob.setup(force_alloc_complex=True)
+
+                # values between the table breakpoints, where the tables are differentiable
+                prob.set_val(Aircraft.Wing.FLAP_CHORD_RATIO, 0.27)
+                prob.set_val('flap_defl_ratio', 0.63)
+                prob.set_val(Aircraft.Wing.ASPECT_RATIO, 9.3)
+                prob.set_val(Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED, 0.127)
+                prob.set_val('flap_defl', 37.0, units='deg')
+                prob.set_val('slat_defl_ratio', 0.47)
+                prob.set_val('reynolds', 164.78406)
+                prob.set_val(Dynamic.Atmosphere.MACH, 0.18368)
+                prob.set_val(Aircraft.Wing.TAPER_RATIO, 0.36)
+                prob.set_val('body_to_span_ratio', 0.09239)
+                prob.set_val('chord_to_body_ratio', 0.12679)
+                prob.run_model()
+
+                data = prob.check_partials(out_stream=None, method='cs')
+                assert_check_partials(data, atol=1e-10, rtol=1e-10)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,7 +5,7 @@ from openmdao.utils import cs_safe as cs
 
 from aviary.constants import GRAV_ENGLISH_LBM
 from aviary.subsystems.aerodynamics.gasp_based.common import AeroForces, CLFromLift, TanhRampComp
-from aviary.utils.functions import sigmoidX, smooth_min, d_smooth_min
+from aviary.utils.functions import dSigmoidXdx, sigmoidX, smooth_min, d_smooth_min
 from aviary.variable_info.enums import AircraftTypes, Verbosity
 from aviary.variable_info.functions import add_aviary_input, add_aviary_option, add_aviary_output
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission, Settings
@@ -130,6 +130,25 @@ def cla(ar, sweep, mach):
     )
 
 
+def dcla_dmach(ar, sweep, mach):
+    """Derivative of the lift-curve slope from the Seckel equation with respect to Mach.
+
+    Parameters
+    ----------
+    ar : float
+        Aspect ratio
+    sweep : float
+        Quarter-chord sweep angle, in radians
+    mach : float
+        Mach number.
+    """
+    cos_sweep = np.cos(sweep)
+    q = (ar / (2 * cos_sweep)) ** 2
+    root = np.sqrt(1 + q * (1 - (mach * cos_sweep) ** 2))
+
+    return np.pi * ar / (1 + root) ** 2 * q * mach * cos_sweep**2 / root
+
+
 class WingTailRatios(om.ExplicitComponent):
     # NOTE this is actually getting added in mission, not pre-mission. Which place is
     # intended for this component??
@@ -353,27 +372,26 @@ class Xlifts(om.ExplicitComponent):
     def setup_partials(self):
         ar = np.arange(self.options['num_nodes'])
 
-        self.declare_partials('lift_ratio', '*', method='cs')
-        self.declare_partials('lift_ratio', Dynamic.Atmosphere.MACH, rows=ar, cols=ar, method='cs')
-        self.declare_partials('lift_curve_slope', '*', method='cs')
+        geom_params = [
+            Aircraft.Wing.ASPECT_RATIO,
+            Aircraft.Wing.SWEEP,
+            Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION,
+            Aircraft.HorizontalTail.SWEEP,
+            Aircraft.HorizontalTail.MOMENT_RATIO,
+            'sbar',
+            'cbar',
+            'hbar',
+            'bbar',
+        ]
+
         self.declare_partials(
-            'lift_curve_slope',
-            [
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION,
-                Aircraft.HorizontalTail.SWEEP,
-                Aircraft.HorizontalTail.MOMENT_RATIO,
-                'sbar',
-                'cbar',
-                'hbar',
-                'bbar',
-            ],
+            'lift_ratio',
+            [Aircraft.Design.STATIC_MARGIN, Aircraft.Design.CG_DELTA] + geom_params,
             method='cs',
         )
-        self.declare_partials(
-            'lift_curve_slope', Dynamic.Atmosphere.MACH, rows=ar, cols=ar, method='cs'
-        )
+        self.declare_partials('lift_ratio', Dynamic.Atmosphere.MACH, rows=ar, cols=ar)
+        self.declare_partials('lift_curve_slope', geom_params, method='cs')
+        self.declare_partials('lift_curve_slope', Dynamic.Atmosphere.MACH, rows=ar, cols=ar)
 
     def compute(self, inputs, outputs):
         (
@@ -444,6 +462,60 @@ class Xlifts(om.ExplicitComponent):
         outputs['lift_curve_slope'] = claw
         outputs['lift_ratio'] = lift_ratio
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            static_margin,
+            delta_cg,
+            AR,
+            sweep_c4,
+            htail_loc,
+            htail_sweep,
+            h_tail_moment,
+            sbar,
+            cbar,
+            hbar,
+            bbar,
+        ) = inputs.values()
+
+        delta = (static_margin + delta_cg) * h_tail_moment
+        xt = 1 / h_tail_moment
+        art = AR * bbar**2 / sbar
+        h = hbar * AR
+
+        claw0 = cla(AR, deg2rad(sweep_c4), mach)
+        dclaw0 = dcla_dmach(AR, deg2rad(sweep_c4), mach)
+        clat0 = cla(art, deg2rad(htail_sweep), mach) * (0.9 + 0.1 * htail_loc)
+        dclat0 = dcla_dmach(art, deg2rad(htail_sweep), mach) * (0.9 + 0.1 * htail_loc)
+
+        eps1 = 1 / (4 * np.pi * np.sqrt(xt**2 + h**2))
+        eps2 = 1 / np.pi / AR
+        eps3 = cs.abs(xt) / (np.pi * AR * np.sqrt(xt**2 + h**2 + AR**2 / 4))
+        eps4 = 1 / np.pi / art
+        eps5 = cs.abs(xt) / (np.pi * art * np.sqrt(xt**2 + h**2 + art**2 * cbar**2 / 4))
+
+        # only the lift-curve slopes of the surfaces depend on Mach
+        downwash_wing = eps1 + eps2 + eps3
+        downwash_tail = eps4 - eps5 - cbar * eps1
+
+        num = claw0 * (1 - clat0 * downwash_tail)
+        dnum = dclaw0 * (1 - clat0 * downwash_tail) - claw0 * dclat0 * downwash_tail
+        denom = 1 - clat0 * claw0 * downwash_wing * downwash_tail
+        ddenom = -(dclat0 * claw0 + clat0 * dclaw0) * downwash_wing * downwash_tail
+        claw = num / denom
+        dclaw = (dnum * denom - num * ddenom) / denom**2
+
+        clat = clat0 * (1 - claw * downwash_wing)
+        dclat = dclat0 * (1 - claw * downwash_wing) - clat0 * dclaw * downwash_wing
+
+        abar = clat / claw
+        dabar = (dclat * claw - clat * dclaw) / claw**2
+        c = 1 / (1 + 1 / abar / sbar)
+        dc = sbar / (abar * sbar + 1) ** 2 * dabar
+
+        J['lift_curve_slope', Dynamic.Atmosphere.MACH] = dclaw
+        J['lift_ratio', Dynamic.Atmosphere.MACH] = dc / (1 + delta - c) ** 2
+
 
 class FormFactorAndSIWB(om.ExplicitComponent):
     """
@@ -923,7 +995,7 @@ class AeroGeom(om.ExplicitComponent):
             method='cs',
         )
         self.declare_partials('SA4', [Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED], method='cs')
-        self.declare_partials('cf', [Dynamic.Atmosphere.MACH], rows=ar, cols=ar, method='cs')
+        self.declare_partials('cf', [Dynamic.Atmosphere.MACH], rows=ar, cols=ar)
 
         # diag partials for SA5-SA7
         self.declare_partials(
@@ -935,7 +1007,6 @@ class AeroGeom(om.ExplicitComponent):
             ],
             rows=ar,
             cols=ar,
-            method='cs',
         )
         self.declare_partials(
             'SA6',
@@ -946,7 +1017,6 @@ class AeroGeom(om.ExplicitComponent):
             ],
             rows=ar,
             cols=ar,
-            method='cs',
         )
         self.declare_partials(
             'SA7',
@@ -958,7 +1028,6 @@ class AeroGeom(om.ExplicitComponent):
             ],
             rows=ar,
             cols=ar,
-            method='cs',
         )
 
         # dense partials for SA5-SA7
@@ -1137,6 +1206,113 @@ class AeroGeom(om.ExplicitComponent):
         outputs['SA7'] = sa7
         outputs['cf'] = cf
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            sos,
+            nu,
+            ufac,
+            ff_wing,
+            ff_fus,
+            ff_nac,
+            ff_vtail,
+            ff_htail,
+            wing_fus_intf,
+            strut_fus_intf,
+            cd0_inc,
+            fe_fus_inc,
+            wing_min_pressure_loc,
+            wing_max_thickness_loc,
+            AR,
+            sweep_c4,
+            taper_ratio,
+            strut_wing_area_ratio,
+            avg_chord,
+            htail_chord,
+            vtail_chord,
+            fus_len,
+            nac_len,
+            htail_area,
+            fus_SA,
+            nacelle_area,
+            wing_area,
+            vtail_area,
+            tc_ratio,
+            strut_chord,
+            feintwf,
+            areashieldwf,
+            siwb,
+        ) = inputs.values()
+        nn = self.options['num_nodes']
+
+        # only the per-node partials are computed here, the rest use complex step
+        cf = 0.455 / 7**2.58 / (1 + 0.144 * mach**2) ** 0.65
+        dcf_dmach = -0.65 * 0.455 / 7**2.58 / (1 + 0.144 * mach**2) ** 1.65 * 0.288 * mach
+
+        reli_y1 = 700000 * np.ones(nn)
+        reli_y2 = sos * mach / nu
+        sig = sigmoidX(mach, 0.1, mu=0.005)
+        dsig_dmach = dSigmoidXdx(mach, 0.1, mu=0.005)
+        reli = (1 - sig) * reli_y1 + sig * reli_y2
+        dreli = {
+            Dynamic.Atmosphere.MACH: dsig_dmach * (reli_y2 - reli_y1) + sig * sos / nu,
+            Dynamic.Atmosphere.SPEED_OF_SOUND: sig * mach / nu,
+            Dynamic.Atmosphere.KINEMATIC_VISCOSITY: -sig * sos * mach / nu**2,
+        }
+        dcf = {
+            Dynamic.Atmosphere.MACH: dcf_dmach,
+            Dynamic.Atmosphere.SPEED_OF_SOUND: np.zeros(nn),
+            Dynamic.Atmosphere.KINEMATIC_VISCOSITY: np.zeros(nn),
+        }
+
+        good_mask = reli > 1
+
+        def re_factor(length):
+            """Re correction factor and its derivative with respect to reli."""
+            fre = np.ones(nn)
+            dfre_dreli = np.zeros(nn)
+            log_re = np.log10(reli[good_mask] * length) / 7
+            fre[good_mask] = log_re**-2.6
+            dfre_dreli[good_mask] = -2.6 * log_re**-3.6 / (7 * np.log(10) * reli[good_mask])
+            return fre, dfre_dreli
+
+        ffre, dffre = re_factor(fus_len)
+        fwre, dfwre = re_factor(avg_chord)
+        fnre, dfnre = re_factor(nac_len)
+        fvtre, dfvtre = re_factor(vtail_chord)
+        fhtre, dfhtre = re_factor(htail_chord)
+        if self.options[Aircraft.Wing.HAS_STRUT]:
+            fstrtre, dfstrtre = re_factor(strut_chord)
+        else:
+            fstrtre, dfstrtre = np.ones(nn), np.zeros(nn)
+
+        for wrt in dreli:
+            dcf_dx = dcf[wrt]
+            dreli_dx = dreli[wrt]
+
+            dfef = fus_SA * ff_fus * (dcf_dx * ffre + cf * dffre * dreli_dx)
+            dfew = ff_wing * wing_area * (dcf_dx * fwre + cf * dfwre * dreli_dx)
+            dfen = 2 * ff_nac * nacelle_area * (dcf_dx * fnre + cf * dfnre * dreli_dx)
+            dfevt = ff_vtail * vtail_area * (dcf_dx * fvtre + cf * dfvtre * dreli_dx)
+            dfeht = ff_htail * htail_area * (dcf_dx * fhtre + cf * dfhtre * dreli_dx)
+            dfestrt = (
+                strut_fus_intf
+                * strut_wing_area_ratio
+                * wing_area
+                * (dcf_dx * fstrtre + cf * dfstrtre * dreli_dx)
+            )
+
+            dcdw0 = dfew / wing_area
+            dfeiwf = -wing_fus_intf * dcdw0 * areashieldwf
+            dcdpo = (dfef + dfevt + dfeht + dfen + dfeiwf + dfestrt) / wing_area
+
+            J['SA5', wrt] = dcdpo
+            J['SA6', wrt] = ff_wing * dfwre * dreli_dx
+            J['SA7', wrt] = 1.1938 / np.pi * (dcdw0 / np.cos(deg2rad(sweep_c4)) ** 2 + dcdpo)
+
+        J['SA7', 'ufac'] = -1 / (np.pi * AR * siwb * ufac**2)
+        J['cf', Dynamic.Atmosphere.MACH] = dcf_dmach
+
 
 class AeroSetup(om.Group):
     """Calculations for setting up aero."""
@@ -1360,13 +1536,26 @@ class DragCoef(om.ExplicitComponent):
         self.declare_partials('*', '*', dependent=False)
         ar = np.arange(self.options['num_nodes'])
 
-        self.declare_partials('CD_base', ['*'], method='cs')
+        self.declare_partials(
+            'CD_base',
+            [
+                'flap_defl',
+                Aircraft.Wing.HEIGHT,
+                'airport_alt',
+                Aircraft.Wing.FLAP_CHORD_RATIO,
+                'dCL_flaps_model',
+                'dCL_flaps_coef',
+                'CDI_factor',
+                Aircraft.Wing.AVERAGE_CHORD,
+                Aircraft.Wing.SPAN,
+            ],
+            method='cs',
+        )
         self.declare_partials(
             'CD_base',
             [Dynamic.Mission.ALTITUDE, 'CL', 'cf', 'SA5', 'SA6', 'SA7'],
             rows=ar,
             cols=ar,
-            method='cs',
         )
         # self.declare_partials(
         #     "CD_base", [Mission.Design.GROSS_MASS, "dCD_flaps_model", "wing_area"], val=0
@@ -1425,6 +1614,56 @@ class DragCoef(om.ExplicitComponent):
         outputs['dCD_flaps_full'] = dCD_flaps_model  # same as inputs['dCD_flaps_model']
         outputs['dCD_gear_full'] = dcd_gear
 
+    def compute_partials(self, inputs, J):
+        (
+            alt,
+            CL,
+            gross_mass_initial,
+            flap_defl,
+            wing_height,
+            airport_alt,
+            flap_chord_ratio,
+            dCL_flaps_model,
+            dCD_flaps_model,
+            dCL_flaps_coef,
+            CDI_factor,
+            avg_chord,
+            wingspan,
+            wing_area,
+            cf,
+            SA5,
+            SA6,
+            SA7,
+        ) = inputs.values()
+
+        # only the per-node partials are computed here, the rest use complex step
+        cdi = SA7 * (CL - dCL_flaps_coef * dCL_flaps_model) ** 2 / CDI_factor
+        dcdi_dCL = 2 * SA7 * (CL - dCL_flaps_coef * dCL_flaps_model) / CDI_factor
+
+        hac = wing_height + alt - airport_alt
+        heff = 2 * hac - np.sin(deg2rad(flap_defl)) * flap_chord_ratio * avg_chord
+        hob = heff / wingspan
+        dhob_dalt = 2 / wingspan
+        sig = np.exp(-2.48 * hob**0.768)
+        dsig_dalt = -2.48 * 0.768 * hob**-0.232 * sig * dhob_dalt
+        betag = np.sqrt(1 + hob**2) - hob
+        dbetag_dalt = (hob / np.sqrt(1 + hob**2) - 1) * dhob_dalt
+        c1 = betag * CL / (12.5664 * hac)
+        dc1_dalt = CL / 12.5664 * (dbetag_dalt / hac - betag / hac**2)
+        dc1_dCL = betag / (12.5664 * hac)
+
+        # dcd_ground = -(sig - c1) * cdi / (1.0 - c1) - c1 * SA6 * cf
+        dground_dsig = -cdi / (1.0 - c1)
+        dground_dc1 = -cdi * (sig - 1.0) / (1.0 - c1) ** 2 - SA6 * cf
+        dground_dcdi = -(sig - c1) / (1.0 - c1)
+
+        J['CD_base', Dynamic.Mission.ALTITUDE] = dground_dsig * dsig_dalt + dground_dc1 * dc1_dalt
+        J['CD_base', 'CL'] = dcdi_dCL * (1 + dground_dcdi) + dground_dc1 * dc1_dCL
+        J['CD_base', 'cf'] = SA6 * (1 - c1)
+        J['CD_base', 'SA5'] = 1.0
+        J['CD_base', 'SA6'] = cf * (1 - c1)
+        J['CD_base', 'SA7'] = cdi / SA7 * (1 + dground_dcdi)
+
 
 class DragCoefClean(om.ExplicitComponent):
     """Clean drag coefficient for high-speed flight."""
@@ -1469,9 +1708,17 @@ class DragCoefClean(om.ExplicitComponent):
             [Dynamic.Atmosphere.MACH, 'CL', 'cf', 'SA1', 'SA2', 'SA5', 'SA6', 'SA7'],
             rows=ar,
             cols=ar,
-            method='cs',
         )
-        self.declare_partials('CD', [Aircraft.Design.DRAG_DIVERGENCE_SHIFT], method='cs')
+        self.declare_partials(
+            'CD',
+            [
+                Aircraft.Design.DRAG_DIVERGENCE_SHIFT,
+                Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR,
+                Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR,
+                Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR,
+                Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR,
+            ],
+        )
 
     def compute(self, inputs, outputs):
         (
@@ -1513,6 +1760,56 @@ class DragCoefClean(om.ExplicitComponent):
 
         outputs['CD'] = CD_scaled
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            CL,
+            div_drag_supercrit,
+            subsonic_factor,
+            supersonic_factor,
+            lift_factor,
+            zero_lift_factor,
+            cf,
+            SA1,
+            SA2,
+            SA5,
+            SA6,
+            SA7,
+        ) = inputs.values()
+
+        mach_div = SA1 + SA2 * CL + div_drag_supercrit
+
+        sig = sigmoidX(mach, mach_div, mu=0.005)
+        dsig_dmach = dSigmoidXdx(mach, mach_div, mu=0.005)
+        delcdm = sig * (10 * (mach - mach_div) ** 3)
+        ddelcdm_dmach = dsig_dmach * (10 * (mach - mach_div) ** 3) + sig * (
+            30 * (mach - mach_div) ** 2
+        )
+        # delcdm depends on mach - mach_div only
+        ddelcdm_dmach_div = -ddelcdm_dmach
+
+        cd0 = SA5 + SA6 * cf
+        cdi = SA7 * CL**2
+        CD = cd0 * zero_lift_factor + cdi * lift_factor + delcdm
+
+        supersonic = mach >= 1.0
+        scale = np.where(supersonic, supersonic_factor, subsonic_factor)
+
+        J['CD', Dynamic.Atmosphere.MACH] = scale * ddelcdm_dmach
+        J['CD', 'CL'] = scale * (2 * SA7 * CL * lift_factor + ddelcdm_dmach_div * SA2)
+        J['CD', 'cf'] = scale * SA6 * zero_lift_factor
+        J['CD', 'SA1'] = scale * ddelcdm_dmach_div
+        J['CD', 'SA2'] = scale * ddelcdm_dmach_div * CL
+        J['CD', 'SA5'] = scale * zero_lift_factor
+        J['CD', 'SA6'] = scale * cf * zero_lift_factor
+        J['CD', 'SA7'] = scale * CL**2 * lift_factor
+
+        J['CD', Aircraft.Design.DRAG_DIVERGENCE_SHIFT] = scale * ddelcdm_dmach_div
+        J['CD', Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR] = np.where(supersonic, 0.0, CD)
+        J['CD', Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR] = np.where(supersonic, CD, 0.0)
+        J['CD', Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR] = scale * cdi
+        J['CD', Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR] = scale * cd0
+
 
 class GroundEffect(om.ExplicitComponent):
     """Factor of CL due to ground effect."""
@@ -1567,8 +1864,24 @@ class GroundEffect(om.ExplicitComponent):
             'lift_curve_slope',
         ]
 
-        self.declare_partials('kclge', ['*'], method='cs')
-        self.declare_partials('kclge', dynvars, rows=ar, cols=ar, method='cs')
+        self.declare_partials(
+            'kclge',
+            [
+                Aircraft.Wing.ZERO_LIFT_ANGLE,
+                Aircraft.Wing.SWEEP,
+                Aircraft.Wing.ASPECT_RATIO,
+                Aircraft.Wing.HEIGHT,
+                'airport_alt',
+                'flap_defl',
+                Aircraft.Wing.FLAP_CHORD_RATIO,
+                Aircraft.Wing.TAPER_RATIO,
+                'dCL_flaps_model',
+                Aircraft.Wing.AVERAGE_CHORD,
+                Aircraft.Wing.SPAN,
+            ],
+            method='cs',
+        )
+        self.declare_partials('kclge', dynvars, rows=ar, cols=ar)
 
     def compute(self, inputs, outputs):
         (
@@ -1615,6 +1928,63 @@ class GroundEffect(om.ExplicitComponent):
 
         outputs['kclge'] = kclge
 
+    def compute_partials(self, inputs, J):
+        (
+            alpha,
+            alt,
+            lift_curve_slope,
+            alpha0,
+            sweep_c4,
+            AR,
+            wing_height,
+            airport_alt,
+            flap_defl,
+            flap_chord_ratio,
+            taper_ratio,
+            dCL_flaps_model,
+            avg_chord,
+            wingspan,
+        ) = inputs.values()
+
+        # only the per-node partials are computed here, the rest use complex step
+        hac = wing_height + alt - airport_alt
+        heff = 2 * hac - np.sin(deg2rad(flap_defl)) * flap_chord_ratio * avg_chord
+        dheff_dalt = 2.0
+        sig = np.exp(-2.48 * (heff / wingspan) ** 0.768)
+        dsig_dalt = -2.48 * 0.768 * (heff / wingspan) ** -0.232 * sig * dheff_dalt / wingspan
+        betag = (1 + (heff / wingspan) ** 2) ** 0.5 - heff / wingspan
+        dbetag_dalt = (
+            ((heff / wingspan) / (1 + (heff / wingspan) ** 2) ** 0.5 - 1) * dheff_dalt / wingspan
+        )
+        rlmc2 = cs.arctan2(
+            AR * np.tan(deg2rad(sweep_c4)) - ((1 - taper_ratio) / (1 + taper_ratio)), AR
+        )
+        c3 = 2 * np.cos(rlmc2) + np.sqrt(AR**2 + (2 * np.cos(rlmc2)) ** 2)
+        c4 = betag / (12.5664 * hac / avg_chord)
+        dc4_dalt = avg_chord / 12.5664 * (dbetag_dalt / hac - betag / hac**2)
+        cloge = lift_curve_slope * deg2rad(alpha - alpha0) + dCL_flaps_model
+        kclge = (
+            1
+            + sig
+            - sig * AR * np.cos(rlmc2) / c3
+            - c4 * (cloge - lift_curve_slope / (16 * hac / avg_chord))
+        )
+
+        dkclge_dalpha = -c4 * lift_curve_slope * np.pi / 180.0
+        dkclge_dalt = (
+            dsig_dalt * (1 - AR * np.cos(rlmc2) / c3)
+            - dc4_dalt * (cloge - lift_curve_slope / (16 * hac / avg_chord))
+            - c4 * lift_curve_slope * avg_chord / (16 * hac**2)
+        )
+        dkclge_dlift_curve_slope = -c4 * (deg2rad(alpha - alpha0) - avg_chord / (16 * hac))
+
+        # kclge is clipped to 1.0, and is 1.0 far from the ground
+        clipped = np.logical_or(kclge < 1.0, hac / wingspan >= 10.0)
+
+        J['kclge', Dynamic.Vehicle.ANGLE_OF_ATTACK] = np.where(clipped, 0.0, dkclge_dalpha)
+        J['kclge', Dynamic.Mission.ALTITUDE] = np.where(clipped, 0.0, dkclge_dalt)
+        J['kclge', 'lift_curve_slope'] = np.where(clipped, 0.0, dkclge_dlift_curve_slope)
+
 
 class LiftCoeff(om.ExplicitComponent):
     """GASP lift coefficient calculation for low-speed near-ground flight."""
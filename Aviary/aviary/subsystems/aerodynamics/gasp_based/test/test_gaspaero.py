@@ -690,6 +690,9 @@ class AeroGeomTest(unittest.TestCase):
         assert_near_equal(prob['SA6'], [2.09276756, 2.09276756], tol)
         assert_near_equal(prob['SA7'], [0.03978045, 0.03978045], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs', step=1.1e-40)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 class BWBAeroSetupTest(unittest.TestCase):
     def test_case1(self):
@@ -844,6 +847,9 @@ class GroundEffectTest(unittest.TestCase):
         tol = 1e-7
         assert_near_equal(prob['kclge'], [1.15064679, 1.15064679], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs', step=1.1e-40)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 class BWBBodyLiftCurveSlopeTest(unittest.TestCase):
     """Body lift curve slope test for BWB"""
@@ -1058,6 +1064,9 @@ class DragCoefTest(unittest.TestCase):
         assert_near_equal(prob['dCD_flaps_full'], [0.0, 0.0], tol)
         assert_near_equal(prob['dCD_gear_full'], [0.01619421, 0.01619421], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs', step=1.1e-40)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
     def test_case2(self):
         """BWB data"""
         prob = om.Problem()
@@ -1144,6 +1153,9 @@ class DragCoefCleanTest(unittest.TestCase):
         tol = 1e-4
         assert_near_equal(prob['CD'], [0.02251097, 0.02251097], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs', step=1.1e-40)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
     def test_case2(self):
         """BWB data"""
         prob = om.Problem()
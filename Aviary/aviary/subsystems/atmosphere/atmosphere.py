@@ -1,15 +1,191 @@
+import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
+from dymos.models.atmosphere.atmos_1976 import USatm1976Data
 
-from aviary.subsystems.atmosphere.flight_conditions import FlightConditions
+from aviary import constants
 from aviary.variable_info.enums import SpeedType
 from aviary.variable_info.variables import Dynamic
 
+# Akima coefficients of the 1976 standard atmosphere tables, stacked so that every property is
+# looked up with a single gather. The first bin extrapolates below the lowest table altitude.
+_TABLE_ALTITUDES = np.hstack((USatm1976Data.alt[0], USatm1976Data.alt))
+_TABLE_COEFFS = np.stack(
+    (
+        USatm1976Data.akima_T,
+        USatm1976Data.akima_P,
+        USatm1976Data.akima_rho,
+        USatm1976Data.akima_viscosity,
+        USatm1976Data.akima_dT,
+    ),
+    axis=1,
+)
 
-class Atmosphere(om.Group):
+_GAMMA = 1.4
+_GAS_CONSTANT = 1716.49  # (ft*lbf)/(slug*degR)
+_K = _GAMMA * _GAS_CONSTANT
+
+# Sutherland's constant for air, used to correct viscosity for temperature offsets
+_SUTHERLAND_TEMPERATURE = 198.72  # degR
+
+# radius of the earth used by the 1976 standard to convert to geopotential altitude
+_R0 = 6_356_766 / 0.3048  # ft
+
+
+def _evaluate_tables(altitude, compute_second_derivatives=False):
+    """
+    Evaluate the standard atmosphere tables at the given geopotential altitudes.
+
+    Parameters
+    ----------
+    altitude : ndarray
+        Geopotential altitude, in ft.
+    compute_second_derivatives : bool
+        If True, also return the second derivatives of the tables.
+
+    Returns
+    -------
+    values : ndarray
+        Temperature, pressure, density, viscosity and temperature lapse rate, one row each.
+    first : ndarray
+        First derivatives of values with respect to altitude.
+    second : ndarray
+        Second derivatives of values with respect to altitude. Only returned if
+        compute_second_derivatives is True.
+    """
+    idx = np.searchsorted(USatm1976Data.alt, altitude.real, side='left')
+    dx = altitude - _TABLE_ALTITUDES[idx]
+
+    c0, c1, c2, c3 = _TABLE_COEFFS[idx].T
+
+    values = c0 + dx * (c1 + dx * (c2 + dx * c3))
+    first = c1 + dx * (2.0 * c2 + 3.0 * c3 * dx)
+
+    if not compute_second_derivatives:
+        return values, first
+
+    second = 2.0 * c2 + 6.0 * c3 * dx
+
+    return values, first, second
+
+
+def compute_atmosphere(
+    altitude, delta_T=0.0, h_def='geodetic', output_dsos_dh=False, compute_derivatives=False
+):
     """
-    Group that contains atmospheric conditions for the aircraft's current flight
-    condition, as well as conversions for different speed types (TAS, EAS, Mach).
+    Compute the atmospheric properties of the 1976 standard atmosphere, with an optional
+    constant temperature offset, and optionally their derivatives with respect to altitude.
+
+    Pressure is unchanged by the offset; density, speed of sound and viscosity are corrected
+    for the offset temperature. The altitude rates drhos_dh and dsos_dh are rates with
+    respect to geopotential altitude, as in the 1976 standard atmosphere component from dymos.
+
+    Parameters
+    ----------
+    altitude : ndarray
+        Altitude, in ft.
+    delta_T : float
+        Offset of the ambient temperature from the standard atmosphere, in degR.
+    h_def : str
+        The definition of the given altitude, 'geodetic' or 'geopotential'.
+    output_dsos_dh : bool
+        If True, also compute the altitude rate of the speed of sound, 'dsos_dh'.
+    compute_derivatives : bool
+        If True, also return the derivatives of each property with respect to altitude.
+
+    Returns
+    -------
+    atmosphere : dict
+        Temperature (degR), static pressure (psi), density (slug/ft**3), viscosity
+        (lbf*s/ft**2), drhos_dh (slug/ft**4), speed of sound (ft/s), and dsos_dh (1/s) if
+        requested, keyed by the outputs of the Atmosphere component.
+    derivs : dict
+        Derivatives of atmosphere with respect to altitude. Only returned if
+        compute_derivatives is True.
+    """
+    geodetic = h_def == 'geodetic'
+
+    if geodetic:
+        dz_dh = (_R0 / (_R0 + altitude)) ** 2
+        # Equation 19 from the original standard
+        altitude = altitude / (_R0 + altitude) * _R0
+
+    if compute_derivatives:
+        values, first, second = _evaluate_tables(altitude, True)
+        d2T_std, _, d2rho_std, _, _ = second
+    else:
+        values, first = _evaluate_tables(altitude)
+
+    T_std, P, rho_std, visc_std, dT_dz = values
+    dT_std, dP, drho_std, dvisc_std, d2T_dz2 = first
+
+    T = T_std + delta_T
+    sos = np.sqrt(_K * T)
+
+    if delta_T == 0.0:
+        rho, drho = rho_std, drho_std
+        visc, dvisc = visc_std, dvisc_std
+    else:
+        # density changes with temperature at constant pressure
+        ratio = T_std / T
+        dratio = dT_std * delta_T / T**2
+        rho = rho_std * ratio
+        drho = drho_std * ratio + rho_std * dratio
+
+        # Sutherland's law correction of the tabulated viscosity
+        S = _SUTHERLAND_TEMPERATURE
+        visc_ratio = (T / T_std) ** 1.5 * (T_std + S) / (T + S)
+        dvisc_ratio = (
+            dT_std * visc_ratio * (1.5 / T - 1.0 / (T + S) - 1.5 / T_std + 1.0 / (T_std + S))
+        )
+        visc = visc_std * visc_ratio
+        dvisc = dvisc_std * visc_ratio + visc_std * dvisc_ratio
+
+    atmosphere = {
+        Dynamic.Atmosphere.TEMPERATURE: T,
+        Dynamic.Atmosphere.STATIC_PRESSURE: P,
+        Dynamic.Atmosphere.DENSITY: rho,
+        'viscosity': visc,
+        'drhos_dh': drho,
+        Dynamic.Atmosphere.SPEED_OF_SOUND: sos,
+    }
+    if output_dsos_dh:
+        atmosphere['dsos_dh'] = 0.5 * _K * dT_dz / sos
+
+    if not compute_derivatives:
+        return atmosphere
+
+    if delta_T == 0.0:
+        d2rho = d2rho_std
+    else:
+        d2ratio = delta_T * (d2T_std * T - 2.0 * dT_std**2) / T**3
+        d2rho = d2rho_std * ratio + 2.0 * drho_std * dratio + rho_std * d2ratio
+
+    derivs = {
+        Dynamic.Atmosphere.TEMPERATURE: dT_std,
+        Dynamic.Atmosphere.STATIC_PRESSURE: dP,
+        Dynamic.Atmosphere.DENSITY: drho,
+        'viscosity': dvisc,
+        'drhos_dh': d2rho,
+        Dynamic.Atmosphere.SPEED_OF_SOUND: 0.5 * _K * dT_std / sos,
+    }
+    if output_dsos_dh:
+        derivs['dsos_dh'] = 0.5 * _K / sos * (d2T_dz2 - 0.5 * dT_dz * dT_std / T)
+
+    if geodetic:
+        for name, deriv in derivs.items():
+            derivs[name] = deriv * dz_dh
+
+    return atmosphere, derivs
+
+
+class Atmosphere(om.ExplicitComponent):
+    """
+    Component that computes atmospheric conditions for the aircraft's current flight
+    condition from the 1976 standard atmosphere, as well as conversions for different
+    speed types (TAS, EAS, Mach).
+
+    A constant ISA temperature offset may be applied. Pressure is unchanged by the offset;
+    density, speed of sound and viscosity are corrected for the offset temperature.
     """
 
     def initialize(self):
@@ -40,27 +216,175 @@ class Atmosphere(om.Group):
             desc='defines input airspeed as equivalent airspeed, true airspeed, or mach number',
         )
 
+        self.options.declare(
+            'delta_T',
+            types=(int, float),
+            default=0.0,
+            desc='offset of the ambient temperature from the standard atmosphere, in degR',
+        )
+
     def setup(self):
         nn = self.options['num_nodes']
         speed_type = self.options['input_speed_type']
-        h_def = self.options['h_def']
-        output_dsos_dh = self.options['output_dsos_dh']
-
-        self.add_subsystem(
-            name='standard_atmosphere',
-            subsys=USatm1976Comp(num_nodes=nn, h_def=h_def, output_dsos_dh=output_dsos_dh),
-            promotes_inputs=[('h', Dynamic.Mission.ALTITUDE)],
-            promotes_outputs=[
-                '*',
-                ('sos', Dynamic.Atmosphere.SPEED_OF_SOUND),
-                ('rho', Dynamic.Atmosphere.DENSITY),
-                ('temp', Dynamic.Atmosphere.TEMPERATURE),
-                ('pres', Dynamic.Atmosphere.STATIC_PRESSURE),
-            ],
+        arange = np.arange(nn)
+
+        self.add_input(Dynamic.Mission.ALTITUDE, val=np.ones(nn), units='ft')
+
+        self.add_output(Dynamic.Atmosphere.TEMPERATURE, val=np.ones(nn), units='degR')
+        self.add_output(Dynamic.Atmosphere.STATIC_PRESSURE, val=np.ones(nn), units='psi')
+        self.add_output(Dynamic.Atmosphere.DENSITY, val=np.ones(nn), units='slug/ft**3')
+        self.add_output('viscosity', val=np.ones(nn), units='lbf*s/ft**2')
+        self.add_output('drhos_dh', val=np.ones(nn), units='slug/ft**4')
+        self.add_output(Dynamic.Atmosphere.SPEED_OF_SOUND, val=np.ones(nn), units='ft/s')
+        if self.options['output_dsos_dh']:
+            self.add_output('dsos_dh', val=np.ones(nn), units='1/s')
+
+        self.add_output(
+            Dynamic.Atmosphere.DYNAMIC_PRESSURE,
+            val=np.zeros(nn),
+            units='lbf/ft**2',
+            desc='dynamic pressure',
+        )
+
+        speeds = {
+            SpeedType.TAS: (Dynamic.Mission.VELOCITY, 'ft/s', 'true air speed'),
+            SpeedType.EAS: ('EAS', 'ft/s', 'equivalent air speed'),
+            SpeedType.MACH: (Dynamic.Atmosphere.MACH, 'unitless', 'Mach number'),
+        }
+
+        for speed, (name, units, desc) in speeds.items():
+            if speed is speed_type:
+                self.add_input(name, val=np.zeros(nn), units=units, desc=desc)
+            else:
+                self.add_output(name, val=np.zeros(nn), units=units, desc=desc)
+
+        atmosphere_outputs = [
+            Dynamic.Atmosphere.TEMPERATURE,
+            Dynamic.Atmosphere.STATIC_PRESSURE,
+            Dynamic.Atmosphere.DENSITY,
+            'viscosity',
+            'drhos_dh',
+            Dynamic.Atmosphere.SPEED_OF_SOUND,
+        ]
+        if self.options['output_dsos_dh']:
+            atmosphere_outputs.append('dsos_dh')
+
+        input_speed = speeds[speed_type][0]
+        speed_outputs = [name for name, _, _ in speeds.values() if name != input_speed]
+
+        self.declare_partials(
+            atmosphere_outputs + speed_outputs,
+            Dynamic.Mission.ALTITUDE,
+            rows=arange,
+            cols=arange,
+        )
+        self.declare_partials(
+            speed_outputs + [Dynamic.Atmosphere.DYNAMIC_PRESSURE],
+            input_speed,
+            rows=arange,
+            cols=arange,
+        )
+
+        # with EAS as the input, dynamic pressure does not depend on the atmosphere
+        if speed_type is not SpeedType.EAS:
+            self.declare_partials(
+                Dynamic.Atmosphere.DYNAMIC_PRESSURE,
+                Dynamic.Mission.ALTITUDE,
+                rows=arange,
+                cols=arange,
+            )
+
+    def compute(self, inputs, outputs):
+        speed_type = self.options['input_speed_type']
+
+        atmosphere = compute_atmosphere(
+            inputs[Dynamic.Mission.ALTITUDE],
+            self.options['delta_T'],
+            self.options['h_def'],
+            self.options['output_dsos_dh'],
         )
 
-        self.add_subsystem(
-            name='flight_conditions',
-            subsys=FlightConditions(num_nodes=nn, input_speed_type=speed_type),
-            promotes=['*'],
+        for name, val in atmosphere.items():
+            outputs[name] = val
+
+        rho = atmosphere[Dynamic.Atmosphere.DENSITY]
+        sos = atmosphere[Dynamic.Atmosphere.SPEED_OF_SOUND]
+        sigma = rho / constants.RHO_SEA_LEVEL_ENGLISH
+
+        if speed_type is SpeedType.TAS:
+            TAS = inputs[Dynamic.Mission.VELOCITY]
+            outputs[Dynamic.Atmosphere.MACH] = TAS / sos
+            outputs['EAS'] = TAS * sigma**0.5
+            outputs[Dynamic.Atmosphere.DYNAMIC_PRESSURE] = 0.5 * rho * TAS**2
+
+        elif speed_type is SpeedType.EAS:
+            EAS = inputs['EAS']
+            outputs[Dynamic.Mission.VELOCITY] = TAS = EAS / sigma**0.5
+            outputs[Dynamic.Atmosphere.MACH] = TAS / sos
+            outputs[Dynamic.Atmosphere.DYNAMIC_PRESSURE] = (
+                0.5 * EAS**2 * constants.RHO_SEA_LEVEL_ENGLISH
+            )
+
+        elif speed_type is SpeedType.MACH:
+            mach = inputs[Dynamic.Atmosphere.MACH]
+            outputs[Dynamic.Mission.VELOCITY] = TAS = sos * mach
+            outputs['EAS'] = TAS * sigma**0.5
+            outputs[Dynamic.Atmosphere.DYNAMIC_PRESSURE] = 0.5 * rho * TAS**2
+
+    def compute_partials(self, inputs, J):
+        speed_type = self.options['input_speed_type']
+        altitude = Dynamic.Mission.ALTITUDE
+
+        atmosphere, derivs = compute_atmosphere(
+            inputs[altitude],
+            self.options['delta_T'],
+            self.options['h_def'],
+            self.options['output_dsos_dh'],
+            compute_derivatives=True,
         )
+
+        for name, deriv in derivs.items():
+            J[name, altitude] = deriv
+
+        rho = atmosphere[Dynamic.Atmosphere.DENSITY]
+        sos = atmosphere[Dynamic.Atmosphere.SPEED_OF_SOUND]
+        drho_dh = derivs[Dynamic.Atmosphere.DENSITY]
+        dsos_dh = derivs[Dynamic.Atmosphere.SPEED_OF_SOUND]
+        sigma = rho / constants.RHO_SEA_LEVEL_ENGLISH
+        dsqrt_sigma_dh = 0.5 * drho_dh / (rho * constants.RHO_SEA_LEVEL_ENGLISH) ** 0.5
+
+        if speed_type is SpeedType.TAS:
+            TAS = inputs[Dynamic.Mission.VELOCITY]
+
+            J[Dynamic.Atmosphere.MACH, Dynamic.Mission.VELOCITY] = 1.0 / sos
+            J[Dynamic.Atmosphere.MACH, altitude] = -TAS / sos**2 * dsos_dh
+            J['EAS', Dynamic.Mission.VELOCITY] = sigma**0.5
+            J['EAS', altitude] = TAS * dsqrt_sigma_dh
+            J[Dynamic.Atmosphere.DYNAMIC_PRESSURE, Dynamic.Mission.VELOCITY] = rho * TAS
+            J[Dynamic.Atmosphere.DYNAMIC_PRESSURE, altitude] = 0.5 * TAS**2 * drho_dh
+
+        elif speed_type is SpeedType.EAS:
+            EAS = inputs['EAS']
+            TAS = EAS / sigma**0.5
+            dTAS_dEAS = 1.0 / sigma**0.5
+            dTAS_dh = -0.5 * TAS / rho * drho_dh
+
+            J[Dynamic.Mission.VELOCITY, 'EAS'] = dTAS_dEAS
+            J[Dynamic.Mission.VELOCITY, altitude] = dTAS_dh
+            J[Dynamic.Atmosphere.MACH, 'EAS'] = dTAS_dEAS / sos
+            J[Dynamic.Atmosphere.MACH, altitude] = dTAS_dh / sos - TAS / sos**2 * dsos_dh
+            J[Dynamic.Atmosphere.DYNAMIC_PRESSURE, 'EAS'] = EAS * constants.RHO_SEA_LEVEL_ENGLISH
+
+        elif speed_type is SpeedType.MACH:
+            mach = inputs[Dynamic.Atmosphere.MACH]
+            TAS = sos * mach
+            dTAS_dh = mach * dsos_dh
+
+            J[Dynamic.Mission.VELOCITY, Dynamic.Atmosphere.MACH] = sos
+            J[Dynamic.Mission.VELOCITY, altitude] = dTAS_dh
+            J['EAS', Dynamic.Atmosphere.MACH] = sos * sigma**0.5
+            J['EAS', altitude] = dTAS_dh * sigma**0.5 + TAS * dsqrt_sigma_dh
+            J[Dynamic.Atmosphere.DYNAMIC_PRESSURE, Dynamic.Atmosphere.MACH] = rho * TAS * sos
+            J[Dynamic.Atmosphere.DYNAMIC_PRESSURE, altitude] = (
+                0.5 * TAS**2 * drho_dh + rho * TAS * dTAS_dh
+            )
@@ -0,0 +1,150 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+from aviary.subsystems.atmosphere.atmosphere import Atmosphere, compute_atmosphere
+from aviary.variable_info.enums import SpeedType
+from aviary.variable_info.variables import Dynamic
+
+altitudes = np.array([-1000.0, 0.0, 10000.0, 25000.0, 36089.0, 37000.0, 45000.0, 65617.0])
+
+
+def build_problem(delta_T=0.0, input_speed_type=SpeedType.TAS, h_def='geodetic'):
+    nn = altitudes.size
+
+    prob = om.Problem()
+    prob.model.add_subsystem(
+        'atmosphere',
+        Atmosphere(
+            num_nodes=nn,
+            input_speed_type=input_speed_type,
+            h_def=h_def,
+            output_dsos_dh=True,
+            delta_T=delta_T,
+        ),
+        promotes=['*'],
+    )
+
+    prob.setup(force_alloc_complex=True)
+
+    prob.set_val(Dynamic.Mission.ALTITUDE, altitudes, units='ft')
+    speeds = {
+        SpeedType.TAS: (Dynamic.Mission.VELOCITY, np.linspace(100.0, 800.0, nn)),
+        SpeedType.EAS: ('EAS', np.linspace(100.0, 500.0, nn)),
+        SpeedType.MACH: (Dynamic.Atmosphere.MACH, np.linspace(0.1, 0.9, nn)),
+    }
+    prob.set_val(*speeds[input_speed_type])
+
+    prob.run_model()
+
+    return prob
+
+
+class AtmosphereTest(unittest.TestCase):
+    def test_standard_atmosphere(self):
+        # the tables must reproduce the dymos implementation of the 1976 standard atmosphere
+        for h_def in ('geodetic', 'geopotential'):
+            with self.subTest(h_def=h_def):
+                prob = build_problem(h_def=h_def)
+
+                reference = om.Problem()
+                reference.model.add_subsystem(
+                    'atmos',
+                    USatm1976Comp(num_nodes=altitudes.size, h_def=h_def, output_dsos_dh=True),
+                )
+                reference.setup()
+                reference.set_val('atmos.h', altitudes, units='ft')
+                reference.run_model()
+
+                for name, ref_name in (
+                    (Dynamic.Atmosphere.TEMPERATURE, 'temp'),
+                    (Dynamic.Atmosphere.STATIC_PRESSURE, 'pres'),
+                    (Dynamic.Atmosphere.DENSITY, 'rho'),
+                    (Dynamic.Atmosphere.SPEED_OF_SOUND, 'sos'),
+                    ('viscosity', 'viscosity'),
+                    ('drhos_dh', 'drhos_dh'),
+                    ('dsos_dh', 'dsos_dh'),
+                ):
+                    assert_near_equal(
+                        prob.get_val(name), reference.get_val(f'atmos.{ref_name}'), 1e-14
+                    )
+
+    def test_flight_conditions(self):
+        prob = build_problem()
+
+        TAS = prob.get_val(Dynamic.Mission.VELOCITY, units='ft/s')
+        rho = prob.get_val(Dynamic.Atmosphere.DENSITY, units='slug/ft**3')
+        sos = prob.get_val(Dynamic.Atmosphere.SPEED_OF_SOUND, units='ft/s')
+        mach = prob.get_val(Dynamic.Atmosphere.MACH)
+
+        assert_near_equal(mach, TAS / sos, 1e-14)
+        assert_near_equal(
+            prob.get_val(Dynamic.Atmosphere.DYNAMIC_PRESSURE, units='lbf/ft**2'),
+            0.5 * rho * TAS**2,
+            1e-14,
+        )
+
+        # round trip through the other input speed types
+        for speed_type, name in ((SpeedType.MACH, Dynamic.Atmosphere.MACH), (SpeedType.EAS, 'EAS')):
+            with self.subTest(input_speed_type=speed_type):
+                other = build_problem(input_speed_type=speed_type)
+                other.set_val(name, prob.get_val(name))
+                other.run_model()
+
+                assert_near_equal(other.get_val(Dynamic.Mission.VELOCITY), TAS, 1e-12)
+                assert_near_equal(
+                    other.get_val(Dynamic.Atmosphere.DYNAMIC_PRESSURE),
+                    prob.get_val(Dynamic.Atmosphere.DYNAMIC_PRESSURE),
+                    1e-12,
+                )
+
+    def test_temperature_offset(self):
+        delta_T = 27.0
+        standard = build_problem()
+        hot = build_problem(delta_T=delta_T)
+
+        T = standard.get_val(Dynamic.Atmosphere.TEMPERATURE)
+
+        assert_near_equal(hot.get_val(Dynamic.Atmosphere.TEMPERATURE), T + delta_T, 1e-14)
+        assert_near_equal(
+            hot.get_val(Dynamic.Atmosphere.STATIC_PRESSURE),
+            standard.get_val(Dynamic.Atmosphere.STATIC_PRESSURE),
+            1e-14,
+        )
+        # ideal gas at constant pressure
+        assert_near_equal(
+            hot.get_val(Dynamic.Atmosphere.DENSITY),
+            standard.get_val(Dynamic.Atmosphere.DENSITY) * T / (T + delta_T),
+            1e-14,
+        )
+        assert_near_equal(
+            hot.get_val(Dynamic.Atmosphere.SPEED_OF_SOUND),
+            standard.get_val(Dynamic.Atmosphere.SPEED_OF_SOUND) * np.sqrt((T + delta_T) / T),
+            1e-14,
+        )
+
+    def test_compute_atmosphere(self):
+        # the function used by the component can be called without building a problem
+        delta_T = 27.0
+        prob = build_problem(delta_T=delta_T)
+        atmosphere = compute_atmosphere(altitudes, delta_T, output_dsos_dh=True)
+
+        for name, val in atmosphere.items():
+            with self.subTest(name=name):
+                assert_near_equal(val, prob.get_val(name), 1e-15)
+
+    def test_partials(self):
+        for speed_type in SpeedType:
+            for h_def in ('geodetic', 'geopotential'):
+                for delta_T in (0.0, -18.0):
+                    with self.subTest(speed_type=speed_type, h_def=h_def, delta_T=delta_T):
+                        prob = build_problem(delta_T, speed_type, h_def)
+                        partial_data = prob.check_partials(out_stream=None, method='cs')
+                        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
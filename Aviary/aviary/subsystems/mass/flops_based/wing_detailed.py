@@ -63,13 +63,35 @@ class DetailedWingBendingFact(om.ExplicitComponent):
         add_aviary_output(self, Aircraft.Wing.BENDING_MATERIAL_FACTOR, units='unitless')
         add_aviary_output(self, Aircraft.Wing.ENG_POD_INERTIA_FACTOR, units='unitless')
 
+        # The integration stations only depend on options, so they and the interpolant onto
+        # them are built once instead of on every call to compute.
+        inp_stations = np.array(input_station_dist)
+        num_integration_stations = self.options[Aircraft.Wing.NUM_INTEGRATION_STATIONS]
+
+        target_dy = (inp_stations[-1] - inp_stations[0]) / num_integration_stations
+        stations_per_section = np.floor(np.abs(np.diff(inp_stations) / target_dy + 0.5))
+        stations_per_section[-1] += 1  # add one more point to the last section
+        self._stations_per_section = stations_per_section.astype(int)
+
+        integration_stations = np.empty(0)
+
+        for i, val in enumerate(inp_stations[1:]):
+            endpoint = i == len(inp_stations) - 2
+            integration_stations = np.append(
+                integration_stations,
+                np.linspace(inp_stations[i], val, self._stations_per_section[i], endpoint=endpoint),
+            )
+
+        self._integration_stations = integration_stations
+        self._station_interp = InterpND(
+            method='slinear', points=(inp_stations), x_interp=integration_stations
+        )
+
     def setup_partials(self):
         # TODO: Analytic derivs will be challenging, but possible.
         self.declare_partials('*', '*', method='cs')
 
     def compute(self, inputs, outputs):
-        input_station_dist = self.options[Aircraft.Wing.INPUT_STATION_DIST]
-        inp_stations = np.array(input_station_dist)
         num_integration_stations = self.options[Aircraft.Wing.NUM_INTEGRATION_STATIONS]
         num_wing_engines = self.options[Aircraft.Engine.NUM_WING_ENGINES]
         num_engine_type = len(num_wing_engines)
@@ -105,22 +127,8 @@ class DetailedWingBendingFact(om.ExplicitComponent):
         # TODO There are also no checks that number of engine locations is consistent with
         # half of number of wing mounted engines, which should get added to preprocessor
 
-        target_dy = (inp_stations[-1] - inp_stations[0]) / num_integration_stations
-        stations_per_section = np.floor(np.abs(np.diff(inp_stations) / target_dy + 0.5))
-        stations_per_section[-1] += 1  # add one more point to the last section
-        integration_stations = np.empty(0, dtype=chord.dtype)
-        sweep_int_stations = np.empty(0, dtype=chord.dtype)
-
-        for i, val in enumerate(inp_stations[1:]):
-            endpoint = i == len(inp_stations) - 2
-            per_section = int(stations_per_section[i])
-            integration_stations = np.append(
-                integration_stations,
-                np.linspace(inp_stations[i], val, per_section, endpoint=endpoint),
-            )
-            sweep_int_stations = np.append(
-                sweep_int_stations, load_path_sweep[i] * np.ones(per_section)
-            )
+        integration_stations = self._integration_stations
+        sweep_int_stations = np.repeat(load_path_sweep, self._stations_per_section)
 
         dy = np.diff(integration_stations)
         avg_sweep = np.sum(
@@ -140,10 +148,7 @@ class DetailedWingBendingFact(om.ExplicitComponent):
                 f'{Aircraft.Wing.LOAD_DISTRIBUTION_CONTROL}, it must be "1", "2", or "3".'
             )
 
-        chord_interp = InterpND(
-            method='slinear', points=(inp_stations), x_interp=integration_stations
-        )
-        chord_int_stations = chord_interp.evaluate_spline(chord, compute_derivative=False)
+        chord_int_stations = self._station_interp.evaluate_spline(chord, compute_derivative=False)
         if arref > 0.0:
             # Scale
             chord_int_stations *= arref / ar
@@ -175,8 +180,9 @@ class DetailedWingBendingFact(om.ExplicitComponent):
         emi = (del_moment + dy * load_path_length) * csw
         # em = np.sum(emi)
 
-        tc_interp = InterpND(method='slinear', points=(inp_stations), x_interp=integration_stations)
-        tc_int_stations = tc_interp.evaluate_spline(thickness_to_chord, compute_derivative=False)
+        tc_int_stations = self._station_interp.evaluate_spline(
+            thickness_to_chord, compute_derivative=False
+        )
         if tcref > 0.0:
             tc_int_stations *= tc / tcref
 
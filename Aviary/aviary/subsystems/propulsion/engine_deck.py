@@ -28,6 +28,7 @@ import warnings
 
 import numpy as np
 import openmdao.api as om
+from openmdao.components.interp_util.interp_semi import InterpNDSemi
 from openmdao.utils.units import convert_units
 
 from aviary.interface.utils import round_it
@@ -36,6 +37,7 @@ from aviary.subsystems.propulsion.engine_scaling import EngineScaling
 from aviary.subsystems.propulsion.engine_sizing import SizeEngine
 from aviary.subsystems.propulsion.utils import (
     EngineModelVariables,
+    SharedMetaModelSemiStructuredComp,
     UncorrectData,
     convert_geopotential_altitude,
     default_units,
@@ -331,6 +333,7 @@ class EngineDeck(EngineModel):
         - Determine reference thrust.
         - Normalize throttles & hybrid throttles.
         - Fill flight idle points if requested.
+        - Pre-compute maximum thrust and shaft power for each flight condition.
         """
         self._read_data(data)
 
@@ -355,6 +358,10 @@ class EngineDeck(EngineModel):
         if self.get_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE):
             self._generate_flight_idle()
 
+        if self.use_thrust or self.use_shaft_power:
+            # tabulate max thrust/shaft power envelope for use in mission analysis
+            self._generate_max_envelope()
+
     def _read_data(self, raw_data: NamedValues):
         """
         Import tabular engine data; either from memory or from a data file.
@@ -405,7 +412,7 @@ class EngineDeck(EngineModel):
                 # Convert data to expected units. Required so settings like tolerances
                 # that assume units work as expected
                 try:
-                    val = np.array([convert_units(i, units, default_units[key]) for i in val])
+                    val = convert_units(np.asarray(val, dtype=float), units, default_units[key])
                 except TypeError:
                     raise TypeError(
                         f"{self.error_message}: units of '{units}' provided for "
@@ -776,6 +783,107 @@ class EngineDeck(EngineModel):
         # Re-normalize throttle since "dummy" idle values were used
         self._normalize_throttle()
 
+    def _generate_max_envelope(self):
+        """
+        Pre-compute maximum thrust and shaft power for each flight condition in the data
+        set, so mission analysis can interpolate a reduced (Mach, altitude) table instead
+        of evaluating the full engine deck a second time.
+
+        Maximum values are assumed to occur at maximum throttle and hybrid throttle for
+        each flight condition. The full engine deck is evaluated at each flight
+        condition using the same interpolation method used during mission analysis.
+        """
+        interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        packed_data = self.packed_data
+        data_indices = self.data_indices
+
+        mach_table = np.array([])
+        alt_table = np.array([])
+
+        # for each unique flight condition...
+        for M in range(self.mach_max_count):
+            for A in range(self.alt_max_count):
+                if data_indices[M, A] != 0:
+                    mach_table = np.append(mach_table, packed_data[MACH][M, A, 0])
+                    alt_table = np.append(alt_table, packed_data[ALTITUDE][M, A, 0])
+
+        num_points = len(mach_table)
+
+        # maximum throttle and hybrid throttle are either a single global value or one
+        # value per flight condition, in the same order as mach_table and alt_table
+        input_variables = [MACH, ALTITUDE, THROTTLE]
+        max_inputs = [mach_table, alt_table, np.broadcast_to(self.throttle_max, num_points)]
+        if self.use_hybrid_throttle:
+            input_variables.append(HYBRID_THROTTLE)
+            max_inputs.append(np.broadcast_to(self.hybrid_throttle_max, num_points))
+
+        grid = np.array([self.data[variable] for variable in input_variables]).T
+        max_points = np.array(max_inputs).T
+
+        output_variables = [THRUST]
+        if self.use_shaft_power:
+            if SHAFT_POWER in self.engine_variables:
+                output_variables.append(SHAFT_POWER)
+            else:
+                output_variables.append(SHAFT_POWER_CORRECTED)
+
+        self.max_envelope = {MACH: mach_table, ALTITUDE: alt_table}
+        for variable in output_variables:
+            interp = InterpNDSemi(grid, self.data[variable], method=interp_method)
+            self.max_envelope[variable] = interp.interpolate(max_points)
+
+    def _generate_inverse_throttle_table(self, num_samples=21):
+        """
+        Pre-compute throttle as a function of flight condition and net thrust, with thrust
+        expressed as a fraction of the maximum thrust at that flight condition.
+
+        For each flight condition in the maximum thrust envelope, net thrust is evaluated
+        over a sweep of throttle settings using the same interpolation method used during
+        mission analysis. Thrust is assumed to increase with throttle, so samples that do
+        not increase thrust over all lower throttle settings are dropped.
+        """
+        interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        max_envelope = self.max_envelope
+        mach_table = max_envelope[MACH]
+        alt_table = max_envelope[ALTITUDE]
+        num_points = len(mach_table)
+
+        throttle_min = np.broadcast_to(self.throttle_min, num_points)
+        throttle_max = np.broadcast_to(self.throttle_max, num_points)
+        samples = np.linspace(0.0, 1.0, num_samples)
+        throttles = throttle_min[:, np.newaxis] + np.outer(throttle_max - throttle_min, samples)
+
+        grid = np.array([self.data[MACH], self.data[ALTITUDE], self.data[THROTTLE]]).T
+        interp = InterpNDSemi(grid, self.data[THRUST], method=interp_method)
+        points = np.array(
+            [
+                np.repeat(mach_table, num_samples),
+                np.repeat(alt_table, num_samples),
+                throttles.ravel(),
+            ]
+        ).T
+        thrust = interp.interpolate(points).reshape((num_points, num_samples))
+
+        table = {MACH: [], ALTITUDE: [], 'thrust_fraction': [], THROTTLE: []}
+        for i in range(num_points):
+            max_thrust = max_envelope[THRUST][i]
+            if max_thrust <= 0.0:
+                continue
+
+            thrust_fraction = thrust[i] / max_thrust
+            previous_max = np.maximum.accumulate(thrust_fraction)[:-1]
+            keep = np.concatenate(([True], thrust_fraction[1:] > previous_max))
+            if np.count_nonzero(keep) < 2:
+                continue
+
+            num_kept = np.count_nonzero(keep)
+            table[MACH].append(np.full(num_kept, mach_table[i]))
+            table[ALTITUDE].append(np.full(num_kept, alt_table[i]))
+            table['thrust_fraction'].append(thrust_fraction[keep])
+            table[THROTTLE].append(throttles[i, keep])
+
+        self.inverse_throttle_table = {key: np.concatenate(val) for key, val in table.items()}
+
     def build_pre_mission(self, aviary_inputs, **kwargs) -> om.ExplicitComponent:
         """
         Build components to be added to pre-mission propulsion subsystem.
@@ -794,7 +902,7 @@ class EngineDeck(EngineModel):
         """
         interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
         # interpolator object for engine data
-        engine = om.MetaModelSemiStructuredComp(
+        engine = SharedMetaModelSemiStructuredComp(
             method=interp_method, extrapolate=True, vec_size=num_nodes
         )
 
@@ -842,7 +950,8 @@ class EngineDeck(EngineModel):
         """
         Creates interpolator objects to be added to mission-level propulsion subsystem.
         Interpolators must be re-generated for each ODE due to potentially different
-        num_nodes in each mission segment.
+        num_nodes in each mission segment. The underlying interpolation tables are
+        shared between all interpolators built from the same engine data.
 
         Parameters
         ----------
@@ -853,8 +962,8 @@ class EngineDeck(EngineModel):
         -------
         engine_group : openmdao.core.Group
             An OpenMDAO group containing engine data interpolators, an EngineScaling
-            component, and max throttle/max hybrid_throttle generating components as
-            needed for this EngineDeck.
+            component, and a max thrust/shaft power interpolator as needed for this
+            EngineDeck.
         """
         interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
 
@@ -863,113 +972,32 @@ class EngineDeck(EngineModel):
         engine = self._build_engine_interpolator(num_nodes, aviary_inputs)
         units = self.engine_variable_units
 
-        # Create copy of interpolation component that computes max thrust/shp for current
-        # flight condition
+        # Create interpolation component that computes max thrust/shp for current flight
+        # condition from the pre-computed envelope
         # NOTE max thrust is assumed to occur at maximum throttle and hybrid throttle
         #      for each flight condition
-        # TODO Use solver to find throttle/hybrid throttle for maximum thrust at given flight condition?
-        #      Pre-solve max throttle/hybrid throttle for each flight condition, interpolate on
-        #      reduced data set?
         if self.use_thrust or self.use_shaft_power:
-            if self.global_throttle or (self.global_hybrid_throttle and self.use_hybrid_throttle):
-                # create IndepVarComp to pass maximum throttle is to max thrust interpolator
-                fixed_throttles = om.IndepVarComp()
-                if self.global_throttle:
-                    fixed_throttles.add_output(
-                        'throttle_max',
-                        val=np.ones(num_nodes) * self.throttle_max,
-                        units='unitless',
-                        desc='Engine maximum throttle',
-                    )
-                if self.global_hybrid_throttle and self.use_hybrid_throttle:
-                    fixed_throttles.add_output(
-                        'hybrid_throttle_max',
-                        val=np.ones(num_nodes) * self.hybrid_throttle_max,
-                        units='unitless',
-                        desc='Engine maximum hybrid throttle',
-                    )
-            if not (
-                self.global_throttle or (self.global_hybrid_throttle and self.use_hybrid_throttle)
-            ):
-                interp_throttles = om.MetaModelSemiStructuredComp(
-                    method=interp_method, extrapolate=False, vec_size=num_nodes
-                )
-
-                packed_data = self.packed_data
-                mach_table = np.array([])
-                alt_table = np.array([])
-
-                for M in range(self.mach_max_count):
-                    for A in range(self.alt_max_count):
-                        if self.data_indices[M, A] != 0:
-                            mach_table = np.append(mach_table, packed_data[MACH][M, A, 0])
-                            alt_table = np.append(alt_table, packed_data[ALTITUDE][M, A, 0])
-
-                # add inputs and outputs to interpolator
-                interp_throttles.add_input(
-                    Dynamic.Atmosphere.MACH,
-                    mach_table,
-                    units='unitless',
-                    desc='Current flight Mach number',
-                )
-                interp_throttles.add_input(
-                    Dynamic.Mission.ALTITUDE,
-                    alt_table,
-                    units=units[ALTITUDE],
-                    desc='Current flight altitude',
-                )
-                if not self.global_throttle:
-                    interp_throttles.add_output(
-                        'throttle_max',
-                        self.throttle_max,
-                        units='unitless',
-                        desc='max throttle available at current flight condition',
-                    )
-                if not self.global_hybrid_throttle and self.use_hybrid_throttle:
-                    interp_throttles.add_output(
-                        'hybrid_throttle_max',
-                        self.hybrid_throttle_max,
-                        units='unitless',
-                        desc='max hybrid throttle available at current flight condition',
-                    )
+            max_envelope = self.max_envelope
 
-            # Calculation of max thrust currently done with a duplicate of the engine
-            # model and scaling components
-            max_thrust_engine = om.MetaModelSemiStructuredComp(
+            max_thrust_engine = SharedMetaModelSemiStructuredComp(
                 method=interp_method, extrapolate=False, vec_size=num_nodes
             )
 
             max_thrust_engine.add_input(
                 Dynamic.Atmosphere.MACH,
-                self.data[MACH],
+                max_envelope[MACH],
                 units='unitless',
                 desc='Current flight Mach number',
             )
             max_thrust_engine.add_input(
                 Dynamic.Mission.ALTITUDE,
-                self.data[ALTITUDE],
+                max_envelope[ALTITUDE],
                 units=units[ALTITUDE],
                 desc='Current flight altitude',
             )
-            # replace throttle coming from mission with max value based on flight condition
-            max_thrust_engine.add_input(
-                'throttle_max',
-                self.data[THROTTLE],
-                units='unitless',
-                desc='Current engine throttle',
-            )
-            if self.use_hybrid_throttle:
-                # replace hybrid throttle coming from mission with max value based on
-                # flight condition
-                max_thrust_engine.add_input(
-                    'hybrid_throttle_max',
-                    self.data[HYBRID_THROTTLE],
-                    units='unitless',
-                    desc='Current engine hybrid throttle',
-                )
             max_thrust_engine.add_output(
                 'thrust_net_max_unscaled',
-                self.data[THRUST],
+                max_envelope[THRUST],
                 units=units[THRUST],
                 desc='maximum thrust that can currently be produced',
             )
@@ -977,14 +1005,14 @@ class EngineDeck(EngineModel):
             if SHAFT_POWER in self.engine_variables:
                 max_thrust_engine.add_output(
                     'shaft_power_max_unscaled',
-                    self.data[SHAFT_POWER],
+                    max_envelope[SHAFT_POWER],
                     units=units[SHAFT_POWER],
                     desc='maximum shaft power that can currently be produced',
                 )
             else:
                 max_thrust_engine.add_output(
                     'shaft_power_corrected_max_unscaled',
-                    self.data[SHAFT_POWER_CORRECTED],
+                    max_envelope[SHAFT_POWER_CORRECTED],
                     units=units[SHAFT_POWER_CORRECTED],
                     desc='maximum corrected shaft power that can currently be produced',
                 )
@@ -1021,21 +1049,6 @@ class EngineDeck(EngineModel):
             )
 
         if self.use_thrust or self.use_shaft_power:
-            if self.global_throttle or (self.global_hybrid_throttle and self.use_hybrid_throttle):
-                engine_group.add_subsystem(
-                    'fixed_max_throttles', fixed_throttles, promotes_outputs=['*']
-                )
-
-            if not (
-                self.global_throttle or (self.global_hybrid_throttle and self.use_hybrid_throttle)
-            ):
-                engine_group.add_subsystem(
-                    'interp_max_throttles',
-                    interp_throttles,
-                    promotes_inputs=['*'],
-                    promotes_outputs=['*'],
-                )
-
             engine_group.add_subsystem(
                 'max_interpolation', max_thrust_engine, promotes_inputs=['*']
             )
@@ -1109,6 +1122,118 @@ class EngineDeck(EngineModel):
 
         return engine_group
 
+    def build_inverse_throttle(self, num_nodes, aviary_inputs) -> om.Group:
+        """
+        Creates a group that computes the throttle setting needed for all engines of this
+        type to produce a required total net thrust, using an inverse lookup of the engine
+        deck. This allows throttle to be computed explicitly during mission analysis
+        instead of converging a thrust balance with a solver.
+
+        The inverse table is only an approximation of the forward engine deck, so thrust
+        computed at the resulting throttle will differ slightly from the required thrust.
+
+        Parameters
+        ----------
+        num_nodes : int
+            Number of nodes present in the current Dymos phase of mission analysis.
+
+        Returns
+        -------
+        throttle_group : openmdao.core.Group
+            An OpenMDAO group with inputs for Mach number, altitude, required thrust, and
+            engine scale factor, which outputs throttle.
+        """
+        if self.use_hybrid_throttle or not self.use_thrust:
+            raise UserWarning(
+                f'Inverse throttle lookup is not supported for {self.error_message}, which '
+                'must provide net thrust and must not use hybrid throttle.'
+            )
+
+        if not hasattr(self, 'inverse_throttle_table'):
+            self._generate_inverse_throttle_table()
+
+        interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        units = default_units.copy()
+        for key in self.engine_variables:
+            units[key] = self.engine_variables[key]
+        max_envelope = self.max_envelope
+        table = self.inverse_throttle_table
+
+        num_engines = self.get_val(Aircraft.Engine.NUM_ENGINES)
+        scale_performance = self.get_val(Aircraft.Engine.SCALE_PERFORMANCE)
+
+        throttle_group = om.Group()
+
+        max_thrust_engine = SharedMetaModelSemiStructuredComp(
+            method=interp_method, extrapolate=False, vec_size=num_nodes
+        )
+        max_thrust_engine.add_input(Dynamic.Atmosphere.MACH, max_envelope[MACH], units='unitless')
+        max_thrust_engine.add_input(
+            Dynamic.Mission.ALTITUDE, max_envelope[ALTITUDE], units=units[ALTITUDE]
+        )
+        max_thrust_engine.add_output(
+            'thrust_net_max_unscaled', max_envelope[THRUST], units=units[THRUST]
+        )
+
+        throttle_group.add_subsystem(
+            'max_interpolation',
+            max_thrust_engine,
+            promotes_inputs=[Dynamic.Atmosphere.MACH, Dynamic.Mission.ALTITUDE],
+        )
+
+        # thrust and max thrust are scaled by the same factor, so the fraction of max thrust
+        # does not depend on engine scaling
+        thrust_units = units[THRUST]
+        if scale_performance:
+            thrust_fraction = om.ExecComp(
+                f'thrust_fraction = thrust_required / ({num_engines} * scale_factor * thrust_max)',
+                thrust_fraction={'shape': num_nodes, 'units': 'unitless'},
+                thrust_required={'shape': num_nodes, 'units': thrust_units},
+                thrust_max={'shape': num_nodes, 'units': thrust_units},
+                scale_factor={'val': 1.0, 'units': 'unitless'},
+                has_diag_partials=True,
+            )
+            promotes_inputs = ['thrust_required', ('scale_factor', Aircraft.Engine.SCALE_FACTOR)]
+        else:
+            thrust_fraction = om.ExecComp(
+                f'thrust_fraction = thrust_required / ({num_engines} * thrust_max)',
+                thrust_fraction={'shape': num_nodes, 'units': 'unitless'},
+                thrust_required={'shape': num_nodes, 'units': thrust_units},
+                thrust_max={'shape': num_nodes, 'units': thrust_units},
+                has_diag_partials=True,
+            )
+            promotes_inputs = ['thrust_required']
+
+        throttle_group.add_subsystem(
+            'thrust_fraction', thrust_fraction, promotes_inputs=promotes_inputs
+        )
+
+        inverse_engine = SharedMetaModelSemiStructuredComp(
+            method=interp_method, extrapolate=True, vec_size=num_nodes
+        )
+        inverse_engine.add_input(Dynamic.Atmosphere.MACH, table[MACH], units='unitless')
+        inverse_engine.add_input(Dynamic.Mission.ALTITUDE, table[ALTITUDE], units=units[ALTITUDE])
+        inverse_engine.add_input('thrust_fraction', table['thrust_fraction'], units='unitless')
+        inverse_engine.add_output(
+            Dynamic.Vehicle.Propulsion.THROTTLE, table[THROTTLE], units='unitless'
+        )
+
+        throttle_group.add_subsystem(
+            'inverse_interpolation',
+            inverse_engine,
+            promotes_inputs=[Dynamic.Atmosphere.MACH, Dynamic.Mission.ALTITUDE],
+            promotes_outputs=[Dynamic.Vehicle.Propulsion.THROTTLE],
+        )
+
+        throttle_group.connect(
+            'max_interpolation.thrust_net_max_unscaled', 'thrust_fraction.thrust_max'
+        )
+        throttle_group.connect(
+            'thrust_fraction.thrust_fraction', 'inverse_interpolation.thrust_fraction'
+        )
+
+        return throttle_group
+
     def get_parameters(self):
         params = {
             Aircraft.Engine.SCALE_FACTOR: {
@@ -1502,24 +1627,24 @@ class EngineDeck(EngineModel):
         data_indices = self.data_indices
 
         packed_data = self.packed_data = {}
-        idx = 0
 
-        for key in self.data:
-            packed_data[key] = np.zeros((mach_max_count, alt_max_count, data_max_count))
+        # Sorted data fills each Mach, altitude point in turn. Points with no data are
+        # skipped, and the number of data points is index+1.
+        data_indices = data_indices[:mach_max_count, :alt_max_count]
+        counts = np.where(data_indices == 0, 0, data_indices + 1).ravel()
+        mach_idx, alt_idx = np.unravel_index(
+            np.repeat(np.arange(counts.size), counts), (mach_max_count, alt_max_count)
+        )
+        data_idx = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
 
-        for M in range(mach_max_count):
-            for A in range(alt_max_count):
-                if data_indices[M, A] == 0:
-                    # skip point if there is no data
-                    continue
+        for key in self.data:
+            unpacked_data = self.data[key]
+            num_points = min(len(unpacked_data), len(data_idx))
 
-                # number of data points is index+1
-                for D in range(data_indices[M, A] + 1):
-                    for key in self.data:
-                        unpacked_data = self.data[key]
-                        if idx < len(unpacked_data):
-                            packed_data[key][M, A, D] = unpacked_data[idx]
-                    idx += 1
+            packed_data[key] = np.zeros((mach_max_count, alt_max_count, data_max_count))
+            packed_data[key][mach_idx[:num_points], alt_idx[:num_points], data_idx[:num_points]] = (
+                unpacked_data[:num_points]
+            )
 
     def _count_data(self):
         """
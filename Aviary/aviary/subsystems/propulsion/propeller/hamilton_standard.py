@@ -10,78 +10,99 @@ from aviary.variable_info.functions import add_aviary_input, add_aviary_option,
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 
 
+def _take(a, idx):
+    """Gather a[..., idx] along the last axis, with one index per leading entry."""
+    return np.take_along_axis(a, idx[..., None], axis=-1)[..., 0]
+
+
+def _unint_coeffs(xa, x):
+    """
+    Locate x in the ascending table xa and compute the four point interpolation
+    coefficients used by _unint and _biquad. Points off either end of the table are
+    clamped to the end value.
+
+    Parameters
+    ----------
+    xa : ndarray
+        Table values in ascending order, shape (..., n). May either be shared by all
+        points or given separately for each point.
+    x : ndarray
+        Point(s) to interpolate at, broadcastable against xa[..., 0].
+
+    Returns
+    -------
+    jx1 : ndarray
+        Index of the first of the four table points used for each x.
+    coeffs : ndarray
+        Interpolation coefficients for each of the four table points, shape (..., 4).
+    lmt : ndarray
+        0 if x is inside the table, 1 if off the low end, 2 if off the high end.
+    """
+    xa = np.asarray(xa)
+    x = np.asarray(x)
+    n = xa.shape[-1]
+    shape = np.broadcast_shapes(x.shape, xa.shape[:-1])
+    xa = np.broadcast_to(xa, shape + (n,))
+    x = np.broadcast_to(x, shape)
+
+    x_lo = xa[..., 0]
+    x_hi = xa[..., -1]
+    lmt = np.where(x.real < x_lo.real, 1, np.where(x.real > x_hi.real, 2, 0))
+    # off table points take the end value of the table
+    x = np.where(lmt == 1, x_lo, np.where(lmt == 2, x_hi, x))
+
+    # idx: first table point at or above x, interval is (xa[idx-1], xa[idx]]
+    idx = np.clip(np.sum(xa.real < x.real[..., None], axis=-1), 1, n - 1)
+    # jx1: the first point of four points
+    jx1 = np.where(idx == 1, 0, np.where(idx == n - 1, n - 4, idx - 2))
+    x_idx = _take(xa, idx)
+    x_prev = _take(xa, idx - 1)
+    # first interval uses curve A only, last interval uses curve B only
+    ra = np.where(idx == 1, 1.0, np.where(idx == n - 1, 0.0, (x_idx - x) / (x_idx - x_prev)))
+    rb = 1.0 - ra
+
+    xc = [_take(xa, jx1 + j) for j in range(4)]
+    p1 = xc[1] - xc[0]
+    p2 = xc[2] - xc[1]
+    p3 = xc[3] - xc[2]
+    p4 = p1 + p2
+    p5 = p2 + p3
+    d1 = x - xc[0]
+    d2 = x - xc[1]
+    d3 = x - xc[2]
+    d4 = x - xc[3]
+    c1 = ra / p1 * d2 / p4 * d3
+    c2 = -ra / p1 * d1 / p2 * d3 + rb / p2 * d3 / p5 * d4
+    c3 = ra / p2 * d1 / p4 * d2 - rb / p2 * d2 / p3 * d4
+    c4 = rb / p5 * d2 / p3 * d3
+
+    return jx1, np.stack((c1, c2, c3, c4), axis=-1), lmt
+
+
 def _unint(xa, ya, x):
     """
     Univariate table routine with separate arrays for x and y
     This routine interpolates over a 4 point interval using a
     variation of 3nd degree interpolation to produce a continuity
     of slope between adjacent intervals.
+
+    The routine is vectorized: x may be an array of points, and xa and ya may be
+    given either as a single table or as one table per point (shape (..., n)).
+    Returns the interpolated values and the limit flag of each point (0 inside the
+    table, 1 off the low end, 2 off the high end).
     """
-    Lmt = 0
-    n = len(xa)
-    # test for off low end
-    if xa[0] > x:
-        Lmt = 1  # off low end
-        y = ya[0]
-    elif xa[0] == x:
-        y = ya[0]  # at low end
-    else:
-        ifnd = 0
-        idx = 0
-        for i in range(1, n):
-            if xa[i] == x:
-                ifnd = 1  # at a node
-                idx = i
-                break
-            elif xa[i] > x:
-                ifnd = 2  # between (xa[i-1],xa[i])
-                idx = i
-                break
-        if ifnd == 0:
-            idx = n
-            Lmt = 2  # off high end
-            y = ya[n - 1]
-        elif ifnd == 1:
-            y = ya[idx]
-        elif ifnd == 2:
-            # jx1: the first point of four points
-            if idx == 1:
-                # first interval
-                jx1 = 0
-                ra = 1.0
-            elif idx == n - 1:
-                # last interval
-                jx1 = n - 4
-                ra = 0.0
-            else:
-                jx1 = idx - 2
-                ra = (xa[idx] - x) / (xa[idx] - xa[idx - 1])
-            rb = 1.0 - ra
-
-            # get coefficients and results
-            p1 = xa[jx1 + 1] - xa[jx1]
-            p2 = xa[jx1 + 2] - xa[jx1 + 1]
-            p3 = xa[jx1 + 3] - xa[jx1 + 2]
-            p4 = p1 + p2
-            p5 = p2 + p3
-            d1 = x - xa[jx1]
-            d2 = x - xa[jx1 + 1]
-            d3 = x - xa[jx1 + 2]
-            d4 = x - xa[jx1 + 3]
-            c1 = ra / p1 * d2 / p4 * d3
-            c2 = -ra / p1 * d1 / p2 * d3 + rb / p2 * d3 / p5 * d4
-            c3 = ra / p2 * d1 / p4 * d2 - rb / p2 * d2 / p3 * d4
-            c4 = rb / p5 * d2 / p3 * d3
-            y = ya[jx1] * c1 + ya[jx1 + 1] * c2 + ya[jx1 + 2] * c3 + ya[jx1 + 3] * c4
-
-            # we don't want y to be an array
-            try:
-                y = y[0]
-            # floats/ints will give TypeError, numpy versions give IndexError
-            except (TypeError, IndexError):
-                pass
-
-    return y, Lmt
+    ya = np.asarray(ya)
+    n = np.shape(xa)[-1]
+    # tables may carry unused trailing entries, only the first n values are used
+    ya = ya[..., :n]
+
+    jx1, coeffs, lmt = _unint_coeffs(xa, x)
+    shape = np.broadcast_shapes(jx1.shape, ya.shape[:-1])
+    jx1 = np.broadcast_to(jx1, shape)
+    ya = np.broadcast_to(ya, shape + (n,))
+    y = sum(coeffs[..., j] * _take(ya, jx1 + j) for j in range(4))
+
+    return y, lmt
 
 
 def _biquad(T, i, xi, yi):
@@ -95,153 +116,40 @@ def _biquad(T, i, xi, yi):
     T(i+1) = number of x values in xi array
     T(i+2) = number of y values in yi array
     T(i+3) = values of x in ascending order
+
+    The routine is vectorized over xi and yi. As in the original routine, points
+    off the high end of the x table return zero.
     """
-    lmt = 0
     nx = int(T[i])
     ny = int(T[i + 1])
     j1 = int(i + 2)
-    j2 = j1 + nx - 1
-    # search in x sense
-    # jx1 = subscript of 1st x
-    # search routine - input j1, j2, xi
-    #                - output ra_x, rb_x, kx, jx1
-    z = 0.0
-    x = xi
-    kx = 0
-    ifnd_x = 0
-    jn = 0
-    xc = [0, 0, 0, 0]
-    for j in range(j1, j2 + 1):
-        if T[j] >= x:
-            ifnd_x = 1
-            jn = j
-            break
-    if ifnd_x == 0:
-        # off high end
-        x = T[j2]
-        kx = 2
-        # the last 4 points and curve B
-        jx1 = j2 - 3
-        ra_x = 0.0
-    else:
-        # test for -- off low end, first interval, other
-        if jn < j1 + 1:
-            if T[jn] != x:
-                kx = 1
-                x = T[j1]
-        if jn <= j1 + 1:
-            jx1 = j1
-            ra_x = 1.0
-        else:
-            # test for last interval
-            if j == j2:
-                jx1 = j2 - 3
-                ra_x = 0.0
-            else:
-                jx1 = jn - 2
-                ra_x = (T[jn] - x) / (T[jn] - T[jn - 1])
-        rb_x = 1.0 - ra_x
+    j2 = j1 + nx
+    x_tab = np.asarray(T[j1:j2])
 
-        # return here from search of x
+    jx, cx, kx = _unint_coeffs(x_tab, xi)
+
+    if ny == 0:
+        # univariate table
+        z_tab = np.asarray(T[j2 : j2 + nx])
+        z = sum(cx[..., m] * z_tab[jx + m] for m in range(4))
         lmt = kx
-        jx = jx1
-        # The following code puts x values in xc blocks
-        for j in range(4):
-            xc[j] = T[jx1 + j]
-        # get coeff. in x sense
-        # coefficient routine - input x,x1,x2,x3,x4,ra_x,rb_x
-        p1 = xc[1] - xc[0]
-        p2 = xc[2] - xc[1]
-        p3 = xc[3] - xc[2]
-        p4 = p1 + p2
-        p5 = p2 + p3
-        d1 = x - xc[0]
-        d2 = x - xc[1]
-        d3 = x - xc[2]
-        d4 = x - xc[3]
-        cx1 = ra_x / p1 * d2 / p4 * d3
-        cx2 = -ra_x / p1 * d1 / p2 * d3 + rb_x / p2 * d3 / p5 * d4
-        cx3 = ra_x / p2 * d1 / p4 * d2 - rb_x / p2 * d2 / p3 * d4
-        cx4 = rb_x / p5 * d2 / p3 * d3
-        # return to main body
-
-        # return here with coeff. test for univariate or bivariate
-        if ny == 0:
-            z = 0.0
-            jy = jx + nx
-            z = cx1 * T[jy] + cx2 * T[jy + 1] + cx3 * T[jy + 2] + cx4 * T[jy + 3]
-        else:
-            # bivariate table
-            y = yi
-            j3 = j2 + 1
-            j4 = j3 + ny - 1
-            # search in y sense
-            # jy1 = subscript of 1st y
-            # search routine - input j3,j4,y
-            #                - output ra_y,rb_y,ky,,jy1
-            ky = 0
-            ifnd_y = 0
-            for j in range(j3, j4 + 1):
-                if T[j] >= y:
-                    ifnd_y = 1
-                    break
-            if ifnd_y == 0:
-                # off high end
-                y = T[j4]
-                ky = 2
-                # use last 4 points and curve B
-                jy1 = j4 - 3
-                ra_y = 0.0
-            else:
-                # test for off low end, first interval
-                if j < j3 + 1:
-                    if T[j] != y:
-                        ky = 1
-                        y = T[j3]
-                if j <= j3 + 1:
-                    jy1 = j3
-                    ra_y = 1.0
-                else:
-                    # test for last interval
-                    if j == j4:
-                        jy1 = j4 - 3
-                        ra_y = 0.0
-                    else:
-                        jy1 = j - 2
-                        ra_y = (T[j] - y) / (T[j] - T[j - 1])
-            rb_y = 1.0 - ra_y
-
-            lmt = lmt + 3 * ky
-            # interpolate in y sense
-            # subscript - base, num. of col., num. of y's
-            jy = (j4 + 1) + (jx - i - 2) * ny + (jy1 - j3)
-            yt = [0, 0, 0, 0]
-            for m in range(4):
-                jx = jy
-                yt[m] = cx1 * T[jx] + cx2 * T[jx + ny] + cx3 * T[jx + 2 * ny] + cx4 * T[jx + 3 * ny]
-                jy = jy + 1
-
-            # the following code puts y values in yc block
-            yc = [0, 0, 0, 0]
-            for j in range(4):
-                yc[j] = T[jy1]
-                jy1 = jy1 + 1
-            # get coeff. in y sense
-            # coefficient routine - input y, y1, y2, y3, y4, ra_y, rb_y
-            p1 = yc[1] - yc[0]
-            p2 = yc[2] - yc[1]
-            p3 = yc[3] - yc[2]
-            p4 = p1 + p2
-            p5 = p2 + p3
-            d1 = y - yc[0]
-            d2 = y - yc[1]
-            d3 = y - yc[2]
-            d4 = y - yc[3]
-            cy1 = ra_y / p1 * d2 / p4 * d3
-            cy2 = -ra_y / p1 * d1 / p2 * d3 + rb_y / p2 * d3 / p5 * d4
-            cy3 = ra_y / p2 * d1 / p4 * d2 - rb_y / p2 * d2 / p3 * d4
-            cy4 = rb_y / p5 * d2 / p3 * d3
-            z = cy1 * yt[0] + cy2 * yt[1] + cy3 * yt[2] + cy4 * yt[3]
+    else:
+        # bivariate table
+        j3 = j2 + ny
+        y_tab = np.asarray(T[j2:j3])
+        z_tab = np.asarray(T[j3 : j3 + nx * ny]).reshape(nx, ny)
+
+        jy, cy, ky = _unint_coeffs(y_tab, yi)
+        jx, jy = np.broadcast_arrays(jx, jy)
+
+        z = 0.0
+        for m in range(4):
+            # interpolate in x sense at each of the four y points
+            yt = sum(cx[..., k] * z_tab[jx + k, jy + m] for k in range(4))
+            z = z + cy[..., m] * yt
+        lmt = kx + 3 * ky
+
+    z = np.where(kx == 2, 0.0, z)
 
     return z, lmt
 
@@ -607,6 +515,10 @@ class HamiltonStandard(om.ExplicitComponent):
     The original documentation is available at
     https://ntrs.nasa.gov/api/citations/19720010354/downloads/19720010354.pdf
     It computes the thrust coefficient of a propeller blade.
+
+    The table lookups are evaluated for all nodes at once. The outputs at each node only
+    depend on the inputs at that node, so partials are diagonal and are evaluated by
+    complex stepping all nodes at the same time.
     """
 
     def initialize(self):
@@ -636,15 +548,88 @@ class HamiltonStandard(om.ExplicitComponent):
         # propeller tip compressibility loss factor
         self.add_output('comp_tip_loss_factor', val=np.zeros(nn), units='unitless')
 
-        self.declare_partials('*', '*', method='cs')
+    def setup_partials(self):
+        arange = np.arange(self.options['num_nodes'])
+
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            [
+                'power_coefficient',
+                'advance_ratio',
+                Dynamic.Atmosphere.MACH,
+                'tip_mach',
+            ],
+            rows=arange,
+            cols=arange,
+        )
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            [
+                Aircraft.Engine.Propeller.ACTIVITY_FACTOR,
+                Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT,
+            ],
+        )
 
     def compute(self, inputs, outputs):
+        ct, xft = self._compute_hamilton_standard(inputs, report=True)
+
+        outputs['thrust_coefficient'] = ct
+        outputs['comp_tip_loss_factor'] = xft
+
+    def compute_partials(self, inputs, partials):
+        # Each input is complex stepped at every node at once, so there is one vectorized
+        # pass per input regardless of num_nodes. This is exact because node i only
+        # affects the outputs at node i.
+        step = 1.0e-40
+        input_names = [
+            'power_coefficient',
+            'advance_ratio',
+            Dynamic.Atmosphere.MACH,
+            'tip_mach',
+            Aircraft.Engine.Propeller.ACTIVITY_FACTOR,
+            Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT,
+        ]
+
+        for wrt in input_names:
+            cs_inputs = {name: np.array(inputs[name], dtype=complex) for name in input_names}
+            cs_inputs[wrt] += step * 1j
+
+            ct, xft = self._compute_hamilton_standard(cs_inputs)
+
+            partials['thrust_coefficient', wrt] = ct.imag / step
+            partials['comp_tip_loss_factor', wrt] = xft.imag / step
+
+    def _compute_hamilton_standard(self, inputs, report=False):
+        """
+        Run the Hamilton Standard procedure for all nodes at once.
+
+        Parameters
+        ----------
+        inputs : dict-like
+            Component inputs, which may be complex for complex step.
+        report : bool
+            If True, print table look-up warnings as they are encountered.
+
+        Returns
+        -------
+        ct : ndarray
+            Thrust coefficient at each node.
+        xft : ndarray
+            Compressibility tip loss factor at each node.
+        """
         verbosity = self.options[Settings.VERBOSITY]
         num_blades = self.options[Aircraft.Engine.Propeller.NUM_BLADES]
+        nn = self.options['num_nodes']
 
+        power_coefficient = inputs['power_coefficient']
+        advance_ratio = inputs['advance_ratio']
+        mach = inputs[Dynamic.Atmosphere.MACH]
+        tip_mach = inputs['tip_mach']
         act_factor = inputs[Aircraft.Engine.Propeller.ACTIVITY_FACTOR][0]
         cli = inputs[Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT][0]
 
+        dtype = np.result_type(power_coefficient, advance_ratio, mach, tip_mach, act_factor, cli)
+
         # TODO verify this works with multiple engine models (i.e. prop mission is
         #      properly slicing these inputs)
         # ensure num_blades is an int, so it can be used as array index later
@@ -655,293 +640,228 @@ class HamiltonStandard(om.ExplicitComponent):
         else:
             num_blades = int(num_blades[0])
 
-        AF_adj_CP = np.zeros(7, dtype=cli.dtype)  # AFCP: an AF adjustment of CP to be assigned
-        AF_adj_CT = np.zeros(7, dtype=cli.dtype)  # AFCT: an AF adjustment of CT to be assigned
-
-        CTT = np.zeros(7, dtype=cli.dtype)
-        BLL = np.zeros(7, dtype=cli.dtype)
-        BLLL = np.zeros(7, dtype=cli.dtype)
-        PXCLI = np.zeros(7, dtype=cli.dtype)
-        XFFT = np.zeros(6, dtype=cli.dtype)
-        CTG = np.zeros(11, dtype=cli.dtype)
-        CTG1 = np.zeros(11, dtype=cli.dtype)
-        TXCLI = np.zeros(6, dtype=cli.dtype)
-        CTTT = np.zeros(4, dtype=cli.dtype)
-        XXXFT = np.zeros(4, dtype=cli.dtype)
-
-        for i_node in range(self.options['num_nodes']):
-            ichck = 0
-            run_flag = 0
-            xft = 1.0
-
-            CTT[:] = 0.0
-            BLL[:] = 0.0
-            BLLL[:] = 0.0
-            PXCLI[:] = 0.0
-            XFFT[:] = 0.0
-            CTG[:] = 0.0
-            CTG1[:] = 0.0
-            TXCLI[:] = 0.0
-            CTTT[:] = 0.0
-            XXXFT[:] = 0.0
-
-            for k in range(2):
-                AF_adj_CP[k], run_flag = _unint(Act_Factor_arr, AFCPC[k], act_factor)
-                AF_adj_CT[k], run_flag = _unint(Act_Factor_arr, AFCTC[k], act_factor)
-            for k in range(2, 7):
-                AF_adj_CP[k] = AF_adj_CP[1]
-                AF_adj_CT[k] = AF_adj_CT[1]
-            if inputs['advance_ratio'][i_node] <= 0.5:
-                AFCTE = (
-                    2.0 * inputs['advance_ratio'][i_node] * (AF_adj_CT[1] - AF_adj_CT[0])
-                    + AF_adj_CT[0]
-                )
-            else:
-                AFCTE = AF_adj_CT[1]
-
-            # bounding J (advance ratio) for setting up interpolation
-            if inputs['advance_ratio'][i_node] <= 1.0:
-                J_begin = 0
-                J_end = 3
-            elif inputs['advance_ratio'][i_node] <= 1.5:
-                J_begin = 1
-                J_end = 4
-            elif inputs['advance_ratio'][i_node] <= 2.0:
-                J_begin = 2
-                J_end = 5
-            else:
-                J_begin = 3
-                J_end = 6
-
-            CL_tab_idx_begin = 0  # NCLT
-            CL_tab_idx_end = 0  # NCLTT
-            # flag that given lift coeff (cli) does not fall on a node point of CL_arr
-            CL_tab_idx_flg = 0  # NCL_flg
-            ifnd = 0
-
-            power_coefficient = inputs['power_coefficient'][i_node]
-            for ii in range(6):
-                cl_idx = ii
-                if abs(cli - CL_arr[ii]) <= 0.0009:
-                    ifnd = 1
-                    break
-            if ifnd == 0:
-                if cli <= 0.6:
-                    CL_tab_idx_begin = 0
-                    CL_tab_idx_end = 3
-                elif cli <= 0.7:
-                    CL_tab_idx_begin = 1
-                    CL_tab_idx_end = 4
-                else:
-                    CL_tab_idx_begin = 2
-                    CL_tab_idx_end = 5
-            else:
-                CL_tab_idx_begin = cl_idx
-                CL_tab_idx_end = cl_idx
-                # flag that given lift coeff (cli) falls on a node point of CL_arr
-                CL_tab_idx_flg = 1
-
-            lmod = (num_blades % 2) + 1
-            if lmod == 1:
-                nbb = 1
-                idx_blade = int(num_blades / 2)
-                # even number of blades idx_blade = 1 if 2 blades;
-                #                       idx_blade = 2 if 4 blades;
-                #                       idx_blade = 3 if 6 blades;
-                #                       idx_blade = 4 if 8 blades.
-                idx_blade = idx_blade - 1
+        AF_adj_CP = np.zeros(7, dtype=dtype)  # AFCP: an AF adjustment of CP to be assigned
+        AF_adj_CT = np.zeros(7, dtype=dtype)  # AFCT: an AF adjustment of CT to be assigned
+        for k in range(2):
+            AF_adj_CP[k], run_flag = _unint(Act_Factor_arr, AFCPC[k], act_factor)
+            AF_adj_CT[k], run_flag = _unint(Act_Factor_arr, AFCTC[k], act_factor)
+        AF_adj_CP[2:] = AF_adj_CP[1]
+        AF_adj_CT[2:] = AF_adj_CT[1]
+        AFCTE = np.where(
+            advance_ratio.real <= 0.5,
+            2.0 * advance_ratio * (AF_adj_CT[1] - AF_adj_CT[0]) + AF_adj_CT[0],
+            AF_adj_CT[1],
+        )
+
+        # bounding J (advance ratio) for setting up interpolation
+        J_begin = np.select(
+            [advance_ratio.real <= 1.0, advance_ratio.real <= 1.5, advance_ratio.real <= 2.0],
+            [0, 1, 2],
+            default=3,
+        )
+        # indices of the four advance ratio tables used at each node
+        J_idx = J_begin[:, np.newaxis] + np.arange(4)
+        J_tab = advance_ratio_array[J_idx]
+
+        # flag that given lift coeff (cli) falls on a node point of CL_arr
+        cl_node = np.abs(cli.real - CL_arr) <= 0.0009
+        if cl_node.any():
+            CL_tab_idx_begin = CL_tab_idx_end = int(np.argmax(cl_node))  # NCLT, NCLTT
+            CL_tab_idx_flg = 1  # NCL_flg
+        else:
+            CL_tab_idx_flg = 0
+            if cli.real <= 0.6:
+                CL_tab_idx_begin = 0
+                CL_tab_idx_end = 3
+            elif cli.real <= 0.7:
+                CL_tab_idx_begin = 1
+                CL_tab_idx_end = 4
             else:
-                nbb = 4
-                # odd number of blades
-                idx_blade = 0  # start from first blade
-
-            for ibb in range(nbb):
-                # nbb = 1 even number of blades. No interpolation needed
-                # nbb = 4 odd number of blades. So, interpolation done
-                #       using 4 sets of even J (advance ratio) interpolation
-                for kdx in range(J_begin, J_end + 1):
-                    CP_Eff = power_coefficient * AF_adj_CP[kdx]
-                    PBL, run_flag = _unint(CPEC, BL_P_corr_table[idx_blade], CP_Eff)
-                    # PBL = number of blades correction for power_coefficient
-                    CPE1 = CP_Eff * PBL * PF_CLI_arr[kdx]
-                    CL_tab_idx = CL_tab_idx_begin
-                    for kl in range(CL_tab_idx_begin, CL_tab_idx_end + 1):
-                        CPE1X = CPE1
-                        if CPE1 < CP_CLi_table[CL_tab_idx][0]:
-                            CPE1X = CP_CLi_table[CL_tab_idx][0]
-                        cli_len = cli_arr_len[CL_tab_idx]
-                        PXCLI[kl], run_flag = _unint(
-                            CP_CLi_table[CL_tab_idx][:cli_len], XPCLI[CL_tab_idx], CPE1X
-                        )
-                        if run_flag == 1:
-                            ichck = ichck + 1
-                        if verbosity == Verbosity.DEBUG or ichck <= Verbosity.BRIEF:
-                            if run_flag == 1:
-                                warnings.warn(
-                                    f'Mach = {inputs[Dynamic.Atmosphere.MACH][i_node]}\n'
-                                    f'VTMACH = {inputs["tip_mach"][i_node]}\n'
-                                    f'J = {inputs["advance_ratio"][i_node]}\n'
-                                    f'power_coefficient = {power_coefficient}\n'
-                                    f'CP_Eff = {CP_Eff}'
-                                )
-                            if kl == 4 and CPE1 < 0.010:
-                                print(
-                                    f'Extrapolated data is being used for CLI=.6--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5'
-                                )
-                            if kl == 5 and CPE1 < 0.010:
-                                print(
-                                    f'Extrapolated data is being used for CLI=.7--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5'
-                                )
-                            if kl == 6 and CPE1 < 0.010:
+                CL_tab_idx_begin = 2
+                CL_tab_idx_end = 5
+        CL_tabs = range(CL_tab_idx_begin, CL_tab_idx_end + 1)
+        CL_interp = CL_arr[CL_tab_idx_begin : CL_tab_idx_begin + 4]
+
+        lmod = (num_blades % 2) + 1
+        if lmod == 1:
+            nbb = 1
+            idx_blade = int(num_blades / 2)
+            # even number of blades idx_blade = 1 if 2 blades;
+            #                       idx_blade = 2 if 4 blades;
+            #                       idx_blade = 3 if 6 blades;
+            #                       idx_blade = 4 if 8 blades.
+            idx_blade = idx_blade - 1
+        else:
+            nbb = 4
+            # odd number of blades
+            idx_blade = 0  # start from first blade
+
+        # number of table look-ups that went off the tables at each node
+        ichck = np.zeros(nn, dtype=int)
+
+        PXCLI = np.zeros((6, nn), dtype=dtype)
+        TXCLI = np.zeros((6, nn), dtype=dtype)
+        XFFT = np.zeros((6, nn), dtype=dtype)
+        CTTT = np.zeros((nbb, nn), dtype=dtype)
+        XXXFT = np.zeros((nbb, nn), dtype=dtype)
+
+        TFCLII, run_flag = _unint(advance_ratio_array, TF_CLI_arr, advance_ratio)
+
+        # difference between flight mach and critical mach for each CL table
+        DMN = np.zeros((6, nn), dtype=dtype)
+        for kl in CL_tabs:
+            ZMCRT, run_flag = _unint(advance_ratio_array2, mach_corr_table[kl], advance_ratio)
+            DMN[kl] = np.where(
+                advance_ratio.real != 0.0,
+                mach - ZMCRT,
+                tip_mach - mach_tip_corr_arr[kl],
+            )
+
+        for ibb in range(nbb):
+            # nbb = 1 even number of blades. No interpolation needed
+            # nbb = 4 odd number of blades. So, interpolation done
+            #       using 4 sets of even J (advance ratio) interpolation
+            BLL = np.zeros((nn, 4), dtype=dtype)
+            CTT = np.zeros((nn, 4), dtype=dtype)
+            for j in range(4):
+                kdx = J_idx[:, j]
+                CP_Eff = power_coefficient * AF_adj_CP[kdx]
+                PBL, run_flag = _unint(CPEC, BL_P_corr_table[idx_blade], CP_Eff)
+                # PBL = number of blades correction for power_coefficient
+                CPE1 = CP_Eff * PBL * PF_CLI_arr[kdx]
+                for kl in CL_tabs:
+                    CPE1X = np.where(CPE1.real < CP_CLi_table[kl][0], CP_CLi_table[kl][0], CPE1)
+                    cli_len = cli_arr_len[kl]
+                    PXCLI[kl], run_flag = _unint(CP_CLi_table[kl][:cli_len], XPCLI[kl], CPE1X)
+                    ichck += run_flag == 1
+                    if report:
+                        show = (verbosity == Verbosity.DEBUG) | (ichck <= Verbosity.BRIEF)
+                        for i_node in np.flatnonzero(show & (run_flag == 1)):
+                            warnings.warn(
+                                f'Mach = {mach[i_node]}\n'
+                                f'VTMACH = {tip_mach[i_node]}\n'
+                                f'J = {advance_ratio[i_node]}\n'
+                                f'power_coefficient = {power_coefficient[i_node]}\n'
+                                f'CP_Eff = {CP_Eff[i_node]}'
+                            )
+                        if kl == 4 or kl == 5:
+                            cli_name = '.6' if kl == 4 else '.7'
+                            for i_node in np.flatnonzero(show & (CPE1.real < 0.010)):
                                 print(
-                                    f'Extrapolated data is being used for CLI=.8--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5'
+                                    f'Extrapolated data is being used for CLI={cli_name}--CPE1,PXCLI,L= , {CPE1[i_node]},{PXCLI[kl][i_node]},{idx_blade}   Suggest inputting CLI=.5'
                                 )
-                        NERPT = 1
-                        CL_tab_idx = CL_tab_idx + 1
-                    if CL_tab_idx_flg != 1:
-                        PCLI, run_flag = _unint(
-                            CL_arr[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            PXCLI[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            inputs[Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT][0],
-                        )
-                    else:
-                        PCLI = PXCLI[CL_tab_idx_begin]
-                        # PCLI = CLI adjustment to power_coefficient
-                    CP_Eff = CP_Eff * PCLI  # the effective CP at baseline point for kdx
-                    ang_len = ang_arr_len[kdx]
-                    BLL[kdx], run_flag = _unint(
-                        # blade angle at baseline point for kdx
-                        CP_Angle_table[idx_blade][kdx][:ang_len],
-                        Blade_angle_table[kdx],
-                        CP_Eff,
+                if CL_tab_idx_flg != 1:
+                    PCLI, run_flag = _unint(CL_interp, PXCLI[CL_tab_idx_begin:][:4].T, cli)
+                else:
+                    PCLI = PXCLI[CL_tab_idx_begin]
+                    # PCLI = CLI adjustment to power_coefficient
+                CP_Eff = CP_Eff * PCLI  # the effective CP at baseline point for kdx
+
+                # the blade angle tables differ in length, so look up each table in turn
+                for k in np.unique(kdx):
+                    on_table = kdx == k
+                    ang_len = ang_arr_len[k]
+                    # blade angle at baseline point for kdx
+                    BLL[on_table, j], run_flag = _unint(
+                        CP_Angle_table[idx_blade][k][:ang_len],
+                        Blade_angle_table[k],
+                        CP_Eff[on_table],
                     )
-                    try:
-                        CTT[kdx], run_flag = _unint(
-                            # thrust coeff at baseline point for kdx
-                            Blade_angle_table[kdx][:ang_len],
-                            CT_Angle_table[idx_blade][kdx][:ang_len],
-                            BLL[kdx],
+                    # thrust coeff at baseline point for kdx
+                    CTT[on_table, j], run_flag = _unint(
+                        Blade_angle_table[k][:ang_len],
+                        CT_Angle_table[idx_blade][k],
+                        BLL[on_table, j],
+                    )
+                    if report and np.any(run_flag > 1):
+                        NERPT = 2
+                        print(f'ERROR IN PROP. PERF.-- NERPT={NERPT}, run_flag={run_flag.max()}')
+
+            CTTT[ibb], run_flag = _unint(J_tab, CTT, advance_ratio)
+
+            # make extra correction. CTG is an "error" function, and the iteration (loop counter = "IL") tries to drive CTG/CT to 0
+            # ERR_CT = CTG1[il]/CTTT[ibb], where CTG1 =CT_Eff - CTTT(IBB).
+            # Nodes are iterated together, each one stops updating once it has
+            # converged (ifnd1) or the next guess is non-positive (ifnd2).
+            CTG = np.zeros((11, nn), dtype=dtype)
+            CTG1 = np.zeros((11, nn), dtype=dtype)
+            CTG[0] = 0.100
+            CTG[1] = 0.200
+            NCTG = 10
+            ct = np.zeros(nn, dtype=dtype)
+            xft = np.ones(nn, dtype=dtype)
+            active = np.ones(nn, dtype=bool)
+            for il in range(NCTG):
+                CT_Eff = CTG[il] * AFCTE
+                TBL, run_flag = _unint(CTEC, BL_T_corr_table[idx_blade], CT_Eff)
+                # TBL = number of blades correction for thrust_coefficient
+                CTE1 = CT_Eff * TBL * TFCLII
+                for kl in CL_tabs:
+                    CTE1X = np.where(CTE1.real < CT_CLi_table[kl][0], CT_CLi_table[kl][0], CTE1)
+                    cli_len = cli_arr_len[kl]
+                    TXCLI[kl], run_flag = _unint(CT_CLi_table[kl][:cli_len], XTCLI[kl], CTE1X)
+                    NERPT = 5
+                    if report and np.any(active & (run_flag == 1)):
+                        # off lower bound only.
+                        print(
+                            f'ERROR IN PROP. PERF.-- NERPT={NERPT}, run_flag=1, il={il}, kl = {kl}'
                         )
-                    except IndexError:
-                        raise om.AnalysisError(
-                            'interp failed for CTT (thrust coefficient) in hamilton_standard.py'
+                    # compressibility tip loss factor
+                    CTE2 = CT_Eff * TXCLI[kl] * TBL
+                    XFFT[kl] = np.where(
+                        DMN[kl].real > 0.0, _biquad(comp_mach_CT_arr, 1, DMN[kl], CTE2)[0], 1.0
+                    )
+                if CL_tab_idx_flg != 1:
+                    TCLII, run_flag = _unint(CL_interp, TXCLI[CL_tab_idx_begin:][:4].T, cli)
+                    xft_il, run_flag = _unint(CL_interp, XFFT[CL_tab_idx_begin:][:4].T, cli)
+                else:
+                    TCLII = TXCLI[CL_tab_idx_begin]
+                    xft_il = XFFT[CL_tab_idx_begin]
+                CT_Eff = CTG[il] * AFCTE * TCLII
+                CTG1[il] = CT_Eff - CTTT[ibb]
+
+                xft = np.where(active, xft_il, xft)
+                converged = active & (np.abs(CTG1[il].real / CTTT[ibb].real) < 0.001)
+                ct = np.where(converged, CTG[il], ct)
+                active &= ~converged
+
+                if il > 0:
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        CTG[il + 1] = np.where(
+                            active,
+                            -CTG1[il - 1] * (CTG[il] - CTG[il - 1]) / (CTG1[il] - CTG1[il - 1])
+                            + CTG[il - 1],
+                            CTG[il],
                         )
-                    if run_flag > 1:
-                        NERPT = 2
-                        print(f'ERROR IN PROP. PERF.-- NERPT={NERPT}, run_flag={run_flag}')
+                    # thrust coefficient stays zero where the guess goes non-positive
+                    active &= CTG[il + 1].real > 0
 
-                BLLL[ibb], run_flag = _unint(
-                    advance_ratio_array[J_begin : J_begin + 4],
-                    BLL[J_begin : J_begin + 4],
-                    inputs['advance_ratio'][i_node],
-                )
-                ang_blade = BLLL[ibb]
-                CTTT[ibb], run_flag = _unint(
-                    advance_ratio_array[J_begin : J_begin + 4],
-                    CTT[J_begin : J_begin + 4],
-                    inputs['advance_ratio'][i_node],
-                )
+                if not active.any():
+                    break
 
-                # make extra correction. CTG is an "error" function, and the iteration (loop counter = "IL") tries to drive CTG/CT to 0
-                # ERR_CT = CTG1[il]/CTTT[ibb], where CTG1 =CT_Eff - CTTT(IBB).
-                CTG[0] = 0.100
-                CTG[1] = 0.200
-                TFCLII, run_flag = _unint(
-                    advance_ratio_array, TF_CLI_arr, inputs['advance_ratio'][i_node]
+            if active.any():
+                raise ValueError(
+                    'Integrated design cl adjustment not working properly for ct '
+                    f'definition (ibb={ibb})'
                 )
-                NCTG = 10
-                ifnd1 = 0
-                ifnd2 = 0
-                for il in range(NCTG):
-                    ct = CTG[il]
-                    CT_Eff = CTG[il] * AFCTE
-                    TBL, run_flag = _unint(CTEC, BL_T_corr_table[idx_blade], CT_Eff)
-                    # TBL = number of blades correction for thrust_coefficient
-                    CTE1 = CT_Eff * TBL * TFCLII
-                    CL_tab_idx = CL_tab_idx_begin
-                    for kl in range(CL_tab_idx_begin, CL_tab_idx_end + 1):
-                        CTE1X = CTE1
-                        if CTE1 < CT_CLi_table[CL_tab_idx][0]:
-                            CTE1X = CT_CLi_table[CL_tab_idx][0]
-                        cli_len = cli_arr_len[CL_tab_idx]
-                        TXCLI[kl], run_flag = _unint(
-                            CT_CLi_table[CL_tab_idx][:cli_len], XTCLI[CL_tab_idx][:cli_len], CTE1X
-                        )
-                        NERPT = 5
-                        if run_flag == 1:
-                            # off lower bound only.
-                            print(
-                                f'ERROR IN PROP. PERF.-- NERPT={NERPT}, '
-                                f'run_flag={run_flag}, il={il}, kl = {kl}'
-                            )
-                        if inputs['advance_ratio'][i_node] != 0.0:
-                            ZMCRT, run_flag = _unint(
-                                advance_ratio_array2,
-                                mach_corr_table[CL_tab_idx],
-                                inputs['advance_ratio'][i_node],
-                            )
-                            DMN = inputs[Dynamic.Atmosphere.MACH][i_node] - ZMCRT
-                        else:
-                            ZMCRT = mach_tip_corr_arr[CL_tab_idx]
-                            DMN = inputs['tip_mach'][i_node] - ZMCRT
-                        XFFT[kl] = 1.0  # compressibility tip loss factor
-                        if DMN > 0.0:
-                            CTE2 = CT_Eff * TXCLI[kl] * TBL
-                            XFFT[kl], run_flag = _biquad(comp_mach_CT_arr, 1, DMN, CTE2)
-                        CL_tab_idx = CL_tab_idx + 1
-                    if CL_tab_idx_flg != 1:
-                        cli = inputs[Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT][0]
-                        TCLII, run_flag = _unint(
-                            CL_arr[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            TXCLI[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            cli,
-                        )
-                        xft, run_flag = _unint(
-                            CL_arr[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            XFFT[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            cli,
-                        )
-                    else:
-                        TCLII = TXCLI[CL_tab_idx_begin]
-                        xft = XFFT[CL_tab_idx_begin]
-                    ct = CTG[il]
-                    CT_Eff = CTG[il] * AFCTE * TCLII
-                    CTG1[il] = CT_Eff - CTTT[ibb]
-                    if abs(CTG1[il] / CTTT[ibb]) < 0.001:
-                        ifnd1 = 1
-                        break
-                    if il > 0:
-                        CTG[il + 1] = (
-                            -CTG1[il - 1] * (CTG[il] - CTG[il - 1]) / (CTG1[il] - CTG1[il - 1])
-                            + CTG[il - 1]
-                        )
-                        if CTG[il + 1] <= 0:
-                            ifnd2 = 1
-                            break
-
-                if ifnd1 == 0 and ifnd2 == 0:
-                    raise ValueError(
-                        'Integrated design cl adjustment not working properly for ct '
-                        f'definition (ibb={ibb})'
-                    )
-                if ifnd1 == 0 and ifnd2 == 1:
-                    ct = 0.0
-                CTTT[ibb] = ct
-                XXXFT[ibb] = xft
-                idx_blade = idx_blade + 1
-
-            if nbb != 1:
-                # interpolation by the number of blades if odd number
-                ang_blade, run_flag = _unint(num_blades_arr, BLLL[:4], num_blades)
-                ct, run_flag = _unint(num_blades_arr, CTTT, num_blades)
-                xft, run_flag = _unint(num_blades_arr, XXXFT, num_blades)
-
-            # NOTE this could be handled via the metamodel comps (extrapolate flag)
-            if ichck > 0:
-                print(f'  table look-up error = {ichck} (if you go outside the tables.)')
-
-            outputs['thrust_coefficient'][i_node] = ct
-            outputs['comp_tip_loss_factor'][i_node] = xft
+            CTTT[ibb] = ct
+            XXXFT[ibb] = xft
+            idx_blade = idx_blade + 1
+
+        if nbb != 1:
+            # interpolation by the number of blades if odd number
+            ct, run_flag = _unint(num_blades_arr, CTTT.T, num_blades)
+            xft, run_flag = _unint(num_blades_arr, XXXFT.T, num_blades)
+        else:
+            ct = CTTT[0]
+            xft = XXXFT[0]
+
+        # NOTE this could be handled via the metamodel comps (extrapolate flag)
+        if report:
+            for count in ichck[ichck > 0]:
+                print(f'  table look-up error = {count} (if you go outside the tables.)')
+
+        return ct, xft
 
 
 class PostHamiltonStandard(om.ExplicitComponent):
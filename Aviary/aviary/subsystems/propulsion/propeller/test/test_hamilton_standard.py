@@ -135,6 +135,68 @@ class HamiltonStandardTest(unittest.TestCase):
         assert_check_partials(partial_data, atol=1e-5, rtol=1e-5)
 
 
+class HamiltonStandardOddBladesTest(unittest.TestCase):
+    """
+    Test computation in HamiltonStandard class with an odd number of blades, which
+    interpolates between blade tables, and a lift coefficient between table values.
+    """
+
+    def setUp(self):
+        options = get_option_defaults()
+        options.set_val(Aircraft.Engine.Propeller.NUM_BLADES, val=5, units='unitless')
+
+        prob = om.Problem()
+
+        num_nodes = 4
+
+        prob.model.add_subsystem(
+            'hs',
+            HamiltonStandard(num_nodes=num_nodes),
+            promotes_inputs=['*'],
+            promotes_outputs=['*'],
+        )
+
+        setup_model_options(prob, options)
+
+        prob.setup()
+        self.prob = prob
+
+    def test_HS_odd_blades(self):
+        prob = self.prob
+        prob.set_val('power_coefficient', [0.2352, 0.2352, 0.2553, 0.1], units='unitless')
+        prob.set_val('advance_ratio', [0.0066, 0.8295, 1.9908, 2.7], units='unitless')
+        prob.set_val(Dynamic.Atmosphere.MACH, [0.001509, 0.1887, 0.4976, 0.75], units='unitless')
+        prob.set_val('tip_mach', [1.2094, 1.2094, 1.3290, 0.9], units='unitless')
+        prob.set_val(Aircraft.Engine.Propeller.ACTIVITY_FACTOR, 114.0, units='unitless')
+        prob.set_val(Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT, 0.55, units='unitless')
+
+        prob.run_model()
+
+        tol = 5e-4
+        assert_near_equal(
+            prob.get_val('thrust_coefficient'),
+            [0.31483832, 0.21236651, 0.1128742, 0.00303466],
+            tolerance=tol,
+        )
+        assert_near_equal(
+            prob.get_val('comp_tip_loss_factor'),
+            [1.0, 1.0, 0.96631429, 0.59429091],
+            tolerance=tol,
+        )
+
+        partial_data = prob.check_partials(
+            out_stream=None,
+            compact_print=True,
+            show_only_incorrect=True,
+            form='central',
+            method='fd',
+            minimum_step=1e-12,
+            abs_err_tol=5.0e-4,
+            rel_err_tol=5.0e-5,
+        )
+        assert_check_partials(partial_data, atol=1e-5, rtol=1e-5)
+
+
 class PostHamiltonStandardTest(unittest.TestCase):
     """Test computation in PostHamiltonStandard class."""
 
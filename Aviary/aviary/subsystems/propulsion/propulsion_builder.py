@@ -122,6 +122,23 @@ class CorePropulsionBuilder(PropulsionBuilderBase):
             engine_options=kwargs,
         )
 
+    def build_inverse_throttle(self, num_nodes, aviary_inputs):
+        """
+        Build a group that computes the throttle needed to produce the required total thrust
+        using an inverse lookup of the engine model. Only supported for a single engine type
+        whose engine model provides build_inverse_throttle().
+        """
+        if len(self.engine_models) > 1:
+            raise UserWarning('Inverse throttle lookup is only supported for a single engine type.')
+
+        engine = self.engine_models[0]
+        if not hasattr(engine, 'build_inverse_throttle'):
+            raise UserWarning(
+                f'Engine model <{engine.name}> does not support inverse throttle lookup.'
+            )
+
+        return engine.build_inverse_throttle(num_nodes, aviary_inputs)
+
     # NOTE no unittests!
     def get_states(self):
         """Call get_states() on all engine models and return combined result."""
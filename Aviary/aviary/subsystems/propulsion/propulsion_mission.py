@@ -3,10 +3,30 @@ import sys
 import numpy as np
 import openmdao.api as om
 
+from aviary.subsystems.propulsion.stacked_engine_decks import (
+    StackedEngineInterpolation,
+    StackedEngineScaling,
+    can_stack_engine_decks,
+    get_scaled_outputs,
+)
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.functions import add_aviary_option
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 
+# engine outputs that are vectorized and promoted out of PropulsionMission
+# TODO this list shouldn't be hardcoded so it can be extended by users
+supported_outputs = {
+    Dynamic.Vehicle.Propulsion.THRUST: 'lbf',
+    Dynamic.Vehicle.Propulsion.THRUST_MAX: 'lbf',
+    Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE: 'lbm/h',
+    Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN: 'kW',
+    Dynamic.Vehicle.Propulsion.NOX_RATE: 'lb/h',
+    Dynamic.Vehicle.Propulsion.TEMPERATURE_T4: 'degR',
+    Dynamic.Vehicle.Propulsion.SHAFT_POWER: 'hp',
+    Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX: 'hp',
+    # 'exit_area_unscaled': 'ft**2',
+}
+
 
 class PropulsionMission(om.Group):
     """
@@ -34,6 +54,14 @@ class PropulsionMission(om.Group):
             desc='dictionary of options for each EngineModel',
         )
 
+        self.options.declare(
+            'stack_engine_decks',
+            types=bool,
+            default=True,
+            desc='If True, multiple EngineDecks that share the same independent variables are '
+            'evaluated together by a single interpolation and scaling component',
+        )
+
     def setup(self):
         nn = self.options['num_nodes']
         options: AviaryValues = self.options['aviary_options']
@@ -41,7 +69,13 @@ class PropulsionMission(om.Group):
         engine_options = self.options['engine_options']
         num_engine_type = len(engine_models)
 
-        if num_engine_type > 1:
+        self._stacked = self.options['stack_engine_decks'] and can_stack_engine_decks(engine_models)
+
+        if self._stacked:
+            self.parameters = set()
+            self._setup_stacked_engine_decks()
+
+        elif num_engine_type > 1:
             # We need a component to add parameters to problem. Dymos can't find it when
             # it is already sliced across several components.
             # TODO is this problem fixable from dymos end (introspection includes parameters)?
@@ -138,67 +172,15 @@ class PropulsionMission(om.Group):
             if engine.use_hybrid_throttle:
                 self.promotes(engine.name, inputs=[Dynamic.Vehicle.Propulsion.HYBRID_THROTTLE])
 
-        # TODO might be able to avoid hardcoding using propulsion Enums
-        # mux component to vectorize individual engine outputs into 2d arrays
-        perf_mux = om.MuxComp(vec_size=num_engine_type)
-        # add each engine data variable to mux component
-        perf_mux.add_var(Dynamic.Vehicle.Propulsion.THRUST, val=0, shape=(nn,), axis=1, units='lbf')
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.THRUST_MAX,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='lbf',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='lbm/h',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='kW',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.NOX_RATE,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='lb/h',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.TEMPERATURE_T4,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='degR',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.SHAFT_POWER,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='hp',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='hp',
-        )
-        # perf_mux.add_var(
-        #     'exit_area_unscaled',
-        #     shape=(nn,),
-        #     axis=1,
-        #     units='ft**2')
+        if not self._stacked:
+            # TODO might be able to avoid hardcoding using propulsion Enums
+            # mux component to vectorize individual engine outputs into 2d arrays
+            perf_mux = om.MuxComp(vec_size=num_engine_type)
+            # add each engine data variable to mux component
+            for output, units in supported_outputs.items():
+                perf_mux.add_var(output, val=0, shape=(nn,), axis=1, units=units)
 
-        self.add_subsystem('vectorize_performance', subsys=perf_mux, promotes_outputs=['*'])
+            self.add_subsystem('vectorize_performance', subsys=perf_mux, promotes_outputs=['*'])
 
         self.add_subsystem(
             'propulsion_sum',
@@ -207,22 +189,63 @@ class PropulsionMission(om.Group):
             promotes_outputs=['*'],
         )
 
+    def _setup_stacked_engine_decks(self):
+        """
+        Add a single interpolation component and a single scaling component that evaluate
+        all engine types at once.
+        """
+        nn = self.options['num_nodes']
+        engine_models = self.options['engine_models']
+        num_engine_type = len(engine_models)
+        engine_variables = engine_models[0].engine_variables
+
+        interp_outputs = []
+        if engine_models[0].use_t4:
+            interp_outputs.append(Dynamic.Vehicle.Propulsion.TEMPERATURE_T4)
+
+        self.add_subsystem(
+            'stacked_interpolation',
+            StackedEngineInterpolation(num_nodes=nn, engine_models=engine_models),
+            promotes_inputs=['*'],
+            promotes_outputs=interp_outputs,
+        )
+
+        scaled_outputs = get_scaled_outputs(engine_variables)
+
+        self.add_subsystem(
+            'stacked_scaling',
+            StackedEngineScaling(num_nodes=nn, engine_variables=engine_variables),
+            promotes_inputs=[Aircraft.Engine.SCALE_FACTOR, Dynamic.Atmosphere.MACH],
+            promotes_outputs=[output for output in scaled_outputs if output in supported_outputs],
+        )
+
+        for input, _ in scaled_outputs.values():
+            self.connect(f'stacked_interpolation.{input}', f'stacked_scaling.{input}')
+
+        # outputs that no engine type provides are zero, as they are when muxed
+        missing_outputs = [
+            output
+            for output in supported_outputs
+            if output not in scaled_outputs and output not in interp_outputs
+        ]
+
+        if missing_outputs:
+            missing_performance = om.IndepVarComp()
+            for output in missing_outputs:
+                missing_performance.add_output(
+                    output, val=np.zeros((nn, num_engine_type)), units=supported_outputs[output]
+                )
+
+            self.add_subsystem('missing_performance', missing_performance, promotes_outputs=['*'])
+
     def configure(self):
         # Special configure step needed to handle multiple, unique engine models.
         # Handle checking each EngineModel for compatible outputs with
         # vectorize_performance component and connecting those outputs
 
-        # TODO this list shouldn't be hardcoded so it can be extended by users
-        supported_outputs = [
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
-            Dynamic.Vehicle.Propulsion.NOX_RATE,
-            Dynamic.Vehicle.Propulsion.SHAFT_POWER,
-            Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
-            Dynamic.Vehicle.Propulsion.TEMPERATURE_T4,
-            Dynamic.Vehicle.Propulsion.THRUST,
-            Dynamic.Vehicle.Propulsion.THRUST_MAX,
-        ]
+        # stacked engine decks are connected in setup
+        if self._stacked:
+            return
 
         engine_models = self.options['engine_models']
         engine_names = [engine.name for engine in engine_models]
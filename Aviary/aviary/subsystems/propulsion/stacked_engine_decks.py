@@ -0,0 +1,444 @@
+"""
+Components that evaluate every engine type of an aircraft at once.
+
+When all engine types on an aircraft are EngineDecks with the same independent variables and
+performance variables, PropulsionMission replaces the interpolation and scaling group of each
+engine type with a single StackedEngineInterpolation and a single StackedEngineScaling
+component. Variables that belong to an engine type have shape (num_nodes, num_engine_types),
+the same layout as the vectorized outputs of PropulsionMission.
+"""
+
+import numpy as np
+import openmdao.api as om
+from openmdao.components.interp_util.outofbounds_error import OutOfBoundsError
+
+from aviary.subsystems.propulsion.engine_deck import EngineDeck
+from aviary.subsystems.propulsion.utils import (
+    EngineModelVariables,
+    build_interpolant,
+    default_units,
+    max_variables,
+)
+from aviary.variable_info.functions import add_aviary_input, add_aviary_option
+from aviary.variable_info.variables import Aircraft, Dynamic, Mission
+
+MACH = EngineModelVariables.MACH
+ALTITUDE = EngineModelVariables.ALTITUDE
+THROTTLE = EngineModelVariables.THROTTLE
+HYBRID_THROTTLE = EngineModelVariables.HYBRID_THROTTLE
+THRUST = EngineModelVariables.THRUST
+SHAFT_POWER = EngineModelVariables.SHAFT_POWER
+SHAFT_POWER_CORRECTED = EngineModelVariables.SHAFT_POWER_CORRECTED
+FUEL_FLOW = EngineModelVariables.FUEL_FLOW
+TEMPERATURE = EngineModelVariables.TEMPERATURE_T4
+RPM = EngineModelVariables.RPM
+
+# independent variables that can be stacked, and the ones that are shared by all engine types
+independent_variables = [MACH, ALTITUDE, THROTTLE, HYBRID_THROTTLE]
+flight_condition_variables = [MACH, ALTITUDE]
+
+# interpolated variables that are not scaled
+no_scale_variables = [TEMPERATURE, RPM]
+
+
+def _get_interpolation_inputs(engine):
+    """Return the independent variables of an EngineDeck, in the order they are interpolated."""
+    inputs = getattr(engine, 'inputs', [])
+    if inputs == []:
+        inputs = independent_variables
+
+    return [variable for variable in engine.engine_variables if variable in inputs]
+
+
+def can_stack_engine_decks(engine_models):
+    """
+    Return whether a list of engine models can be evaluated by stacked components.
+
+    Engine models can be stacked if they are all EngineDecks that use the same interpolation
+    method, independent variables, and performance variables with the same units. Decks with
+    corrected shaft power are not stacked, since they need to be uncorrected per engine type.
+
+    Parameters
+    ----------
+    engine_models : list of EngineModel
+        Engine models on the aircraft.
+
+    Returns
+    -------
+    bool
+        True if the engine models can be stacked.
+    """
+    if len(engine_models) < 2:
+        return False
+
+    for engine in engine_models:
+        # subclasses may build a different mission group
+        if not isinstance(engine, EngineDeck) or (
+            type(engine).build_mission is not EngineDeck.build_mission
+        ):
+            return False
+
+        if SHAFT_POWER_CORRECTED in engine.engine_variables:
+            return False
+
+        if any(var not in independent_variables for var in _get_interpolation_inputs(engine)):
+            return False
+
+    first = engine_models[0]
+    interp_method = first.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+    inputs = _get_interpolation_inputs(first)
+
+    for engine in engine_models[1:]:
+        if (
+            engine.get_val(Aircraft.Engine.INTERPOLATION_METHOD) != interp_method
+            or _get_interpolation_inputs(engine) != inputs
+            or engine.engine_variables != first.engine_variables
+        ):
+            return False
+
+    return True
+
+
+class StackedEngineInterpolation(om.ExplicitComponent):
+    """
+    Interpolates the unscaled performance of several EngineDecks at once.
+
+    Each engine type is evaluated at its own throttle settings for every node. The
+    interpolation tables are shared with all other engine interpolation components built from
+    the same engine data.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # the partials are those of the semi-structured interpolants, which are not exact
+        # across the sub-tables, so they are not checked, as for MetaModelSemiStructuredComp
+        self._no_check_partials = True
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+        self.options.declare(
+            'engine_models', types=list, desc='list of EngineDecks that can be stacked'
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        engine_models = self.options['engine_models']
+        num_engine_type = len(engine_models)
+
+        deck = engine_models[0]
+        interp_method = deck.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        inputs = _get_interpolation_inputs(deck)
+
+        units = {**default_units, **deck.engine_variables}
+
+        for variable in inputs:
+            if variable in flight_condition_variables:
+                shape = nn
+            else:
+                shape = (nn, num_engine_type)
+
+            self.add_input(variable.value, np.zeros(shape), units=units[variable])
+
+        # map each output to the names of its independent variables and one interpolant per
+        # engine type
+        self._tables = {}
+
+        input_names = [variable.value for variable in inputs]
+
+        for variable in deck.engine_variables:
+            if variable in inputs:
+                continue
+
+            if variable in no_scale_variables:
+                name = variable.value
+            else:
+                name = variable.value + '_unscaled'
+
+            self.add_output(name, np.zeros((nn, num_engine_type)), units=units[variable])
+
+            self._tables[name] = (
+                input_names,
+                [
+                    build_interpolant(
+                        [engine.data[var] for var in inputs],
+                        engine.data[variable],
+                        interp_method,
+                        True,
+                    )
+                    for engine in engine_models
+                ],
+            )
+
+        # max thrust/shaft power is interpolated from the pre-computed envelope of each deck.
+        # NOTE max thrust is assumed to occur at maximum throttle and hybrid throttle for
+        #      each flight condition
+        max_outputs = []
+        if deck.use_thrust or deck.use_shaft_power:
+            max_outputs.append(THRUST)
+        if deck.use_shaft_power:
+            max_outputs.append(SHAFT_POWER)
+
+        for variable in max_outputs:
+            name = max_variables[variable] + '_unscaled'
+
+            self.add_output(name, np.zeros((nn, num_engine_type)), units=units[variable])
+
+            self._tables[name] = (
+                [MACH.value, ALTITUDE.value],
+                [
+                    build_interpolant(
+                        [engine.max_envelope[MACH], engine.max_envelope[ALTITUDE]],
+                        engine.max_envelope[variable],
+                        interp_method,
+                        False,
+                    )
+                    for engine in engine_models
+                ],
+            )
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options['engine_models'])
+
+        flight_condition_names = [variable.value for variable in flight_condition_variables]
+
+        r = np.arange(nn * num_engine_type)
+        c = np.repeat(np.arange(nn), num_engine_type)
+
+        for name, (input_names, _) in self._tables.items():
+            for input_name in input_names:
+                if input_name in flight_condition_names:
+                    self.declare_partials(name, input_name, rows=r, cols=c)
+                else:
+                    self.declare_partials(name, input_name, rows=r, cols=r)
+
+    def _get_points(self, inputs, input_names, engine_idx):
+        """Return the interpolation points of one engine type at every node."""
+        columns = []
+        for input_name in input_names:
+            val = inputs[input_name]
+            if val.ndim > 1:
+                val = val[:, engine_idx]
+            columns.append(val)
+
+        return np.array(columns).T
+
+    def compute(self, inputs, outputs):
+        engine_models = self.options['engine_models']
+
+        for name, (input_names, interps) in self._tables.items():
+            for idx, interp in enumerate(interps):
+                points = self._get_points(inputs, input_names, idx)
+
+                try:
+                    outputs[name][:, idx] = interp._interpolate(points)
+
+                except OutOfBoundsError as err:
+                    raise om.AnalysisError(
+                        f"{self.msginfo}: Error interpolating output '{name}' of engine "
+                        f"'{engine_models[idx].name}' because input '{input_names[err.idx]}' "
+                        f"required extrapolation, where its value '{err.value}' exceeded the "
+                        f"range ('{err.lower}', '{err.upper}')",
+                        msginfo=self.msginfo,
+                    )
+
+    def compute_partials(self, inputs, J):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options['engine_models'])
+
+        for name, (input_names, interps) in self._tables.items():
+            derivs = np.zeros((len(input_names), nn, num_engine_type), dtype=inputs.asarray().dtype)
+
+            for idx, interp in enumerate(interps):
+                points = self._get_points(inputs, input_names, idx)
+                derivs[:, :, idx] = interp.gradient(points).T
+
+            for i, input_name in enumerate(input_names):
+                J[name, input_name] = derivs[i].ravel()
+
+
+def get_scaled_outputs(engine_variables):
+    """
+    Return the outputs of StackedEngineScaling for a set of engine performance variables.
+
+    Parameters
+    ----------
+    engine_variables : dict
+        Performance variables of the engine decks, mapped to their units.
+
+    Returns
+    -------
+    dict
+        Name of each scaled output, mapped to the name of its unscaled input and its units.
+    """
+    skipped_variables = independent_variables + no_scale_variables
+    scaled_outputs = {}
+
+    for variable, units in engine_variables.items():
+        if variable in skipped_variables:
+            continue
+
+        if variable is FUEL_FLOW:
+            scaled_outputs[Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE] = (
+                variable.value + '_unscaled',
+                units,
+            )
+        else:
+            scaled_outputs[variable.value] = (variable.value + '_unscaled', units)
+
+            if variable in max_variables:
+                scaled_outputs[max_variables[variable]] = (
+                    max_variables[variable] + '_unscaled',
+                    units,
+                )
+
+    return scaled_outputs
+
+
+class StackedEngineScaling(om.ExplicitComponent):
+    """
+    Scales the performance of several engine types at once, based on the scale factor of
+    each engine type. Equivalent to one EngineScaling component per engine type.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+        self.options.declare(
+            'engine_variables',
+            types=dict,
+            desc='dict of variables to be scaled for all engine types with units',
+        )
+
+        add_aviary_option(self, Aircraft.Engine.CONSTANT_FUEL_CONSUMPTION, units='lbm/h')
+        add_aviary_option(self, Aircraft.Engine.FUEL_FLOW_SCALER_CONSTANT_TERM)
+        add_aviary_option(self, Aircraft.Engine.FUEL_FLOW_SCALER_LINEAR_TERM)
+        add_aviary_option(self, Aircraft.Engine.NUM_ENGINES)
+        add_aviary_option(self, Aircraft.Engine.SCALE_PERFORMANCE)
+        add_aviary_option(self, Aircraft.Engine.SUBSONIC_FUEL_FLOW_SCALER)
+        add_aviary_option(self, Aircraft.Engine.SUPERSONIC_FUEL_FLOW_SCALER)
+        add_aviary_option(self, Mission.Summary.FUEL_FLOW_SCALER)
+
+    def _get_engine_option(self, name):
+        """Return the value of an option for each engine type."""
+        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+        val = self.options[name]
+        if isinstance(val, tuple):
+            val = val[0]
+
+        return np.broadcast_to(np.asarray(val), (num_engine_type,))
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+        shape = (nn, num_engine_type)
+
+        self._scaled_outputs = get_scaled_outputs(self.options['engine_variables'])
+
+        add_aviary_input(self, Aircraft.Engine.SCALE_FACTOR, val=np.ones(num_engine_type))
+
+        self.add_input(
+            Dynamic.Atmosphere.MACH,
+            val=np.zeros(nn),
+            desc='current Mach number',
+            units='unitless',
+        )
+
+        for output, (input, units) in self._scaled_outputs.items():
+            self.add_input(input, val=np.zeros(shape), units=units)
+            self.add_output(output, val=np.zeros(shape), units=units)
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+
+        r = np.arange(nn * num_engine_type)
+        c = np.tile(np.arange(num_engine_type), nn)
+
+        for output, (input, _) in self._scaled_outputs.items():
+            self.declare_partials(output, Aircraft.Engine.SCALE_FACTOR, rows=r, cols=c)
+            self.declare_partials(output, input, rows=r, cols=r)
+
+    def _compute_factors(self, inputs):
+        """
+        Return the performance scale factor of each engine type and the fuel flow scale
+        factor of each engine type at each node, with their derivatives with respect to the
+        engine scale factors.
+        """
+        scale_performance = self._get_engine_option(Aircraft.Engine.SCALE_PERFORMANCE)
+        subsonic_fuel_factor = self._get_engine_option(Aircraft.Engine.SUBSONIC_FUEL_FLOW_SCALER)
+        supersonic_fuel_factor = self._get_engine_option(
+            Aircraft.Engine.SUPERSONIC_FUEL_FLOW_SCALER
+        )
+        constant_fuel_term = self._get_engine_option(Aircraft.Engine.FUEL_FLOW_SCALER_CONSTANT_TERM)
+        linear_fuel_term = self._get_engine_option(Aircraft.Engine.FUEL_FLOW_SCALER_LINEAR_TERM)
+        mission_fuel_scaler = self.options[Mission.Summary.FUEL_FLOW_SCALER]
+
+        engine_scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+        mach_number = inputs[Dynamic.Atmosphere.MACH]
+
+        # NOTE mission-specific fuel flow scaling factor is overwritten by
+        #      scale_performance = False
+        scale_factor = np.where(scale_performance, engine_scale_factor, 1.0)
+        scale_deriv = np.where(scale_performance, 1.0, 0.0)
+
+        # Calculate fuel flow rate scaling factor using FLOPS-derived equation
+        fuel_flow_equation_scaling = (
+            1 + constant_fuel_term + linear_fuel_term * (1 - engine_scale_factor)
+        )
+        fuel_flow_mach_scaling = np.where(
+            mach_number.real[:, np.newaxis] >= 1.0, supersonic_fuel_factor, subsonic_fuel_factor
+        )
+
+        fuel_flow_scale_factor = np.where(
+            scale_performance,
+            engine_scale_factor
+            * fuel_flow_mach_scaling
+            * fuel_flow_equation_scaling
+            * mission_fuel_scaler,
+            1.0,
+        )
+        fuel_flow_scale_deriv = np.where(
+            scale_performance,
+            fuel_flow_mach_scaling
+            * mission_fuel_scaler
+            * (
+                1
+                + linear_fuel_term
+                + constant_fuel_term
+                - (2 * linear_fuel_term * engine_scale_factor)
+            ),
+            0.0,
+        )
+
+        return scale_factor, scale_deriv, fuel_flow_scale_factor, fuel_flow_scale_deriv
+
+    def compute(self, inputs, outputs):
+        constant_fuel_flow = self._get_engine_option(Aircraft.Engine.CONSTANT_FUEL_CONSUMPTION)
+
+        scale_factor, _, fuel_flow_scale_factor, _ = self._compute_factors(inputs)
+
+        for output, (input, _) in self._scaled_outputs.items():
+            if output == Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE:
+                outputs[output] = -(inputs[input] * fuel_flow_scale_factor + constant_fuel_flow)
+            else:
+                outputs[output] = inputs[input] * scale_factor
+
+    def compute_partials(self, inputs, J):
+        nn = self.options['num_nodes']
+
+        scale_factor, scale_deriv, fuel_flow_scale_factor, fuel_flow_scale_deriv = (
+            self._compute_factors(inputs)
+        )
+
+        for output, (input, _) in self._scaled_outputs.items():
+            if output == Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE:
+                J[output, input] = -fuel_flow_scale_factor.ravel()
+                J[output, Aircraft.Engine.SCALE_FACTOR] = -(
+                    fuel_flow_scale_deriv * inputs[input]
+                ).ravel()
+            else:
+                J[output, input] = np.tile(scale_factor, nn)
+                J[output, Aircraft.Engine.SCALE_FACTOR] = (inputs[input] * scale_deriv).ravel()
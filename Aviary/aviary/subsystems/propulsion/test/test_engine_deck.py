@@ -2,7 +2,9 @@ import csv
 import unittest
 from pathlib import Path
 
-from openmdao.utils.assert_utils import assert_near_equal
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
 from aviary.subsystems.propulsion.engine_deck import EngineDeck
 from aviary.subsystems.propulsion.utils import EngineModelVariables as keys
@@ -136,6 +138,107 @@ class EngineDeckTest(unittest.TestCase):
         assert_near_equal(thrust, expected_thrust, tolerance=tol)
         assert_near_equal(fuel_flow_rate, expected_fuel_flow_rate, tolerance=tol)
 
+    def test_shared_training_data(self):
+        aviary_values = get_flops_inputs('LargeSingleAisle2FLOPS')
+        model = build_engine_deck(aviary_values)
+
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'interp_3', model._build_engine_interpolator(3, aviary_values), promotes=['*']
+        )
+        prob.model.add_subsystem(
+            'interp_5', model._build_engine_interpolator(5, aviary_values), promotes=[]
+        )
+        prob.setup()
+
+        prob.set_val('mach', [0.2, 0.5, 0.8])
+        prob.set_val('altitude', [0.0, 15000.0, 35000.0], units='ft')
+        prob.set_val('throttle', [0.5, 0.8, 1.0])
+        prob.set_val('interp_5.mach', [0.2, 0.5, 0.8, 0.2, 0.5])
+        prob.set_val('interp_5.altitude', [0.0, 15000.0, 35000.0, 0.0, 15000.0], units='ft')
+        prob.set_val('interp_5.throttle', [0.5, 0.8, 1.0, 0.5, 0.8])
+        prob.run_model()
+
+        interp_3 = prob.model.interp_3.interps
+        interp_5 = prob.model.interp_5.interps
+        for name in interp_3:
+            # each phase has its own interpolant, but they share read-only training data
+            self.assertIsNot(interp_3[name], interp_5[name])
+            self.assertIs(interp_3[name].values, interp_5[name].values)
+            self.assertFalse(interp_3[name].values.flags.writeable)
+
+        thrust_3 = prob.get_val('interp_3.thrust_net_unscaled', units='lbf')
+        thrust_5 = prob.get_val('interp_5.thrust_net_unscaled', units='lbf')
+        assert_near_equal(thrust_5, np.tile(thrust_3, 2)[:5], tolerance=1e-12)
+
+    def test_max_envelope(self):
+        aviary_values = get_flops_inputs('LargeSingleAisle1FLOPS')
+        model = build_engine_deck(aviary_values)
+
+        mach = [0.2, 0.45, 0.8]
+        altitude = [0.0, 12000.0, 37000.0]
+
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'engine', model.build_mission(3, aviary_values), promotes_inputs=['*']
+        )
+        prob.model.add_subsystem(
+            'deck', model._build_engine_interpolator(3, aviary_values), promotes=[]
+        )
+        prob.model.set_input_defaults('mach', np.zeros(3))
+        prob.setup()
+
+        prob.set_val('mach', mach)
+        prob.set_val('altitude', altitude, units='ft')
+        prob.set_val('deck.mach', mach)
+        prob.set_val('deck.altitude', altitude, units='ft')
+        # evaluate full engine deck at max (normalized) throttle
+        prob.set_val('deck.throttle', np.ones(3))
+        prob.run_model()
+
+        max_thrust = prob.get_val('engine.max_interpolation.thrust_net_max_unscaled', units='lbf')
+        deck_thrust = prob.get_val('deck.thrust_net_unscaled', units='lbf')
+        assert_near_equal(max_thrust, deck_thrust, tolerance=1e-10)
+
+        # envelope is tabulated once per flight condition
+        self.assertEqual(len(model.max_envelope[keys.THRUST]), np.count_nonzero(model.data_indices))
+
+    def test_inverse_throttle(self):
+        aviary_values = get_flops_inputs('LargeSingleAisle1FLOPS')
+        model = build_engine_deck(aviary_values)
+        num_engines = model.get_val(Aircraft.Engine.NUM_ENGINES)
+
+        mach = [0.2, 0.45, 0.8]
+        altitude = [0.0, 12000.0, 37000.0]
+        thrust_required = np.array([15000.0, 12000.0, 6000.0]) * num_engines
+
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'inverse',
+            model.build_inverse_throttle(3, aviary_values),
+            promotes_inputs=['*'],
+        )
+        prob.model.add_subsystem(
+            'engine', model.build_mission(3, aviary_values), promotes_inputs=['*']
+        )
+        prob.model.connect('inverse.throttle', 'throttle')
+        prob.model.set_input_defaults('mach', np.zeros(3))
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val('mach', mach)
+        prob.set_val('altitude', altitude, units='ft')
+        prob.set_val('thrust_required', thrust_required, units='lbf')
+        prob.run_model()
+
+        # forward engine deck at the computed throttle gives back the required thrust
+        thrust = prob.get_val('engine.thrust_net', units='lbf') * num_engines
+        assert_near_equal(thrust, thrust_required, tolerance=1e-3)
+
+        partial_data = prob.check_partials(
+            out_stream=None, method='fd', form='central', includes=['*inverse*']
+        )
+        assert_check_partials(partial_data, atol=1e-6, rtol=1e-5)
+
 
 if __name__ == '__main__':
     unittest.main()
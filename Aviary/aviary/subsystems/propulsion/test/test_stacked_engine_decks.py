@@ -0,0 +1,129 @@
+import unittest
+from copy import deepcopy
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+from aviary.models.aircraft.multi_engine_single_aisle.multi_engine_single_aisle_data import (
+    engine_1_inputs,
+    engine_2_inputs,
+    inputs,
+)
+from aviary.subsystems.propulsion.propulsion_mission import PropulsionMission
+from aviary.subsystems.propulsion.stacked_engine_decks import can_stack_engine_decks
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.functions import get_path
+from aviary.utils.preprocessors import preprocess_propulsion
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.variables import Aircraft, Dynamic, Settings
+
+
+def build_engines(scale_performance=True, interpolation_method='slinear'):
+    engine_2_options = deepcopy(engine_2_inputs)
+    engine_2_options.set_val(Aircraft.Engine.SCALE_PERFORMANCE, scale_performance)
+    engine_2_options.set_val(Aircraft.Engine.INTERPOLATION_METHOD, interpolation_method)
+
+    engine1 = build_engine_deck(engine_1_inputs)
+    engine1.name = 'engine_1'
+    engine2 = build_engine_deck(engine_2_options)
+    engine2.name = 'engine_2'
+
+    return [engine1, engine2]
+
+
+class StackedEngineDecksTest(unittest.TestCase):
+    def build_problem(self, stack, scale_performance=True):
+        nn = 20
+
+        options = deepcopy(inputs)
+        options.set_val(Settings.VERBOSITY, 0)
+
+        engine_models = build_engines(scale_performance)
+        preprocess_propulsion(options, engine_models)
+
+        prob = om.Problem(reports=False)
+        prob.model.add_subsystem(
+            'core_propulsion',
+            PropulsionMission(
+                num_nodes=nn,
+                aviary_options=options,
+                engine_models=engine_models,
+                stack_engine_decks=stack,
+            ),
+            promotes=['*'],
+        )
+
+        ivc = om.IndepVarComp()
+        ivc.add_output(Dynamic.Atmosphere.MACH, np.linspace(0.0, 0.85, nn))
+        ivc.add_output(Dynamic.Mission.ALTITUDE, np.linspace(0.0, 40000.0, nn), units='ft')
+        ivc.add_output(
+            Dynamic.Vehicle.Propulsion.THROTTLE,
+            np.column_stack((np.linspace(1.0, 0.6, nn), np.linspace(0.3, 0.9, nn))),
+        )
+        ivc.add_output(Aircraft.Engine.SCALE_FACTOR, [0.9, 1.1])
+        prob.model.add_subsystem('IVC', ivc, promotes=['*'])
+
+        setup_model_options(prob, options, engine_models=engine_models)
+
+        prob.setup(force_alloc_complex=True)
+
+        prob.run_model()
+
+        return prob
+
+    def test_can_stack(self):
+        self.assertTrue(can_stack_engine_decks(build_engines()))
+        # a single engine type has nothing to stack
+        self.assertFalse(can_stack_engine_decks(build_engines()[:1]))
+        self.assertFalse(can_stack_engine_decks(build_engines(interpolation_method='lagrange2')))
+
+        # turboshaft decks provide corrected shaft power
+        turboshaft_options = deepcopy(engine_1_inputs)
+        turboshaft_options.set_val(
+            Aircraft.Engine.DATA_FILE, get_path('models/engines/turboshaft_1120hp.csv')
+        )
+        turboshaft = build_engine_deck(turboshaft_options)
+        self.assertFalse(can_stack_engine_decks([turboshaft, deepcopy(turboshaft)]))
+
+    def test_stacked_matches_individual(self):
+        outputs = [
+            Dynamic.Vehicle.Propulsion.THRUST_TOTAL,
+            Dynamic.Vehicle.Propulsion.THRUST_MAX_TOTAL,
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+            Dynamic.Vehicle.Propulsion.NOX_RATE_TOTAL,
+        ]
+        wrt = [
+            Dynamic.Atmosphere.MACH,
+            Dynamic.Mission.ALTITUDE,
+            Dynamic.Vehicle.Propulsion.THROTTLE,
+            Aircraft.Engine.SCALE_FACTOR,
+        ]
+
+        for scale_performance in (True, False):
+            with self.subTest(scale_performance=scale_performance):
+                individual = self.build_problem(False, scale_performance)
+                stacked = self.build_problem(True, scale_performance)
+
+                self.assertIn('stacked_scaling', stacked.model.core_propulsion._subsystems_allprocs)
+
+                for output in outputs + [
+                    Dynamic.Vehicle.Propulsion.THRUST,
+                    Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
+                    Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
+                ]:
+                    assert_near_equal(
+                        stacked.get_val(output), individual.get_val(output), tolerance=1e-12
+                    )
+
+                totals = individual.compute_totals(outputs, wrt)
+                stacked_totals = stacked.compute_totals(outputs, wrt)
+                for key, val in totals.items():
+                    assert_near_equal(stacked_totals[key], val, tolerance=1e-12)
+
+                partial_data = stacked.check_partials(out_stream=None, method='cs')
+                assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,11 +5,14 @@ default_units : dict
     Matches each EngineModelVariables entry with default units (str)
 """
 
+import hashlib
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 
 import numpy as np
 import openmdao.api as om
+from openmdao.components.interp_util.interp_semi import InterpNDSemi
 
 import aviary.constants as constants
 from aviary.utils.aviary_values import AviaryValues
@@ -67,6 +70,12 @@ max_variables = {
     EngineModelVariables.SHAFT_POWER: Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
 }
 
+# process-wide cache of read-only interpolation training data, keyed by a hash of the data.
+# Only the least recently used _INTERP_DATA_CACHE_SIZE arrays are kept.
+_interp_data_cache = OrderedDict()
+_INTERP_DATA_CACHE_SIZE = 64
+
+
 # class InstallationDragFlag(Enum):
 #     """
 #     Define constants that map to supported options for scaling of installation drag.
@@ -215,6 +224,133 @@ def build_engine_deck(
     return EngineDeck(**kwargs)
 
 
+def _hash_data(*arrays):
+    """Return a hash of the contents of the provided arrays."""
+    data_hash = hashlib.sha1()
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype=float)
+        data_hash.update(str(array.shape).encode())
+        data_hash.update(array.tobytes())
+    return data_hash.hexdigest()
+
+
+def clear_interpolation_cache():
+    """Remove all training data shared between engine interpolation components."""
+    _interp_data_cache.clear()
+
+
+def get_shared_training_data(data):
+    """
+    Return a read-only copy of interpolation training data that is shared between callers.
+
+    Arrays are stored in a bounded, process-wide cache, so every phase that interpolates the
+    same engine data uses one copy of it.
+
+    Parameters
+    ----------
+    data : array_like
+        Training data.
+
+    Returns
+    -------
+    ndarray
+        Read-only array with the same contents as data.
+    """
+    key = _hash_data(data)
+
+    if key in _interp_data_cache:
+        _interp_data_cache.move_to_end(key)
+    else:
+        shared = np.array(data, dtype=float)
+        shared.flags.writeable = False
+        _interp_data_cache[key] = shared
+
+        if len(_interp_data_cache) > _INTERP_DATA_CACHE_SIZE:
+            _interp_data_cache.popitem(last=False)
+
+    return _interp_data_cache[key]
+
+
+def build_interpolant(training_inputs, training_outputs, method, extrapolate):
+    """
+    Return a new semi-structured interpolant built on shared training data.
+
+    Each interpolant caches the last point it was evaluated at, so every component needs its
+    own. Only the training data is shared.
+
+    Parameters
+    ----------
+    training_inputs : list of ndarray
+        Training data of each independent variable, in the order they are interpolated.
+    training_outputs : ndarray
+        Training data of the dependent variable.
+    method : str
+        Interpolation method.
+    extrapolate : bool
+        If True, values outside of the training data are extrapolated.
+
+    Returns
+    -------
+    InterpNDSemi
+        Interpolant of the training data.
+    """
+    grid = np.array([get_shared_training_data(col) for col in training_inputs]).T
+
+    return InterpNDSemi(
+        grid,
+        get_shared_training_data(training_outputs),
+        method=method,
+        extrapolate=extrapolate,
+    )
+
+
+class SharedMetaModelSemiStructuredComp(om.MetaModelSemiStructuredComp):
+    """
+    MetaModelSemiStructuredComp that shares its training data with every other instance
+    built from identical data.
+
+    Engine decks build a new interpolation component for each mission phase, often with a
+    different number of nodes. The training data does not depend on vec_size, so one
+    read-only copy of it is kept per process. Each component still builds its own
+    interpolants.
+    """
+
+    def add_input(self, name, training_data, val=1.0, **kwargs):
+        """
+        Add an input to this component and a corresponding training input.
+
+        Parameters
+        ----------
+        name : str
+            Name of the input.
+        training_data : ndarray
+            Training data for this variable.
+        val : float or ndarray
+            Initial value for the input.
+        **kwargs : dict
+            Additional arguments for add_input.
+        """
+        super().add_input(name, get_shared_training_data(training_data), val=val, **kwargs)
+
+    def add_output(self, name, training_data=None, **kwargs):
+        """
+        Add an output to this component and a corresponding training output.
+
+        Parameters
+        ----------
+        name : str
+            Name of the variable output.
+        training_data : ndarray
+            Training data for this variable.
+        **kwargs : dict
+            Additional arguments for add_output.
+        """
+        if training_data is not None and not self.options['training_data_gradients']:
+            training_data = get_shared_training_data(training_data)
+
+        super().add_output(name, training_data=training_data, **kwargs)
+
+
 # TODO combine with aviary/utils/data_interpolator_builder.py build_data_interpolator
 class EngineDataInterpolator(om.Group):
     """
@@ -17,10 +17,8 @@ class AviaryValues
     define a collection of named values with associated units
 """
 
-from openmdao.utils.units import convert_units as _convert_units
-
 from aviary.utils.named_values import NamedValues, get_items, get_keys, get_values
-from aviary.utils.utils import cast_type, check_type
+from aviary.utils.utils import cast_type, check_type, get_conversion_factors
 from aviary.variable_info.variable_meta_data import _MetaData
 
 # TODO: workaround to avoid unused imports - a better solution is desired such as utils or making
@@ -72,9 +70,8 @@ class AviaryValues(NamedValues):
         expected_units = meta_data[key]['units']
 
         try:
-            # NOTE the value here is unimportant, we only care if OpenMDAO will
-            # convert the units
-            _convert_units(10, expected_units, units)
+            # NOTE we only care if OpenMDAO will convert the units
+            get_conversion_factors(expected_units, units)
         except ValueError:
             raise ValueError(f'The units {units} which you have provided for {key} are invalid.')
         except TypeError:
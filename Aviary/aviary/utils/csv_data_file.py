@@ -1,6 +1,11 @@
 import getpass
+import hashlib
+import io
+import os
 import re
+import tempfile
 import warnings
+import zipfile
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +16,12 @@ from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues, get_items, get_keys
 from aviary.variable_info.enums import Verbosity
 
+# increment when the contents of cached data files change
+_CACHE_VERSION = 1
+# cached data is stored as "<filename>.cache.npz" next to the data file, or as
+# "<filename>.<path hash>.cache.npz" in a separate cache directory
+_CACHE_SUFFIX = '.cache.npz'
+
 
 # multiple type annotation uses "typeA | typeB" syntax, but requires Python 3.10+
 # filename: (str, Path)
@@ -20,6 +31,7 @@ def read_data_file(
     aliases=None,
     save_comments=False,
     verbosity=Verbosity.BRIEF,
+    cache=False,
 ):
     """
     Read data file in Aviary format, which is data delimited by commas with any amount of whitespace
@@ -43,6 +55,12 @@ def read_data_file(
         flag if comments in data file should be returned along with data. Defaults to False.
     verbosity : (int, Verbosity), optional
         controls level of printouts when running this method. Default is BRIEF (1).
+    cache : bool or (str, Path), optional
+        flag if parsed file contents should be stored in, and loaded from, a binary cache file.
+        If True, the cache file is stored next to the data file. If a directory is provided, the
+        cache file is stored there instead, which allows caching data files in read-only
+        locations such as an installed package. The cache is invalidated whenever the contents
+        of the data file change. Defaults to False.
 
     Returns
     -------
@@ -62,7 +80,6 @@ def read_data_file(
     filepath = get_path(filename)
 
     data = NamedValues()
-    comments = []
     inputs = []
     outputs = []
 
@@ -73,139 +90,104 @@ def read_data_file(
                 aliases[key] = [aliases[key]]
             aliases[key] = [re.sub('\\s', '_', item).lower() for item in aliases[key]]
 
-    with open(filepath, newline=None, encoding='utf-8-sig') as file:
-        # csv.reader() and other available packages that can read csv files are not used
-        # Manual control of file reading ensures that comments are kept intact and other checks can
-        # be performed
-        check_for_header = True
-        for line_count, line_data in enumerate(file):
-            # if comments are present in line, strip them out
-            if '#' in line_data:
-                index = line_data.index('#')
-                comments.append(line_data[index + 1 :].strip())
-                line_data = line_data[:index]
-
-            # split by delimiters, remove whitespace and newline characters
-            # do not split by delimiters inside parentheses yet
-            line_data = re.split(r'[;,]\s*(?![^()]*\))', line_data.strip())
-
-            # ignore empty lines
-            if not line_data or line_data == ['']:
-                continue
+    header_data, header_line, table, row_lines, row_lengths, comments = _read_raw_data(
+        filepath, cache
+    )
 
-            # try to convert line_data to float, skip any blank strings
-            try:
-                line_data = [float(var) for var in line_data if var != '']
-            # data contains things other than floats
-            except ValueError:
-                # skip checking for header data if not required
-                if check_for_header:
-                    # dictionary of header name: units
-                    header = {}
-                    # list of which column goes with each valid header entry
-                    valid_indices = []
-                    for index in range(len(line_data)):
-                        item = re.split('[(,]', line_data[index])
-                        item = [item[i].strip(') ') for i in range(len(item))]
-                        # OpenMDAO vars can't have spaces, convert to underscores
-                        name = re.sub('\\s', '_', item[0])
-                        if aliases:
-                            # "reverse" lookup name in alias dict
-                            for key in aliases:
-                                if name.lower() in aliases[key]:
-                                    name = key
-                                    break
-
-                        default_units = 'unitless'
-                        # if metadata is provided, ensure variable exists and update default_units
-                        if metadata is not None:
-                            if name not in metadata.keys():
-                                if verbosity > Verbosity.QUIET:  # BRIEF, VERBOSE, DEBUG
-                                    warnings.warn(
-                                        f'<{filename}: Header <{name}> was not recognized, and '
-                                        'will be skipped'
-                                    )
-                                continue
-                            else:
-                                default_units = metadata[name]['units']
-
-                        provided_units = False
-                        if len(item) > 1:
-                            # check if variables are labeled inputs or outputs
-                            if 'input' in item:
-                                # edge case where user provides both for some reason
-                                if 'output' in item:
-                                    raise UserWarning(
-                                        f'{filepath}: Variable {name} is listed as both an input '
-                                        'and an output.'
-                                    )
-                                item.pop(item.index('input'))
-                                inputs.append(name)
-                            elif 'output' in item:
-                                item.pop(item.index('output'))
-                                outputs.append(name)
-
-                            # if units are provided, check that they are valid
-                            if len(item) > 1:
-                                provided_units = True
-                                units = item[-1]
-                                if valid_units(item[1]):
-                                    # check that units are compatible with expected units
-                                    if metadata is not None:
-                                        if not is_compatible(units, default_units):
-                                            # Raising error here, as trying to use default units
-                                            # could mean accidental conversion which would
-                                            # significantly impact analysis
-                                            raise ValueError(
-                                                f'{filepath}: Provided units of <{units}> for '
-                                                f'column <{name}>, which are not compatible with '
-                                                f'default units of {default_units}.'
-                                            )
-                                else:
-                                    # Units were not recognized. Raise error
-                                    raise ValueError(
-                                        f'Invalid units <{units}> provided for '
-                                        f'column <{name}> while reading '
-                                        f'<{filepath}>.'
-                                    )
-
-                        if not provided_units:
-                            if metadata is not None and default_units != 'unitless':
-                                # units were not provided, but variable should have them assume
-                                # default units for that variable
-                                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                                    warnings.warn(
-                                        f'Units were not provided for column <{name}> while '
-                                        f'reading <{filepath}>. Using default units of '
-                                        f'{default_units}.'
-                                    )
-                            units = default_units
-
-                        header[name] = units
-                        valid_indices.append(index)
-
-                    if len(header) > 0:
-                        check_for_header = False
-                        raw_data = {key: [] for key in header.keys()}
-                        continue
-
-                # only raise error if not checking for header, or invalid header found
-                raise ValueError(
-                    f'Non-numerical value found in data file <{filepath}> on line {str(line_count)}'
-                )
-
-            # This point is reached when the first valid numerical entry in data file is found. Stop
-            # looking for header data from now on
-            check_for_header = False
-
-            # pull out data for each valid header, ignore other columns
-            for idx, variable in enumerate(header.keys()):
-                # valid_indices matches dictionary order, pull data from correct column
-                raw_data[variable].append(line_data[valid_indices[idx]])
+    # dictionary of header name: units
+    header = {}
+    # list of which column goes with each valid header entry
+    valid_indices = []
+    for index in range(len(header_data)):
+        item = re.split('[(,]', header_data[index])
+        item = [item[i].strip(') ') for i in range(len(item))]
+        # OpenMDAO vars can't have spaces, convert to underscores
+        name = re.sub('\\s', '_', item[0])
+        if aliases:
+            # "reverse" lookup name in alias dict
+            for key in aliases:
+                if name.lower() in aliases[key]:
+                    name = key
+                    break
+
+        default_units = 'unitless'
+        # if metadata is provided, ensure variable exists and update default_units
+        if metadata is not None:
+            if name not in metadata.keys():
+                if verbosity > Verbosity.QUIET:  # BRIEF, VERBOSE, DEBUG
+                    warnings.warn(
+                        f'<{filename}: Header <{name}> was not recognized, and will be skipped'
+                    )
+                continue
+            else:
+                default_units = metadata[name]['units']
+
+        provided_units = False
+        if len(item) > 1:
+            # check if variables are labeled inputs or outputs
+            if 'input' in item:
+                # edge case where user provides both for some reason
+                if 'output' in item:
+                    raise UserWarning(
+                        f'{filepath}: Variable {name} is listed as both an input and an output.'
+                    )
+                item.pop(item.index('input'))
+                inputs.append(name)
+            elif 'output' in item:
+                item.pop(item.index('output'))
+                outputs.append(name)
+
+            # if units are provided, check that they are valid
+            if len(item) > 1:
+                provided_units = True
+                units = item[-1]
+                if valid_units(item[1]):
+                    # check that units are compatible with expected units
+                    if metadata is not None:
+                        if not is_compatible(units, default_units):
+                            # Raising error here, as trying to use default units could mean
+                            # accidental conversion which would significantly impact analysis
+                            raise ValueError(
+                                f'{filepath}: Provided units of <{units}> for column <{name}>, '
+                                'which are not compatible with default units of '
+                                f'{default_units}.'
+                            )
+                else:
+                    # Units were not recognized. Raise error
+                    raise ValueError(
+                        f'Invalid units <{units}> provided for column <{name}> while reading '
+                        f'<{filepath}>.'
+                    )
+
+        if not provided_units:
+            if metadata is not None and default_units != 'unitless':
+                # units were not provided, but variable should have them assume default units
+                # for that variable
+                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
+                    warnings.warn(
+                        f'Units were not provided for column <{name}> while reading '
+                        f'<{filepath}>. Using default units of {default_units}.'
+                    )
+            units = default_units
+
+        header[name] = units
+        valid_indices.append(index)
+
+    if header_line is not None and len(header) == 0:
+        # header was found, but none of its entries are valid
+        raise ValueError(
+            f'Non-numerical value found in data file <{filepath}> on line {str(header_line)}'
+        )
+
+    missing_data = row_lengths <= max(valid_indices, default=-1)
+    if np.any(missing_data):
+        line_count = row_lines[np.argmax(missing_data)]
+        raise ValueError(f'Missing data in data file <{filepath}> on line {str(line_count)}')
 
     # store data in NamedValues object
-    for variable in header.keys():
-        data.set_val(variable, val=np.array(raw_data[variable]), units=header[variable])
+    # valid_indices matches dictionary order, pull data from correct column
+    for idx, variable in enumerate(header.keys()):
+        data.set_val(variable, val=table[:, valid_indices[idx]].copy(), units=header[variable])
 
     if save_comments:
         return data, inputs, outputs, comments
@@ -213,6 +195,149 @@ def read_data_file(
         return data, inputs, outputs
 
 
+def _read_raw_data(filepath, cache=False):
+    """
+    Read header, numerical data, and comments from a data file, using its binary cache file
+    when caching is requested and the cache is up to date. See read_data_file() for cache.
+
+    Returns
+    -------
+    header_data : list of str
+        unprocessed header entries, empty if no header was found
+    header_line : int or None
+        line number of header in data file
+    table : numpy.ndarray
+        two-dimensional array of numerical data, with one row per line of data. Rows with
+        fewer entries than the longest row are padded with NaN
+    row_lines : numpy.ndarray
+        line number in data file of each row of data
+    row_lengths : numpy.ndarray
+        number of entries provided in each row of data
+    comments : list of str
+        any comments from file, with comment characters ('#') stripped out
+    """
+    contents = Path(filepath).read_bytes()
+
+    if not cache:
+        return _parse_raw_data(filepath, contents)
+
+    file_hash = hashlib.sha1(contents).hexdigest()
+    filepath = Path(filepath)
+
+    if cache is True:
+        cache_path = filepath.with_name(filepath.name + _CACHE_SUFFIX)
+    else:
+        # data files with the same name in different directories get separate cache files
+        path_hash = hashlib.sha1(str(filepath.resolve()).encode()).hexdigest()[:16]
+        cache_path = Path(cache) / f'{filepath.name}.{path_hash}{_CACHE_SUFFIX}'
+
+    if cache_path.is_file():
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                if cached['version'] == _CACHE_VERSION and cached['hash'] == file_hash:
+                    header_line = int(cached['header_line'])
+                    return (
+                        cached['header'].tolist(),
+                        header_line if header_line >= 0 else None,
+                        cached['table'],
+                        cached['row_lines'],
+                        cached['row_lengths'],
+                        cached['comments'].tolist(),
+                    )
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # unreadable cache is treated as out of date
+            pass
+
+    raw_data = _parse_raw_data(filepath, contents)
+
+    _write_cache(cache_path, file_hash, *raw_data)
+
+    return raw_data
+
+
+def _parse_raw_data(filepath, contents):
+    """Parse contents of data file, see _read_raw_data()."""
+    header_data = []
+    header_line = None
+    rows = []
+    row_lines = []
+    comments = []
+
+    file = io.StringIO(contents.decode('utf-8-sig'), newline=None)
+    # csv.reader() and other available packages that can read csv files are not used
+    # Manual control of file reading ensures that comments are kept intact and other checks can
+    # be performed
+    for line_count, line_data in enumerate(file):
+        # if comments are present in line, strip them out
+        if '#' in line_data:
+            index = line_data.index('#')
+            comments.append(line_data[index + 1 :].strip())
+            line_data = line_data[:index]
+
+        # split by delimiters, remove whitespace and newline characters
+        # do not split by delimiters inside parentheses yet
+        line_data = re.split(r'[;,]\s*(?![^()]*\))', line_data.strip())
+
+        # ignore empty lines
+        if not line_data or line_data == ['']:
+            continue
+
+        # try to convert line_data to float, skip any blank strings
+        try:
+            line_data = [float(var) for var in line_data if var != '']
+        # data contains things other than floats
+        except ValueError:
+            # only the first non-numerical line, before any data, can be the header
+            if header_line is None and not rows:
+                header_data = line_data
+                header_line = line_count
+                continue
+
+            raise ValueError(
+                f'Non-numerical value found in data file <{filepath}> on line {str(line_count)}'
+            )
+
+        rows.append(line_data)
+        row_lines.append(line_count)
+
+    row_lengths = np.array([len(row) for row in rows], dtype=int)
+    table = np.full((len(rows), max([len(header_data), *row_lengths])), np.nan)
+    for idx, row in enumerate(rows):
+        table[idx, : len(row)] = row
+
+    return header_data, header_line, table, np.array(row_lines, dtype=int), row_lengths, comments
+
+
+def _write_cache(
+    cache_path, file_hash, header_data, header_line, table, row_lines, row_lengths, comments
+):
+    """Write parsed contents of a data file to its binary cache file."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so other processes never read a partial cache
+        fd, temp_path = tempfile.mkstemp(suffix='.npz', dir=cache_path.parent)
+    except OSError:
+        # caching is optional, skip it if the cache directory is not writable
+        return
+
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            np.savez(
+                file,
+                version=_CACHE_VERSION,
+                hash=file_hash,
+                header=np.array(header_data, dtype=str),
+                header_line=-1 if header_line is None else header_line,
+                table=table,
+                row_lines=row_lines,
+                row_lengths=row_lengths,
+                comments=np.array(comments, dtype=str),
+            )
+        os.replace(temp_path, cache_path)
+    except OSError:
+        Path(temp_path).unlink(missing_ok=True)
+
+
 # multiple type annotation uses "typeA | typeB" syntax, but requires Python 3.10+
 # filename: (str, Path)
 # comments: (str, list)
@@ -8,7 +8,7 @@ import tempfile
 import textwrap
 import numpy as np
 
-from aviary.interface.cmd_entry_points import _command_map
+from aviary.interface.cmd_entry_points import _load_command
 
 """
 # DocTAPE #
@@ -524,7 +524,7 @@ def glue_actions(cmd, curr_glued=None, glue_default=False, glue_choices=False, m
     if curr_glued is None:
         curr_glued = []
     parser = argparse.ArgumentParser()
-    _command_map[cmd][0](parser)
+    _load_command(cmd)[0](parser)
     actions = [*parser._get_optional_actions(), *parser._get_positional_actions()]
     for action in actions:
         opt_list = action.option_strings
@@ -1,22 +1,27 @@
 #!/usr/bin/python
 import argparse
 import getpass
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
+from glob import glob
+from pathlib import Path
 
 import numpy as np
 import openmdao.api as om
 from openmdao.components.interp_util.interp import InterpND
+from openmdao.utils.units import convert_units
 
 from aviary.interface.utils import round_it
-from aviary.subsystems.atmosphere.atmosphere import Atmosphere
+from aviary.subsystems.atmosphere.atmosphere import compute_atmosphere
 from aviary.subsystems.propulsion.engine_deck import normalize
 from aviary.subsystems.propulsion.utils import EngineModelVariables, default_units
 from aviary.utils.conversion_utils import _parse, _read_map, _rep
-from aviary.utils.csv_data_file import write_data_file
+from aviary.utils.csv_data_file import read_data_file, write_data_file
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
+from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.variables import Dynamic
 
 
@@ -235,45 +240,7 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
 
         if compute_T4:
             # compute T4 using atmospheric model
-            prob = om.Problem()
-
-            prob.model.add_subsystem(
-                'T4T2', om.IndepVarComp('T4:T2', T4T2, units='unitless'), promotes=['*']
-            )
-
-            prob.model.add_subsystem(
-                Dynamic.Atmosphere.MACH,
-                om.IndepVarComp(Dynamic.Atmosphere.MACH, data[MACH], units='unitless'),
-                promotes=['*'],
-            )
-
-            prob.model.add_subsystem(
-                Dynamic.Mission.ALTITUDE,
-                om.IndepVarComp(Dynamic.Mission.ALTITUDE, data[ALTITUDE], units='ft'),
-                promotes=['*'],
-            )
-
-            prob.model.add_subsystem(
-                name='atmosphere',
-                subsys=Atmosphere(num_nodes=len(data[MACH])),
-                promotes_inputs=[Dynamic.Mission.ALTITUDE],
-                promotes_outputs=[Dynamic.Atmosphere.TEMPERATURE],
-            )
-
-            prob.model.add_subsystem(
-                name='conversion',
-                subsys=AtmosCalc(num_nodes=len(data[MACH])),
-                promotes_inputs=[
-                    Dynamic.Atmosphere.MACH,
-                    Dynamic.Atmosphere.TEMPERATURE,
-                ],
-                promotes_outputs=['t2'],
-            )
-
-            prob.setup()
-            prob.run_model()
-
-            T2 = prob.get_val('t2')
+            T2, _ = _inlet_conditions(data[MACH], data[ALTITUDE])
             T4 = T2 * T4T2
             data[TEMPERATURE] = T4
             # Throttle is T4 normalized from 0 to 1 (T4max)
@@ -310,7 +277,10 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
         # round data if requested, using sig_figs as guide
         if round_data:
             for key in data:
-                data[key] = np.array([round_it(val, sig_figs[key]) for val in data[key]])
+                # columns repeat many values, so each unique value is only rounded once
+                unique_vals, inverse = np.unique(data[key], return_inverse=True)
+                rounded = np.array([round_it(val, sig_figs[key]) for val in unique_vals])
+                data[key] = rounded[inverse]
 
         # data needs to be string so column length can be easily found later
         for var in data:
@@ -342,15 +312,111 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
         write_data.set_val(header_names[key], formatted_data[key], default_units[key])
 
     if output_file is None:
-        sfx = data_file.suffix
-        if sfx == '.csv':
-            ext = '_aviary.csv'
-        else:
-            ext = '.csv'
-        output_file = data_file.stem + ext
+        output_file = _default_output_name(data_file)
     write_data_file(output_file, write_data, outputs, comments, include_timestamp=True)
 
 
+def convert_engine_decks(
+    input_files, output_dir, data_format: EngineDeckType, round_data=False, max_workers=None
+):
+    """
+    Converts a batch of FLOPS- or GASP-formatted engine decks into Aviary csv format.
+    Each deck is converted as in convert_engine_deck(), in a separate process. A binary
+    cache of each converted deck is written next to it, so it is loaded quickly the first
+    time it is used.
+
+    Parameters
+    ----------
+    input_files : (str, Path, list)
+        engine deck files to be converted, given as a list of paths, a directory (all files
+        in it except .csv and cache files), or a glob pattern
+    output_dir : (str, Path)
+        directory where the converted decks are written, using the default output file
+        names of convert_engine_deck(). If None, the current working directory is used.
+    data_format : (EngineDeckType)
+        data format used by all input files (FLOPS or GASP)
+    round_data : bool, optional
+        Sets if any generated data should be rounded. Defaults to False.
+    max_workers : int, optional
+        Maximum number of processes used to convert the decks. If 1, decks are converted
+        one after another in this process. If None (default), the number of processors on
+        the machine is used.
+
+    Returns
+    -------
+    list of Path
+        paths to the converted engine decks, in the order of the input files
+    """
+    data_files = _find_engine_decks(input_files)
+
+    output_dir = Path.cwd() if output_dir is None else Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    output_files = [output_dir / _default_output_name(data_file) for data_file in data_files]
+
+    if len(set(output_files)) < len(output_files):
+        raise ValueError(
+            'Engine decks with the same file name cannot be converted into the same directory.'
+        )
+
+    jobs = [
+        (data_file, output_file, data_format, round_data)
+        for data_file, output_file in zip(data_files, output_files)
+    ]
+
+    if max_workers == 1 or len(jobs) < 2:
+        for job in jobs:
+            _convert_and_cache(*job)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_convert_and_cache, *job) for job in jobs]
+            for future in futures:
+                future.result()
+
+    return output_files
+
+
+def _find_engine_decks(input_files):
+    """Return the paths to the engine decks given as a list, directory, or glob pattern."""
+    if isinstance(input_files, (str, Path)):
+        if Path(input_files).is_dir():
+            # skip decks already in Aviary format, as well as their binary caches
+            return sorted(
+                path
+                for path in Path(input_files).iterdir()
+                if path.is_file()
+                and not path.name.startswith('.')
+                and path.suffix not in ('.csv', '.npz')
+            )
+
+        if any(char in str(input_files) for char in '*?['):
+            data_files = sorted(Path(path) for path in glob(str(input_files)))
+            if not data_files:
+                raise FileNotFoundError(f'No engine decks match "{input_files}".')
+            return data_files
+
+        input_files = [input_files]
+
+    return [get_path(input_file) for input_file in input_files]
+
+
+def _default_output_name(data_file):
+    """Return the default name of the converted version of an engine deck."""
+    if data_file.suffix == '.csv':
+        ext = '_aviary.csv'
+    else:
+        ext = '.csv'
+
+    return data_file.stem + ext
+
+
+def _convert_and_cache(input_file, output_file, data_format, round_data):
+    """Convert an engine deck and write the binary cache of the converted deck."""
+    convert_engine_deck(input_file, output_file, data_format, round_data)
+    # reading the new deck stores its parsed contents in the binary cache
+    read_data_file(output_file, verbosity=Verbosity.QUIET)
+
+
 def _read_flops_engine(input_file):
     """
     Read engine data file using FLOPS standard, which is column delimited data
@@ -521,11 +587,7 @@ def _make_structured_grid(
         all_alts = map_data[:, 0]
         alts = np.unique(all_alts)
 
-        sizes = (alts.size, t4t2s.size, machs.size)
-        vals = np.zeros(np.prod(sizes), dtype=float)
-        alt_vec = np.zeros(np.prod(sizes), dtype=float)
-        mach_vec = np.zeros(np.prod(sizes), dtype=float)
-        t4t2_vec = np.zeros(np.prod(sizes), dtype=float)
+        vals = np.zeros(alts.size * npts, dtype=float)
 
         for i, alt in enumerate(alts):
             d = map_data[all_alts == alt]
@@ -545,11 +607,12 @@ def _make_structured_grid(
             interp = InterpND(
                 method='2D-' + method, points=(t4t2, mach), values=f, extrapolate=True
             )
-            sl = slice(i * npts, (i + 1) * npts)
-            vals[sl] = interp.interpolate(pts)
-            alt_vec[sl] = [alt] * len(pts)
-            t4t2_vec[sl] = pts[:, 0]
-            mach_vec[sl] = pts[:, 1]
+            vals[i * npts : (i + 1) * npts] = interp.interpolate(pts)
+
+        # every altitude is resampled onto the same T4/T2 and Mach points
+        alt_vec = np.repeat(alts, npts)
+        t4t2_vec = np.tile(pts[:, 0], alts.size)
+        mach_vec = np.tile(pts[:, 1], alts.size)
 
         structured_data[field] = {
             'vals': vals,
@@ -571,57 +634,11 @@ def _generate_flight_idle(data, T4T2, ref_sls_airflow, ref_sfn_idle):
 
     nn = len(mach_list)
 
-    prob = om.Problem()
-
-    prob.model.add_subsystem(
-        Dynamic.Atmosphere.MACH,
-        om.IndepVarComp(Dynamic.Atmosphere.MACH, mach_list, units='unitless'),
-        promotes=['*'],
-    )
-
-    prob.model.add_subsystem(
-        Dynamic.Mission.ALTITUDE,
-        om.IndepVarComp(Dynamic.Mission.ALTITUDE, alt_list, units='ft'),
-        promotes=['*'],
-    )
-
-    prob.model.add_subsystem(
-        name='atmosphere',
-        subsys=Atmosphere(num_nodes=nn),
-        promotes_inputs=[Dynamic.Mission.ALTITUDE],
-        promotes_outputs=[
-            Dynamic.Atmosphere.TEMPERATURE,
-            Dynamic.Atmosphere.STATIC_PRESSURE,
-        ],
-    )
-
-    prob.model.add_subsystem(
-        name='conversion',
-        subsys=AtmosCalc(num_nodes=nn),
-        promotes_inputs=[
-            Dynamic.Atmosphere.MACH,
-            Dynamic.Atmosphere.TEMPERATURE,
-            Dynamic.Atmosphere.STATIC_PRESSURE,
-        ],
-        promotes_outputs=['t2', 'p2'],
-    )
-
-    prob.model.add_subsystem(
-        name='flight_idle',
-        subsys=CalculateIdle(
-            num_nodes=nn, ref_sfn_idle=ref_sfn_idle, ref_sls_airflow=ref_sls_airflow
-        ),
-        promotes_inputs=['t2', 'p2', 'pct_corr_airflow_idle', 'sfc_idle'],
-        promotes_outputs=['idle_thrust', 'idle_fuelflow'],
+    t2, p2 = _inlet_conditions(mach_list, alt_list)
+    idle_thrust, idle_fuelflow = _idle_performance(
+        t2, p2, _PCT_CORR_AIRFLOW_IDLE, _SFC_IDLE, ref_sls_airflow, ref_sfn_idle
     )
 
-    prob.setup()
-
-    prob.run_model()
-
-    idle_thrust = prob.get_val('idle_thrust')
-    idle_fuelflow = prob.get_val('idle_fuelflow')
-
     data[MACH] = np.append(data[MACH], mach_list)
     data[ALTITUDE] = np.append(data[ALTITUDE], alt_list)
     data[THRUST] = np.append(data[THRUST], idle_thrust)
@@ -634,6 +651,43 @@ def _generate_flight_idle(data, T4T2, ref_sls_airflow, ref_sfn_idle):
 _PSLS_PSF = 2116.22  # SLS pressure in psf
 _TSLS_DEGR = 518.67  # SLS temperature in deg R
 
+# idle assumptions used when generating flight idle points
+_PCT_CORR_AIRFLOW_IDLE = 0.5
+_SFC_IDLE = 1.0  # lbm/h/lbf
+
+
+def _inlet_conditions(mach, altitude):
+    """
+    Compute engine inlet total temperature (degR) and pressure (psf) at the given Mach
+    numbers and altitudes (ft) in the standard atmosphere.
+    """
+    atmosphere = compute_atmosphere(altitude)
+    temperature = atmosphere[Dynamic.Atmosphere.TEMPERATURE]
+    pressure = convert_units(atmosphere[Dynamic.Atmosphere.STATIC_PRESSURE], 'psi', 'psf')
+
+    return _total_conditions(mach, temperature, pressure)
+
+
+def _total_conditions(mach, T, P):
+    """Compute total temperature and pressure from static conditions and Mach number."""
+    gamma = 1.4
+    t2 = T * (1 + 0.5 * (gamma - 1) * mach**2)
+    p2 = P * (t2 / T) ** (gamma / (gamma - 1))
+
+    return t2, p2
+
+
+def _idle_performance(t2, p2, pct_corr_airflow_idle, sfc_idle, ref_sls_airflow, ref_sfn_idle):
+    """Compute idle thrust (lbf) and fuel flow (lbm/h) of a GASP engine."""
+    rthet2 = np.sqrt(t2 / _TSLS_DEGR)
+    delta2 = p2 / _PSLS_PSF
+
+    airflow_ref = pct_corr_airflow_idle * ref_sls_airflow  # don't un-correct
+    thrust_ref = airflow_ref * delta2 / rthet2 * ref_sfn_idle
+    fuelflow_ref = thrust_ref * sfc_idle
+
+    return thrust_ref, fuelflow_ref
+
 
 class CalculateIdle(om.ExplicitComponent):
     """
@@ -656,10 +710,14 @@ class CalculateIdle(om.ExplicitComponent):
 
         self.add_input('t2', _TSLS_DEGR, units='degR', shape=nn, desc='Engine inlet temperature')
         self.add_input('p2', _PSLS_PSF, units='psf', shape=nn, desc='Engine inlet pressure')
-        self.add_input('pct_corr_airflow_idle', 0.5, desc='Percent corrected airflow at idle')
+        self.add_input(
+            'pct_corr_airflow_idle',
+            _PCT_CORR_AIRFLOW_IDLE,
+            desc='Percent corrected airflow at idle',
+        )
         self.add_input(
             'sfc_idle',
-            1.0,
+            _SFC_IDLE,
             units='lbm/h/lbf',
             desc='Thrust-specific fuel consumption at idle',
         )
@@ -678,15 +736,14 @@ class CalculateIdle(om.ExplicitComponent):
             sfc_idle,
         ) = inputs.values()
 
-        ref_sls_airflow = self.options['ref_sls_airflow']
-        ref_sfn_idle = self.options['ref_sfn_idle']
-
-        rthet2 = np.sqrt(t2 / _TSLS_DEGR)
-        delta2 = p2 / _PSLS_PSF
-
-        airflow_ref = pct_corr_airflow_idle * ref_sls_airflow  # don't un-correct
-        thrust_ref = airflow_ref * delta2 / rthet2 * ref_sfn_idle
-        fuelflow_ref = thrust_ref * sfc_idle
+        thrust_ref, fuelflow_ref = _idle_performance(
+            t2,
+            p2,
+            pct_corr_airflow_idle,
+            sfc_idle,
+            self.options['ref_sls_airflow'],
+            self.options['ref_sfn_idle'],
+        )
 
         outputs['idle_thrust'] = thrust_ref
         # outputs["idle_airflow"] = airflow_ref
@@ -727,21 +784,25 @@ class AtmosCalc(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         mach, T, P = inputs.values()
 
-        gamma = 1.4
-        t2 = T * (1 + 0.5 * (gamma - 1) * mach**2)
-        p2 = P * (t2 / T) ** (gamma / (gamma - 1))
+        t2, p2 = _total_conditions(mach, T, P)
 
         outputs['t2'] = t2
         outputs['p2'] = p2
 
 
 def _setup_EDC_parser(parser):
-    parser.add_argument('input_file', type=str, help='path to engine deck file to be converted')
+    parser.add_argument(
+        'input_file',
+        type=str,
+        help='path to engine deck file to be converted, or a directory or glob pattern '
+        '(quoted) of engine deck files to be converted together',
+    )
     parser.add_argument(
         'output_file',
         type=str,
         nargs='?',
-        help='path to file where new converted data will be written',
+        help='path to file where new converted data will be written, or the directory '
+        'where converted decks are written if input_file is a directory or glob pattern',
     )
     parser.add_argument(
         '-f',
@@ -751,9 +812,26 @@ def _setup_EDC_parser(parser):
         help='data format used by input_file',
     )
     parser.add_argument('--round', action='store_true', help='round data to improve readability')
+    parser.add_argument(
+        '--max_workers',
+        type=int,
+        default=None,
+        help='maximum number of processes used to convert a directory or glob pattern of '
+        'engine decks, defaults to the number of processors',
+    )
 
 
 def _exec_EDC(args, user_args):
+    if Path(args.input_file).is_dir() or any(char in args.input_file for char in '*?['):
+        convert_engine_decks(
+            input_files=args.input_file,
+            output_dir=args.output_file,
+            data_format=args.data_format,
+            round_data=args.round,
+            max_workers=args.max_workers,
+        )
+        return
+
     convert_engine_deck(
         input_file=args.input_file,
         output_file=args.output_file,
@@ -65,8 +65,10 @@ def merge_2_meta_data_dicts(dict1, dict2):
     for key in sorted(all_duplicate_keys):
         # check that the metadata in both dictionaries associated with the same key is the same
         value1, value2 = dict1[key], dict2[key]
-        # throw an error if the dicts have the same key with different metadata
-        if not almost_equal(value1, value2):
+        # throw an error if the dicts have the same key with different metadata. Entries
+        # shared between dictionaries (e.g. copies of the core metadata) are the same object
+        # and need no comparison
+        if value1 is not value2 and not almost_equal(value1, value2):
             raise ValueError(
                 f'You have attempted to merge metadata dictionaries that contain the same variable with different metadata. The offending variable present in multiple dictionaries is "{key}".'
             )
@@ -103,10 +105,10 @@ def merge_meta_data(dicts_to_merge):
     None
         No exceptions raised by this method, although other methods called within may raise exceptions.
     """
-    merged_dict = dicts_to_merge[0]
+    merged_dict = dict(dicts_to_merge[0])
 
     # iterate through all the dictionaries and merge them together into one, two by two
-    for dict_item in dicts_to_merge:
+    for dict_item in dicts_to_merge[1:]:
         merged_dict = merge_2_meta_data_dicts(merged_dict, dict_item)
 
     return merged_dict
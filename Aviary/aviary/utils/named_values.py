@@ -153,6 +153,50 @@ class NamedValues(Collection):
 
         return val
 
+    def get_vals(self, keys, units='unitless') -> list:
+        """
+        Return multiple named values in the specified units.
+
+        Note, requesting a named value that does not exist will raise `KeyError`.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            the names of the items
+
+        units : str or Sequence[str] ('unitless')
+            the units of the returned values, either shared by all items or one per item
+
+        Returns
+        -------
+        list
+            the values, in the same order as keys
+
+        Raises
+        ------
+        KeyError
+            if any of the named values do not exist
+
+        ValueError
+            if the number of units does not match the number of keys
+
+        See Also
+        --------
+        get_val
+        """
+        if isinstance(units, str):
+            units = [units] * len(keys)
+
+        elif len(units) != len(keys):
+            raise ValueError(
+                f'{self.__class__.__name__}: get_vals: {len(keys)} keys were requested, but '
+                f'{len(units)} units were provided'
+            )
+
+        get_val = self.get_val
+
+        return [get_val(key, key_units) for key, key_units in zip(keys, units)]
+
     def set_val(self, key, val, units='unitless'):
         """
         Update the named value and its associated units.
@@ -90,6 +90,35 @@ class TestAviaryCSV(unittest.TestCase):
         if 'Real Var' not in get_keys(data):
             raise RuntimeError("'Real Var' is not in data read from csv")
 
+    def test_read_data_file_cache(self):
+        write_data_file('cached.csv', self.data, self.outputs)
+
+        # caching is opt-in
+        read_data_file('cached.csv')
+        self.assertFalse(os.path.isfile('cached.csv.cache.npz'))
+
+        data, _, _ = read_data_file('cached.csv', cache=True)
+        self.assertTrue(os.path.isfile('cached.csv.cache.npz'))
+        assert_near_equal(data.get_val('fake_var', 'lbm'), [0.932, 1023.54, 0, -13])
+
+        # second read is loaded from cache
+        data, inputs, outputs = read_data_file('cached.csv', cache=True)
+        assert_near_equal(data.get_val('fake_var', 'lbm'), [0.932, 1023.54, 0, -13])
+        self.assertEqual(inputs, self.inputs)
+        self.assertEqual(outputs, self.outputs)
+
+        # modifying data file invalidates cache
+        self.data.set_val('fake_var', [1.0, 2.0, 3.0, 4.0], 'lbm')
+        write_data_file('cached.csv', self.data, self.outputs)
+        data, _, _ = read_data_file('cached.csv', cache=True)
+        assert_near_equal(data.get_val('fake_var', 'lbm'), [1.0, 2.0, 3.0, 4.0])
+
+        # cache files can be kept in a separate directory
+        data, _, _ = read_data_file('cached.csv', cache='data_cache')
+        self.assertEqual(len(os.listdir('data_cache')), 1)
+        data, _, _ = read_data_file('cached.csv', cache='data_cache')
+        assert_near_equal(data.get_val('fake_var', 'lbm'), [1.0, 2.0, 3.0, 4.0])
+
     @use_tempdirs
     def test_parse_input(self):
         aircraft_values = get_option_defaults(engine=False)
@@ -1,9 +1,16 @@
+import shutil
 import unittest
 from pathlib import Path
 
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.utils.engine_deck_conversion import EngineDeckType, convert_engine_deck
+from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.engine_deck_conversion import (
+    EngineDeckType,
+    convert_engine_deck,
+    convert_engine_decks,
+)
 from aviary.utils.functions import get_path
 
 
@@ -72,6 +79,34 @@ class TestEngineDeckConversion(unittest.TestCase):
         self.prepare_and_run(filename, data_format=EngineDeckType.GASP_TS)
         self.compare_files(filename)
 
+    def test_batch_conversion(self):
+        decks = Path.cwd() / 'decks'
+        decks.mkdir()
+        for name in ('deck_1.eng', 'deck_2.eng'):
+            shutil.copy(get_path('utils/test/data/turbofan_23k_1.eng'), decks / name)
+        # decks already in Aviary format are skipped
+        shutil.copy(get_path('models/engines/turbofan_23k_1.csv'), decks)
+
+        output_files = convert_engine_decks(
+            decks, 'converted', EngineDeckType.GASP, round_data=True, max_workers=2
+        )
+
+        self.assertEqual([path.name for path in output_files], ['deck_1.csv', 'deck_2.csv'])
+
+        expected, _, _ = read_data_file(get_path('models/engines/turbofan_23k_1.csv'))
+        for output_file in output_files:
+            self.assertTrue(Path(str(output_file) + '.cache.npz').is_file())
+
+            data, _, _ = read_data_file(output_file)
+            for key, (val, units) in expected:
+                assert_near_equal(data.get_val(key, units), val)
+
+        # glob patterns select decks by name
+        output_files = convert_engine_decks(
+            str(decks / '*_1.eng'), 'glob', EngineDeckType.GASP, max_workers=1
+        )
+        self.assertEqual([path.name for path in output_files], ['deck_1.csv'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,8 @@ import unittest
 
 import aviary.api as av
 from aviary.utils.merge_variable_metadata import merge_meta_data
+from aviary.variable_info.variable_meta_data import _MetaData
+from aviary.variable_info.variables import Aircraft
 
 dict1 = av.CoreMetaData.copy()
 # this is the baseline Aviary-core metadata
@@ -293,6 +295,29 @@ class MergeMetaDataTest(unittest.TestCase):
             merge_meta_data([dict2, dict6])  # test the larger difference
         self.assertEqual(str(cm.exception), merged_dicts_26_msg)
 
+    def test_core_meta_data_copy(self):
+        # other tests add variables to av.CoreMetaData, so start from a fresh copy
+        core = _MetaData.copy()
+        extended = core.copy()
+        av.add_meta_data('aircraft:test:new_var', meta_data=extended, units='m')
+        av.update_meta_data(Aircraft.Wing.SPAN, meta_data=extended, units='m')
+
+        # changes to a copy of the core metadata never reach the core metadata
+        self.assertNotIn('aircraft:test:new_var', core)
+        self.assertNotIn('aircraft:test:new_var', _MetaData)
+        self.assertEqual(core[Aircraft.Wing.SPAN]['units'], 'ft')
+        self.assertEqual(_MetaData[Aircraft.Wing.SPAN]['units'], 'ft')
+        self.assertIsNot(extended[Aircraft.Wing.SPAN], _MetaData[Aircraft.Wing.SPAN])
+
+        # the remaining entries are shared, so merging them needs no comparison
+        self.assertIs(extended[Aircraft.Wing.AREA], _MetaData[Aircraft.Wing.AREA])
+        merged = merge_meta_data([_MetaData, core])
+        self.assertEqual(merged.keys(), _MetaData.keys())
+        self.assertIsNot(merged, _MetaData)
+
+        with self.assertRaises(ValueError):
+            merge_meta_data([_MetaData, extended])
+
 
 if __name__ == '__main__':
     unittest.main()
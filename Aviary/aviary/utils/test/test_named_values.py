@@ -157,6 +157,34 @@ class NamedValuesTest(unittest.TestCase):
         self.assertEqual(val, aval)
         self.assertEqual(aunits, 'unitless')
 
+    def test_get_vals(self):
+        a = NamedValues()
+        a.set_val('elapsed_time', 42, 'min')
+        a.set_val('temperature', [0.0, 100.0], 'degC')
+        a.set_val('count', 3)
+
+        # shared units
+        vals = a.get_vals(['elapsed_time', 'elapsed_time'], 's')
+        self.assertEqual(vals, [42 * 60, 42 * 60])
+
+        # units per key
+        time, temperature, count = a.get_vals(
+            ['elapsed_time', 'temperature', 'count'], ['h', 'degK', 'unitless']
+        )
+        self.assertAlmostEqual(time, 0.7)
+        self.assertAlmostEqual(temperature[0], 273.15)
+        self.assertAlmostEqual(temperature[1], 373.15)
+        self.assertEqual(count, 3)
+
+        # unit conversion is local; item is unchanged
+        self.assertEqual(a.get_item('temperature'), ([0.0, 100.0], 'degC'))
+
+        with self.assertRaises(KeyError):
+            a.get_vals(['elapsed_time', _nokey], 's')
+
+        with self.assertRaises(ValueError):
+            a.get_vals(['elapsed_time', 'count'], ['s'])
+
     def test_collection(self):
         self.assertNotEqual(len(_data1), 0)
         d = NamedValues(_data1)
@@ -0,0 +1,55 @@
+"""Unit test cases for unit conversion helpers in aviary/utils/utils.py."""
+
+import unittest
+
+import numpy as np
+
+from aviary.utils.utils import get_conversion_factors, wrapped_convert_units
+
+
+class UnitConversionTest(unittest.TestCase):
+    """Test get_conversion_factors and wrapped_convert_units."""
+
+    def test_conversion_factors(self):
+        self.assertEqual(get_conversion_factors('min', 's'), (60.0, 0.0))
+        self.assertAlmostEqual(sum(get_conversion_factors('degC', 'degK')), 274.15)
+
+        with self.assertRaises(TypeError):
+            get_conversion_factors('ft', 's')
+
+    def test_same_units(self):
+        # no conversion is needed, so integers stay integers
+        for units in (('ft', 'ft'), ('ft', None), (None, 'ft')):
+            with self.subTest(units=units):
+                factor, offset = get_conversion_factors(*units)
+                self.assertEqual((factor, offset), (1, 0))
+                self.assertIsInstance(factor, int)
+                self.assertIsInstance(offset, int)
+
+        val = wrapped_convert_units((3, 'ft'), 'ft')
+        self.assertEqual(val, 3)
+        self.assertIsInstance(val, int)
+
+        vals = wrapped_convert_units(([3, None], 'ft'), 'ft')
+        self.assertEqual(vals, [3, None])
+        self.assertIsInstance(vals[0], int)
+
+    def test_wrapped_convert_units(self):
+        self.assertAlmostEqual(wrapped_convert_units((2, 'h'), 'min'), 120.0)
+        self.assertEqual(wrapped_convert_units((None, 'h'), 'min'), None)
+
+        vals = wrapped_convert_units(((0.0, None, 100.0), 'degC'), 'degK')
+        self.assertIsInstance(vals, tuple)
+        self.assertAlmostEqual(vals[0], 273.15)
+        self.assertIsNone(vals[1])
+        self.assertAlmostEqual(vals[2], 373.15)
+
+        array = np.array([1.0, 2.0])
+        converted = wrapped_convert_units((array, 'ft'), 'inch')
+        np.testing.assert_allclose(converted, [12.0, 24.0])
+        # the original array is not modified
+        np.testing.assert_array_equal(array, [1.0, 2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
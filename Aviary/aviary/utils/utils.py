@@ -5,9 +5,10 @@ Helps to avoid circular imports. These functions do not rely on imports from oth
 
 from copy import deepcopy
 from enum import Enum
+from functools import lru_cache
 
 import numpy as np
-from openmdao.utils.units import convert_units
+from openmdao.utils.units import unit_conversion
 
 from aviary.variable_info.variable_meta_data import _MetaData
 
@@ -27,6 +28,41 @@ def isiterable(val, valid_iterables: tuple = (list, np.ndarray, tuple)):
     return isinstance(val, valid_iterables)
 
 
+@lru_cache(maxsize=1024)
+def get_conversion_factors(old_units, new_units):
+    """
+    Return the scale factor and offset to convert values between two units. Results are
+    cached, so repeated conversions between the same pair of units do not need to re-parse
+    the unit strings.
+
+    Parameters
+    ----------
+    old_units : str
+        Original units.
+    new_units : str
+        New units to convert to.
+
+    Returns
+    -------
+    (float, float)
+        Conversion factor and offset, where new_value = (old_value + offset) * factor. If
+        either side has no units or the units are identical, (1, 0) is returned so that
+        integer values stay integers.
+
+    Raises
+    ------
+    ValueError
+        If either units are not valid.
+    TypeError
+        If the units are not compatible.
+    """
+    if not old_units or not new_units or old_units == new_units:
+        # one side has no units, or no conversion is needed
+        return 1, 0
+
+    return unit_conversion(old_units, new_units)
+
+
 def wrapped_convert_units(val_unit_tuple, new_units):
     """
     Wrapper for OpenMDAO's convert_units function. Can handle iterable values.
@@ -43,12 +79,22 @@ def wrapped_convert_units(val_unit_tuple, new_units):
     value: float, list, np.ndarray, tuple
         Value converted to new units, as the same type as provided
     """
-    value, units = deepcopy(val_unit_tuple)
+    value, units = val_unit_tuple
 
     # can't convert units on None; return None
     if value is None:
         return None
 
+    # one side has no units, value is unchanged
+    if not units or not new_units:
+        return deepcopy(value)
+
+    factor, offset = get_conversion_factors(units, new_units)
+
+    if isinstance(value, np.ndarray) and value.dtype.kind in 'fc':
+        # convert entire array of floats at once
+        return (value + offset) * factor
+
     if isiterable(value):
         # tuples are immutable, so we have to convert to list to modify each index
         if isinstance(value, tuple):
@@ -56,16 +102,17 @@ def wrapped_convert_units(val_unit_tuple, new_units):
             value = list(value)
         else:
             istuple = False
+            value = deepcopy(value)
 
         for i, item in enumerate(value):
             # Any entry may be none.
             if value[i] is not None:
-                value[i] = convert_units(item, units, new_units)
+                value[i] = (item + offset) * factor
 
         if istuple:
             value = tuple(value)
     else:
-        value = convert_units(value, units, new_units)
+        value = (value + offset) * factor
 
     return value
 
@@ -0,0 +1,60 @@
+import unittest
+
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.validation_cases.performance_benchmarks import (
+    METRICS,
+    find_regressions,
+    load_history,
+    main,
+)
+
+
+def _entry(**results):
+    return {'results': {'FwFm': dict(results)}}
+
+
+class FindRegressionsTest(unittest.TestCase):
+    def test_regressions(self):
+        baseline = _entry(setup=1.0, run_model=1.0, compute_totals=0.05, peak_memory=200.0)
+        entry = _entry(setup=1.5, run_model=1.1, compute_totals=0.1, peak_memory=300.0)
+
+        # run_model is within the relative tolerance and compute_totals within the absolute one
+        self.assertEqual(
+            find_regressions(entry, baseline),
+            [('FwFm', 'setup', 1.0, 1.5), ('FwFm', 'peak_memory', 200.0, 300.0)],
+        )
+
+        # metrics missing from abs_tolerances have no absolute tolerance
+        self.assertEqual(
+            find_regressions(entry, baseline, abs_tolerances={'setup': 1.0}),
+            [('FwFm', 'compute_totals', 0.05, 0.1), ('FwFm', 'peak_memory', 200.0, 300.0)],
+        )
+
+    def test_missing_values(self):
+        baseline = {'results': {'GwGm': {'setup': 1.0}}}
+        entry = _entry(setup=5.0, peak_memory=None)
+
+        self.assertEqual(find_regressions(entry, baseline), [])
+        self.assertEqual(find_regressions(_entry(setup=5.0), _entry(peak_memory=1.0)), [])
+
+
+@use_tempdirs
+class PerformanceBenchmarksTest(unittest.TestCase):
+    def test_run(self):
+        self.assertEqual(main(['FwFm', '--save_baseline', 'baseline.json']), 0)
+        self.assertEqual(main(['FwFm', '--baseline', 'baseline.json', '--tolerance', '1e6']), 0)
+
+        history = load_history('performance_history.json')
+        self.assertEqual(len(history), 2)
+
+        results = history[-1]['results']['FwFm']
+        self.assertEqual(sorted(results), sorted(METRICS))
+        self.assertGreater(results['compute_totals'], 0.0)
+
+        with self.assertRaises(ValueError):
+            main(['BWB_typo'])
+
+
+if __name__ == '__main__':
+    unittest.main()
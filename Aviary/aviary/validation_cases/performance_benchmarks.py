@@ -0,0 +1,457 @@
+"""
+Timing and memory benchmarks of the standard Aviary models.
+
+Each model is built and measured in its own python process, so that the peak memory of one
+model does not hide that of the next, and import costs are paid the same way every time. The
+results of each run are appended to a json history file, and can be compared against a stored
+baseline to find regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from copy import deepcopy
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+# Metrics measured for each model, in the order they are reported. Times are in seconds and
+# memory is in MB.
+METRICS = ('setup', 'final_setup', 'run_model', 'compute_totals', 'peak_memory')
+
+# Changes smaller than these absolute amounts are never reported as regressions, because they
+# are within the noise of timing a single run.
+DEFAULT_ABS_TOLERANCES = {
+    'setup': 0.25,
+    'final_setup': 0.25,
+    'run_model': 0.25,
+    'compute_totals': 0.25,
+    'peak_memory': 20.0,
+}
+
+
+def _build_FwFm(prob):
+    from aviary.models.missions.height_energy_default import phase_info
+
+    prob.load_inputs(
+        'models/aircraft/test_aircraft/aircraft_for_bench_FwFm.csv', deepcopy(phase_info)
+    )
+
+
+def _build_GwGm(prob):
+    from aviary.models.missions.two_dof_default import phase_info
+
+    prob.load_inputs(
+        'models/aircraft/test_aircraft/aircraft_for_bench_GwGm.csv', deepcopy(phase_info)
+    )
+
+
+def _build_multiengine(prob):
+    from aviary.models.aircraft.multi_engine_single_aisle.multi_engine_single_aisle_data import (
+        engine_1_inputs,
+        engine_2_inputs,
+        inputs,
+    )
+    from aviary.models.missions.height_energy_default import phase_info
+    from aviary.subsystems.propulsion.utils import build_engine_deck
+    from aviary.variable_info.variables import Aircraft
+
+    engine1 = build_engine_deck(engine_1_inputs)
+    engine1.name = 'engine_1'
+    engine2 = build_engine_deck(engine_2_inputs)
+    engine2.name = 'engine_2'
+
+    inputs = inputs.deepcopy()
+    inputs.set_val(Aircraft.Nacelle.LAMINAR_FLOW_LOWER, np.zeros(2))
+    inputs.set_val(Aircraft.Nacelle.LAMINAR_FLOW_UPPER, np.zeros(2))
+
+    prob.load_inputs(inputs, deepcopy(phase_info), engine_builders=[engine1, engine2])
+
+
+def _build_turboprop_freighter(prob):
+    from aviary.models.aircraft.large_turboprop_freighter.phase_info import two_dof_phase_info
+    from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
+    from aviary.utils.process_input_decks import create_vehicle
+    from aviary.variable_info.variables import Aircraft, Mission
+
+    csv_path = 'models/aircraft/large_turboprop_freighter/large_turboprop_freighter_GASP.csv'
+    options, _ = create_vehicle(csv_path)
+    turboprop = TurbopropModel('turboprop', options=options)
+
+    prob.load_inputs(csv_path, deepcopy(two_dof_phase_info), engine_builders=[turboprop])
+    prob.aviary_inputs.set_val(Mission.Constraints.MAX_MACH, 0.5)
+    prob.aviary_inputs.set_val(Aircraft.Fuselage.AVG_DIAMETER, 4.125, 'm')
+
+
+def _build_BWB(prob):
+    from aviary.models.missions.two_dof_default import phase_info
+
+    prob.load_inputs('models/aircraft/blended_wing_body/generic_BWB_GASP.csv', deepcopy(phase_info))
+
+
+# Functions that load the inputs of each benchmark model into an AviaryProblem. The models
+# match those of the benchmark tests.
+MODELS = {
+    'FwFm': _build_FwFm,
+    'GwGm': _build_GwGm,
+    'multiengine': _build_multiengine,
+    'turboprop_freighter': _build_turboprop_freighter,
+    'BWB': _build_BWB,
+}
+
+
+def _peak_memory():
+    """Return the peak memory used by this process so far in MB, or None if unknown."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return peak / 1024**2
+    return peak / 1024
+
+
+def measure_model(model, repeats=1):
+    """
+    Build one of the benchmark models and measure it in this process.
+
+    Parameters
+    ----------
+    model : str
+        Name of the model, one of the keys of MODELS.
+    repeats : int
+        Number of times run_model and compute_totals are timed. The fastest time is kept.
+
+    Returns
+    -------
+    dict
+        Value of each of the METRICS. Times are in seconds and memory is in MB.
+    """
+    import openmdao.api as om
+
+    from aviary.interface.methods_for_level2 import AviaryProblem
+
+    if model not in MODELS:
+        raise ValueError(f'Unknown benchmark model "{model}". Options are {list(MODELS)}.')
+
+    # reports and recording are not part of what is being measured
+    prob = AviaryProblem(verbosity=0, reports=False)
+    MODELS[model](prob)
+    prob.check_and_preprocess_inputs()
+    prob.build_model()
+    prob.add_driver('SLSQP', max_iter=0, verbosity=0)
+    prob.add_design_variables()
+    prob.add_objective()
+
+    results = {}
+
+    start = time.perf_counter()
+    prob.setup()
+    results['setup'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    prob.final_setup()
+    results['final_setup'] = time.perf_counter() - start
+
+    run_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        prob.run_model()
+        run_times.append(time.perf_counter() - start)
+    results['run_model'] = min(run_times)
+
+    totals_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        prob.compute_totals()
+        totals_times.append(time.perf_counter() - start)
+    results['compute_totals'] = min(totals_times)
+
+    results['peak_memory'] = _peak_memory()
+
+    om.clear_reports()
+
+    return results
+
+
+def _measure_in_subprocess(model, repeats):
+    """Measure a model in a new python process, in a temporary working directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result_file = Path(tmpdir) / 'result.json'
+        subprocess.run(
+            [sys.executable, '-m', __name__, model, str(repeats), str(result_file)],
+            cwd=tmpdir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+        with open(result_file) as f:
+            return json.load(f)
+
+
+def run_benchmarks(models=None, repeats=1, history_file=None):
+    """
+    Measure benchmark models, each in its own python process.
+
+    Parameters
+    ----------
+    models : list of str, optional
+        Names of the models to measure. By default all MODELS are measured.
+    repeats : int
+        Number of times run_model and compute_totals are timed for each model. The fastest
+        time is kept.
+    history_file : str or Path, optional
+        Json file that the new entry is appended to. It is created if it does not exist.
+
+    Returns
+    -------
+    dict
+        History entry with the time of the run, the versions of python and the main packages,
+        and the metrics of each model under 'results'.
+    """
+    import dymos
+    import openmdao
+
+    import aviary
+
+    if models is None:
+        models = list(MODELS)
+
+    entry = {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'versions': {
+            'python': platform.python_version(),
+            'aviary': aviary.__version__,
+            'openmdao': openmdao.__version__,
+            'dymos': dymos.__version__,
+            'numpy': np.__version__,
+        },
+        'platform': platform.platform(),
+        'results': {},
+    }
+
+    for model in models:
+        if model not in MODELS:
+            raise ValueError(f'Unknown benchmark model "{model}". Options are {list(MODELS)}.')
+
+        entry['results'][model] = _measure_in_subprocess(model, repeats)
+
+    if history_file is not None:
+        history = load_history(history_file)
+        history.append(entry)
+
+        with open(history_file, 'w') as f:
+            json.dump(history, f, indent=1)
+
+    return entry
+
+
+def load_history(history_file):
+    """
+    Load the entries of a benchmark history file.
+
+    Parameters
+    ----------
+    history_file : str or Path
+        Json file written by run_benchmarks.
+
+    Returns
+    -------
+    list of dict
+        History entries, oldest first. Empty if the file does not exist.
+    """
+    if not os.path.exists(history_file):
+        return []
+
+    with open(history_file) as f:
+        return json.load(f)
+
+
+def find_regressions(entry, baseline, rel_tolerance=0.2, abs_tolerances=None):
+    """
+    Compare the results of a benchmark run against a baseline run.
+
+    A metric regresses when it exceeds its baseline value by more than both the relative
+    tolerance and its absolute tolerance.
+
+    Parameters
+    ----------
+    entry : dict
+        History entry of the new run.
+    baseline : dict
+        History entry of the baseline run.
+    rel_tolerance : float
+        Allowed increase of each metric, relative to its baseline value.
+    abs_tolerances : dict, optional
+        Allowed increase of each metric, in its own units. Defaults to
+        DEFAULT_ABS_TOLERANCES.
+
+    Returns
+    -------
+    list of tuple
+        Model, metric, baseline value and new value of each regression.
+    """
+    if abs_tolerances is None:
+        abs_tolerances = DEFAULT_ABS_TOLERANCES
+
+    regressions = []
+
+    for model, results in entry['results'].items():
+        if model not in baseline['results']:
+            continue
+
+        baseline_results = baseline['results'][model]
+
+        for metric in METRICS:
+            new = results.get(metric)
+            old = baseline_results.get(metric)
+            if new is None or old is None:
+                continue
+
+            increase = new - old
+            if increase > rel_tolerance * old and increase > abs_tolerances.get(metric, 0.0):
+                regressions.append((model, metric, old, new))
+
+    return regressions
+
+
+def print_results(entry, baseline=None, out_stream=None):
+    """
+    Print a table of the metrics of each model in a benchmark run.
+
+    Parameters
+    ----------
+    entry : dict
+        History entry of the run.
+    baseline : dict, optional
+        History entry of a baseline run. When given, the change from the baseline is printed
+        with each metric.
+    out_stream : file-like, optional
+        Where to print the table. Defaults to stdout.
+    """
+    if out_stream is None:
+        out_stream = sys.stdout
+
+    header = f'{"model":<20}' + ''.join(f'{metric:>16}' for metric in METRICS)
+    print(header, file=out_stream)
+    print('-' * len(header), file=out_stream)
+
+    for model, results in entry['results'].items():
+        line = f'{model:<20}'
+
+        for metric in METRICS:
+            value = results.get(metric)
+            if value is None:
+                line += f'{"-":>16}'
+                continue
+
+            text = f'{value:.3f}'
+            if baseline is not None and model in baseline['results']:
+                old = baseline['results'][model].get(metric)
+                if old:
+                    text += f' ({100.0 * (value - old) / old:+.0f}%)'
+
+            line += f'{text:>16}'
+
+        print(line, file=out_stream)
+
+
+def _setup_parser(parser):
+    parser.add_argument(
+        'models',
+        nargs='*',
+        default=None,
+        help=f'models to measure, from {list(MODELS)}. Default is all of them',
+    )
+    parser.add_argument(
+        '--history',
+        default='performance_history.json',
+        help='json file that the results are appended to. Default is performance_history.json',
+    )
+    parser.add_argument(
+        '--baseline',
+        default=None,
+        help='json file with the baseline results. Regressions from it are reported and the '
+        'exit code is 1 when there are any',
+    )
+    parser.add_argument(
+        '--save_baseline',
+        default=None,
+        help='json file that the results of this run are written to, as a new baseline',
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=1,
+        help='number of times run_model and compute_totals are timed. Default is 1',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='allowed relative increase of each metric from the baseline. Default is 0.2',
+    )
+
+
+def main(args=None):
+    """
+    Run the performance benchmarks from the command line.
+
+    Parameters
+    ----------
+    args : list of str, optional
+        Command line arguments. Defaults to sys.argv.
+
+    Returns
+    -------
+    int
+        Exit code, which is 1 if any regressions were found and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description='Aviary performance benchmarks')
+    _setup_parser(parser)
+    args = parser.parse_args(args)
+
+    entry = run_benchmarks(args.models or None, repeats=args.repeats, history_file=args.history)
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print_results(entry, baseline)
+
+    if args.save_baseline is not None:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(entry, f, indent=1)
+
+    if baseline is None:
+        return 0
+
+    regressions = find_regressions(entry, baseline, rel_tolerance=args.tolerance)
+
+    for model, metric, old, new in regressions:
+        print(f'REGRESSION: {model} {metric} went from {old:.3f} to {new:.3f}')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    # run by _measure_in_subprocess as: model, repeats, result file
+    model, repeats, result_file = sys.argv[1:]
+
+    with open(result_file, 'w') as f:
+        json.dump(measure_model(model, int(repeats)), f)
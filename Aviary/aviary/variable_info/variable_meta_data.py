@@ -2,7 +2,6 @@
 Define meta data associated with variables in the Aviary data hierarchy.
 """
 
-from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
@@ -8165,5 +8164,8 @@ add_meta_data(
 # external subsystem extensions, we would be modifying the original and
 # the original _MetaData in the core of Aviary could get altered in
 # undesirable ways. By importing this copy to the API the user modifies a
-# new MetaData designed just for their purposes.
-CoreMetaData = deepcopy(_MetaData)
+# new MetaData designed just for their purposes. The entries themselves are shared
+# rather than deep-copied: add_meta_data and update_meta_data always replace an entry
+# instead of modifying it, so changes made through CoreMetaData never reach _MetaData.
+# Sharing the entries also lets merge_meta_data skip comparing them.
+CoreMetaData = _MetaData.copy()
@@ -5,6 +5,7 @@ import json
 import os
 import re
 import shutil
+import sqlite3
 import traceback
 import zipfile
 from collections import defaultdict
@@ -41,6 +42,7 @@ except BaseException:
 from dymos.visualization.timeseries.bokeh_timeseries_report import _meta_tree_subsys_iter
 from openmdao.utils.om_warnings import issue_warning
 
+from aviary.interface.reports import write_n2_from_record_file
 from aviary.visualization.aircraft_3d_model import Aircraft3DModel
 
 # support getting this function from OpenMDAO post movement of the function to utils
@@ -557,73 +559,181 @@ def create_aviary_variables_table_data_nested(output_dir, recorder_file):
     return table_data_nested
 
 
-def convert_driver_case_recorder_file_to_df(recorder_file_name):
+def _get_driver_history_names(driver_case):
+    """
+    Get the names of the objectives, constraints and design variables in a driver case.
+
+    A variable can be in more than one of these, so the duplicates are filtered out giving
+    priority to the objectives, then the constraints, then the design variables.
+
+    Parameters
+    ----------
+    driver_case : Case
+        A case recorded by the driver.
+
+    Returns
+    -------
+    list of str
+        Names of the variables in the order of the data frame columns.
+    """
+    all_var_names = list(driver_case.get_objectives(scaled=False).keys())
+
+    for name in list(driver_case.get_constraints(scaled=False).keys()) + list(
+        driver_case.get_design_vars(scaled=False).keys()
+    ):
+        if name not in all_var_names:
+            all_var_names.append(name)
+
+    return all_var_names
+
+
+def _read_driver_history(recorder_file_name, var_names, start_id=0):
+    """
+    Read the norm of the given driver variables for every driver case after start_id.
+
+    All cases are fetched with a single query and each variable is collected into a column,
+    instead of building a Case object for every iteration.
+
+    Parameters
+    ----------
+    recorder_file_name : str or Path
+        Name of the case recorder file.
+    var_names : list of str
+        Promoted names of the driver variables to read.
+    start_id : int
+        Only cases whose row id is greater than this are read.
+
+    Returns
+    -------
+    dict
+        Mapping of variable name to an array with one value per case.
+    int
+        Number of cases read.
+    int
+        Row id of the last case read.
+    """
+    cr = om.CaseReader(recorder_file_name, pre_load=False)
+    var_info = cr.problem_metadata['variables']
+
+    with sqlite3.connect(recorder_file_name) as con:
+        rows = con.execute(
+            'SELECT id, iteration_coordinate, outputs FROM driver_iterations '
+            'WHERE id > ? ORDER BY id',
+            (start_id,),
+        ).fetchall()
+    con.close()
+
+    values = {name: [] for name in var_names}
+
+    for _, iteration_coordinate, outputs in rows:
+        if isinstance(outputs, str):
+            outputs = json.loads(outputs)
+            case_values = {}
+
+            for name in var_names:
+                meta = var_info[name]
+                # auto_ivc outputs may be recorded under their promoted input name
+                value = np.asarray(outputs.get(meta['source'], outputs.get(name)))
+
+                if meta['indices'] is not None:
+                    value = value[meta['indices']]
+
+                case_values[name] = value
+        else:
+            # older recording formats store binary blobs, so let the case reader decode them
+            driver_case = cr.get_case(iteration_coordinate)
+            case_values = {
+                **driver_case.get_design_vars(scaled=False),
+                **driver_case.get_constraints(scaled=False),
+                **driver_case.get_objectives(scaled=False),
+            }
+
+        for name in var_names:
+            values[name].append(np.ravel(case_values[name]))
+
+    columns = {
+        name: np.linalg.norm(np.array(vals).reshape(len(rows), -1), axis=1)
+        for name, vals in values.items()
+    }
+    last_id = rows[-1][0] if rows else start_id
+
+    return columns, len(rows), last_id
+
+
+def convert_driver_case_recorder_file_to_df(recorder_file_name, cache=True):
     """
     Convert a case recorder file into a Pandas data frame.
 
+    Each variable is reduced to the norm of its value. When cache is True, the data frame is
+    saved next to the case recorder file and only the iterations recorded since the last
+    call are read.
+
     Parameters
     ----------
-    recorder_file_name : str
+    recorder_file_name : str or Path
         Name of the case recorder file.
+    cache : bool
+        If True, read and update the cached data frame next to the case recorder file.
+
+    Returns
+    -------
+    DataFrame or None
+        Data frame with one row per driver iteration, or None if there are no driver cases.
     """
-    cr = om.CaseReader(recorder_file_name)
-    driver_cases = cr.list_cases('driver', out_stream=None)
-
-    df = None
-    for i, case in enumerate(driver_cases):
-        driver_case = cr.get_case(case)
-
-        desvars = driver_case.get_design_vars(scaled=False)
-        objectives = driver_case.get_objectives(scaled=False)
-        constraints = driver_case.get_constraints(scaled=False)
-
-        if i == 0:  # Only need to get header of the data frame once
-            # Need to worry about the fact that a variable can be in more than one of
-            #  desvars, cons, and obj. So filter out the dupes
-            initial_desvars_names = list(desvars.keys())
-            initial_constraints_names = list(constraints.keys())
-            objectives_names = list(objectives.keys())
-
-            # Start with obj, then cons, then desvars
-            # Give priority to having a duplicate being in the obj and cons
-            #  over being in the desvars
-            all_var_names = objectives_names.copy()
-            constraints_names = []
-            for name in initial_constraints_names:
-                if name not in all_var_names:
-                    constraints_names.append(name)
-                    all_var_names.append(name)
-            desvars_names = []
-            for name in initial_desvars_names:
-                if name not in all_var_names:
-                    desvars_names.append(name)
-                    all_var_names.append(name)
-            header = ['iter_count'] + all_var_names
-            df = pd.DataFrame(columns=header)
-
-        # Now fill up a row
-        row = [
-            i,
-        ]
-        # important to do in this order since that is the order added to the header
-        for varname in objectives_names:
-            value = objectives[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in constraints_names:
-            value = constraints[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in desvars_names:
-            value = desvars[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-        df.loc[i] = row
+    recorder_file_name = Path(recorder_file_name)
+    cache_file_name = recorder_file_name.with_name(recorder_file_name.stem + '_df.pkl')
+
+    with sqlite3.connect(recorder_file_name) as con:
+        first_case = con.execute(
+            'SELECT iteration_coordinate, timestamp FROM driver_iterations ORDER BY id LIMIT 1'
+        ).fetchone()
+        max_id = con.execute('SELECT max(id) FROM driver_iterations').fetchone()[0]
+    con.close()
+
+    if first_case is None:
+        return None
+
+    iteration_coordinate, first_timestamp = first_case
+
+    cached_df = None
+    if cache and cache_file_name.exists():
+        try:
+            cached_df = pd.read_pickle(cache_file_name)
+        except Exception:
+            cached_df = None
+
+        # a new run overwrites the recorder file, so the cache only applies to the same run
+        if cached_df is not None and cached_df.attrs.get('first_timestamp') != first_timestamp:
+            cached_df = None
+
+    if cached_df is not None:
+        if cached_df.attrs['last_id'] == max_id:
+            return cached_df
+
+        var_names = list(cached_df.columns)[1:]
+        start_id = cached_df.attrs['last_id']
+    else:
+        cr = om.CaseReader(recorder_file_name, pre_load=False)
+        var_names = _get_driver_history_names(cr.get_case(iteration_coordinate))
+        start_id = 0
+
+    columns, num_cases, last_id = _read_driver_history(recorder_file_name, var_names, start_id)
+
+    num_previous = 0 if cached_df is None else len(cached_df)
+    iter_count = np.arange(num_previous, num_previous + num_cases)
+    df = pd.DataFrame({'iter_count': iter_count, **columns}, index=iter_count)
+
+    if cached_df is not None:
+        df = pd.concat([cached_df, df])
+
+    df.attrs = {'first_timestamp': first_timestamp, 'last_id': last_id}
+
+    if cache:
+        try:
+            df.to_pickle(cache_file_name)
+        except OSError:
+            # the reports may be in a read-only location, the cache is optional
+            pass
 
     return df
 
@@ -1211,6 +1321,14 @@ def dashboard(script_name, port=0, run_in_background=False):
     )
 
     # N2
+    # the N2 diagram of the results may have been left for the dashboard to write, see the n2
+    # argument of AviaryProblem.run_aviary_problem
+    n2_path = reports_dir / 'n2.html'
+    if problem_recorder_path.exists() and (
+        not n2_path.exists() or n2_path.stat().st_mtime < problem_recorder_path.stat().st_mtime
+    ):
+        write_n2_from_record_file(problem_recorder_path, n2_path)
+
     create_report_frame(
         'N2',
         model_tabs_list,
@@ -1258,7 +1376,7 @@ def dashboard(script_name, port=0, run_in_background=False):
     opt_history_path = out_dir / 'optimization_history.db'
     if opt_history_path.exists():
         df = convert_driver_case_recorder_file_to_df(opt_history_path)
-        cr = om.CaseReader(opt_history_path)
+        cr = om.CaseReader(opt_history_path, pre_load=False)
         opt_history_pane = create_optimization_history_plot(cr, df)
         optimization_tabs_list.append(('Optimization History', opt_history_pane))
 
@@ -0,0 +1,79 @@
+import sqlite3
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.visualization.dashboard import convert_driver_case_recorder_file_to_df
+
+
+@use_tempdirs
+class DriverHistoryTest(unittest.TestCase):
+    def setUp(self):
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'comp',
+            om.ExecComp(
+                ['f = sum((x - 3.0)**2) + y**2', 'g = x[0] + y', 'h = 2.0 * x'],
+                x=np.ones(4),
+                h=np.ones(4),
+            ),
+            promotes=['*'],
+        )
+        prob.model.add_design_var('x', lower=-10.0, upper=10.0, ref=2.0, indices=[1, 3])
+        prob.model.add_design_var('y', lower=-10.0, upper=10.0)
+        prob.model.add_objective('f')
+        prob.model.add_constraint('g', upper=1.0)
+        prob.model.add_constraint('h', lower=0.0, indices=[0, 2])
+        # y is both a design variable and a constraint, so it only gets one column
+        prob.model.add_constraint('y', lower=-1.0)
+
+        prob.driver = om.DOEDriver(om.UniformGenerator(num_samples=20, seed=0))
+        prob.driver.add_recorder(om.SqliteRecorder('history.db'))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.recorder_file = prob.get_outputs_dir() / 'history.db'
+
+    def test_convert_to_df(self):
+        df = convert_driver_case_recorder_file_to_df(self.recorder_file, cache=False)
+
+        self.assertEqual(list(df.columns), ['iter_count', 'f', 'y', 'g', 'h', 'x'])
+        self.assertEqual(len(df), 20)
+
+        cr = om.CaseReader(self.recorder_file)
+        for i, case_id in enumerate(cr.list_cases('driver', out_stream=None)):
+            case = cr.get_case(case_id)
+            assert_near_equal(df['x'][i], np.linalg.norm(case.get_design_vars(scaled=False)['x']))
+            assert_near_equal(df['h'][i], np.linalg.norm(case.get_constraints(scaled=False)['h']))
+            assert_near_equal(df['f'][i], np.abs(case.get_objectives(scaled=False)['f'][0]))
+
+    def test_incremental_cache(self):
+        full_df = convert_driver_case_recorder_file_to_df(self.recorder_file, cache=False)
+
+        # cache the first part of the history, then read the rest from the recorder
+        with sqlite3.connect(self.recorder_file) as con:
+            rows = con.execute('SELECT * FROM driver_iterations WHERE id > 12').fetchall()
+            con.execute('DELETE FROM driver_iterations WHERE id > 12')
+        con.close()
+
+        df = convert_driver_case_recorder_file_to_df(self.recorder_file)
+        self.assertEqual(len(df), 12)
+
+        with sqlite3.connect(self.recorder_file) as con:
+            con.executemany(
+                f'INSERT INTO driver_iterations VALUES ({", ".join(["?"] * len(rows[0]))})', rows
+            )
+        con.close()
+
+        df = convert_driver_case_recorder_file_to_df(self.recorder_file)
+        self.assertEqual(df.attrs['last_id'], 20)
+        assert_near_equal(df.to_numpy(dtype=float), full_df.to_numpy(dtype=float))
+
+
+if __name__ == '__main__':
+    unittest.main()